@@ -0,0 +1,176 @@
+"""Ansible callback plugin, writing a Mac Maker playbook event stream."""
+
+import json
+import os
+import time
+from typing import Any, Dict, Optional, TextIO
+
+from ansible.plugins.callback import CallbackBase
+
+DOCUMENTATION = """
+  name: mac_maker_events
+  type: notification
+  short_description: Writes playbook events for Mac Maker.
+  description:
+    - Appends newline-delimited JSON events to the file named by the
+      MAC_MAKER_EVENTS_FILE environment variable.
+    - Does nothing if the environment variable is not set.
+"""
+
+# Keep in sync with config.ENV_MAC_MAKER_EVENTS_FILE, this plugin runs inside
+# the ansible-playbook process and is loaded without the mac_maker package.
+ENV_MAC_MAKER_EVENTS_FILE = "MAC_MAKER_EVENTS_FILE"
+
+
+class CallbackModule(CallbackBase):
+  """Ansible callback plugin, writing a Mac Maker playbook event stream.
+
+  Each event is a single line of JSON, flushed as soon as it is written, so
+  the controller can consume the stream while the playbook is running.
+  """
+
+  CALLBACK_VERSION = 2.0
+  CALLBACK_TYPE = "notification"
+  CALLBACK_NAME = "mac_maker_events"
+  CALLBACK_NEEDS_ENABLED = False
+
+  def __init__(self, *args: Any, **kwargs: Any) -> None:
+    super().__init__(*args, **kwargs)
+    self.stream: Optional[TextIO] = None
+    self.play: Optional[Dict[str, Any]] = None
+    self.task: Optional[Dict[str, Any]] = None
+    self.started = time.monotonic()
+
+    path = os.getenv(ENV_MAC_MAKER_EVENTS_FILE)
+    if path:
+      # pylint: disable=consider-using-with
+      self.stream = open(path, "a", encoding="utf-8")
+
+  def v2_playbook_on_start(self, playbook: Any) -> None:
+    self.started = time.monotonic()
+    self._emit(
+        "playbook_start",
+        playbook=getattr(playbook, "_file_name", None),
+    )
+
+  def v2_playbook_on_play_start(self, play: Any) -> None:
+    self._end_play()
+    self.play = {
+        "play": play.get_name(),
+        "play_id": str(play._uuid),  # pylint: disable=protected-access
+        "started": time.monotonic(),
+    }
+    self._emit("play_start", play=self.play["play"], id=self.play["play_id"])
+
+  def v2_playbook_on_task_start(self, task: Any, is_conditional: Any) -> None:
+    self._start_task(task, handler=False)
+
+  def v2_playbook_on_handler_task_start(self, task: Any) -> None:
+    self._start_task(task, handler=True)
+
+  def v2_runner_on_ok(self, result: Any) -> None:
+    # pylint: disable=protected-access
+    status = "changed" if result._result.get("changed") else "ok"
+    self._host_result(result, status)
+
+  def v2_runner_on_failed(
+      self,
+      result: Any,
+      ignore_errors: bool = False,
+  ) -> None:
+    self._host_result(result, "ignored" if ignore_errors else "failed")
+
+  def v2_runner_on_skipped(self, result: Any) -> None:
+    self._host_result(result, "skipped")
+
+  def v2_runner_on_unreachable(self, result: Any) -> None:
+    self._host_result(result, "unreachable")
+
+  def v2_playbook_on_stats(self, stats: Any) -> None:
+    self._end_play()
+    self._emit(
+        "playbook_end",
+        duration=time.monotonic() - self.started,
+        hosts={
+            host: stats.summarize(host) for host in sorted(stats.processed)
+        },
+    )
+    if self.stream is not None:
+      self.stream.close()
+      self.stream = None
+
+  def _start_task(self, task: Any, handler: bool) -> None:
+    self._end_task()
+    # pylint: disable=protected-access
+    role = task._role.get_name() if task._role else None
+    self.task = {
+        "task": task.get_name().strip(),
+        "task_id": str(task._uuid),
+        "role": role,
+        "action": task.action,
+        "handler": handler,
+        "started": time.monotonic(),
+        "hosts": {},
+    }
+    self._emit(
+        "task_start",
+        task=self.task["task"],
+        id=self.task["task_id"],
+        role=role,
+        action=task.action,
+        handler=handler,
+    )
+
+  def _host_result(self, result: Any, status: str) -> None:
+    # pylint: disable=protected-access
+    host = result._host.get_name()
+    task_id = str(result._task._uuid)
+    duration = None
+    if self.task is not None and self.task["task_id"] == task_id:
+      duration = time.monotonic() - self.task["started"]
+      self.task["hosts"][host] = status
+    self._emit(
+        "host_result",
+        host=host,
+        task=result._task.get_name().strip(),
+        id=task_id,
+        status=status,
+        changed=bool(result._result.get("changed", False)),
+        failed=status in ("failed", "unreachable"),
+        duration=duration,
+    )
+
+  def _end_task(self) -> None:
+    if self.task is None:
+      return
+    self._emit(
+        "task_end",
+        task=self.task["task"],
+        id=self.task["task_id"],
+        role=self.task["role"],
+        action=self.task["action"],
+        handler=self.task["handler"],
+        hosts=self.task["hosts"],
+        duration=time.monotonic() - self.task["started"],
+    )
+    self.task = None
+
+  def _end_play(self) -> None:
+    self._end_task()
+    if self.play is None:
+      return
+    self._emit(
+        "play_end",
+        play=self.play["play"],
+        id=self.play["play_id"],
+        duration=time.monotonic() - self.play["started"],
+    )
+    self.play = None
+
+  def _emit(self, event: str, **fields: Any) -> None:
+    if self.stream is None:
+      return
+    fields["event"] = event
+    fields["time"] = time.time()
+    self.stream.write(json.dumps(fields, default=str) + "\n")
+    self.stream.flush()
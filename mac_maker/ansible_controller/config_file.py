@@ -0,0 +1,62 @@
+"""Configuration file for Ansible."""
+
+import configparser
+import io
+import logging
+import os
+from pathlib import Path
+
+from mac_maker import config
+from mac_maker.ansible_controller.spec import Spec
+from mac_maker.utilities.mixins.text_file import TextFileWriter
+from mac_maker.utilities.state import StateDirectory
+
+
+class AnsibleConfigFile(TextFileWriter):
+  """Configuration file for Ansible.
+
+  The generated file enables pipelining, smart fact gathering and a jsonfile
+  fact cache, that expires after a day.  Facts are cached in the state
+  directory, so they outlive the workspace and can be reused by later jobs.
+  Any settings in the profile's own `ansible.cfg` take precedence over these
+  defaults.
+
+  :param spec: The provisioning spec instance.
+  """
+
+  class Messages:
+    written = "ConfigFile: Ansible configuration has been written to %s."
+
+  def __init__(self, spec: Spec) -> None:
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.spec = spec
+    self.path = Path(spec.profile_data_path) / config.ANSIBLE_CONFIG_FILE
+    self.profile_path = (
+        Path(spec.profile_data_path) / config.PROFILE_ANSIBLE_CONFIG_FILE
+    )
+
+  def write(self) -> None:
+    """Write the Ansible configuration file to the correct location."""
+
+    parser = self._create_parser()
+    parser.read_dict(config.ANSIBLE_CONFIG_DEFAULTS)
+    parser.set(
+        "defaults",
+        "fact_caching_connection",
+        str(StateDirectory().get_folder(config.ANSIBLE_FACT_CACHE_FOLDER)),
+    )
+    if self.profile_path.is_file():
+      parser.read(self.profile_path, encoding=self.encoding)
+
+    content = io.StringIO()
+    parser.write(content)
+
+    os.makedirs(self.spec.profile_data_path, exist_ok=True)
+    self.write_text_file(content.getvalue(), self.path)
+    self.log.debug(self.Messages.written, self.path)
+
+  def _create_parser(self) -> configparser.ConfigParser:
+    return configparser.ConfigParser(
+        inline_comment_prefixes=(";",),
+        interpolation=None,
+    )
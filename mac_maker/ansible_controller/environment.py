@@ -5,6 +5,8 @@ import os
 from typing import Dict, List, Literal, Union
 
 from mac_maker import config
+from mac_maker.ansible_controller.config_file import AnsibleConfigFile
+from mac_maker.ansible_controller.events import EventStream
 from mac_maker.ansible_controller.spec import Spec
 
 ExpandableSpecKeys = Union[Literal["roles_path"], Literal["collections_path"],]
@@ -13,6 +15,9 @@ ExpandableSpecKeys = Union[Literal["roles_path"], Literal["collections_path"],]
 class AnsibleEnvironment:
   """Ansible runtime environment.
 
+  The bundled callback plugin is added to the plugin path, and writes
+  playbook events to the workspace.
+
   :param spec: The provisioning spec instance.
   """
 
@@ -36,6 +41,13 @@ class AnsibleEnvironment:
         config.ENV_ANSIBLE_COLLECTIONS_PATH,
         'collections_path',
     )
+    self.env[config.ENV_ANSIBLE_CONFIG] = str(AnsibleConfigFile(self.spec).path)
+    event_stream = EventStream(self.spec)
+    self._combine_env_with_list(
+        config.ENV_ANSIBLE_CALLBACK_PLUGINS,
+        [str(event_stream.plugin_path)],
+    )
+    self.env[config.ENV_MAC_MAKER_EVENTS_FILE] = str(event_stream.path)
     self._save()
     self.log.debug("Environment: Ansible runtime environment is ready.")
 
@@ -49,6 +61,15 @@ class AnsibleEnvironment:
     new_env_value = existing_spec_value + existing_env_value
     self.env[variable_name] = self._list_to_env(new_env_value)
 
+  def _combine_env_with_list(
+      self,
+      variable_name: str,
+      values: List[str],
+  ) -> None:
+    existing_env_value = self._env_to_list(variable_name)
+    new_values = [value for value in values if value not in existing_env_value]
+    self.env[variable_name] = self._list_to_env(new_values + existing_env_value)
+
   def _env_to_list(self, variable_name: str) -> List[str]:
     value = os.getenv(variable_name, None)
     if value is None:
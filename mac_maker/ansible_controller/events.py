@@ -0,0 +1,124 @@
+"""Playbook event stream, written by the bundled callback plugin."""
+
+import contextlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from mac_maker import config
+from mac_maker.ansible_controller.spec import Spec
+
+TypeEvent = Dict[str, Any]
+TypeEventListener = Callable[[TypeEvent], None]
+
+
+class EventStream:
+  """Playbook event stream, written by the bundled callback plugin.
+
+  The callback plugin appends newline-delimited JSON events to a file in the
+  workspace.  The file is polled while the playbook is running, and each new
+  complete event is passed to the subscribed listeners, in order.
+
+  :param spec: The provisioning spec instance.
+  """
+
+  plugin_path = Path(__file__).parent / "callback_plugins"
+
+  class Messages:
+    event = "EventStream: Received '%s' event."
+    invalid = "EventStream: Skipped an invalid event: %s"
+
+  def __init__(self, spec: Spec) -> None:
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.spec = spec
+    self.path = Path(spec.workspace_root_path) / config.ANSIBLE_EVENTS_FILE
+    self.listeners: List[TypeEventListener] = []
+    self._offset = 0
+    self._partial = b""
+
+  def subscribe(self, listener: TypeEventListener) -> None:
+    """Pass each new event to a listener.
+
+    :param listener: A callable accepting each event.
+    """
+
+    self.listeners.append(listener)
+
+  def reset(self) -> None:
+    """Discard the events of any previous playbook run."""
+
+    self.path.unlink(missing_ok=True)
+    self._offset = 0
+    self._partial = b""
+
+  def poll(self) -> List[TypeEvent]:
+    """Read the events written since the last poll.
+
+    :returns: The new complete events, which were passed to the listeners.
+    """
+
+    if not self.path.is_file():
+      return []
+
+    with open(self.path, "rb") as file_handle:
+      file_handle.seek(self._offset)
+      content = file_handle.read()
+    self._offset += len(content)
+
+    lines = (self._partial + content).split(b"\n")
+    self._partial = lines.pop()
+
+    events = []
+    for line in lines:
+      event = self._decode(line)
+      if event is None:
+        continue
+      self.log.debug(self.Messages.event, event["event"])
+      for listener in self.listeners:
+        listener(event)
+      events.append(event)
+    return events
+
+  @contextlib.contextmanager
+  def follow(
+      self,
+      interval: float = config.ANSIBLE_EVENTS_POLL_INTERVAL,
+  ) -> Iterator[None]:
+    """Poll the event stream in the background, until the context exits.
+
+    The stream is polled one final time on exit, so no events are missed.
+
+    :param interval: The number of seconds between polls.
+    """
+
+    stop = threading.Event()
+    worker = threading.Thread(
+        target=self._follow,
+        args=(stop, interval),
+        daemon=True,
+    )
+    worker.start()
+    try:
+      yield
+    finally:
+      stop.set()
+      worker.join()
+      self.poll()
+
+  def _follow(self, stop: threading.Event, interval: float) -> None:
+    while not stop.wait(interval):
+      self.poll()
+
+  def _decode(self, line: bytes) -> Optional[TypeEvent]:
+    if not line.strip():
+      return None
+    try:
+      event = json.loads(line)
+    except ValueError:
+      event = None
+    if not isinstance(event, dict) or "event" not in event:
+      self.log.warning(self.Messages.invalid, line[:200])
+      return None
+    return event
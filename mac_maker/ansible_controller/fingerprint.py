@@ -0,0 +1,95 @@
+"""Fingerprint of a profile's installed Ansible Galaxy requirements."""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import List
+
+from mac_maker import config
+from mac_maker.ansible_controller.spec import Spec
+from mac_maker.utilities.mixins.json_file import JSONFileReader, JSONFileWriter
+
+
+class GalaxyFingerprint(JSONFileReader, JSONFileWriter):
+  """Fingerprint of a profile's installed Ansible Galaxy requirements.
+
+  The fingerprint digests the content of the requirements file, along with
+  the name, size and modification time of every file in the roles and
+  collections install folders.  When the recorded fingerprint still matches,
+  the previous install is intact and the Galaxy commands can be skipped.
+
+  :param spec: The provisioning spec instance.
+  """
+
+  class Messages:
+    current = "GalaxyFingerprint: Galaxy requirements are unchanged (%s)."
+    recorded = "GalaxyFingerprint: Recorded fingerprint %s."
+    stale = "GalaxyFingerprint: Galaxy requirements have changed."
+
+  def __init__(self, spec: Spec) -> None:
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.spec = spec
+    self.path = Path(spec.workspace_root_path) / config.GALAXY_FINGERPRINT_FILE
+
+  def compute(self) -> str:
+    """Compute the fingerprint of the current requirements and install trees.
+
+    :returns: The hex digest of the fingerprint.
+    """
+
+    digest = hashlib.sha256()
+    requirements_file = Path(self.spec.galaxy_requirements_file)
+    if requirements_file.is_file():
+      digest.update(requirements_file.read_bytes())
+    for install_path in self._get_install_paths():
+      digest.update(f"\0{install_path}\0".encode())
+      for entry in self._walk(Path(install_path)):
+        digest.update(entry.encode())
+    return digest.hexdigest()
+
+  def is_current(self) -> bool:
+    """Check if the recorded fingerprint matches the current one.
+
+    :returns: A boolean indicating if the Galaxy requirements are unchanged.
+    """
+
+    if not self.path.is_file():
+      self.log.debug(self.Messages.stale)
+      return False
+
+    recorded = self.load_json_file(self.path).get("fingerprint")
+    if recorded != self.compute():
+      self.log.debug(self.Messages.stale)
+      return False
+
+    self.log.debug(self.Messages.current, recorded)
+    return True
+
+  def record(self) -> None:
+    """Record the current fingerprint, after a successful install."""
+
+    fingerprint = self.compute()
+    self.write_json_file(
+        {
+            "fingerprint": fingerprint
+        },
+        self.path,
+    )
+    self.log.debug(self.Messages.recorded, fingerprint)
+
+  def _get_install_paths(self) -> List[str]:
+    return [self.spec.roles_path[0], self.spec.collections_path[0]]
+
+  def _walk(self, install_path: Path) -> List[str]:
+    entries = []
+    for folder, folder_names, file_names in os.walk(install_path):
+      folder_names.sort()
+      for file_name in sorted(file_names):
+        file_path = Path(folder) / file_name
+        file_stat = file_path.lstat()
+        entries.append(
+            f"{file_path.relative_to(install_path).as_posix()}\0"
+            f"{file_stat.st_size}\0{file_stat.st_mtime_ns}\n"
+        )
+    return entries
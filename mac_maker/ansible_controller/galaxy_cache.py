@@ -0,0 +1,439 @@
+"""Machine-wide, content-addressed cache of Ansible Galaxy artifacts."""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import stat
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import yaml
+from mac_maker import config
+from mac_maker.ansible_controller.spec import Spec
+from mac_maker.utilities.file_copier import FileCopier
+from mac_maker.utilities.mixins.json_file import JSONFileReader, JSONFileWriter
+from mac_maker.utilities.state import StateDirectory
+
+TypeRequirements = Dict[str, List[Any]]
+
+
+class GalaxyArtifact(NamedTuple):
+  """A role or collection, pinned to an exact version."""
+
+  kind: str
+  name: str
+  version: str
+
+  def get_key(self) -> str:
+    """Return a key uniquely identifying this artifact.
+
+    :returns: The artifact's key.
+    """
+
+    return f"{self.kind}:{self.name}:{self.version}"
+
+
+class GalaxyInstall(NamedTuple):
+  """The Galaxy requirements that remain to be installed."""
+
+  requirements_file: str
+  roles: bool
+  collections: bool
+
+
+class GalaxyCache(JSONFileReader, JSONFileWriter):
+  """Machine-wide, content-addressed cache of Ansible Galaxy artifacts.
+
+  Roles and collections pinned to an exact version in the profile's
+  requirements file are stored in the state directory once installed, keyed
+  by a digest of their content, so identical artifacts are only stored once.
+  Before installing, cached artifacts are restored into the profile with
+  reflinks or hardlinks, and only the remaining requirements are passed on to
+  Ansible Galaxy.
+
+  Collections are cached along with the exact versions of the collections
+  they depend on.  Roles with dependencies are never cached.
+
+  :param spec: The provisioning spec instance.
+  """
+
+  galaxy_name = re.compile(r"^[\w-]+\.[\w-]+$")
+  role_name = re.compile(r"^[\w-][\w.-]*$")
+  exact_version = re.compile(r"^(==)?\s*(?P<version>[\w][\w.+-]*)$")
+  role_kind = "role"
+  collection_kind = "collection"
+
+  class Messages:
+    error_restore_failure = "GalaxyCache: Unable to restore '%s': %s"
+    error_store_failure = "GalaxyCache: Unable to store '%s': %s"
+    restored = "GalaxyCache: Restored '%s' from '%s'."
+    stored = "GalaxyCache: Stored '%s' in '%s'."
+
+  def __init__(self, spec: Spec) -> None:
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.spec = spec
+    self.root = StateDirectory().get_folder(config.GALAXY_CACHE_FOLDER)
+    self.install_roots = {
+        self.role_kind: Path(spec.roles_path[0]),
+        self.collection_kind: Path(spec.collections_path[0]),
+    }
+    self.pending_file = (
+        Path(spec.workspace_root_path) / config.GALAXY_CACHE_REQUIREMENTS_FILE
+    )
+    self.copier = FileCopier()
+
+  def get_install(self) -> GalaxyInstall:
+    """Return an install of all the profile's Galaxy requirements.
+
+    :returns: The Galaxy requirements to install.
+    """
+
+    return GalaxyInstall(
+        requirements_file=self.spec.galaxy_requirements_file,
+        roles=True,
+        collections=True,
+    )
+
+  def restore(self) -> GalaxyInstall:
+    """Restore cached artifacts into the profile.
+
+    :returns: The Galaxy requirements that remain to be installed.
+    """
+
+    requirements = self._load_requirements()
+    if requirements is None:
+      return self.get_install()
+
+    index = self._get_index()
+    pending: TypeRequirements = {
+        "roles": [],
+        "collections": []
+    }
+    restored = 0
+    for section, kind in self._get_sections():
+      for entry in requirements[section]:
+        artifact = self._get_artifact(kind, entry)
+        if artifact and self._restore(artifact, index):
+          restored += 1
+        else:
+          pending[section].append(entry)
+
+    if not restored:
+      return self.get_install()
+
+    self.pending_file.write_text(
+        yaml.safe_dump(pending),
+        encoding=self.encoding,
+    )
+    return GalaxyInstall(
+        requirements_file=str(self.pending_file),
+        roles=bool(pending["roles"]),
+        collections=bool(pending["collections"]),
+    )
+
+  def store(self) -> None:
+    """Store the profile's installed, pinned artifacts in the cache."""
+
+    requirements = self._load_requirements()
+    if requirements is None:
+      return
+
+    index = self._get_index()
+    for section, kind in self._get_sections():
+      for entry in requirements[section]:
+        artifact = self._get_artifact(kind, entry)
+        if artifact:
+          self._store(artifact, index)
+
+  def _get_sections(self) -> List[List[str]]:
+    return [
+        ["roles", self.role_kind],
+        ["collections", self.collection_kind],
+    ]
+
+  def _load_requirements(self) -> Optional[TypeRequirements]:
+    try:
+      with open(
+          self.spec.galaxy_requirements_file,
+          encoding=self.encoding,
+      ) as file_handle:
+        content = yaml.safe_load(file_handle)
+    except (OSError, yaml.YAMLError):
+      return None
+
+    if isinstance(content, list):
+      content = {
+          "roles": content
+      }
+    if not isinstance(content, dict):
+      return None
+    return {
+        "roles": list(content.get("roles") or []),
+        "collections": list(content.get("collections") or []),
+    }
+
+  def _get_artifact(self, kind: str, entry: Any) -> Optional[GalaxyArtifact]:
+    if not isinstance(entry, dict):
+      return None
+
+    match = self.exact_version.match(str(entry.get("version", "")))
+    if match is None:
+      return None
+
+    name = entry.get("name")
+    if kind == self.role_kind:
+      source = entry.get("src", name)
+      if entry.get("scm") or not self._is_galaxy_name(source):
+        return None
+      name = name or source
+      if not isinstance(name, str) or not self.role_name.match(name):
+        return None
+    elif entry.get("type", "galaxy") != "galaxy":
+      return None
+    elif not self._is_galaxy_name(name):
+      return None
+
+    return GalaxyArtifact(kind, str(name), match.group("version"))
+
+  def _is_galaxy_name(self, name: Any) -> bool:
+    return isinstance(name, str) and bool(self.galaxy_name.match(name))
+
+  def _get_index(self) -> Dict[str, Path]:
+    index: Dict[str, Path] = {}
+    last_used: Dict[str, float] = {}
+    pattern = f"*/{config.GALAXY_CACHE_ARTIFACT_FILE}"
+    for artifact_file in self.root.glob(pattern):
+      try:
+        metadata = self.load_json_file(artifact_file)
+        mtime = artifact_file.parent.stat().st_mtime
+        key = GalaxyArtifact(*metadata["artifact"]).get_key()
+      except (OSError, ValueError, KeyError, TypeError):
+        continue
+      if mtime >= last_used.get(key, mtime):
+        index[key] = artifact_file.parent
+        last_used[key] = mtime
+    return index
+
+  def _get_installed_version(self, artifact: GalaxyArtifact) -> Optional[str]:
+    install_root = self.install_roots[artifact.kind]
+    try:
+      if artifact.kind == self.role_kind:
+        install_info = (
+            install_root / artifact.name / "meta" / ".galaxy_install_info"
+        )
+        content = yaml.safe_load(install_info.read_text(self.encoding))
+        return str(content["version"])
+      manifest = self.load_json_file(
+          install_root / self._get_collection_path(artifact) / "MANIFEST.json"
+      )
+      return str(manifest["collection_info"]["version"])
+    except (OSError, ValueError, KeyError, TypeError, yaml.YAMLError):
+      return None
+
+  def _get_collection_path(self, artifact: GalaxyArtifact) -> str:
+    namespace, name = artifact.name.split(".")
+    return f"ansible_collections/{namespace}/{name}"
+
+  def _get_paths(self, artifact: GalaxyArtifact) -> List[str]:
+    if artifact.kind == self.role_kind:
+      return [artifact.name]
+    paths = [self._get_collection_path(artifact)]
+    info_path = f"ansible_collections/{artifact.name}-{artifact.version}.info"
+    if (self.install_roots[artifact.kind] / info_path).is_dir():
+      paths.append(info_path)
+    return paths
+
+  def _get_dependencies(
+      self,
+      artifact: GalaxyArtifact,
+  ) -> Optional[List[GalaxyArtifact]]:
+    install_root = self.install_roots[artifact.kind]
+    try:
+      if artifact.kind == self.role_kind:
+        return self._get_role_dependencies(install_root / artifact.name)
+      manifest = self.load_json_file(
+          install_root / self._get_collection_path(artifact) / "MANIFEST.json"
+      )
+      names = manifest["collection_info"].get("dependencies") or {}
+    except FileNotFoundError:
+      return []
+    except (OSError, ValueError, KeyError, AttributeError, yaml.YAMLError):
+      return None
+
+    dependencies = []
+    for name in sorted(names):
+      dependency = GalaxyArtifact(self.collection_kind, name, "")
+      version = self._get_installed_version(dependency)
+      if version is None:
+        return None
+      dependencies.append(dependency._replace(version=version))
+    return dependencies
+
+  def _get_role_dependencies(
+      self,
+      role_path: Path,
+  ) -> Optional[List[GalaxyArtifact]]:
+    for meta_file in ("main.yml", "main.yaml"):
+      meta = role_path / "meta" / meta_file
+      if meta.is_file():
+        content = yaml.safe_load(meta.read_text(self.encoding)) or {}
+        return None if content.get("dependencies") else []
+    return []
+
+  def _get_digest(self, artifact: GalaxyArtifact, paths: List[str]) -> str:
+    digest = hashlib.sha256(f"{artifact.get_key()}\0".encode())
+    install_root = self.install_roots[artifact.kind]
+    for path in paths:
+      for folder, folder_names, file_names in os.walk(install_root / path):
+        folder_names.sort()
+        for name in sorted(folder_names + file_names):
+          file_path = Path(folder) / name
+          relative_path = file_path.relative_to(install_root).as_posix()
+          digest.update(f"{relative_path}\0".encode())
+          if file_path.is_symlink():
+            digest.update(f"->{os.readlink(file_path)}\0".encode())
+          elif file_path.is_file():
+            executable = os.access(file_path, os.X_OK)
+            digest.update(f"{executable}\0".encode())
+            with open(file_path, "rb") as file_handle:
+              digest.update(hashlib.file_digest(file_handle, "sha256").digest())
+    return digest.hexdigest()
+
+  def _restore(
+      self,
+      artifact: GalaxyArtifact,
+      index: Dict[str, Path],
+  ) -> bool:
+    cached = index.get(artifact.get_key())
+    if cached is None:
+      return False
+
+    try:
+      metadata = self.load_json_file(cached / config.GALAXY_CACHE_ARTIFACT_FILE)
+      for dependency in metadata["dependencies"]:
+        if not self._restore(GalaxyArtifact(*dependency), index):
+          return False
+      if self._get_installed_version(artifact) != artifact.version:
+        self._remove_installed(artifact)
+        self._copy_content(
+            cached / config.GALAXY_CACHE_CONTENT_FOLDER,
+            self.install_roots[artifact.kind],
+            metadata["paths"],
+        )
+      os.utime(cached)
+    except (OSError, ValueError, KeyError) as exc:
+      self.log.warning(
+          self.Messages.error_restore_failure,
+          artifact.get_key(),
+          exc,
+      )
+      return False
+
+    self.log.debug(self.Messages.restored, artifact.get_key(), cached)
+    return True
+
+  def _store(
+      self,
+      artifact: GalaxyArtifact,
+      index: Dict[str, Path],
+  ) -> bool:
+    if artifact.get_key() in index:
+      return True
+    if self._get_installed_version(artifact) != artifact.version:
+      return False
+    dependencies = self._get_dependencies(artifact)
+    if dependencies is None:
+      return False
+    for dependency in dependencies:
+      if not self._store(dependency, index):
+        return False
+
+    paths = self._get_paths(artifact)
+    try:
+      cached = self.root / self._get_digest(artifact, paths)
+      if not cached.exists():
+        self._create(artifact, cached, paths, dependencies)
+    except OSError as exc:
+      self.log.warning(
+          self.Messages.error_store_failure,
+          artifact.get_key(),
+          exc,
+      )
+      return False
+
+    index[artifact.get_key()] = cached
+    self.log.debug(self.Messages.stored, artifact.get_key(), cached)
+    return True
+
+  def _create(
+      self,
+      artifact: GalaxyArtifact,
+      cached: Path,
+      paths: List[str],
+      dependencies: List[GalaxyArtifact],
+  ) -> None:
+    temporary = cached.with_name(f".{cached.name}.{os.getpid()}.tmp")
+    try:
+      self._copy_content(
+          self.install_roots[artifact.kind],
+          temporary / config.GALAXY_CACHE_CONTENT_FOLDER,
+          paths,
+      )
+      self._make_read_only(temporary / config.GALAXY_CACHE_CONTENT_FOLDER)
+      self.write_json_file(
+          {
+              "artifact": list(artifact),
+              "dependencies": [list(dependency) for dependency in dependencies],
+              "paths": paths,
+          },
+          temporary / config.GALAXY_CACHE_ARTIFACT_FILE,
+      )
+      os.rename(temporary, cached)
+    except OSError:
+      if not cached.exists():
+        raise
+    finally:
+      shutil.rmtree(temporary, ignore_errors=True)
+
+  def _copy_content(
+      self,
+      source: Path,
+      destination: Path,
+      paths: List[str],
+  ) -> None:
+    for path in paths:
+      target = destination / path
+      target.parent.mkdir(parents=True, exist_ok=True)
+      try:
+        shutil.copytree(
+            source / path,
+            target,
+            symlinks=True,
+            copy_function=self.copier.copy,
+        )
+      except OSError:
+        shutil.rmtree(target, ignore_errors=True)
+        raise
+    self.copier.log_summary()
+
+  def _remove_installed(self, artifact: GalaxyArtifact) -> None:
+    install_root = self.install_roots[artifact.kind]
+    paths = [install_root / path for path in self._get_paths(artifact)]
+    if artifact.kind == self.collection_kind:
+      collections_root = install_root / "ansible_collections"
+      paths += collections_root.glob(f"{artifact.name}-*.info")
+    for path in paths:
+      if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+      elif path.is_symlink() or path.exists():
+        path.unlink()
+
+  def _make_read_only(self, folder: Path) -> None:
+    write_bits = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+    for path, _, file_names in os.walk(folder):
+      for file_name in file_names:
+        file_path = Path(path) / file_name
+        if not file_path.is_symlink():
+          file_path.chmod(file_path.stat().st_mode & ~write_bits)
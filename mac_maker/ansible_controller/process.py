@@ -2,9 +2,14 @@
 
 import logging
 import os
+import queue
+import signal
 import subprocess
 import sys
+import threading
+from typing import Dict, List, Tuple
 
+import click
 from mac_maker import config
 from mac_maker.ansible_controller import environment
 from mac_maker.ansible_controller.spec import Spec
@@ -34,6 +39,89 @@ class AnsibleProcess:
     self.log.debug("AnsibleProcess: Preparing to launch Ansible Process.")
     self._call(command)
 
+  def spawn_concurrently(self, commands: Dict[str, str]) -> None:
+    """Spawns several Ansible CLI Commands, each in its own process.
+
+    The output of each process is streamed, prefixed with the command's name.
+    If any command fails, the remaining processes are terminated.
+
+    :param commands: A dictionary of names to the Ansible CLI Commands to spawn.
+    """
+
+    self.log.debug("AnsibleProcess: Preparing to launch Ansible Processes.")
+    self._environment()
+
+    results: "queue.Queue[Tuple[str, int]]" = queue.Queue()
+    workers: List["subprocess.Popen[str]"] = []
+    streams: List[threading.Thread] = []
+
+    try:
+      for name, command in commands.items():
+        workers.append(self._open(command))
+        stream = threading.Thread(
+            target=self._stream,
+            args=(name, workers[-1], results),
+            daemon=True,
+        )
+        stream.start()
+        streams.append(stream)
+
+      for _ in workers:
+        name, return_code = results.get()
+        if return_code != 0:
+          self.log.error(
+              "AnsibleProcess: Command '%s' failed to execute!",
+              name,
+          )
+          raise ChildProcessError
+    finally:
+      for worker in workers:
+        if worker.poll() is None:
+          self._terminate(worker)
+      for stream in streams:
+        stream.join()
+
+    self.log.debug("AnsibleProcess: Commands completed successfully!")
+
+  def _open(self, command: str) -> "subprocess.Popen[str]":
+    self.log.debug(
+        "AnsibleProcess: Executing '%s'",
+        command,
+    )
+
+    worker = subprocess.Popen(  # pylint: disable=consider-using-with
+        self._normalized_command(command),
+        cwd=self.spec.profile_data_path,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        start_new_session=True,
+    )  # nosec B602
+    self.log.debug(
+        "AnsibleProcess: Spawned worker process %s",
+        worker.pid,
+    )
+    return worker
+
+  def _terminate(self, worker: "subprocess.Popen[str]") -> None:
+    try:
+      os.killpg(worker.pid, signal.SIGTERM)
+    except ProcessLookupError:
+      pass
+
+  def _stream(
+      self,
+      name: str,
+      worker: "subprocess.Popen[str]",
+      results: "queue.Queue[Tuple[str, int]]",
+  ) -> None:
+    if worker.stdout is not None:
+      with worker.stdout:
+        for line in worker.stdout:
+          click.echo(f"[{name}] {line.rstrip()}")
+    results.put((name, worker.wait()))
+
   def _call(self, command: str) -> None:
     self.log.debug(
         "AnsibleProcess: Executing '%s'",
@@ -41,10 +129,10 @@ class AnsibleProcess:
     )
 
     self._environment()
-    self._execution_location()
 
     with subprocess.Popen(
         self._normalized_command(command),
+        cwd=self.spec.profile_data_path,
         shell=True,
     ) as worker:  # nosec B602
       self.log.debug(
@@ -75,6 +163,3 @@ class AnsibleProcess:
   def _environment(self) -> None:
     env = environment.AnsibleEnvironment(self.spec)
     env.setup()
-
-  def _execution_location(self) -> None:
-    os.chdir(self.spec.profile_data_path)
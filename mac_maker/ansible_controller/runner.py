@@ -1,11 +1,19 @@
 """AnsibleRunner workflow class."""
 
 import logging
+from typing import Optional
 
 import click
 from mac_maker import config
-from mac_maker.ansible_controller import process
+from mac_maker.ansible_controller import (
+    events,
+    fingerprint,
+    galaxy_cache,
+    process,
+    timing,
+)
 from mac_maker.ansible_controller.spec import Spec
+from mac_maker.utilities.phase_timer import PhaseTimer
 
 
 class AnsibleRunner:
@@ -13,31 +21,61 @@ class AnsibleRunner:
 
   :param spec: The provisioning spec instance.
   :param debug: Enable or disable logs.
+  :param force_galaxy: Install Galaxy requirements, even if they're unchanged.
+  :param offline: Use the installed Galaxy requirements, without installing.
+  :param refresh_facts: Discard cached facts, and gather them again.
+  :param timer: A timer measuring the phases of the job, or None to create one.
   """
 
-  def __init__(self, spec: Spec, debug: bool = False):
+  def __init__(
+      self,
+      spec: Spec,
+      debug: bool = False,
+      force_galaxy: bool = False,
+      offline: bool = False,
+      refresh_facts: bool = False,
+      timer: Optional[PhaseTimer] = None,
+  ):
     self.log = logging.getLogger(config.LOGGER_NAME)
     self.debug = debug
+    self.force_galaxy = force_galaxy
+    self.offline = offline
+    self.refresh_facts = refresh_facts
     self.spec = spec
     self.process = process.AnsibleProcess(spec)
+    self.fingerprint = fingerprint.GalaxyFingerprint(spec)
+    self.galaxy_cache = galaxy_cache.GalaxyCache(spec)
+    self.events = events.EventStream(spec)
+    self.timer = timer or PhaseTimer()
+    self.timing = timing.TimingReport(spec, self.timer)
+    self.events.subscribe(self.timing.record)
 
-  def start(self) -> None:
-    """Start the Ansible provisioning workflow."""
+  def start(self) -> bool:
+    """Start the Ansible provisioning workflow.
+
+    :returns: A boolean indicating if the provisioning succeeded.
+    """
 
-    galaxy_roles_command = self._construct_galaxy_roles_command()
-    galaxy_col_command = self._construct_galaxy_col_command()
     playbook_command = self._construct_ansible_playbook_command()
 
     try:
-      self._do_install_galaxy_roles(galaxy_roles_command)
-      self._do_install_galaxy_col(galaxy_col_command)
+      with self.timer.measure(config.TIMING_PHASE_GALAXY):
+        self._do_install_galaxy_requirements()
       self._do_ansible_playbook(playbook_command)
     except ChildProcessError:
-      return
+      return False
+    return True
+
+  def install(self) -> None:
+    """Install the profile's Galaxy requirements, without running Ansible.
 
-  def _construct_galaxy_roles_command(self) -> str:
+    :raises: :class:`ChildProcessError`
+    """
+
+    self._do_install_galaxy_requirements()
+
+  def _construct_galaxy_roles_command(self, requirements_file: str) -> str:
 
-    requirements_file = self.spec.galaxy_requirements_file
     role_path = self.spec.roles_path[0]
     self.log.debug(
         "AnsibleRunner: Reading Profile role requirements from: %s",
@@ -49,9 +87,8 @@ class AnsibleRunner:
     )
     return command
 
-  def _construct_galaxy_col_command(self) -> str:
+  def _construct_galaxy_col_command(self, requirements_file: str) -> str:
 
-    requirements_file = self.spec.galaxy_requirements_file
     col_path = self.spec.collections_path[0]
     self.log.debug(
         "AnsibleRunner: Reading Profile collection requirements from: %s",
@@ -72,30 +109,59 @@ class AnsibleRunner:
         "\"ansible_become_password="
         "'{{ lookup('env', 'ANSIBLE_BECOME_PASSWORD') }}'\""
     )
+    if self.refresh_facts:
+      command += " --flush-cache"
     if self.debug:
       command += " -vvvv"
     return command
 
-  def _do_install_galaxy_roles(self, galaxy_command: str) -> None:
-    click.echo(config.ANSIBLE_ROLES_MESSAGE)
-    self.process.spawn(galaxy_command)
+  def _restore_galaxy_cache(self) -> galaxy_cache.GalaxyInstall:
+    if config.GALAXY_CACHE_ENABLED and not self.force_galaxy:
+      return self.galaxy_cache.restore()
+    return self.galaxy_cache.get_install()
+
+  def _do_install_galaxy_requirements(self) -> None:
+    if self.offline:
+      click.echo(config.ANSIBLE_GALAXY_OFFLINE_MESSAGE)
+      return
+    if not self.force_galaxy and self.fingerprint.is_current():
+      click.echo(config.ANSIBLE_GALAXY_SKIPPED_MESSAGE)
+      return
+
+    click.echo(config.ANSIBLE_GALAXY_MESSAGE)
+    install = self._restore_galaxy_cache()
+    requirements_file = install.requirements_file
+    commands = {}
+    if install.roles:
+      roles_command = self._construct_galaxy_roles_command(requirements_file)
+      commands[config.ANSIBLE_GALAXY_ROLES_PREFIX] = roles_command
+    if install.collections:
+      col_command = self._construct_galaxy_col_command(requirements_file)
+      commands[config.ANSIBLE_GALAXY_COLLECTIONS_PREFIX] = col_command
+    if commands:
+      self.process.spawn_concurrently(commands)
     self.log.debug(
         "AnsibleRunner: Profile Ansible Galaxy roles have been "
         "installed to: %s",
         self.spec.roles_path[0],
     )
-
-  def _do_install_galaxy_col(self, galaxy_command: str) -> None:
-    click.echo(config.ANSIBLE_COLLECTIONS_MESSAGE)
-    self.process.spawn(galaxy_command)
     self.log.debug(
         "AnsibleRunner: Profile Ansible Galaxy collections have been "
         "installed to: %s",
         self.spec.collections_path[0],
     )
+    if config.GALAXY_CACHE_ENABLED:
+      self.galaxy_cache.store()
+    self.fingerprint.record()
 
   def _do_ansible_playbook(self, ansible_command: str) -> None:
     click.echo(config.ANSIBLE_INVOKE_MESSAGE)
     self.log.debug("AnsibleRunner: Invoking Ansible ...")
-    self.process.spawn(ansible_command)
+    self.events.reset()
+    try:
+      with self.timer.measure(config.TIMING_PHASE_PLAYBOOK):
+        with self.events.follow():
+          self.process.spawn(ansible_command)
+    finally:
+      self.timing.report()
     self.log.debug("AnsibleRunner: Ansible Playbook has finished!",)
@@ -1,7 +1,7 @@
 """Ansible provisioning job spec data."""
 
 import dataclasses
-from typing import List
+from typing import List, Optional
 
 from mac_maker.profile import Profile
 
@@ -17,12 +17,18 @@ class Spec:
   roles_path: List[str]
   collections_path: List[str]
   inventory: str
+  source_commit: Optional[str] = None
 
   @classmethod
-  def from_profile(cls, profile: Profile) -> "Spec":
+  def from_profile(
+      cls,
+      profile: Profile,
+      source_commit: Optional[str] = None,
+  ) -> "Spec":
     """Generate a provisioning spec from a profile instance.
 
     :param profile: The profile being used.
+    :param source_commit: The commit SHA the profile was retrieved from.
     :returns: The created spec instance.
     """
 
@@ -36,4 +42,5 @@ class Spec:
         roles_path=[str(profile.get_roles_path().resolve())],
         collections_path=[str(profile.get_collections_path().resolve())],
         inventory=str(profile.get_inventory_file().resolve()),
+        source_commit=source_commit,
     )
@@ -8,6 +8,7 @@ from unittest import mock
 import pytest
 from mac_maker.ansible_controller import (
     environment,
+    galaxy_cache,
     interpreter,
     inventory,
     process,
@@ -53,6 +54,29 @@ def mocked_command() -> str:
   return "ansible-galaxy install requirements -r requirements.yml"
 
 
+@pytest.fixture
+def mocked_event_stream() -> mock.Mock:
+  return mock.Mock(return_value=mock.MagicMock())
+
+
+@pytest.fixture
+def mocked_galaxy_cache(global_spec_mock: spec.Spec) -> mock.Mock:
+  instance = mock.Mock()
+  instance.get_install.return_value = galaxy_cache.GalaxyInstall(
+      requirements_file=global_spec_mock.galaxy_requirements_file,
+      roles=True,
+      collections=True,
+  )
+  instance.restore.return_value = instance.get_install.return_value
+  return mock.Mock(return_value=instance)
+
+
+@pytest.fixture
+def mocked_galaxy_fingerprint() -> mock.Mock:
+  instance = mock.Mock(**{"is_current.return_value": False})
+  return mock.Mock(return_value=instance)
+
+
 @pytest.fixture
 def mocked_os() -> mock.Mock:
   return mock.Mock()
@@ -63,6 +87,11 @@ def mocked_os_chdir() -> mock.Mock:
   return mock.Mock()
 
 
+@pytest.fixture
+def mocked_os_killpg() -> mock.Mock:
+  return mock.Mock()
+
+
 @pytest.fixture
 def mocked_popen(mocked_popen_process: mock.Mock) -> mock.Mock:
   return mock.Mock(return_value=mocked_popen_process)
@@ -73,6 +102,11 @@ def mocked_popen_process() -> mock.MagicMock:
   return mock.MagicMock()
 
 
+@pytest.fixture
+def mocked_timing_report() -> mock.Mock:
+  return mock.Mock(return_value=mock.MagicMock())
+
+
 @pytest.fixture
 def mocked_textfile_write() -> mock.Mock:
   return mock.Mock()
@@ -125,12 +159,19 @@ def setup_inventory_module(
 @pytest.fixture
 def setup_process_module(
     mocked_ansible_environment: mock.Mock,
+    mocked_click_echo: mock.Mock,
     mocked_os_chdir: mock.Mock,
+    mocked_os_killpg: mock.Mock,
     mocked_popen: mock.MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> Callable[[], None]:
 
   def setup() -> None:
+    monkeypatch.setattr(
+        process,
+        "click",
+        mock.Mock(**{"echo": mocked_click_echo}),
+    )
     monkeypatch.setattr(
         process,
         "environment",
@@ -141,6 +182,7 @@ def setup_process_module(
         "os",
         mock.Mock(**{
             "chdir": mocked_os_chdir,
+            "killpg": mocked_os_killpg,
             "path": os.path
         }),
     )
@@ -155,10 +197,29 @@ def setup_process_module(
 def setup_runner_module(
     mocked_ansible_process: mock.Mock,
     mocked_click_echo: mock.Mock,
+    mocked_event_stream: mock.Mock,
+    mocked_galaxy_cache: mock.Mock,
+    mocked_galaxy_fingerprint: mock.Mock,
+    mocked_timing_report: mock.Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> Callable[[], None]:
 
   def setup() -> None:
+    monkeypatch.setattr(
+        runner,
+        "events",
+        mock.Mock(**{"EventStream": mocked_event_stream}),
+    )
+    monkeypatch.setattr(
+        runner,
+        "galaxy_cache",
+        mock.Mock(**{"GalaxyCache": mocked_galaxy_cache}),
+    )
+    monkeypatch.setattr(
+        runner,
+        "fingerprint",
+        mock.Mock(**{"GalaxyFingerprint": mocked_galaxy_fingerprint}),
+    )
     monkeypatch.setattr(
         runner,
         "click",
@@ -169,6 +230,11 @@ def setup_runner_module(
         "process",
         mock.Mock(**{"AnsibleProcess": mocked_ansible_process}),
     )
+    monkeypatch.setattr(
+        runner,
+        "timing",
+        mock.Mock(**{"TimingReport": mocked_timing_report}),
+    )
 
   return setup
 
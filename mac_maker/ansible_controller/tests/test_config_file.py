@@ -0,0 +1,152 @@
+"""Test the AnsibleConfigFile class."""
+
+import configparser
+import dataclasses
+import logging
+from pathlib import Path
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.ansible_controller import config_file, spec
+from mac_maker.utilities.state import StateDirectory
+
+
+@pytest.fixture
+def config_file_spec(global_spec_mock: spec.Spec, tmp_path: Path) -> spec.Spec:
+  return dataclasses.replace(
+      global_spec_mock,
+      workspace_root_path=str(tmp_path),
+      profile_data_path=str(tmp_path / config.PROFILE_FOLDER_PATH),
+  )
+
+
+@pytest.fixture
+def ansible_config_file(
+    config_file_spec: spec.Spec,
+) -> config_file.AnsibleConfigFile:
+  return config_file.AnsibleConfigFile(config_file_spec)
+
+
+class TestAnsibleConfigFile:
+  """Test the AnsibleConfigFile class."""
+
+  def read(self, path: Path) -> configparser.ConfigParser:
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(path)
+    return parser
+
+  def test_initialize__attributes(
+      self,
+      ansible_config_file: config_file.AnsibleConfigFile,
+      config_file_spec: spec.Spec,
+  ) -> None:
+    profile_data_path = Path(config_file_spec.profile_data_path)
+
+    assert isinstance(ansible_config_file.log, logging.Logger)
+    assert ansible_config_file.spec == config_file_spec
+    assert ansible_config_file.path == (
+        profile_data_path / config.ANSIBLE_CONFIG_FILE
+    )
+    assert ansible_config_file.profile_path == (
+        profile_data_path / config.PROFILE_ANSIBLE_CONFIG_FILE
+    )
+
+  def test_write__no_profile_config__writes_defaults(
+      self,
+      ansible_config_file: config_file.AnsibleConfigFile,
+  ) -> None:
+    ansible_config_file.write()
+
+    written = self.read(ansible_config_file.path)
+    assert written["defaults"]["gathering"] == "smart"
+    assert written["defaults"]["fact_caching"] == "jsonfile"
+    assert written["defaults"]["fact_caching_timeout"] == str(
+        config.ANSIBLE_FACT_CACHE_TTL
+    )
+    assert written["defaults"]["fact_caching_connection"] == str(
+        StateDirectory().get_folder(config.ANSIBLE_FACT_CACHE_FOLDER)
+    )
+    assert written["defaults"]["forks"] == str(config.ANSIBLE_FORKS)
+    assert written["connection"]["pipelining"] == "True"
+
+  def test_write__profile_config__profile_settings_take_precedence(
+      self,
+      ansible_config_file: config_file.AnsibleConfigFile,
+  ) -> None:
+    ansible_config_file.profile_path.parent.mkdir(parents=True)
+    ansible_config_file.profile_path.write_text(
+        "[defaults]\n"
+        "gathering = explicit ; inline comment\n"
+        "stdout_callback = yaml\n"
+        "[privilege_escalation]\n"
+        "become_ask_pass = False\n"
+    )
+
+    ansible_config_file.write()
+
+    written = self.read(ansible_config_file.path)
+    assert written["defaults"]["gathering"] == "explicit"
+    assert written["defaults"]["stdout_callback"] == "yaml"
+    assert written["defaults"]["fact_caching"] == "jsonfile"
+    assert written["privilege_escalation"]["become_ask_pass"] == "False"
+    assert written["connection"]["pipelining"] == "True"
+
+  def test_write__profile_config__fact_cache_connection_takes_precedence(
+      self,
+      ansible_config_file: config_file.AnsibleConfigFile,
+  ) -> None:
+    ansible_config_file.profile_path.parent.mkdir(parents=True)
+    ansible_config_file.profile_path.write_text(
+        "[defaults]\nfact_caching_connection = /non/existent/facts\n"
+    )
+
+    ansible_config_file.write()
+
+    written = self.read(ansible_config_file.path)
+    assert written["defaults"]["fact_caching_connection"] == \
+        "/non/existent/facts"
+
+  def test_write__profile_config__preserves_interpolation_syntax(
+      self,
+      ansible_config_file: config_file.AnsibleConfigFile,
+  ) -> None:
+    ansible_config_file.profile_path.parent.mkdir(parents=True)
+    ansible_config_file.profile_path.write_text(
+        "[defaults]\nlog_path = %(HOME)s/ansible.log\n"
+    )
+
+    ansible_config_file.write()
+
+    written = self.read(ansible_config_file.path)
+    assert written["defaults"]["log_path"] == "%(HOME)s/ansible.log"
+
+  def test_write__existing_file__overwrites_file(
+      self,
+      ansible_config_file: config_file.AnsibleConfigFile,
+  ) -> None:
+    ansible_config_file.write()
+    ansible_config_file.profile_path.write_text(
+        "[defaults]\ngathering = implicit\n"
+    )
+
+    ansible_config_file.write()
+
+    written = self.read(ansible_config_file.path)
+    assert written["defaults"]["gathering"] == "implicit"
+
+  def test_write__logging(
+      self,
+      ansible_config_file: config_file.AnsibleConfigFile,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+
+    ansible_config_file.write()
+
+    assert decode_logs(caplog.records) == [
+        (
+            "DEBUG:mac_maker:" +
+            ansible_config_file.Messages.written % ansible_config_file.path
+        ),
+    ]
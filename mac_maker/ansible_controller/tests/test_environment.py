@@ -1,9 +1,12 @@
 """Test the AnsibleEnvironment class."""
 import os
 from logging import Logger
+from pathlib import Path
+from typing import Dict
 from unittest import mock
 
-from mac_maker.ansible_controller import environment, spec
+from mac_maker import config
+from mac_maker.ansible_controller import environment, events, spec
 
 TypeMockDict = mock._patch_dict  # pylint: disable=protected-access
 
@@ -11,6 +14,19 @@ TypeMockDict = mock._patch_dict  # pylint: disable=protected-access
 class TestAnsibleEnvironment:
   """Test the AnsibleEnvironment class."""
 
+  @staticmethod
+  def get_generated_env(global_spec_mock: spec.Spec) -> Dict[str, str]:
+    profile_data_path = Path(global_spec_mock.profile_data_path)
+    workspace_root_path = Path(global_spec_mock.workspace_root_path)
+    return {
+        'ANSIBLE_CONFIG':
+            str(profile_data_path / config.ANSIBLE_CONFIG_FILE),
+        'ANSIBLE_CALLBACK_PLUGINS':
+            str(events.EventStream.plugin_path),
+        'MAC_MAKER_EVENTS_FILE':
+            str(workspace_root_path / config.ANSIBLE_EVENTS_FILE),
+    }
+
   @staticmethod
   def mock_environment(**environment_variables: str) -> TypeMockDict:
     return mock.patch.dict(os.environ, environment_variables)
@@ -38,6 +54,7 @@ class TestAnsibleEnvironment:
     assert ansible_environment.env == {
         'ANSIBLE_ROLES_PATH': global_spec_mock.roles_path[0],
         'ANSIBLE_COLLECTIONS_PATH': global_spec_mock.collections_path[0],
+        **self.get_generated_env(global_spec_mock),
     }
 
   @mock_environment()
@@ -68,6 +85,7 @@ class TestAnsibleEnvironment:
     assert ansible_environment.env == {
         'ANSIBLE_ROLES_PATH': ":".join(global_spec_mock.roles_path),
         'ANSIBLE_COLLECTIONS_PATH': ":".join(global_spec_mock.collections_path),
+        **self.get_generated_env(global_spec_mock),
     }
 
   @mock_environment()
@@ -110,6 +128,7 @@ class TestAnsibleEnvironment:
                     '/non/existent/04',
                 ]
             ),
+        **self.get_generated_env(global_spec_mock),
     }
 
   @mock_environment(
@@ -124,3 +143,26 @@ class TestAnsibleEnvironment:
 
     for key, value in ansible_environment.env.items():
       assert os.environ[key] == value
+
+  @mock_environment(ANSIBLE_CALLBACK_PLUGINS='/non/existent/plugins')
+  def test_setup__existing_callback_plugins_env__appends_existing_paths(
+      self,
+      ansible_environment: environment.AnsibleEnvironment,
+  ) -> None:
+    ansible_environment.setup()
+
+    assert ansible_environment.env['ANSIBLE_CALLBACK_PLUGINS'] == ":".join(
+        [str(events.EventStream.plugin_path), '/non/existent/plugins']
+    )
+
+  @mock_environment(ANSIBLE_CALLBACK_PLUGINS='/non/existent/plugins')
+  def test_setup__repeated__does_not_duplicate_callback_plugins_path(
+      self,
+      ansible_environment: environment.AnsibleEnvironment,
+  ) -> None:
+    ansible_environment.setup()
+    ansible_environment.setup()
+
+    assert os.environ['ANSIBLE_CALLBACK_PLUGINS'] == ":".join(
+        [str(events.EventStream.plugin_path), '/non/existent/plugins']
+    )
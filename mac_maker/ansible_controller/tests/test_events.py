@@ -0,0 +1,191 @@
+"""Test the EventStream class."""
+
+import dataclasses
+import json
+import logging
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.ansible_controller import events, spec
+
+PLAY_START = {
+    "event": "play_start"
+}
+PLAYBOOK_END = {
+    "event": "playbook_end"
+}
+TASK_START = {
+    "event": "task_start"
+}
+
+
+@pytest.fixture
+def event_stream(
+    global_spec_mock: spec.Spec, tmp_path: Path
+) -> events.EventStream:
+  return events.EventStream(
+      dataclasses.replace(global_spec_mock, workspace_root_path=str(tmp_path))
+  )
+
+
+class TestEventStream:
+  """Test the EventStream class."""
+
+  def write(self, event_stream: events.EventStream, content: str) -> None:
+    with open(event_stream.path, "a", encoding="utf-8") as file_handle:
+      file_handle.write(content)
+
+  def create_events(self, *stream_events: events.TypeEvent) -> str:
+    return "".join(json.dumps(event) + "\n" for event in stream_events)
+
+  def test_init__attributes(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    assert isinstance(event_stream.log, logging.Logger)
+    assert event_stream.path == (
+        Path(event_stream.spec.workspace_root_path) / config.ANSIBLE_EVENTS_FILE
+    )
+    assert event_stream.listeners == []
+
+  def test_plugin_path__contains_callback_plugin(self) -> None:
+    assert (events.EventStream.plugin_path / "mac_maker_events.py").is_file()
+
+  def test_poll__no_file__returns_no_events(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    assert event_stream.poll() == []
+
+  def test_poll__complete_events__returns_events(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    self.write(event_stream, self.create_events(PLAY_START, TASK_START))
+
+    assert event_stream.poll() == [
+        PLAY_START,
+        TASK_START,
+    ]
+
+  def test_poll__called_again__returns_only_new_events(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    self.write(event_stream, self.create_events(PLAY_START))
+    event_stream.poll()
+    self.write(event_stream, self.create_events(TASK_START))
+
+    assert event_stream.poll() == [TASK_START]
+
+  def test_poll__partial_event__waits_for_complete_line(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    content = self.create_events(TASK_START)
+    self.write(event_stream, content[:5])
+
+    assert event_stream.poll() == []
+
+    self.write(event_stream, content[5:])
+
+    assert event_stream.poll() == [TASK_START]
+
+  def test_poll__invalid_events__skips_invalid_events(
+      self,
+      event_stream: events.EventStream,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.WARNING, logger=config.LOGGER_NAME)
+    self.write(
+        event_stream,
+        "not json\n[1, 2]\n\n" + self.create_events(TASK_START),
+    )
+
+    assert event_stream.poll() == [TASK_START]
+    assert decode_logs(caplog.records) == [
+        "WARNING:mac_maker:" + event_stream.Messages.invalid % b"not json",
+        "WARNING:mac_maker:" + event_stream.Messages.invalid % b"[1, 2]",
+    ]
+
+  def test_poll__subscribed_listeners__calls_listeners_in_order(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    listener1 = mock.Mock()
+    listener2 = mock.Mock()
+    event_stream.subscribe(listener1)
+    event_stream.subscribe(listener2)
+    self.write(event_stream, self.create_events(PLAY_START, TASK_START))
+
+    event_stream.poll()
+
+    expected_calls = [
+        mock.call(PLAY_START),
+        mock.call(TASK_START),
+    ]
+    assert listener1.mock_calls == expected_calls
+    assert listener2.mock_calls == expected_calls
+
+  def test_poll__logging(
+      self,
+      event_stream: events.EventStream,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    self.write(event_stream, self.create_events(PLAY_START))
+
+    event_stream.poll()
+
+    assert decode_logs(caplog.records) == [
+        "DEBUG:mac_maker:" + event_stream.Messages.event % "play_start",
+    ]
+
+  def test_reset__removes_previous_events(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    self.write(event_stream, self.create_events(PLAY_START) + "{")
+    event_stream.poll()
+
+    event_stream.reset()
+    self.write(event_stream, self.create_events(TASK_START))
+
+    assert event_stream.poll() == [TASK_START]
+
+  def test_reset__no_file__does_not_raise_exception(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    event_stream.reset()
+
+    assert not event_stream.path.exists()
+
+  def test_follow__consumes_events_written_inside_context(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    received: List[events.TypeEvent] = []
+    event_stream.subscribe(received.append)
+
+    with event_stream.follow(interval=0.01):
+      self.write(event_stream, self.create_events(PLAY_START))
+      self.write(event_stream, self.create_events(PLAYBOOK_END))
+
+    assert received == [PLAY_START, PLAYBOOK_END]
+
+  def test_follow__exception_inside_context__stops_polling(
+      self,
+      event_stream: events.EventStream,
+  ) -> None:
+    with pytest.raises(ChildProcessError):
+      with event_stream.follow(interval=0.01):
+        raise ChildProcessError
+
+    self.write(event_stream, self.create_events(PLAY_START))
+
+    assert event_stream.poll() == [PLAY_START]
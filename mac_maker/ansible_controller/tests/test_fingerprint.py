@@ -0,0 +1,165 @@
+"""Test the GalaxyFingerprint class."""
+
+import dataclasses
+import logging
+import os
+from pathlib import Path
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.ansible_controller import fingerprint, spec
+
+
+@pytest.fixture
+def fingerprint_spec(global_spec_mock: spec.Spec, tmp_path: Path) -> spec.Spec:
+  requirements_file = tmp_path / "requirements.yml"
+  requirements_file.write_text("roles: []\n")
+  (tmp_path / "roles" / "role1").mkdir(parents=True)
+  (tmp_path / "roles" / "role1" / "main.yml").write_text("---\n")
+  (tmp_path / "collections").mkdir()
+  return dataclasses.replace(
+      global_spec_mock,
+      workspace_root_path=str(tmp_path),
+      galaxy_requirements_file=str(requirements_file),
+      roles_path=[str(tmp_path / "roles")],
+      collections_path=[str(tmp_path / "collections")],
+  )
+
+
+@pytest.fixture
+def galaxy_fingerprint(
+    fingerprint_spec: spec.Spec,
+) -> fingerprint.GalaxyFingerprint:
+  return fingerprint.GalaxyFingerprint(fingerprint_spec)
+
+
+class TestGalaxyFingerprint:
+  """Test the GalaxyFingerprint class."""
+
+  def test_init__attributes(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+      fingerprint_spec: spec.Spec,
+  ) -> None:
+    assert isinstance(galaxy_fingerprint.log, logging.Logger)
+    assert galaxy_fingerprint.spec == fingerprint_spec
+    assert galaxy_fingerprint.path == (
+        Path(fingerprint_spec.workspace_root_path) /
+        config.GALAXY_FINGERPRINT_FILE
+    )
+
+  def test_compute__unchanged__returns_same_fingerprint(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+  ) -> None:
+    assert galaxy_fingerprint.compute() == galaxy_fingerprint.compute()
+
+  def test_compute__requirements_changed__returns_new_fingerprint(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+      fingerprint_spec: spec.Spec,
+  ) -> None:
+    original = galaxy_fingerprint.compute()
+
+    Path(fingerprint_spec.galaxy_requirements_file).write_text("roles: [a]\n")
+
+    assert galaxy_fingerprint.compute() != original
+
+  def test_compute__installed_file_added__returns_new_fingerprint(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+      fingerprint_spec: spec.Spec,
+  ) -> None:
+    original = galaxy_fingerprint.compute()
+
+    (Path(fingerprint_spec.collections_path[0]) / "MANIFEST.json").touch()
+
+    assert galaxy_fingerprint.compute() != original
+
+  def test_compute__installed_file_modified__returns_new_fingerprint(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+      fingerprint_spec: spec.Spec,
+  ) -> None:
+    original = galaxy_fingerprint.compute()
+    role_file = Path(fingerprint_spec.roles_path[0]) / "role1" / "main.yml"
+
+    os.utime(role_file, ns=(0, 0))
+
+    assert galaxy_fingerprint.compute() != original
+
+  def test_compute__installed_file_removed__returns_new_fingerprint(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+      fingerprint_spec: spec.Spec,
+  ) -> None:
+    original = galaxy_fingerprint.compute()
+
+    (Path(fingerprint_spec.roles_path[0]) / "role1" / "main.yml").unlink()
+
+    assert galaxy_fingerprint.compute() != original
+
+  def test_is_current__not_recorded__returns_false(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+  ) -> None:
+    assert galaxy_fingerprint.is_current() is False
+
+  def test_is_current__recorded__returns_true(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+  ) -> None:
+    galaxy_fingerprint.record()
+
+    assert galaxy_fingerprint.is_current() is True
+
+  def test_is_current__recorded__changed__returns_false(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+      fingerprint_spec: spec.Spec,
+  ) -> None:
+    galaxy_fingerprint.record()
+
+    Path(fingerprint_spec.galaxy_requirements_file).write_text("roles: [a]\n")
+
+    assert galaxy_fingerprint.is_current() is False
+
+  def test_is_current__recorded__logging(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    galaxy_fingerprint.record()
+    caplog.clear()
+
+    galaxy_fingerprint.is_current()
+
+    assert decode_logs(caplog.records) == [
+        "DEBUG:mac_maker:" +
+        galaxy_fingerprint.Messages.current % galaxy_fingerprint.compute(),
+    ]
+
+  def test_is_current__not_recorded__logging(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+
+    galaxy_fingerprint.is_current()
+
+    assert decode_logs(caplog.records) == [
+        "DEBUG:mac_maker:" + galaxy_fingerprint.Messages.stale,
+    ]
+
+  def test_record__writes_fingerprint(
+      self,
+      galaxy_fingerprint: fingerprint.GalaxyFingerprint,
+  ) -> None:
+    galaxy_fingerprint.record()
+
+    assert galaxy_fingerprint.load_json_file(galaxy_fingerprint.path) == {
+        "fingerprint": galaxy_fingerprint.compute()
+    }
@@ -0,0 +1,576 @@
+"""Test the GalaxyCache class."""
+
+import dataclasses
+import json
+import logging
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+import yaml
+from mac_maker import config
+from mac_maker.ansible_controller import galaxy_cache, spec
+from mac_maker.utilities.file_copier import FileCopier
+
+
+@pytest.fixture
+def cache_spec(
+    global_spec_mock: spec.Spec,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> spec.Spec:
+  monkeypatch.setenv(config.ENV_MAC_MAKER_HOME, str(tmp_path / "state"))
+  profile = tmp_path / "profile"
+  profile.mkdir()
+  return dataclasses.replace(
+      global_spec_mock,
+      workspace_root_path=str(profile),
+      galaxy_requirements_file=str(profile / "requirements.yml"),
+      roles_path=[str(profile / "roles")],
+      collections_path=[str(profile / "collections")],
+  )
+
+
+@pytest.fixture
+def cache(cache_spec: spec.Spec) -> galaxy_cache.GalaxyCache:
+  return galaxy_cache.GalaxyCache(cache_spec)
+
+
+def write_requirements(cache_spec: spec.Spec, content: Any) -> None:
+  Path(cache_spec.galaxy_requirements_file).write_text(yaml.safe_dump(content))
+
+
+def install_role(
+    cache_spec: spec.Spec,
+    name: str,
+    version: str,
+    meta: Optional[Dict[str, Any]] = None,
+) -> Path:
+  role = Path(cache_spec.roles_path[0]) / name
+  (role / "meta").mkdir(parents=True)
+  (role / "meta" / ".galaxy_install_info").write_text(f"version: {version}\n")
+  (role / "meta" / "main.yml").write_text(yaml.safe_dump(meta or {}))
+  (role / "tasks").mkdir()
+  (role / "tasks" / "main.yml").write_text(f"# {name} {version}\n")
+  return role
+
+
+def install_collection(
+    cache_spec: spec.Spec,
+    name: str,
+    version: str,
+    dependencies: Optional[Dict[str, str]] = None,
+) -> Path:
+  namespace, collection_name = name.split(".")
+  root = Path(cache_spec.collections_path[0]) / "ansible_collections"
+  collection = root / namespace / collection_name
+  collection.mkdir(parents=True)
+  (collection / "MANIFEST.json").write_text(
+      json.dumps(
+          {
+              "collection_info":
+                  {
+                      "version": version,
+                      "dependencies": dependencies or {},
+                  }
+          }
+      )
+  )
+  (collection / "plugins").mkdir()
+  (collection / "plugins" / "module.py").write_text(f"# {name} {version}\n")
+  (root / f"{name}-{version}.info").mkdir()
+  (root / f"{name}-{version}.info" / "GALAXY.yml").write_text("version: 1\n")
+  return collection
+
+
+def get_cached(cache: galaxy_cache.GalaxyCache) -> Dict[str, Dict[str, Any]]:
+  cached = {}
+  for artifact_file in cache.root.glob(
+      f"*/{config.GALAXY_CACHE_ARTIFACT_FILE}"
+  ):
+    metadata = json.loads(artifact_file.read_text())
+    cached[":".join(metadata["artifact"])] = metadata
+  return cached
+
+
+def remove_installed(cache_spec: spec.Spec) -> None:
+  for path in (cache_spec.roles_path[0], cache_spec.collections_path[0]):
+    for folder, _, file_names in os.walk(path):
+      for file_name in file_names:
+        os.chmod(os.path.join(folder, file_name), 0o644)
+  for path in (cache_spec.roles_path[0], cache_spec.collections_path[0]):
+    if os.path.exists(path):
+      shutil.rmtree(path)
+
+
+class TestGalaxyArtifact:
+  """Test the GalaxyArtifact class."""
+
+  def test_get_key__returns_key(self) -> None:
+    artifact = galaxy_cache.GalaxyArtifact("role", "namespace.role", "1.0.0")
+
+    assert artifact.get_key() == "role:namespace.role:1.0.0"
+
+
+class TestGalaxyCache:
+  """Test the GalaxyCache class."""
+
+  def test_init__attributes(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+      tmp_path: Path,
+  ) -> None:
+    assert isinstance(cache.log, logging.Logger)
+    assert isinstance(cache.copier, FileCopier)
+    assert cache.spec == cache_spec
+    assert cache.root == (tmp_path / "state" /
+                          config.GALAXY_CACHE_FOLDER).resolve()
+    assert cache.pending_file == (
+        Path(cache_spec.workspace_root_path) /
+        config.GALAXY_CACHE_REQUIREMENTS_FILE
+    )
+
+  def test_get_install__returns_all_requirements(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    assert cache.get_install() == galaxy_cache.GalaxyInstall(
+        requirements_file=cache_spec.galaxy_requirements_file,
+        roles=True,
+        collections=True,
+    )
+
+  @pytest.mark.parametrize(
+      "kind,entry,expected",
+      [
+          (
+              "role", {
+                  "name": "ns.role",
+                  "version": "1.0.0"
+              }, ("role", "ns.role", "1.0.0")
+          ),
+          (
+              "role", {
+                  "src": "ns.my-role",
+                  "version": "v1.0"
+              }, ("role", "ns.my-role", "v1.0")
+          ),
+          (
+              "role", {
+                  "src": "ns.role",
+                  "name": "alias",
+                  "version": "1.0.0"
+              }, ("role", "alias", "1.0.0")
+          ),
+          ("role", {
+              "name": "ns.role"
+          }, None),
+          (
+              "role", {
+                  "src": "https://github.com/ns/role.git",
+                  "name": "role",
+                  "version": "1.0.0"
+              }, None
+          ),
+          ("role", {
+              "src": "ns.role",
+              "scm": "git",
+              "version": "1.0.0"
+          }, None),
+          ("role", "ns.role,1.0.0", None),
+          (
+              "collection", {
+                  "name": "ns.col",
+                  "version": "1.0.0"
+              }, ("collection", "ns.col", "1.0.0")
+          ),
+          (
+              "collection", {
+                  "name": "ns.col",
+                  "version": "==1.0.0"
+              }, ("collection", "ns.col", "1.0.0")
+          ),
+          ("collection", {
+              "name": "ns.col",
+              "version": ">=1.0.0"
+          }, None),
+          ("collection", {
+              "name": "ns.col",
+              "version": "*"
+          }, None),
+          (
+              "collection", {
+                  "name": "ns.col",
+                  "version": "1.0.0",
+                  "type": "git"
+              }, None
+          ),
+          ("collection", {
+              "name": "/path/to/ns.col",
+              "version": "1.0.0"
+          }, None),
+          ("collection", "ns.col", None),
+      ],
+  )
+  def test_get_artifact__vary_requirement__returns_pinned_artifacts(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      kind: str,
+      entry: Any,
+      expected: Optional[tuple],
+  ) -> None:
+    assert cache._get_artifact(  # pylint: disable=protected-access
+        kind,
+        entry,
+    ) == (galaxy_cache.GalaxyArtifact(*expected) if expected else None)
+
+  def test_store__installed__caches_artifacts(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "roles": [{
+                "name": "ns.role",
+                "version": "1.0.0"
+            }],
+            "collections": [{
+                "name": "ns.col",
+                "version": "2.0.0"
+            }],
+        }
+    )
+    install_role(cache_spec, "ns.role", "1.0.0")
+    install_collection(cache_spec, "ns.col", "2.0.0")
+
+    cache.store()
+
+    cached = get_cached(cache)
+    assert cached["role:ns.role:1.0.0"]["paths"] == ["ns.role"]
+    assert cached["collection:ns.col:2.0.0"]["paths"] == [
+        "ansible_collections/ns/col",
+        "ansible_collections/ns.col-2.0.0.info",
+    ]
+
+  def test_store__installed__cached_files_are_read_only(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "roles": [{
+                "name": "ns.role",
+                "version": "1.0.0"
+            }]
+        }
+    )
+    install_role(cache_spec, "ns.role", "1.0.0")
+
+    cache.store()
+
+    cached_files = list(cache.root.glob("*/content/ns.role/tasks/main.yml"))
+    assert len(cached_files) == 1
+    assert not cached_files[0].stat().st_mode & stat.S_IWUSR
+
+  def test_store__wrong_version_installed__does_not_cache(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "roles": [{
+                "name": "ns.role",
+                "version": "1.0.0"
+            }]
+        }
+    )
+    install_role(cache_spec, "ns.role", "0.9.0")
+
+    cache.store()
+
+    assert not get_cached(cache)
+
+  def test_store__role_with_dependencies__does_not_cache(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "roles": [{
+                "name": "ns.role",
+                "version": "1.0.0"
+            }]
+        }
+    )
+    install_role(
+        cache_spec,
+        "ns.role",
+        "1.0.0",
+        meta={
+            "dependencies": ["ns.other"]
+        },
+    )
+
+    cache.store()
+
+    assert not get_cached(cache)
+
+  def test_store__collection_with_dependencies__caches_dependencies(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "collections": [{
+                "name": "ns.col",
+                "version": "2.0.0"
+            }]
+        }
+    )
+    install_collection(cache_spec, "ns.col", "2.0.0", {
+        "ns.dep": ">=1.0.0"
+    })
+    install_collection(cache_spec, "ns.dep", "1.5.0")
+
+    cache.store()
+
+    cached = get_cached(cache)
+    assert cached["collection:ns.col:2.0.0"]["dependencies"] == [
+        ["collection", "ns.dep", "1.5.0"]
+    ]
+    assert "collection:ns.dep:1.5.0" in cached
+
+  def test_store__collection_dependency_missing__does_not_cache(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "collections": [{
+                "name": "ns.col",
+                "version": "2.0.0"
+            }]
+        }
+    )
+    install_collection(cache_spec, "ns.col", "2.0.0", {
+        "ns.dep": ">=1.0.0"
+    })
+
+    cache.store()
+
+    assert not get_cached(cache)
+
+  def test_store__identical_artifacts__stored_once(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+      tmp_path: Path,
+  ) -> None:
+    requirements = {
+        "roles": [{
+            "name": "ns.role",
+            "version": "1.0.0"
+        }]
+    }
+    write_requirements(cache_spec, requirements)
+    install_role(cache_spec, "ns.role", "1.0.0")
+    other_spec = dataclasses.replace(
+        cache_spec,
+        workspace_root_path=str(tmp_path / "other"),
+        roles_path=[str(tmp_path / "other" / "roles")],
+    )
+    install_role(other_spec, "ns.role", "1.0.0")
+
+    cache.store()
+    galaxy_cache.GalaxyCache(other_spec).store()
+
+    assert len(list(cache.root.iterdir())) == 1
+
+  def test_restore__not_cached__returns_all_requirements(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "roles": [{
+                "name": "ns.role",
+                "version": "1.0.0"
+            }]
+        }
+    )
+
+    assert cache.restore() == cache.get_install()
+    assert not cache.pending_file.exists()
+
+  def test_restore__no_requirements_file__returns_all_requirements(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+  ) -> None:
+    assert cache.restore() == cache.get_install()
+
+  def test_restore__cached__restores_artifacts(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "roles": [{
+                "name": "ns.role",
+                "version": "1.0.0"
+            }],
+            "collections": [{
+                "name": "ns.col",
+                "version": "2.0.0"
+            }],
+        }
+    )
+    install_role(cache_spec, "ns.role", "1.0.0")
+    install_collection(cache_spec, "ns.col", "2.0.0", {
+        "ns.dep": "*"
+    })
+    install_collection(cache_spec, "ns.dep", "1.5.0")
+    cache.store()
+    remove_installed(cache_spec)
+
+    result = cache.restore()
+
+    collections = Path(cache_spec.collections_path[0]) / "ansible_collections"
+    assert result == galaxy_cache.GalaxyInstall(
+        requirements_file=str(cache.pending_file),
+        roles=False,
+        collections=False,
+    )
+    assert (Path(cache_spec.roles_path[0]) / "ns.role" / "tasks" /
+            "main.yml").read_text() == "# ns.role 1.0.0\n"
+    assert (collections / "ns" / "col" / "MANIFEST.json").exists()
+    assert (collections / "ns.col-2.0.0.info" / "GALAXY.yml").exists()
+    assert (collections / "ns" / "dep" / "MANIFEST.json").exists()
+
+  def test_restore__partially_cached__writes_pending_requirements(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    unpinned = {
+        "name": "ns.other"
+    }
+    write_requirements(
+        cache_spec, {
+            "roles": [{
+                "name": "ns.role",
+                "version": "1.0.0"
+            }, unpinned],
+            "collections": [{
+                "name": "ns.col",
+                "version": "2.0.0"
+            }],
+        }
+    )
+    install_role(cache_spec, "ns.role", "1.0.0")
+    cache.store()
+    remove_installed(cache_spec)
+
+    result = cache.restore()
+
+    assert result == galaxy_cache.GalaxyInstall(
+        requirements_file=str(cache.pending_file),
+        roles=True,
+        collections=True,
+    )
+    assert yaml.safe_load(cache.pending_file.read_text()) == {
+        "roles": [unpinned],
+        "collections": [{
+            "name": "ns.col",
+            "version": "2.0.0"
+        }],
+    }
+
+  def test_restore__older_version_installed__replaces_it(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "collections": [{
+                "name": "ns.col",
+                "version": "2.0.0"
+            }]
+        }
+    )
+    install_collection(cache_spec, "ns.col", "2.0.0")
+    cache.store()
+    remove_installed(cache_spec)
+    install_collection(cache_spec, "ns.col", "1.0.0")
+
+    cache.restore()
+
+    collections = Path(cache_spec.collections_path[0]) / "ansible_collections"
+    assert (collections / "ns" / "col" / "plugins" /
+            "module.py").read_text() == "# ns.col 2.0.0\n"
+    assert not (collections / "ns.col-1.0.0.info").exists()
+
+  def test_restore__dependency_evicted__returns_all_requirements(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "collections": [{
+                "name": "ns.col",
+                "version": "2.0.0"
+            }]
+        }
+    )
+    install_collection(cache_spec, "ns.col", "2.0.0", {
+        "ns.dep": "*"
+    })
+    install_collection(cache_spec, "ns.dep", "1.5.0")
+    cache.store()
+    remove_installed(cache_spec)
+    for artifact_file in cache.root.glob("*/artifact.json"):
+      if "ns.dep" in artifact_file.read_text():
+        artifact_file.unlink()
+
+    assert cache.restore() == cache.get_install()
+
+  def test_restore__corrupted_artifact__logs_warning(
+      self,
+      cache: galaxy_cache.GalaxyCache,
+      cache_spec: spec.Spec,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    write_requirements(
+        cache_spec, {
+            "roles": [{
+                "name": "ns.role",
+                "version": "1.0.0"
+            }]
+        }
+    )
+    install_role(cache_spec, "ns.role", "1.0.0")
+    cache.store()
+    remove_installed(cache_spec)
+    for content in cache.root.glob("*/content"):
+      for folder, _, file_names in os.walk(content):
+        for file_name in file_names:
+          os.chmod(os.path.join(folder, file_name), 0o644)
+      shutil.rmtree(content)
+
+    assert cache.restore() == cache.get_install()
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+    assert not (Path(cache_spec.roles_path[0]) / "ns.role").exists()
@@ -2,8 +2,11 @@
 
 import logging
 import os
+import signal
 import sys
+import threading
 from logging import Logger
+from typing import List
 from unittest import mock
 
 import pytest
@@ -42,7 +45,11 @@ class TestAnsibleProcess:
     except ChildProcessError:
       pass
 
-    mocked_popen.assert_called_once_with(mocked_command, shell=True)
+    mocked_popen.assert_called_once_with(
+        mocked_command,
+        cwd=ansible_process.spec.profile_data_path,
+        shell=True,
+    )
     mocked_popen_process.__enter__.return_value.wait.assert_called_once_with()
 
   @pytest.mark.parametrize("return_code", [0, 1])
@@ -69,12 +76,13 @@ class TestAnsibleProcess:
             f'{sys.executable} '
             f'{os.path.join(mocked_bundle_path, "bin", mocked_command)}'
         ),
+        cwd=ansible_process_frozen.spec.profile_data_path,
         shell=True,
     )
     mocked_popen_process.__enter__.return_value.wait.assert_called_once_with()
 
   @pytest.mark.parametrize("return_code", [0, 1])
-  def test_spawn__vary_return_code__changes_directory(
+  def test_spawn__vary_return_code__does_not_change_directory(
       self,
       ansible_process: process.AnsibleProcess,
       mocked_command: str,
@@ -90,9 +98,7 @@ class TestAnsibleProcess:
     except ChildProcessError:
       pass
 
-    mocked_os_chdir.assert_called_once_with(
-        ansible_process.spec.profile_data_path
-    )
+    mocked_os_chdir.assert_not_called()
 
   @pytest.mark.parametrize("return_code", [0, 1])
   def test_spawn__vary_return_code__sets_environment(
@@ -172,3 +178,172 @@ class TestAnsibleProcess:
         f"DEBUG:mac_maker:AnsibleProcess: Spawned worker process {999}",
         "ERROR:mac_maker:AnsibleProcess: Command failed to execute!",
     ]
+
+
+class TestAnsibleProcessConcurrent:
+  """Test the AnsibleProcess class, spawning concurrent commands."""
+
+  commands = {
+      "one": "command1",
+      "two": "command2"
+  }
+  commands_single = {
+      "one": "command1"
+  }
+
+  def create_worker(
+      self,
+      pid: int,
+      return_code: int,
+      output: List[str],
+  ) -> mock.Mock:
+    worker = mock.MagicMock(pid=pid)
+    worker.stdout.__iter__.return_value = output
+    worker.wait.return_value = return_code
+    worker.poll.return_value = return_code
+    return worker
+
+  def create_blocked_worker(self, pid: int) -> mock.Mock:
+    terminated = threading.Event()
+    worker = self.create_worker(pid, -15, [])
+    worker.poll.return_value = None
+    worker.wait.side_effect = lambda: terminated.wait() and -15
+    worker.terminate_event = terminated
+    return worker
+
+  def test_spawn_concurrently__calls_subprocess(
+      self,
+      ansible_process: process.AnsibleProcess,
+      mocked_popen: mock.Mock,
+  ) -> None:
+    mocked_popen.side_effect = [
+        self.create_worker(998, 0, []),
+        self.create_worker(999, 0, []),
+    ]
+
+    ansible_process.spawn_concurrently(self.commands)
+
+    assert mocked_popen.call_args_list == [
+        mock.call(
+            command,
+            cwd=ansible_process.spec.profile_data_path,
+            shell=True,
+            stdout=process.subprocess.PIPE,
+            stderr=process.subprocess.STDOUT,
+            text=True,
+            start_new_session=True,
+        ) for command in ("command1", "command2")
+    ]
+
+  def test_spawn_concurrently__sets_environment_once(
+      self,
+      ansible_process: process.AnsibleProcess,
+      mocked_ansible_environment: mock.Mock,
+      mocked_popen: mock.Mock,
+  ) -> None:
+    mocked_popen.side_effect = [
+        self.create_worker(998, 0, []),
+        self.create_worker(999, 0, []),
+    ]
+
+    ansible_process.spawn_concurrently(self.commands)
+
+    mocked_ansible_environment.assert_called_once_with(ansible_process.spec)
+    mocked_ansible_environment.return_value.setup.assert_called_once_with()
+
+  def test_spawn_concurrently__streams_prefixed_output(
+      self,
+      ansible_process: process.AnsibleProcess,
+      mocked_click_echo: mock.Mock,
+      mocked_popen: mock.Mock,
+  ) -> None:
+    mocked_popen.side_effect = [
+        self.create_worker(998, 0, ["line1\n", "line2\n"]),
+        self.create_worker(999, 0, ["line3\n"]),
+    ]
+
+    ansible_process.spawn_concurrently(self.commands)
+
+    assert sorted(mocked_click_echo.call_args_list) == [
+        mock.call("[one] line1"),
+        mock.call("[one] line2"),
+        mock.call("[two] line3"),
+    ]
+
+  def test_spawn_concurrently__success__correct_logging(
+      self,
+      ansible_process: process.AnsibleProcess,
+      mocked_popen: mock.Mock,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG)
+    mocked_popen.side_effect = [self.create_worker(999, 0, [])]
+
+    ansible_process.spawn_concurrently(self.commands_single)
+
+    assert decode_logs(caplog.records) == [
+        (
+            "DEBUG:mac_maker:AnsibleProcess: "
+            "Preparing to launch Ansible Processes."
+        ),
+        "DEBUG:mac_maker:AnsibleProcess: Executing 'command1'",
+        "DEBUG:mac_maker:AnsibleProcess: Spawned worker process 999",
+        "DEBUG:mac_maker:AnsibleProcess: Commands completed successfully!",
+    ]
+
+  def test_spawn_concurrently__success__does_not_terminate(
+      self,
+      ansible_process: process.AnsibleProcess,
+      mocked_os_killpg: mock.Mock,
+      mocked_popen: mock.Mock,
+  ) -> None:
+    mocked_popen.side_effect = [
+        self.create_worker(998, 0, []),
+        self.create_worker(999, 0, []),
+    ]
+
+    ansible_process.spawn_concurrently(self.commands)
+
+    mocked_os_killpg.assert_not_called()
+
+  def test_spawn_concurrently__fail__terminates_remaining_processes(
+      self,
+      ansible_process: process.AnsibleProcess,
+      mocked_os_killpg: mock.Mock,
+      mocked_popen: mock.Mock,
+  ) -> None:
+    blocked_worker = self.create_blocked_worker(999)
+    mocked_os_killpg.side_effect = lambda pid, sig: (
+        blocked_worker.terminate_event.set()
+    )
+    mocked_popen.side_effect = [
+        self.create_worker(998, 1, []),
+        blocked_worker,
+    ]
+
+    with pytest.raises(ChildProcessError):
+      ansible_process.spawn_concurrently(self.commands)
+
+    mocked_os_killpg.assert_called_once_with(999, signal.SIGTERM)
+
+  def test_spawn_concurrently__fail__correct_logging(
+      self,
+      ansible_process: process.AnsibleProcess,
+      mocked_popen: mock.Mock,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG)
+    mocked_popen.side_effect = [self.create_worker(999, 1, [])]
+
+    with pytest.raises(ChildProcessError):
+      ansible_process.spawn_concurrently(self.commands_single)
+
+    assert decode_logs(caplog.records) == [
+        (
+            "DEBUG:mac_maker:AnsibleProcess: "
+            "Preparing to launch Ansible Processes."
+        ),
+        "DEBUG:mac_maker:AnsibleProcess: Executing 'command1'",
+        "DEBUG:mac_maker:AnsibleProcess: Spawned worker process 999",
+        "ERROR:mac_maker:AnsibleProcess: Command 'one' failed to execute!",
+    ]
@@ -1,13 +1,22 @@
 """Test the AnsibleRunner class."""
 
 import logging
-from typing import Dict, List
+from typing import Any, Callable, Dict, List
 from unittest import mock
 
 import pytest
 from mac_maker import config
 from mac_maker.__helpers__.logs import decode_logs
-from mac_maker.ansible_controller import process, runner, spec
+from mac_maker.ansible_controller import (
+    events,
+    fingerprint,
+    galaxy_cache,
+    process,
+    runner,
+    spec,
+    timing,
+)
+from mac_maker.utilities import phase_timer
 
 RUNNER_MODULE = runner.__name__
 
@@ -15,40 +24,51 @@ RUNNER_MODULE = runner.__name__
 class TestAnsibleRunner:
   """Test the AnsibleRunner class."""
 
-  def create_commands(
+  def create_galaxy_commands(
       self,
       global_spec_mock: spec.Spec,
-      debug: bool,
-  ) -> List[str]:
+  ) -> Dict[str, str]:
     requirements_file_path = global_spec_mock.galaxy_requirements_file
     roles_file_path = global_spec_mock.roles_path[0]
     collections_file_path = global_spec_mock.collections_path[0]
+
+    return {
+        config.ANSIBLE_GALAXY_ROLES_PREFIX:
+            (
+                "ansible-galaxy role install -r"
+                f" {requirements_file_path}"
+                f" -p {roles_file_path}"
+            ),
+        config.ANSIBLE_GALAXY_COLLECTIONS_PREFIX:
+            (
+                "ansible-galaxy collection install -r"
+                f" {requirements_file_path}"
+                f" -p {collections_file_path}"
+            ),
+    }
+
+  def create_playbook_command(
+      self,
+      global_spec_mock: spec.Spec,
+      debug: bool,
+      refresh_facts: bool = False,
+  ) -> str:
     playbook_file = global_spec_mock.playbook
     inventory_file = global_spec_mock.inventory
 
     debug_flag = " -vvvv" if debug else ""
-
-    return [
-        (
-            "ansible-galaxy role install -r"
-            f" {requirements_file_path}"
-            f" -p {roles_file_path}"
-        ),
-        (
-            "ansible-galaxy collection install -r"
-            f" {requirements_file_path}"
-            f" -p {collections_file_path}"
-        ),
-        (
-            "ansible-playbook"
-            f" {playbook_file}"
-            f" -i {inventory_file}"
-            " -e "
-            "\"ansible_become_password="
-            "'{{ lookup('env', 'ANSIBLE_BECOME_PASSWORD') }}'\""
-            f"{debug_flag}"
-        ),
-    ]
+    refresh_facts_flag = " --flush-cache" if refresh_facts else ""
+
+    return (
+        "ansible-playbook"
+        f" {playbook_file}"
+        f" -i {inventory_file}"
+        " -e "
+        "\"ansible_become_password="
+        "'{{ lookup('env', 'ANSIBLE_BECOME_PASSWORD') }}'\""
+        f"{refresh_facts_flag}"
+        f"{debug_flag}"
+    )
 
   def create_logging_messages(
       self,
@@ -93,7 +113,7 @@ class TestAnsibleRunner:
   def test_init__attributes(
       self,
       global_spec_mock: spec.Spec,
-      kwargs: Dict[str, bool],
+      kwargs: Dict[str, Any],
       expected_debug: bool,
   ) -> None:
 
@@ -105,7 +125,16 @@ class TestAnsibleRunner:
     assert isinstance(instance.log, logging.Logger)
     assert instance.spec == global_spec_mock
     assert instance.debug == expected_debug
+    assert instance.force_galaxy is False
+    assert instance.refresh_facts is False
+    assert instance.offline is False
     assert isinstance(instance.process, process.AnsibleProcess)
+    assert isinstance(instance.fingerprint, fingerprint.GalaxyFingerprint)
+    assert isinstance(instance.galaxy_cache, galaxy_cache.GalaxyCache)
+    assert isinstance(instance.events, events.EventStream)
+    assert isinstance(instance.timer, phase_timer.PhaseTimer)
+    assert isinstance(instance.timing, timing.TimingReport)
+    assert instance.events.listeners == [instance.timing.record]
 
   def test_init__ansible_process(
       self,
@@ -115,6 +144,57 @@ class TestAnsibleRunner:
     mocked_ansible_process.assert_called_with(ansible_runner.spec)
     assert ansible_runner.process == mocked_ansible_process.return_value
 
+  def test_init__galaxy_fingerprint(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_galaxy_fingerprint: mock.Mock,
+  ) -> None:
+    mocked_galaxy_fingerprint.assert_called_with(ansible_runner.spec)
+    assert ansible_runner.fingerprint == mocked_galaxy_fingerprint.return_value
+
+  def test_init__galaxy_cache(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_galaxy_cache: mock.Mock,
+  ) -> None:
+    mocked_galaxy_cache.assert_called_with(ansible_runner.spec)
+    assert ansible_runner.galaxy_cache == mocked_galaxy_cache.return_value
+
+  def test_init__event_stream(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_event_stream: mock.Mock,
+  ) -> None:
+    mocked_event_stream.assert_called_with(ansible_runner.spec)
+    assert ansible_runner.events == mocked_event_stream.return_value
+
+  def test_init__timer(
+      self,
+      global_spec_mock: spec.Spec,
+      setup_runner_module: Callable[[], None],
+  ) -> None:
+    setup_runner_module()
+    timer = phase_timer.PhaseTimer()
+
+    instance = runner.AnsibleRunner(global_spec_mock, timer=timer)
+
+    assert instance.timer is timer
+
+  def test_init__timing_report(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_event_stream: mock.Mock,
+      mocked_timing_report: mock.Mock,
+  ) -> None:
+    mocked_timing_report.assert_called_with(
+        ansible_runner.spec,
+        ansible_runner.timer,
+    )
+    assert ansible_runner.timing == mocked_timing_report.return_value
+    mocked_event_stream.return_value.subscribe.assert_called_once_with(
+        mocked_timing_report.return_value.record
+    )
+
   @pytest.mark.parametrize("debug", (True, False))
   def test_start__vary_debug__all_processes_succeed__calls_spawn(
       self,
@@ -124,19 +204,149 @@ class TestAnsibleRunner:
       debug: bool,
   ) -> None:
     ansible_runner.debug = debug
-    mocked_ansible_process.return_value.spawn.side_effect = (
-        None,
-        None,
-        ChildProcessError,
+
+    ansible_runner.start()
+
+    mocked_ansible_process.return_value.spawn_concurrently.\
+        assert_called_once_with(self.create_galaxy_commands(global_spec_mock))
+    mocked_ansible_process.return_value.spawn.assert_called_once_with(
+        self.create_playbook_command(global_spec_mock, debug)
+    )
+
+  @pytest.mark.parametrize("debug", (True, False))
+  def test_start__vary_debug__refresh_facts__calls_spawn(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      global_spec_mock: spec.Spec,
+      mocked_ansible_process: mock.Mock,
+      debug: bool,
+  ) -> None:
+    ansible_runner.debug = debug
+    ansible_runner.refresh_facts = True
+
+    ansible_runner.start()
+
+    mocked_ansible_process.return_value.spawn.assert_called_once_with(
+        self.create_playbook_command(global_spec_mock, debug, True)
+    )
+
+  def test_start__all_processes_succeed__returns_true(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+  ) -> None:
+    assert ansible_runner.start() is True
+
+  def test_start__galaxy_processes_fail__returns_false(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+  ) -> None:
+    mocked_ansible_process.return_value.spawn_concurrently.side_effect = (
+        ChildProcessError
+    )
+
+    assert ansible_runner.start() is False
+
+  def test_start__playbook_process_fails__returns_false(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+  ) -> None:
+    mocked_ansible_process.return_value.spawn.side_effect = ChildProcessError
+
+    assert ansible_runner.start() is False
+
+  def test_start__all_processes_succeed__follows_event_stream(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+      mocked_event_stream: mock.Mock,
+  ) -> None:
+    call_order = mock.Mock()
+    call_order.attach_mock(mocked_event_stream.return_value, "events")
+    call_order.attach_mock(mocked_ansible_process.return_value.spawn, "spawn")
+
+    ansible_runner.start()
+
+    assert call_order.mock_calls == [
+        mock.call.events.reset(),
+        mock.call.events.follow(),
+        mock.call.events.follow().__enter__(),
+        mock.call.spawn(mock.ANY),
+        mock.call.events.follow().__exit__(None, None, None),
+    ]
+
+  def test_start__all_processes_succeed__reports_timing(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+      mocked_timing_report: mock.Mock,
+  ) -> None:
+    ansible_runner.timer = mock.MagicMock()
+    call_order = mock.Mock()
+    call_order.attach_mock(ansible_runner.timer, "timer")
+    call_order.attach_mock(mocked_timing_report.return_value, "timing")
+    call_order.attach_mock(
+        mocked_ansible_process.return_value.spawn_concurrently,
+        "spawn_concurrently",
     )
+    call_order.attach_mock(mocked_ansible_process.return_value.spawn, "spawn")
 
     ansible_runner.start()
 
-    assert mocked_ansible_process.return_value.spawn.call_args_list == [
-        mock.call(command)
-        for command in self.create_commands(global_spec_mock, debug)
+    assert call_order.mock_calls == [
+        mock.call.timer.measure(config.TIMING_PHASE_GALAXY),
+        mock.call.timer.measure().__enter__(),
+        mock.call.spawn_concurrently(mock.ANY),
+        mock.call.timer.measure().__exit__(None, None, None),
+        mock.call.timer.measure(config.TIMING_PHASE_PLAYBOOK),
+        mock.call.timer.measure().__enter__(),
+        mock.call.spawn(mock.ANY),
+        mock.call.timer.measure().__exit__(None, None, None),
+        mock.call.timing.report(),
     ]
 
+  def test_start__playbook_process_fails__reports_timing(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+      mocked_timing_report: mock.Mock,
+  ) -> None:
+    mocked_ansible_process.return_value.spawn.side_effect = ChildProcessError
+
+    ansible_runner.start()
+
+    mocked_timing_report.return_value.report.assert_called_once_with()
+
+  def test_start__galaxy_processes_fail__does_not_report_timing(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+      mocked_timing_report: mock.Mock,
+  ) -> None:
+    mocked_ansible_process.return_value.spawn_concurrently.side_effect = (
+        ChildProcessError
+    )
+
+    ansible_runner.start()
+
+    mocked_timing_report.return_value.report.assert_not_called()
+
+  def test_start__galaxy_processes_fail__does_not_follow_event_stream(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+      mocked_event_stream: mock.Mock,
+  ) -> None:
+    mocked_ansible_process.return_value.spawn_concurrently.side_effect = (
+        ChildProcessError
+    )
+
+    ansible_runner.start()
+
+    mocked_event_stream.return_value.reset.assert_not_called()
+    mocked_event_stream.return_value.follow.assert_not_called()
+
   def test_start__all_processes_succeed__correct_logging(
       self,
       ansible_runner: runner.AnsibleRunner,
@@ -158,113 +368,293 @@ class TestAnsibleRunner:
     ansible_runner.start()
 
     assert mocked_click_echo.call_args_list == [
-        mock.call(config.ANSIBLE_ROLES_MESSAGE),
-        mock.call(config.ANSIBLE_COLLECTIONS_MESSAGE),
+        mock.call(config.ANSIBLE_GALAXY_MESSAGE),
         mock.call(config.ANSIBLE_INVOKE_MESSAGE),
     ]
 
-  @pytest.mark.parametrize("debug", (True, False))
-  def test_start__vary_debug__first_process_fails__calls_spawn(
+  def test_start__all_processes_succeed__records_fingerprint(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_galaxy_fingerprint: mock.Mock,
+  ) -> None:
+    ansible_runner.start()
+
+    mocked_galaxy_fingerprint.return_value.record.assert_called_once_with()
+
+  def test_start__all_processes_succeed__stores_galaxy_cache(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_galaxy_cache: mock.Mock,
+  ) -> None:
+    ansible_runner.start()
+
+    mocked_galaxy_cache.return_value.restore.assert_called_once_with()
+    mocked_galaxy_cache.return_value.store.assert_called_once_with()
+
+  @pytest.mark.parametrize(
+      "roles,collections,expected_prefixes",
+      [
+          (True, False, [config.ANSIBLE_GALAXY_ROLES_PREFIX]),
+          (False, True, [config.ANSIBLE_GALAXY_COLLECTIONS_PREFIX]),
+      ],
+  )
+  def test_start__galaxy_cache_partial_restore__spawns_pending_commands(
+      # pylint: disable=too-many-arguments
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+      mocked_galaxy_cache: mock.Mock,
+      roles: bool,
+      collections: bool,
+      expected_prefixes: List[str],
+  ) -> None:
+    mocked_galaxy_cache.return_value.restore.return_value = (
+        galaxy_cache.GalaxyInstall("/path/to/pending.yml", roles, collections)
+    )
+
+    ansible_runner.start()
+
+    commands = mocked_ansible_process.return_value.spawn_concurrently.\
+        call_args.args[0]
+    assert list(commands) == expected_prefixes
+    assert all(
+        " -r /path/to/pending.yml " in commands[prefix]
+        for prefix in expected_prefixes
+    )
+
+  def test_start__galaxy_cache_full_restore__does_not_spawn_galaxy(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+      mocked_galaxy_cache: mock.Mock,
+      mocked_galaxy_fingerprint: mock.Mock,
+  ) -> None:
+    mocked_galaxy_cache.return_value.restore.return_value = (
+        galaxy_cache.GalaxyInstall("/path/to/pending.yml", False, False)
+    )
+
+    ansible_runner.start()
+
+    mocked_ansible_process.return_value.spawn_concurrently.assert_not_called()
+    mocked_ansible_process.return_value.spawn.assert_called_once()
+    mocked_galaxy_fingerprint.return_value.record.assert_called_once_with()
+
+  def test_start__force_galaxy__does_not_restore_galaxy_cache(
       self,
       ansible_runner: runner.AnsibleRunner,
       global_spec_mock: spec.Spec,
       mocked_ansible_process: mock.Mock,
-      debug: bool,
+      mocked_galaxy_cache: mock.Mock,
   ) -> None:
-    mocked_ansible_process.return_value.spawn.side_effect = (ChildProcessError,)
+    ansible_runner.force_galaxy = True
 
     ansible_runner.start()
 
-    assert mocked_ansible_process.return_value.spawn.call_args_list == [
-        mock.call(command)
-        for command in self.create_commands(global_spec_mock, debug)[0:1]
-    ]
+    mocked_galaxy_cache.return_value.restore.assert_not_called()
+    mocked_galaxy_cache.return_value.store.assert_called_once_with()
+    mocked_ansible_process.return_value.spawn_concurrently.\
+        assert_called_once_with(self.create_galaxy_commands(global_spec_mock))
 
-  def test_start__first_process_fails__click_echo(
+  def test_start__galaxy_cache_disabled__does_not_use_galaxy_cache(
       self,
       ansible_runner: runner.AnsibleRunner,
+      global_spec_mock: spec.Spec,
       mocked_ansible_process: mock.Mock,
+      mocked_galaxy_cache: mock.Mock,
+      monkeypatch: pytest.MonkeyPatch,
+  ) -> None:
+    monkeypatch.setattr(config, "GALAXY_CACHE_ENABLED", False)
+
+    ansible_runner.start()
+
+    mocked_galaxy_cache.return_value.restore.assert_not_called()
+    mocked_galaxy_cache.return_value.store.assert_not_called()
+    mocked_ansible_process.return_value.spawn_concurrently.\
+        assert_called_once_with(self.create_galaxy_commands(global_spec_mock))
+
+  def test_start__fingerprint_current__skips_galaxy_processes(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      global_spec_mock: spec.Spec,
+      mocked_ansible_process: mock.Mock,
+      mocked_galaxy_fingerprint: mock.Mock,
+  ) -> None:
+    mocked_galaxy_fingerprint.return_value.is_current.return_value = True
+
+    ansible_runner.start()
+
+    mocked_ansible_process.return_value.spawn_concurrently.assert_not_called()
+    mocked_galaxy_fingerprint.return_value.record.assert_not_called()
+    mocked_ansible_process.return_value.spawn.assert_called_once_with(
+        self.create_playbook_command(global_spec_mock, False)
+    )
+
+  def test_start__fingerprint_current__click_echo(
+      self,
+      ansible_runner: runner.AnsibleRunner,
       mocked_click_echo: mock.Mock,
+      mocked_galaxy_fingerprint: mock.Mock,
   ) -> None:
-    mocked_ansible_process.return_value.spawn.side_effect = (ChildProcessError,)
+    mocked_galaxy_fingerprint.return_value.is_current.return_value = True
+
     ansible_runner.start()
 
     assert mocked_click_echo.call_args_list == [
-        mock.call(config.ANSIBLE_ROLES_MESSAGE),
+        mock.call(config.ANSIBLE_GALAXY_SKIPPED_MESSAGE),
+        mock.call(config.ANSIBLE_INVOKE_MESSAGE),
     ]
 
-  def test_start__first_process_fails__logging(
+  def test_start__fingerprint_current__force_galaxy__calls_spawn(
       self,
       ansible_runner: runner.AnsibleRunner,
       global_spec_mock: spec.Spec,
       mocked_ansible_process: mock.Mock,
-      caplog: pytest.LogCaptureFixture,
+      mocked_galaxy_fingerprint: mock.Mock,
   ) -> None:
-    mocked_ansible_process.return_value.spawn.side_effect = (ChildProcessError,)
-    caplog.set_level(logging.DEBUG)
+    mocked_galaxy_fingerprint.return_value.is_current.return_value = True
+    ansible_runner.force_galaxy = True
 
     ansible_runner.start()
 
-    assert decode_logs(caplog.records) == \
-           self.create_logging_messages(global_spec_mock)[0:2]
+    mocked_ansible_process.return_value.spawn_concurrently.\
+        assert_called_once_with(self.create_galaxy_commands(global_spec_mock))
+    mocked_galaxy_fingerprint.return_value.record.assert_called_once_with()
 
-  @pytest.mark.parametrize("debug", (True, False))
-  def test_spawn__vary_debug__second_process_fails__calls_spawn(
+  def test_start__offline__skips_galaxy_processes(
       self,
       ansible_runner: runner.AnsibleRunner,
       global_spec_mock: spec.Spec,
       mocked_ansible_process: mock.Mock,
-      debug: bool,
+      mocked_galaxy_cache: mock.Mock,
+      mocked_galaxy_fingerprint: mock.Mock,
   ) -> None:
-    mocked_ansible_process.return_value.spawn.side_effect = (
-        None,
-        ChildProcessError,
+    ansible_runner.offline = True
+
+    ansible_runner.start()
+
+    mocked_ansible_process.return_value.spawn_concurrently.assert_not_called()
+    mocked_galaxy_cache.return_value.restore.assert_not_called()
+    mocked_galaxy_fingerprint.return_value.record.assert_not_called()
+    mocked_ansible_process.return_value.spawn.assert_called_once_with(
+        self.create_playbook_command(global_spec_mock, False)
     )
 
+  def test_start__offline__click_echo(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_click_echo: mock.Mock,
+  ) -> None:
+    ansible_runner.offline = True
+
     ansible_runner.start()
 
-    assert mocked_ansible_process.return_value.spawn.call_args_list == [
-        mock.call(command)
-        for command in self.create_commands(global_spec_mock, debug)[0:2]
+    assert mocked_click_echo.call_args_list == [
+        mock.call(config.ANSIBLE_GALAXY_OFFLINE_MESSAGE),
+        mock.call(config.ANSIBLE_INVOKE_MESSAGE),
     ]
 
-  def test_spawn__second_process_fails__click_echo(
+  def test_install__all_processes_succeed__does_not_call_spawn(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      global_spec_mock: spec.Spec,
+      mocked_ansible_process: mock.Mock,
+      mocked_galaxy_fingerprint: mock.Mock,
+  ) -> None:
+    ansible_runner.install()
+
+    mocked_ansible_process.return_value.spawn_concurrently.\
+        assert_called_once_with(self.create_galaxy_commands(global_spec_mock))
+    mocked_galaxy_fingerprint.return_value.record.assert_called_once_with()
+    mocked_ansible_process.return_value.spawn.assert_not_called()
+
+  def test_install__galaxy_processes_fail__raises_exception(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+  ) -> None:
+    mocked_ansible_process.return_value.spawn_concurrently.side_effect = (
+        ChildProcessError
+    )
+
+    with pytest.raises(ChildProcessError):
+      ansible_runner.install()
+
+  def test_start__galaxy_processes_fail__does_not_record_fingerprint(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+      mocked_galaxy_fingerprint: mock.Mock,
+  ) -> None:
+    mocked_ansible_process.return_value.spawn_concurrently.side_effect = (
+        ChildProcessError
+    )
+
+    ansible_runner.start()
+
+    mocked_galaxy_fingerprint.return_value.record.assert_not_called()
+
+  def test_start__galaxy_processes_fail__does_not_store_galaxy_cache(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+      mocked_galaxy_cache: mock.Mock,
+  ) -> None:
+    mocked_ansible_process.return_value.spawn_concurrently.side_effect = (
+        ChildProcessError
+    )
+
+    ansible_runner.start()
+
+    mocked_galaxy_cache.return_value.store.assert_not_called()
+
+  def test_start__galaxy_processes_fail__does_not_call_spawn(
+      self,
+      ansible_runner: runner.AnsibleRunner,
+      mocked_ansible_process: mock.Mock,
+  ) -> None:
+    mocked_ansible_process.return_value.spawn_concurrently.side_effect = (
+        ChildProcessError
+    )
+
+    ansible_runner.start()
+
+    mocked_ansible_process.return_value.spawn.assert_not_called()
+
+  def test_start__galaxy_processes_fail__click_echo(
       self,
       ansible_runner: runner.AnsibleRunner,
       mocked_ansible_process: mock.Mock,
       mocked_click_echo: mock.Mock,
   ) -> None:
-    mocked_ansible_process.return_value.spawn.side_effect = (
-        None,
-        ChildProcessError,
+    mocked_ansible_process.return_value.spawn_concurrently.side_effect = (
+        ChildProcessError
     )
+
     ansible_runner.start()
 
     assert mocked_click_echo.call_args_list == [
-        mock.call(config.ANSIBLE_ROLES_MESSAGE),
-        mock.call(config.ANSIBLE_COLLECTIONS_MESSAGE),
+        mock.call(config.ANSIBLE_GALAXY_MESSAGE),
     ]
 
-  def test_spawn__second_process_fails__logging(
+  def test_start__galaxy_processes_fail__logging(
       self,
       ansible_runner: runner.AnsibleRunner,
       global_spec_mock: spec.Spec,
       mocked_ansible_process: mock.Mock,
       caplog: pytest.LogCaptureFixture,
   ) -> None:
-    mocked_ansible_process.return_value.spawn.side_effect = (
-        None,
-        ChildProcessError,
+    mocked_ansible_process.return_value.spawn_concurrently.side_effect = (
+        ChildProcessError
     )
     caplog.set_level(logging.DEBUG)
 
     ansible_runner.start()
 
     assert decode_logs(caplog.records) == \
-           self.create_logging_messages(global_spec_mock)[0:3]
+           self.create_logging_messages(global_spec_mock)[0:2]
 
   @pytest.mark.parametrize("debug", (True, False))
-  def test_spawn__vary_debug__third_process_fails__calls_spawn(
+  def test_start__vary_debug__playbook_process_fails__calls_spawn(
       self,
       ansible_runner: runner.AnsibleRunner,
       global_spec_mock: spec.Spec,
@@ -272,50 +662,37 @@ class TestAnsibleRunner:
       debug: bool,
   ) -> None:
     ansible_runner.debug = debug
-    mocked_ansible_process.return_value.spawn.side_effect = (
-        None,
-        None,
-        ChildProcessError,
-    )
+    mocked_ansible_process.return_value.spawn.side_effect = ChildProcessError
 
     ansible_runner.start()
 
-    assert mocked_ansible_process.return_value.spawn.call_args_list == [
-        mock.call(command)
-        for command in self.create_commands(global_spec_mock, debug)
-    ]
+    mocked_ansible_process.return_value.spawn.assert_called_once_with(
+        self.create_playbook_command(global_spec_mock, debug)
+    )
 
-  def test_spawn__third_process_fails__click_echo(
+  def test_start__playbook_process_fails__click_echo(
       self,
       ansible_runner: runner.AnsibleRunner,
       mocked_ansible_process: mock.Mock,
       mocked_click_echo: mock.Mock,
   ) -> None:
-    mocked_ansible_process.return_value.spawn.side_effect = (
-        None,
-        None,
-        ChildProcessError,
-    )
+    mocked_ansible_process.return_value.spawn.side_effect = ChildProcessError
+
     ansible_runner.start()
 
     assert mocked_click_echo.call_args_list == [
-        mock.call(config.ANSIBLE_ROLES_MESSAGE),
-        mock.call(config.ANSIBLE_COLLECTIONS_MESSAGE),
+        mock.call(config.ANSIBLE_GALAXY_MESSAGE),
         mock.call(config.ANSIBLE_INVOKE_MESSAGE),
     ]
 
-  def test_spawn__third_process_fails__logging(
+  def test_start__playbook_process_fails__logging(
       self,
       ansible_runner: runner.AnsibleRunner,
       global_spec_mock: spec.Spec,
       mocked_ansible_process: mock.Mock,
       caplog: pytest.LogCaptureFixture,
   ) -> None:
-    mocked_ansible_process.return_value.spawn.side_effect = (
-        None,
-        None,
-        ChildProcessError,
-    )
+    mocked_ansible_process.return_value.spawn.side_effect = ChildProcessError
     caplog.set_level(logging.DEBUG)
 
     ansible_runner.start()
@@ -0,0 +1,220 @@
+"""Test the TimingReport class."""
+
+import dataclasses
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.ansible_controller import events, spec, timing
+from mac_maker.utilities.phase_timer import PhaseTimer
+
+TIMING_MODULE = timing.__name__
+
+
+@pytest.fixture
+def timing_report(
+    global_spec_mock: spec.Spec, tmp_path: Path
+) -> timing.TimingReport:
+  return timing.TimingReport(
+      dataclasses.replace(global_spec_mock, workspace_root_path=str(tmp_path)),
+      PhaseTimer(),
+  )
+
+
+class TestTimingReport:
+  """Test the TimingReport class."""
+
+  def create_task_end(
+      self,
+      task: str,
+      role: Optional[str],
+      duration: float,
+  ) -> events.TypeEvent:
+    return {
+        "event": "task_end",
+        "task": task,
+        "role": role,
+        "action": "command",
+        "handler": False,
+        "duration": duration,
+    }
+
+  def create_timing(
+      self,
+      task: str,
+      role: Optional[str],
+      duration: float,
+  ) -> timing.TypeTiming:
+    task_end = self.create_task_end(task, role, duration)
+    del task_end["event"]
+    return task_end
+
+  def record_tasks(self, timing_report: timing.TimingReport) -> None:
+    timing_report.record(self.create_task_end("Gather Facts", None, 2.0))
+    timing_report.record(self.create_task_end("Install Apps", "homebrew", 9.0))
+    timing_report.record(self.create_task_end("Tap Casks", "homebrew", 1.5))
+    timing_report.record(self.create_task_end("Set Dock", "desktop", 3.0))
+
+  def test_init__attributes(
+      self,
+      timing_report: timing.TimingReport,
+  ) -> None:
+    assert isinstance(timing_report.log, logging.Logger)
+    assert timing_report.path == (
+        Path(timing_report.spec.workspace_root_path) / config.TIMING_REPORT_FILE
+    )
+    assert isinstance(timing_report.timer, PhaseTimer)
+    assert timing_report.tasks == []
+
+  def test_record__task_end_event__records_task(
+      self,
+      timing_report: timing.TimingReport,
+  ) -> None:
+    timing_report.record(self.create_task_end("Set Dock", "desktop", 3.0))
+
+    assert timing_report.tasks == [
+        self.create_timing("Set Dock", "desktop", 3.0),
+    ]
+
+  @pytest.mark.parametrize(
+      "event_name", ["playbook_start", "task_start", "host_result"]
+  )
+  def test_record__other_events__does_not_record_task(
+      self,
+      timing_report: timing.TimingReport,
+      event_name: str,
+  ) -> None:
+    timing_report.record({
+        "event": event_name,
+        "duration": 1.0
+    })
+
+    assert timing_report.tasks == []
+
+  def test_get_roles__totals_roles__slowest_first(
+      self,
+      timing_report: timing.TimingReport,
+  ) -> None:
+    self.record_tasks(timing_report)
+
+    assert timing_report.get_roles() == [
+        {
+            "role": "homebrew",
+            "duration": 10.5,
+            "tasks": 2
+        },
+        {
+            "role": "desktop",
+            "duration": 3.0,
+            "tasks": 1
+        },
+        {
+            "role": None,
+            "duration": 2.0,
+            "tasks": 1
+        },
+    ]
+
+  def test_get_tasks__slowest_first(
+      self,
+      timing_report: timing.TimingReport,
+  ) -> None:
+    self.record_tasks(timing_report)
+
+    assert timing_report.get_tasks() == [
+        self.create_timing("Install Apps", "homebrew", 9.0),
+        self.create_timing("Set Dock", "desktop", 3.0),
+        self.create_timing("Gather Facts", None, 2.0),
+        self.create_timing("Tap Casks", "homebrew", 1.5),
+    ]
+
+  def test_render__ranked_table(
+      self,
+      timing_report: timing.TimingReport,
+  ) -> None:
+    timing_report.timer.phases[config.TIMING_PHASE_GALAXY] = 4.0
+    timing_report.timer.phases[config.TIMING_PHASE_PLAYBOOK] = 16.25
+    self.record_tasks(timing_report)
+
+    lines = [line.split() for line in timing_report.render(limit=2)]
+
+    assert lines == [
+        config.TIMING_REPORT_MESSAGE.split(),
+        ["Phases", "Duration"],
+        ["Galaxy", "4.00s"],
+        ["Playbook", "16.25s"],
+        ["Slowest", "Roles", "Duration", "Tasks"],
+        ["1.", "homebrew", "10.50s", "2"],
+        ["2.", "desktop", "3.00s", "1"],
+        ["Slowest", "Tasks", "Duration", "Role"],
+        ["1.", "Install", "Apps", "9.00s", "homebrew"],
+        ["2.", "Set", "Dock", "3.00s", "desktop"],
+    ]
+
+  def test_render__no_role__uses_placeholder(
+      self,
+      timing_report: timing.TimingReport,
+  ) -> None:
+    timing_report.record(self.create_task_end("Gather Facts", None, 2.0))
+
+    lines = [line.split() for line in timing_report.render()]
+
+    assert lines[-3:] == [
+        ["1.", config.TIMING_REPORT_UNNAMED, "2.00s", "1"],
+        ["Slowest", "Tasks", "Duration", "Role"],
+        ["1.", "Gather", "Facts", "2.00s", config.TIMING_REPORT_UNNAMED],
+    ]
+
+  @mock.patch(TIMING_MODULE + ".click")
+  def test_report__writes_json_file(
+      self,
+      _: mock.Mock,
+      timing_report: timing.TimingReport,
+  ) -> None:
+    timing_report.timer.phases[config.TIMING_PHASE_PLAYBOOK] = 16.25
+    self.record_tasks(timing_report)
+
+    timing_report.report()
+
+    assert json.loads(timing_report.path.read_text()) == {
+        "phases": {
+            config.TIMING_PHASE_PLAYBOOK: 16.25
+        },
+        "roles": timing_report.get_roles(),
+        "tasks": timing_report.get_tasks(),
+    }
+
+  @mock.patch(TIMING_MODULE + ".click")
+  def test_report__click_echo(
+      self,
+      m_click: mock.Mock,
+      timing_report: timing.TimingReport,
+  ) -> None:
+    self.record_tasks(timing_report)
+
+    timing_report.report()
+
+    assert m_click.echo.call_args_list == [
+        mock.call(line) for line in timing_report.render()
+    ]
+
+  @mock.patch(TIMING_MODULE + ".click")
+  def test_report__logging(
+      self,
+      _: mock.Mock,
+      timing_report: timing.TimingReport,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+
+    timing_report.report()
+
+    assert decode_logs(caplog.records) == [
+        "DEBUG:mac_maker:" +
+        timing_report.Messages.written % timing_report.path,
+    ]
@@ -0,0 +1,147 @@
+"""Timing report of a provisioning run."""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+from mac_maker import config
+from mac_maker.ansible_controller.events import TypeEvent
+from mac_maker.ansible_controller.spec import Spec
+from mac_maker.utilities.mixins.json_file import JSONFileWriter
+from mac_maker.utilities.phase_timer import PhaseTimer
+
+TypeTiming = Dict[str, Any]
+
+
+class TimingReport(JSONFileWriter):
+  """Timing report of a provisioning run.
+
+  Task durations are read from the playbook's `task_end` events, and are
+  totalled for each role.  The duration of each phase of the run, such as
+  installing the Galaxy requirements, is measured separately by a timer.
+
+  :param spec: The provisioning spec instance.
+  :param timer: The timer measuring the phases of the run.
+  """
+
+  class Messages:
+    written = "TimingReport: Timing report has been written to %s."
+
+  def __init__(self, spec: Spec, timer: PhaseTimer) -> None:
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.spec = spec
+    self.path = Path(spec.workspace_root_path) / config.TIMING_REPORT_FILE
+    self.timer = timer
+    self.tasks: List[TypeTiming] = []
+
+  def record(self, event: TypeEvent) -> None:
+    """Record the duration of each task, from the playbook events.
+
+    :param event: A playbook event, from the event stream.
+    """
+
+    if event["event"] != "task_end":
+      return
+    self.tasks.append(
+        {
+            "task": event.get("task"),
+            "role": event.get("role"),
+            "action": event.get("action"),
+            "handler": bool(event.get("handler")),
+            "duration": float(event.get("duration") or 0),
+        }
+    )
+
+  def get_roles(self) -> List[TypeTiming]:
+    """Total the task durations of each role, slowest first.
+
+    :returns: The duration and number of tasks of each role.
+    """
+
+    roles: Dict[Optional[str], TypeTiming] = {}
+    for task in self.tasks:
+      role = roles.setdefault(
+          task["role"],
+          {
+              "role": task["role"],
+              "duration": 0.0,
+              "tasks": 0
+          },
+      )
+      role["duration"] += task["duration"]
+      role["tasks"] += 1
+    return sorted(roles.values(), key=lambda role: -role["duration"])
+
+  def get_tasks(self) -> List[TypeTiming]:
+    """List the recorded tasks, slowest first.
+
+    :returns: The duration of each task.
+    """
+
+    return sorted(self.tasks, key=lambda task: -task["duration"])
+
+  def as_dict(self) -> TypeTiming:
+    """Assemble the timing report.
+
+    :returns: The phase, role and task durations.
+    """
+
+    return {
+        "phases": self.timer.phases,
+        "roles": self.get_roles(),
+        "tasks": self.get_tasks(),
+    }
+
+  def render(self, limit: int = config.TIMING_REPORT_LIMIT) -> List[str]:
+    """Render the timing report as a ranked table.
+
+    :param limit: The maximum number of roles and tasks to include.
+    :returns: The lines of the table.
+    """
+
+    lines = [config.TIMING_REPORT_MESSAGE]
+    lines.append(self._format_row("Phases", None))
+    for phase, duration in self.timer.phases.items():
+      lines.append(self._format_row(phase.capitalize(), duration))
+
+    lines.append(self._format_row("Slowest Roles", None, "Tasks"))
+    for rank, role in enumerate(self.get_roles()[:limit], 1):
+      lines.append(
+          self._format_row(
+              self._format_name(role["role"], rank),
+              role["duration"],
+              str(role["tasks"]),
+          )
+      )
+
+    lines.append(self._format_row("Slowest Tasks", None, "Role"))
+    for rank, task in enumerate(self.get_tasks()[:limit], 1):
+      lines.append(
+          self._format_row(
+              self._format_name(task["task"], rank),
+              task["duration"],
+              task["role"] or config.TIMING_REPORT_UNNAMED,
+          )
+      )
+    return lines
+
+  def report(self) -> None:
+    """Write the timing report to the workspace, and display it."""
+
+    self.write_json_file(self.as_dict(), self.path)
+    self.log.debug(self.Messages.written, self.path)
+    for line in self.render():
+      click.echo(line)
+
+  def _format_name(self, name: Optional[str], rank: int) -> str:
+    return f"{rank:>2}. {name or config.TIMING_REPORT_UNNAMED}"
+
+  def _format_row(
+      self,
+      name: str,
+      duration: Optional[float],
+      detail: str = "",
+  ) -> str:
+    column = "Duration" if duration is None else f"{duration:.2f}s"
+    return f"{name[:48]:<48} {column:>10}  {detail}".rstrip()
@@ -5,7 +5,7 @@ from typing import Optional
 
 import click
 from click_shell import shell
-from mac_maker import jobs
+from mac_maker import config, jobs
 from mac_maker.utilities.logger import Logger
 
 cli_argument_directory = click.Path(
@@ -15,6 +15,35 @@ cli_argument_directory = click.Path(
     readable=True,
 )
 
+cli_option_archive_format = click.option(
+    '--archive-format',
+    default=config.GITHUB_DEFAULT_ARCHIVE_FORMAT,
+    show_default=True,
+    type=click.Choice(list(config.GITHUB_ARCHIVE_FORMATS)),
+    help="Bundle format to download from GitHub.",
+)
+
+cli_option_persistent = click.option(
+    '--persistent',
+    default=False,
+    is_flag=True,
+    help="Reuse a workspace kept from previous runs of this profile.",
+)
+
+cli_option_force_galaxy = click.option(
+    '--force-galaxy',
+    default=False,
+    is_flag=True,
+    help="Install Galaxy roles and collections, even if they're unchanged.",
+)
+
+cli_option_refresh_facts = click.option(
+    '--refresh-facts',
+    default=False,
+    is_flag=True,
+    help="Discard cached Ansible facts, and gather them again.",
+)
+
 cli_argument_file = click.Path(
     exists=True,
     dir_okay=False,
@@ -22,6 +51,19 @@ cli_argument_file = click.Path(
     readable=True,
 )
 
+cli_argument_bundle_output = click.Path(
+    dir_okay=False,
+    file_okay=True,
+    writable=True,
+)
+
+
+def collect_garbage_on_close() -> None:
+  """Evict unused workspaces and caches, once the current command finishes."""
+  if config.GC_AUTOMATIC:
+    job = jobs.GarbageCollectorJob(verbose=False)
+    click.get_current_context().call_on_close(job.invoke)
+
 
 @shell(  # type: ignore[untyped-decorator]
     prompt='Mac Maker > ',
@@ -45,6 +87,7 @@ def cli(debug: bool) -> None:
 )
 def apply() -> None:
   """Apply an OSX Machine Profile to this system."""
+  collect_garbage_on_close()
 
 
 @cli.group(  # type: ignore[untyped-decorator]
@@ -53,16 +96,27 @@ def apply() -> None:
 )
 def precheck() -> None:
   """Ensure an OSX Machine Profile is ready to be applied."""
+  collect_garbage_on_close()
+
+
+@cli.group(  # type: ignore[untyped-decorator]
+    "bundle",
+    short_help="Bundle an OSX Machine Profile for offline use.",
+)
+def bundle() -> None:
+  """Bundle an OSX Machine Profile, and its dependencies, for offline use."""
+  collect_garbage_on_close()
 
 
 @precheck.command("folder")  # type: ignore[untyped-decorator]
 @click.argument('folder_path', type=cli_argument_directory)
-def check_from_folder(folder_path: str) -> None:
+@cli_option_persistent
+def check_from_folder(folder_path: str, persistent: bool) -> None:
   """Precheck an OSX Machine Profile from a local file system folder.
 
   FOLDER_PATH: The path to a folder containing a machine profile definition.
   """
-  job = jobs.FolderJob(folder_path)
+  job = jobs.FolderJob(folder_path, persistent)
   job.precheck()
 
 
@@ -74,12 +128,30 @@ def check_from_folder(folder_path: str) -> None:
     type=str,
     help="Specific branch (or tag) of the GitHub repo."
 )
-def check_from_github(github_url: str, branch: Optional[str]) -> None:
+@cli_option_archive_format
+@cli_option_persistent
+def check_from_github(
+    github_url: str,
+    branch: Optional[str],
+    archive_format: str,
+    persistent: bool,
+) -> None:
   """Precheck an OSX Machine Profile from a public GitHub Repository.
 
   GITHUB_URL: URL of a GitHub repo containing a machine profile definition.
   """
-  job = jobs.GitHubJob(github_url, branch)
+  job = jobs.GitHubJob(github_url, branch, archive_format, persistent)
+  job.precheck()
+
+
+@precheck.command("bundle")  # type: ignore[untyped-decorator]
+@click.argument('bundle_file', type=cli_argument_file)
+def check_from_bundle(bundle_file: str) -> None:
+  """Precheck an OSX Machine Profile from an offline bundle.
+
+  BUNDLE_FILE: The location of a bundle created by the bundle command.
+  """
+  job = jobs.BundleJob(bundle_file)
   job.precheck()
 
 
@@ -96,14 +168,21 @@ def check_from_spec_file(spec_file: str) -> None:
 
 @apply.command("folder")  # type: ignore[untyped-decorator]
 @click.argument('folder_path', type=cli_argument_directory)
-def apply_from_folder(folder_path: str) -> None:
+@cli_option_persistent
+@cli_option_force_galaxy
+@cli_option_refresh_facts
+def apply_from_folder(
+    folder_path: str,
+    persistent: bool,
+    force_galaxy: bool,
+    refresh_facts: bool,
+) -> None:
   """Apply an OSX Machine Profile from a local file system folder.
 
   FOLDER_PATH: The path to a folder containing a machine profile definition.
   """
-  job = jobs.FolderJob(folder_path)
-  job.precheck(notes=False)
-  job.provision()
+  job = jobs.FolderJob(folder_path, persistent)
+  job.apply(force_galaxy=force_galaxy, refresh_facts=refresh_facts)
 
 
 @apply.command("github")  # type: ignore[untyped-decorator]
@@ -114,26 +193,158 @@ def apply_from_folder(folder_path: str) -> None:
     type=str,
     help="Specific branch (or tag) of the GitHub repo."
 )
-def apply_from_github(github_url: str, branch: Optional[str]) -> None:
+@cli_option_archive_format
+@cli_option_persistent
+@cli_option_force_galaxy
+@cli_option_refresh_facts
+def apply_from_github(
+    github_url: str,
+    branch: Optional[str],
+    archive_format: str,
+    persistent: bool,
+    force_galaxy: bool,
+    refresh_facts: bool,
+) -> None:
   """Apply an OSX Machine Profile from a public GitHub Repository.
 
   GITHUB_URL: URL of a GitHub repo containing a machine profile definition.
   """
-  job = jobs.GitHubJob(github_url, branch)
-  job.precheck(notes=False)
-  job.provision()
+  job = jobs.GitHubJob(github_url, branch, archive_format, persistent)
+  job.apply(force_galaxy=force_galaxy, refresh_facts=refresh_facts)
+
+
+@apply.command("bundle")  # type: ignore[untyped-decorator]
+@click.argument('bundle_file', type=cli_argument_file)
+@cli_option_refresh_facts
+def apply_from_bundle(bundle_file: str, refresh_facts: bool) -> None:
+  """Apply an OSX Machine Profile from an offline bundle.
+
+  No network access is required.
+
+  BUNDLE_FILE: The location of a bundle created by the bundle command.
+  """
+  job = jobs.BundleJob(bundle_file)
+  job.apply(refresh_facts=refresh_facts)
 
 
 @apply.command("spec")  # type: ignore[untyped-decorator]
 @click.argument('spec_file', type=cli_argument_file)
-def apply_from_spec_file(spec_file: str) -> None:
+@cli_option_force_galaxy
+@cli_option_refresh_facts
+def apply_from_spec_file(
+    spec_file: str,
+    force_galaxy: bool,
+    refresh_facts: bool,
+) -> None:
   """Apply an OSX Machine Profile from a spec.json file.
 
   SPEC_FILE: The location of a spec.json file.
   """
   job = jobs.SpecFileJob(spec_file)
-  job.precheck(notes=False)
-  job.provision()
+  job.apply(force_galaxy=force_galaxy, refresh_facts=refresh_facts)
+
+
+@bundle.command("folder")  # type: ignore[untyped-decorator]
+@click.argument('folder_path', type=cli_argument_directory)
+@click.argument('bundle_file', type=cli_argument_bundle_output)
+@cli_option_persistent
+def bundle_from_folder(
+    folder_path: str,
+    bundle_file: str,
+    persistent: bool,
+) -> None:
+  """Bundle an OSX Machine Profile from a local file system folder.
+
+  FOLDER_PATH: The path to a folder containing a machine profile definition.
+
+  BUNDLE_FILE: The location to write the bundle to.
+  """
+  job = jobs.BundleBuilderJob(
+      jobs.FolderJob(folder_path, persistent),
+      bundle_file,
+  )
+  job.invoke()
+
+
+@bundle.command("github")  # type: ignore[untyped-decorator]
+@click.argument('github_url', type=click.STRING)
+@click.argument('bundle_file', type=cli_argument_bundle_output)
+@click.option(
+    '--branch',
+    required=False,
+    type=str,
+    help="Specific branch (or tag) of the GitHub repo."
+)
+@cli_option_archive_format
+@cli_option_persistent
+def bundle_from_github(
+    github_url: str,
+    bundle_file: str,
+    branch: Optional[str],
+    archive_format: str,
+    persistent: bool,
+) -> None:
+  """Bundle an OSX Machine Profile from a public GitHub Repository.
+
+  GITHUB_URL: URL of a GitHub repo containing a machine profile definition.
+
+  BUNDLE_FILE: The location to write the bundle to.
+  """
+  job = jobs.BundleBuilderJob(
+      jobs.GitHubJob(github_url, branch, archive_format, persistent),
+      bundle_file,
+  )
+  job.invoke()
+
+
+@cli.command(  # type: ignore[untyped-decorator]
+    "gc",
+    short_help="Remove unused workspaces and caches.",
+)
+@click.option(
+    '--max-size',
+    default=config.GC_MAX_SIZE // (1024 * 1024),
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Total disk budget for workspaces and caches, in MiB.",
+)
+@click.option(
+    '--max-age',
+    default=config.GC_MAX_AGE // (24 * 60 * 60),
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Maximum number of days an unused entry is kept.",
+)
+def garbage_collector(max_size: int, max_age: int) -> None:
+  """Remove unused workspaces and caches, least recently used first."""
+  job = jobs.GarbageCollectorJob(
+      max_size * 1024 * 1024,
+      max_age * 24 * 60 * 60,
+  )
+  job.invoke()
+
+
+@cli.command(  # type: ignore[untyped-decorator]
+    "history",
+    short_help="Report the most recent provisioning runs.",
+)
+@click.option(
+    '--limit',
+    default=config.RUN_HISTORY_LIMIT,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of runs to report.",
+)
+@click.option(
+    '--source',
+    required=False,
+    type=click.Choice(config.RUN_HISTORY_SOURCES),
+    help="Only report runs of profiles from this source.",
+)
+def history(limit: int, source: Optional[str]) -> None:
+  """Report the most recent provisioning runs, and their phase durations."""
+  job = jobs.HistoryJob(limit, source)
+  job.invoke()
 
 
 @cli.command(  # type: ignore[untyped-decorator]
@@ -1,33 +1,108 @@
 """Mac Maker configuration settings."""
 
+import os
 from pathlib import Path
 
 ENV_ANSIBLE_BECOME_PASSWORD = "ANSIBLE_BECOME_PASSWORD"  # nosec
+ENV_ANSIBLE_CALLBACK_PLUGINS = "ANSIBLE_CALLBACK_PLUGINS"
+ENV_ANSIBLE_CONFIG = "ANSIBLE_CONFIG"
 ENV_ANSIBLE_ROLES_PATH = "ANSIBLE_ROLES_PATH"
 ENV_ANSIBLE_COLLECTIONS_PATH = "ANSIBLE_COLLECTIONS_PATH"
+ENV_MAC_MAKER_EVENTS_FILE = "MAC_MAKER_EVENTS_FILE"
+ENV_MAC_MAKER_HOME = "MAC_MAKER_HOME"
 
+ANSIBLE_CONFIG_FILE = "ansible.generated.cfg"
+ANSIBLE_EVENTS_FILE = "events.ndjson"
+ANSIBLE_EVENTS_POLL_INTERVAL = 0.25
+ANSIBLE_FACT_CACHE_FOLDER = "facts"
+ANSIBLE_FACT_CACHE_TTL = 24 * 60 * 60
+ANSIBLE_FORKS = min(32, (os.cpu_count() or 1) * 2)
+ANSIBLE_CONFIG_DEFAULTS = {
+    "defaults":
+        {
+            "fact_caching": "jsonfile",
+            "fact_caching_timeout": str(ANSIBLE_FACT_CACHE_TTL),
+            "forks": str(ANSIBLE_FORKS),
+            "gathering": "smart",
+        },
+    "connection": {
+        "pipelining": "True",
+    },
+}
 ANSIBLE_INVOKE_MESSAGE = "--- Invoking Ansible Runner ---"
 ANSIBLE_INVENTORY_CONTENT = (
     '[all]\n'
     'localhost\t'
     'ansible_connection=local\t'
 )
-ANSIBLE_ROLES_MESSAGE = "--- Installing Profile Roles ---"
-ANSIBLE_COLLECTIONS_MESSAGE = "--- Installing Profile Collections ---"
+ANSIBLE_GALAXY_MESSAGE = "--- Installing Profile Roles and Collections ---"
+ANSIBLE_GALAXY_OFFLINE_MESSAGE = (
+    "--- Using Bundled Profile Roles and Collections ---"
+)
+ANSIBLE_GALAXY_ROLES_PREFIX = "roles"
+ANSIBLE_GALAXY_SKIPPED_MESSAGE = (
+    "--- Profile Roles and Collections are up to date ---"
+)
+ANSIBLE_GALAXY_COLLECTIONS_PREFIX = "collections"
+
+BUNDLE_COMPRESSION_LEVEL = 6
+BUNDLE_MANIFEST_FILE = "bundle.json"
+BUNDLE_VERSION = 1
+
+ARCHIVE_CACHE_FOLDER = "archives"
+ARCHIVE_CACHE_MAX_SIZE = 2 * 1024 * 1024 * 1024
+ARCHIVE_CACHE_TTL = 10 * 60
+
+COPY_HARDLINK = True
+COPY_REFLINK = True
+
+FOLDER_SYNC_CHECKSUM = False
+
+IGNORE_FILE_NAME = ".macmakerignore"
+
+GALAXY_CACHE_ARTIFACT_FILE = "artifact.json"
+GALAXY_CACHE_CONTENT_FOLDER = "content"
+GALAXY_CACHE_ENABLED = True
+GALAXY_CACHE_FOLDER = "galaxy"
+GALAXY_CACHE_REQUIREMENTS_FILE = "requirements.pending.yml"
+GALAXY_FINGERPRINT_FILE = "galaxy.json"
+
+GC_AUTOMATIC = True
+GC_MAX_AGE = 30 * 24 * 60 * 60
+GC_MAX_SIZE = 10 * 1024 * 1024 * 1024
+
+EXTRACTION_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
 GITHUB_HTTP_REGEX = r'http[s]?://github.com/(?P<org>.+)/(?P<repo>[^.]+)(\.git)?'
 GITHUB_SSH_REGEX = r'git@github.com:(?P<org>.+)/(?P<repo>[^.]+)(\.git)?'
 GITHUB_DEFAULT_BRANCH = 'main'
+GITHUB_COMMIT_SHA_REGEX = r'[0-9a-f]{40}'
+GITHUB_ARCHIVE_FORMATS = {
+    "tarball": ".tar.gz",
+    "zip": ".zip",
+}
+GITHUB_DEFAULT_ARCHIVE_FORMAT = "zip"
+GITHUB_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+GITHUB_CONNECT_TIMEOUT = 5
+GITHUB_READ_TIMEOUT = 30
+GITHUB_POOL_SIZE = 10
+GITHUB_RETRIES = 5
+GITHUB_RETRY_BACKOFF = 0.5
+GITHUB_RETRY_JITTER = 0.5
+GITHUB_RETRY_STATUSES = (429, 500, 502, 503, 504)
 
 LOGGER_NAME = 'mac_maker'
 LOGGER_FORMAT = '[%(asctime)s] - [%(name)s] - [%(levelname)s] - %(message)s'
 
+MAC_MAKER_HOME = Path.home() / ".mac_maker"
+
 PROFILE_FOLDER_PATH = "profile"
 PROFILE_NOTES_FILE = "__precheck__/notes.txt"
 PROFILE_ENVIRONMENT_FILE = "__precheck__/env.yml"
 PROFILE_INSTALLER_FILE = "install.yml"
 PROFILE_GALAXY_REQUIREMENTS_FILE = "requirements.yml"
 PROFILE_INVENTORY_FILE = "inventory"
+PROFILE_ANSIBLE_CONFIG_FILE = "ansible.cfg"
 
 PRECHECK = {
     "notes": Path(PROFILE_FOLDER_PATH) / Path(PROFILE_NOTES_FILE),
@@ -35,9 +110,39 @@ PRECHECK = {
 }
 PRECHECK_SUCCESS_MESSAGE = "Ready to proceed!"
 
+RUN_HISTORY_FILE = "history.sqlite3"
+RUN_HISTORY_LIMIT = 20
+RUN_HISTORY_MAX_ENTRIES = 1000
+RUN_HISTORY_SOURCES = ("bundle", "folder", "github", "spec")
+RUN_HISTORY_TASK_COUNTS = {
+    "tasks_ok": "ok",
+    "tasks_changed": "changed",
+    "tasks_failed": "failures",
+    "tasks_skipped": "skipped",
+    "tasks_unreachable": "unreachable",
+}
+RUN_HISTORY_TIMEOUT = 5
+
 SPEC_FILE_NAME = "spec.json"
 
+TIMING_PHASE_GALAXY = "galaxy"
+TIMING_PHASE_PLAYBOOK = "playbook"
+TIMING_PHASE_PRECHECK = "precheck"
+TIMING_PHASE_WORKSPACE = "workspace"
+TIMING_REPORT_FILE = "timing.json"
+TIMING_REPORT_LIMIT = 10
+TIMING_REPORT_MESSAGE = "--- Provisioning Timing Report ---"
+TIMING_REPORT_UNNAMED = "-"
+
 SUDO_PROMPT = "Please enter the SUDO password for your MAC: "
 SUDO_CHECK_COMMAND = "sudo -kS /bin/echo"
 
 WORKSPACE = 'installer.workspace'
+WORKSPACE_BACKGROUND_DELETE = True
+WORKSPACE_LOCK_SUFFIX = '.lock'
+WORKSPACE_MANIFEST_FILE = 'workspace.json'
+WORKSPACE_SYNC_MANIFEST_FILE = 'sync.json'
+WORKSPACES_FOLDER = 'workspaces'
+
+TRASH_LOCK_SUFFIX = '.lock'
+TRASH_SUFFIX = '.trash-'
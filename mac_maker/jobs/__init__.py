@@ -1,6 +1,10 @@
 """Executable Jobs for the Mac Maker."""
 
+from mac_maker.jobs.bundle import BundleJob
+from mac_maker.jobs.bundle_builder import BundleBuilderJob
 from mac_maker.jobs.folder import FolderJob
+from mac_maker.jobs.garbage_collector import GarbageCollectorJob
 from mac_maker.jobs.github import GitHubJob
+from mac_maker.jobs.history import HistoryJob
 from mac_maker.jobs.spec_file import SpecFileJob
 from mac_maker.jobs.version import VersionJob
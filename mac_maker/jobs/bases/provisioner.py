@@ -2,8 +2,13 @@
 
 import abc
 import sys
+import time
+from typing import Optional
 
 import click
+from mac_maker import config
+from mac_maker.ansible_controller.config_file import AnsibleConfigFile
+from mac_maker.ansible_controller.events import TypeEvent
 from mac_maker.ansible_controller.inventory import AnsibleInventoryFile
 from mac_maker.ansible_controller.runner import AnsibleRunner
 from mac_maker.ansible_controller.spec import Spec
@@ -11,11 +16,22 @@ from mac_maker.profile.precheck import TypePrecheckFileData
 from mac_maker.profile.precheck.precheck_extractor import PrecheckExtractor
 from mac_maker.profile.precheck.precheck_validator import PrecheckValidator
 from mac_maker.profile.spec_file import SpecFile, SpecFileContentNotDefined
+from mac_maker.utilities.phase_timer import PhaseTimer
+from mac_maker.utilities.run_history import RunHistory, RunHistoryEntry
 from mac_maker.utilities.sudo import SUDO
 
 
 class ProvisionerJobBase(abc.ABC):
-  """Job base class, with Ansible provisioning."""
+  """Job base class, with Ansible provisioning.
+
+  Each provisioning run is recorded in the run history, along with the
+  duration of each phase of the job, including runs that fail before Ansible
+  is started.
+  """
+
+  location: str
+  offline = False
+  source: str
 
   class Messages:
     precheck_success = "Ready to proceed!"
@@ -24,6 +40,10 @@ class ProvisionerJobBase(abc.ABC):
   def __init__(self) -> None:
     self.spec_file = SpecFile()
     self.precheck_extractor = PrecheckExtractor()
+    self.run_history = RunHistory()
+    self.started = time.time()
+    self.task_counts = dict.fromkeys(config.RUN_HISTORY_TASK_COUNTS, 0)
+    self.timer = PhaseTimer()
 
   @abc.abstractmethod
   def initialize_spec_file(self) -> None:
@@ -35,7 +55,8 @@ class ProvisionerJobBase(abc.ABC):
     try:
       self.spec_file.content
     except SpecFileContentNotDefined:
-      self.initialize_spec_file()
+      with self.timer.measure(config.TIMING_PHASE_WORKSPACE):
+        self.initialize_spec_file()
 
   def get_precheck_content(self) -> TypePrecheckFileData:
     """Extract the Profile's Precheck file contents.
@@ -66,11 +87,12 @@ class ProvisionerJobBase(abc.ABC):
     :param notes: A boolean indicating whether to display the Precheck notes.
     """
 
-    precheck_data = self.get_precheck_content()
+    with self.timer.measure(config.TIMING_PHASE_PRECHECK):
+      precheck_data = self.get_precheck_content()
+      validator = PrecheckValidator(precheck_data['env'])
+      validator.validate_config()
+      results = validator.validate_environment()
 
-    validator = PrecheckValidator(precheck_data['env'])
-    validator.validate_config()
-    results = validator.validate_environment()
     if not results['is_valid']:
       for violation in results['violations']:
         click.echo(violation)
@@ -81,8 +103,43 @@ class ProvisionerJobBase(abc.ABC):
 
     click.echo(self.Messages.precheck_success)
 
-  def provision(self) -> None:
-    """Begin provisioning with Ansible."""
+  def apply(
+      self,
+      force_galaxy: bool = False,
+      refresh_facts: bool = False,
+  ) -> None:
+    """Precheck the Profile, and then provision it with Ansible.
+
+    The run is recorded in the run history, however it ends, and a failed run
+    exits with a non-zero status.
+
+    :param force_galaxy: Install Galaxy requirements, even if they're unchanged.
+    :param refresh_facts: Discard cached facts, and gather them again.
+    """
+
+    exit_status = 1
+
+    try:
+      self.precheck(notes=False)
+      if self.provision(force_galaxy=force_galaxy, refresh_facts=refresh_facts):
+        exit_status = 0
+    finally:
+      self._record_run(exit_status)
+
+    if exit_status:
+      sys.exit(exit_status)
+
+  def provision(
+      self,
+      force_galaxy: bool = False,
+      refresh_facts: bool = False,
+  ) -> bool:
+    """Begin provisioning with Ansible.
+
+    :param force_galaxy: Install Galaxy requirements, even if they're unchanged.
+    :param refresh_facts: Discard cached facts, and gather them again.
+    :returns: A boolean indicating if provisioning succeeded.
+    """
 
     spec = self.get_spec()
 
@@ -92,5 +149,45 @@ class ProvisionerJobBase(abc.ABC):
     inventory = AnsibleInventoryFile(spec)
     inventory.write()
 
-    ansible_job = AnsibleRunner(spec)
-    ansible_job.start()
+    config_file = AnsibleConfigFile(spec)
+    config_file.write()
+
+    ansible_job = AnsibleRunner(
+        spec,
+        force_galaxy=force_galaxy,
+        offline=self.offline,
+        refresh_facts=refresh_facts,
+        timer=self.timer,
+    )
+    ansible_job.events.subscribe(self._count_tasks)
+    return ansible_job.start()
+
+  def _count_tasks(self, event: TypeEvent) -> None:
+    if event["event"] != "playbook_end":
+      return
+    for stats in event["hosts"].values():
+      for count, stat in config.RUN_HISTORY_TASK_COUNTS.items():
+        self.task_counts[count] += stats.get(stat, 0)
+
+  def _get_source_commit(self) -> Optional[str]:
+    try:
+      return self.spec_file.content.source_commit
+    except SpecFileContentNotDefined:
+      return None
+
+  def _record_run(self, exit_status: int) -> None:
+    phases = self.timer.phases
+    self.run_history.record(
+        RunHistoryEntry(
+            started=self.started,
+            source=self.source,
+            location=self.location,
+            ref=self._get_source_commit(),
+            exit_status=exit_status,
+            workspace=phases.get(config.TIMING_PHASE_WORKSPACE),
+            precheck=phases.get(config.TIMING_PHASE_PRECHECK),
+            galaxy=phases.get(config.TIMING_PHASE_GALAXY),
+            playbook=phases.get(config.TIMING_PHASE_PLAYBOOK),
+            **self.task_counts,
+        )
+    )
@@ -11,8 +11,10 @@ from mac_maker.profile import precheck, spec_file
 
 
 class ProvisionerMocks(NamedTuple):
+  mocked_ansible_config_file: mock.Mock
   mocked_ansible_inventory_file: mock.Mock
   mocked_ansible_runner: mock.Mock
+  mocked_run_history: mock.Mock
   mocked_spec: spec_file.SpecFile
   mocked_sudo: mock.Mock
 
@@ -20,18 +22,28 @@ class ProvisionerMocks(NamedTuple):
 @pytest.fixture
 def provisioner_mocks(
     global_spec_file_instance: spec_file.SpecFile,
+    mocked_ansible_config_file: mock.Mock,
     mocked_ansible_inventory_file: mock.Mock,
     mocked_ansible_runner: mock.Mock,
+    mocked_run_history: mock.Mock,
     mocked_sudo: mock.Mock,
 ) -> ProvisionerMocks:
   return ProvisionerMocks(
+      mocked_ansible_config_file=mocked_ansible_config_file,
       mocked_ansible_inventory_file=mocked_ansible_inventory_file,
       mocked_ansible_runner=mocked_ansible_runner,
+      mocked_run_history=mocked_run_history,
       mocked_spec=global_spec_file_instance,
       mocked_sudo=mocked_sudo,
   )
 
 
+@pytest.fixture
+def mocked_ansible_config_file() -> mock.Mock:
+  instance = mock.Mock()
+  return instance
+
+
 @pytest.fixture
 def mocked_ansible_inventory_file() -> mock.Mock:
   instance = mock.Mock()
@@ -71,6 +83,12 @@ def mocked_precheck_validator() -> mock.Mock:
   return instance
 
 
+@pytest.fixture
+def mocked_run_history() -> mock.Mock:
+  instance = mock.Mock()
+  return instance
+
+
 @pytest.fixture
 def mocked_spec_file(
     global_spec_mock: spec.Spec,
@@ -106,12 +124,18 @@ def mocked_validate_environment(
 
 @pytest.fixture
 def setup_provisioner_ansible_mocks(
+    mocked_ansible_config_file: mock.Mock,
     mocked_ansible_inventory_file: mock.Mock,
     mocked_ansible_runner: mock.Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> Callable[[], None]:
 
   def setup() -> None:
+    monkeypatch.setattr(
+        provisioner,
+        "AnsibleConfigFile",
+        mocked_ansible_config_file,
+    )
     monkeypatch.setattr(
         provisioner,
         "AnsibleInventoryFile",
@@ -130,6 +154,7 @@ def setup_provisioner_ansible_mocks(
 def setup_provisioner_module(
     mocked_click_echo: mock.Mock,
     mocked_precheck_validator: mock.Mock,
+    mocked_run_history: mock.Mock,
     mocked_sudo: mock.Mock,
     mocked_sys: mock.Mock,
     setup_provisioner_ansible_mocks: Callable[[], None],
@@ -149,6 +174,11 @@ def setup_provisioner_module(
         "PrecheckValidator",
         mocked_precheck_validator,
     )
+    monkeypatch.setattr(
+        provisioner,
+        "RunHistory",
+        mocked_run_history,
+    )
     monkeypatch.setattr(
         provisioner,
         "SUDO",
@@ -174,6 +204,9 @@ def concrete_provisioning_job_class(
   class ConcreteJob(provisioner.ProvisionerJobBase):
     """Concrete test implementation of the ProvisionerJobBase class."""
 
+    location = "/mock/location"
+    source = "concrete"
+
     def initialize_spec_file(self) -> None:
       self.spec_file.content = global_spec_mock
       mocked_initialize_spec_file()
@@ -1,9 +1,10 @@
 """Test the ProvisionerJobBase class."""
 
-from typing import Dict
+from typing import Dict, List
 from unittest import mock
 
 import pytest
+from mac_maker import config
 from mac_maker.__helpers__.parametrize import templated_ids
 from mac_maker.ansible_controller import spec
 from mac_maker.config import PRECHECK_SUCCESS_MESSAGE
@@ -11,6 +12,8 @@ from mac_maker.jobs.bases.provisioner import ProvisionerJobBase
 from mac_maker.jobs.bases.tests.conftest import ProvisionerMocks
 from mac_maker.profile.precheck import TypePrecheckFileData, precheck_extractor
 from mac_maker.profile.spec_file import SpecFile
+from mac_maker.utilities.phase_timer import PhaseTimer
+from mac_maker.utilities.run_history import RunHistoryEntry
 
 
 class TestJobsBase:
@@ -34,6 +37,26 @@ class TestJobsBase:
         precheck_extractor.PrecheckExtractor,
     )
 
+  def test_initialize__has_run_history(
+      self,
+      concrete_provisioning_job: ProvisionerJobBase,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    assert concrete_provisioning_job.run_history == (
+        provisioner_mocks.mocked_run_history.return_value
+    )
+    assert isinstance(concrete_provisioning_job.started, float)
+    assert concrete_provisioning_job.task_counts == dict.fromkeys(
+        config.RUN_HISTORY_TASK_COUNTS, 0
+    )
+
+  def test_initialize__has_timer(
+      self,
+      concrete_provisioning_job: ProvisionerJobBase,
+  ) -> None:
+    assert isinstance(concrete_provisioning_job.timer, PhaseTimer)
+    assert concrete_provisioning_job.timer.phases == {}
+
   def test_get_precheck_content__no_spec_file__initializes_spec_file_once(
       self,
       concrete_provisioning_job_with_mocked_extractor: ProvisionerJobBase,
@@ -97,6 +120,18 @@ class TestJobsBase:
 
     mocked_initialize_spec_file.assert_called_once_with()
 
+  def test_get_spec__no_spec_file__measures_workspace_phase(
+      self,
+      concrete_provisioning_job: ProvisionerJobBase,
+  ) -> None:
+    concrete_provisioning_job.spec_file._content = None
+
+    concrete_provisioning_job.get_spec()
+
+    assert list(concrete_provisioning_job.timer.phases) == [
+        config.TIMING_PHASE_WORKSPACE,
+    ]
+
   def test_get_spec__spec_file__does_not_initialize_spec_file(
       self,
       concrete_provisioning_job: ProvisionerJobBase,
@@ -192,6 +227,21 @@ class TestJobsBase:
         global_precheck_data_mock['env']
     )
 
+  def test_precheck__measures_precheck_phase(
+      self,
+      concrete_provisioning_job_with_mocked_extractor: ProvisionerJobBase,
+      mocked_validate_environment: mock.Mock,
+  ) -> None:
+    job = concrete_provisioning_job_with_mocked_extractor
+    mocked_validate_environment.return_value = {
+        'is_valid': True,
+        'violations': [],
+    }
+
+    job.precheck()
+
+    assert list(job.timer.phases) == [config.TIMING_PHASE_PRECHECK]
+
   @pytest.mark.parametrize(
       "precheck_args",
       (
@@ -295,6 +345,19 @@ class TestJobsBase:
     provisioner_mocks.mocked_ansible_inventory_file.return_value \
         .write.assert_called_once_with()
 
+  def test_provision__creates_config_file(
+      self,
+      concrete_provisioning_job: ProvisionerJobBase,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    concrete_provisioning_job.provision()
+
+    provisioner_mocks.mocked_ansible_config_file.assert_called_once_with(
+        concrete_provisioning_job.get_spec()
+    )
+    provisioner_mocks.mocked_ansible_config_file.return_value \
+        .write.assert_called_once_with()
+
   def test_provision__prompts_for_sudo(
       self,
       concrete_provisioning_job: ProvisionerJobBase,
@@ -314,7 +377,276 @@ class TestJobsBase:
     concrete_provisioning_job.provision()
 
     provisioner_mocks.mocked_ansible_runner.assert_called_once_with(
-        concrete_provisioning_job.get_spec()
+        concrete_provisioning_job.get_spec(),
+        force_galaxy=False,
+        offline=False,
+        refresh_facts=False,
+        timer=concrete_provisioning_job.timer,
     )
     provisioner_mocks.mocked_ansible_runner.return_value \
         .start.assert_called_once_with()
+
+  def test_provision__force_galaxy__starts_ansible_runner(
+      self,
+      concrete_provisioning_job: ProvisionerJobBase,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    concrete_provisioning_job.provision(force_galaxy=True)
+
+    provisioner_mocks.mocked_ansible_runner.assert_called_once_with(
+        concrete_provisioning_job.get_spec(),
+        force_galaxy=True,
+        offline=False,
+        refresh_facts=False,
+        timer=concrete_provisioning_job.timer,
+    )
+
+  def test_provision__offline__starts_ansible_runner(
+      self,
+      concrete_provisioning_job: ProvisionerJobBase,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    concrete_provisioning_job.offline = True
+
+    concrete_provisioning_job.provision()
+
+    provisioner_mocks.mocked_ansible_runner.assert_called_once_with(
+        concrete_provisioning_job.get_spec(),
+        force_galaxy=False,
+        offline=True,
+        refresh_facts=False,
+        timer=concrete_provisioning_job.timer,
+    )
+
+  def test_provision__refresh_facts__starts_ansible_runner(
+      self,
+      concrete_provisioning_job: ProvisionerJobBase,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    concrete_provisioning_job.provision(refresh_facts=True)
+
+    provisioner_mocks.mocked_ansible_runner.assert_called_once_with(
+        concrete_provisioning_job.get_spec(),
+        force_galaxy=False,
+        offline=False,
+        refresh_facts=True,
+        timer=concrete_provisioning_job.timer,
+    )
+
+  def test_provision__counts_tasks_from_playbook_end_event(
+      self,
+      concrete_provisioning_job: ProvisionerJobBase,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    concrete_provisioning_job.provision()
+    subscribe = provisioner_mocks.mocked_ansible_runner.return_value.events.\
+        subscribe
+    listener = subscribe.call_args.args[0]
+
+    listener({
+        "event": "task_end"
+    })
+    listener(
+        {
+            "event": "playbook_end",
+            "hosts":
+                {
+                    "localhost":
+                        {
+                            "ok": 10,
+                            "changed": 4,
+                            "failures": 1,
+                            "skipped": 2,
+                            "unreachable": 0,
+                            "rescued": 0,
+                        },
+                },
+        }
+    )
+
+    assert concrete_provisioning_job.task_counts == {
+        "tasks_ok": 10,
+        "tasks_changed": 4,
+        "tasks_failed": 1,
+        "tasks_skipped": 2,
+        "tasks_unreachable": 0,
+    }
+
+  @pytest.mark.parametrize(
+      "succeeded",
+      (True, False),
+      ids=templated_ids("succeeded:{0}", lambda arg: str(arg)[0]),
+  )
+  def test_provision__vary_result__returns_result(
+      self,
+      concrete_provisioning_job: ProvisionerJobBase,
+      provisioner_mocks: ProvisionerMocks,
+      succeeded: bool,
+  ) -> None:
+    provisioner_mocks.mocked_ansible_runner.return_value.start.return_value = (
+        succeeded
+    )
+
+    assert concrete_provisioning_job.provision() is succeeded
+
+  def test_apply__prechecks_and_provisions(
+      self,
+      concrete_provisioning_job_with_mocked_extractor: ProvisionerJobBase,
+      mocked_validate_environment: mock.Mock,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    mocked_validate_environment.return_value = {
+        'is_valid': True,
+        'violations': [],
+    }
+
+    concrete_provisioning_job_with_mocked_extractor.apply(
+        force_galaxy=True,
+        refresh_facts=True,
+    )
+
+    mocked_validate_environment.assert_called_once_with()
+    provisioner_mocks.mocked_ansible_runner.assert_called_once_with(
+        concrete_provisioning_job_with_mocked_extractor.get_spec(),
+        force_galaxy=True,
+        offline=False,
+        refresh_facts=True,
+        timer=concrete_provisioning_job_with_mocked_extractor.timer,
+    )
+
+  @pytest.mark.parametrize(
+      "succeeded,expected_exit_status",
+      ((True, 0), (False, 1)),
+  )
+  def test_apply__vary_result__records_run(
+      self,
+      concrete_provisioning_job_with_mocked_extractor: ProvisionerJobBase,
+      mocked_validate_environment: mock.Mock,
+      provisioner_mocks: ProvisionerMocks,
+      succeeded: bool,
+      expected_exit_status: int,
+  ) -> None:
+    job = concrete_provisioning_job_with_mocked_extractor
+    mocked_validate_environment.return_value = {
+        'is_valid': True,
+        'violations': [],
+    }
+    provisioner_mocks.mocked_ansible_runner.return_value.start.return_value = (
+        succeeded
+    )
+    job.timer.phases.update({
+        config.TIMING_PHASE_PLAYBOOK: 120.0
+    })
+
+    job.apply()
+
+    provisioner_mocks.mocked_run_history.return_value.record.\
+        assert_called_once_with(
+            RunHistoryEntry(
+                started=job.started,
+                source="concrete",
+                location="/mock/location",
+                ref=job.get_spec().source_commit,
+                exit_status=expected_exit_status,
+                workspace=None,
+                precheck=mock.ANY,
+                galaxy=None,
+                playbook=120.0,
+                tasks_ok=0,
+                tasks_changed=0,
+                tasks_failed=0,
+                tasks_skipped=0,
+                tasks_unreachable=0,
+            )
+        )
+
+  @pytest.mark.parametrize(
+      "succeeded,expected_exit_codes",
+      ((True, []), (False, [1])),
+  )
+  def test_apply__vary_result__exits_correctly(
+      self,
+      concrete_provisioning_job_with_mocked_extractor: ProvisionerJobBase,
+      mocked_sys: mock.Mock,
+      mocked_validate_environment: mock.Mock,
+      provisioner_mocks: ProvisionerMocks,
+      succeeded: bool,
+      expected_exit_codes: List[int],
+  ) -> None:
+    mocked_validate_environment.return_value = {
+        'is_valid': True,
+        'violations': [],
+    }
+    provisioner_mocks.mocked_ansible_runner.return_value.start.return_value = (
+        succeeded
+    )
+
+    concrete_provisioning_job_with_mocked_extractor.apply()
+
+    assert mocked_sys.exit.mock_calls == [
+        mock.call(exit_code) for exit_code in expected_exit_codes
+    ]
+
+  def test_apply__precheck_failure__records_failed_run(
+      self,
+      concrete_provisioning_job_with_mocked_extractor: ProvisionerJobBase,
+      mocked_sys: mock.Mock,
+      mocked_validate_environment: mock.Mock,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    mocked_sys.exit.side_effect = SystemExit
+    mocked_validate_environment.return_value = {
+        'is_valid': False,
+        'violations': ['violation1'],
+    }
+
+    with pytest.raises(SystemExit):
+      concrete_provisioning_job_with_mocked_extractor.apply()
+
+    provisioner_mocks.mocked_ansible_runner.assert_not_called()
+    recorded = provisioner_mocks.mocked_run_history.return_value.record.\
+        call_args.args[0]
+    assert recorded.exit_status == 1
+    assert recorded.precheck is not None
+
+  def test_apply__spec_failure__records_failed_run_without_ref(
+      self,
+      concrete_provisioning_job_with_mocked_extractor: ProvisionerJobBase,
+      mocked_initialize_spec_file: mock.Mock,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    # pylint: disable=protected-access
+    concrete_provisioning_job_with_mocked_extractor.spec_file._content = None
+    mocked_initialize_spec_file.side_effect = IOError
+
+    with pytest.raises(IOError):
+      concrete_provisioning_job_with_mocked_extractor.apply()
+
+    provisioner_mocks.mocked_ansible_runner.assert_not_called()
+    recorded = provisioner_mocks.mocked_run_history.return_value.record.\
+        call_args.args[0]
+    assert recorded.exit_status == 1
+    assert recorded.ref is None
+    assert recorded.workspace is not None
+
+  def test_apply__exception__records_failed_run(
+      self,
+      concrete_provisioning_job_with_mocked_extractor: ProvisionerJobBase,
+      mocked_validate_environment: mock.Mock,
+      provisioner_mocks: ProvisionerMocks,
+  ) -> None:
+    mocked_validate_environment.return_value = {
+        'is_valid': True,
+        'violations': [],
+    }
+    provisioner_mocks.mocked_sudo.return_value.prompt_for_sudo.side_effect = (
+        KeyboardInterrupt
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+      concrete_provisioning_job_with_mocked_extractor.apply()
+
+    provisioner_mocks.mocked_ansible_runner.assert_not_called()
+    recorded = provisioner_mocks.mocked_run_history.return_value.record.\
+        call_args.args[0]
+    assert recorded.exit_status == 1
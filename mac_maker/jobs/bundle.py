@@ -0,0 +1,46 @@
+"""A provisioning job for a Profile in an offline bundle."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+from mac_maker.jobs.bases.provisioner import ProvisionerJobBase
+from mac_maker.utilities.bundle import Bundle
+from mac_maker.utilities.workspace import WorkSpace
+
+
+class BundleJob(ProvisionerJobBase):
+  """A provisioning job for a Profile in an offline bundle.
+
+  The bundle already contains the profile's Galaxy requirements, so no
+  network access is required.
+
+  :param bundle_file: The path to the bundle file.
+  """
+
+  bundle_file: str
+  offline = True
+  source = "bundle"
+  workspace: Optional[WorkSpace]
+
+  class Messages(ProvisionerJobBase.Messages):
+    load_bundle_profile = "--- Loading Bundled Profile ---"
+
+  def __init__(self, bundle_file: str):
+    super().__init__()
+    self.bundle_file = bundle_file
+    self.location = str(Path(bundle_file).resolve())
+    self.workspace = None
+
+  def initialize_spec_file(self) -> None:
+    """Initialize the spec file for this provisioning job."""
+
+    click.echo(self.Messages.load_bundle_profile)
+
+    bundle = Bundle(self.bundle_file)
+    manifest = bundle.get_manifest()
+    self.workspace = WorkSpace(str(Path(self.bundle_file).resolve()))
+    self.workspace.add_bundle(bundle)
+    self.workspace.add_spec_file(source_commit=manifest["source_commit"])
+    self.spec_file.path = str(self.workspace.spec_file)
+    self.spec_file.load()
@@ -0,0 +1,49 @@
+"""A simple job to bundle a Profile for offline provisioning."""
+
+import sys
+from pathlib import Path
+
+import click
+from mac_maker.ansible_controller.config_file import AnsibleConfigFile
+from mac_maker.ansible_controller.runner import AnsibleRunner
+from mac_maker.jobs.bases.provisioner import ProvisionerJobBase
+from mac_maker.jobs.bases.simple import SimpleJobBase
+from mac_maker.utilities.bundle import Bundle
+
+
+class BundleBuilderJob(SimpleJobBase):
+  """Bundle a Profile, and its Galaxy requirements, for offline provisioning.
+
+  :param job: The provisioning job retrieving the profile to bundle.
+  :param bundle_file: The path to write the bundle file to.
+  """
+
+  class Messages:
+    bundle_created = "--- Bundle Created: %s ---"
+    bundle_failed = "Unable to install the profile's Galaxy requirements!"
+    create_bundle = "--- Creating Bundle ---"
+
+  def __init__(self, job: ProvisionerJobBase, bundle_file: str) -> None:
+    self.job = job
+    self.bundle = Bundle(bundle_file)
+
+  def invoke(self) -> None:
+    """Retrieve the profile, install its requirements and bundle them."""
+
+    spec = self.job.get_spec()
+
+    try:
+      AnsibleRunner(spec).install()
+    except ChildProcessError:
+      click.echo(self.Messages.bundle_failed)
+      sys.exit(1)
+
+    click.echo(self.Messages.create_bundle)
+    profile_root = Path(spec.workspace_root_path)
+    machine_specific = [Path(spec.inventory), AnsibleConfigFile(spec).path]
+    self.bundle.create(
+        profile_root,
+        exclude=machine_specific,
+        source_commit=spec.source_commit,
+    )
+    click.echo(self.Messages.bundle_created % self.bundle.path)
@@ -1,5 +1,6 @@
 """A provisioning job for a Profile in a file system folder."""
 
+from pathlib import Path
 from typing import Optional
 
 import click
@@ -11,17 +12,22 @@ class FolderJob(ProvisionerJobBase):
   """A provisioning job for a Profile in a file system folder.
 
   :param folder_path: The local file system folder path containing a profile.
+  :param persistent: Reuse a persistent workspace for this folder.
   """
 
   folder_path: str
+  persistent: bool
+  source = "folder"
   workspace: Optional[WorkSpace]
 
   class Messages(ProvisionerJobBase.Messages):
     load_folder_profile = "--- Loading Folder Profile ---"
 
-  def __init__(self, folder_path: str):
+  def __init__(self, folder_path: str, persistent: bool = False):
     super().__init__()
     self.folder_path = folder_path
+    self.location = str(Path(folder_path).resolve())
+    self.persistent = persistent
     self.workspace = None
 
   def initialize_spec_file(self) -> None:
@@ -29,7 +35,10 @@ class FolderJob(ProvisionerJobBase):
 
     click.echo(self.Messages.load_folder_profile)
 
-    self.workspace = WorkSpace()
+    self.workspace = WorkSpace(
+        str(Path(self.folder_path).resolve()),
+        self.persistent,
+    )
     self.workspace.add_folder(self.folder_path)
     self.workspace.add_spec_file()
     self.spec_file.path = str(self.workspace.spec_file)
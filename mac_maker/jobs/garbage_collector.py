@@ -0,0 +1,44 @@
+"""A simple job to evict unused workspaces and caches."""
+
+import click
+from mac_maker import config
+from mac_maker.jobs.bases.simple import SimpleJobBase
+from mac_maker.utilities.garbage_collector import GarbageCollector
+
+
+class GarbageCollectorJob(SimpleJobBase):
+  """Evict unused workspaces and caches, within size and age budgets.
+
+  :param max_size: The maximum combined size of all entries in bytes.
+  :param max_age: The maximum number of seconds an entry may remain unused.
+  :param verbose: Report the results of the collection.
+  """
+
+  class Messages:
+    report = (
+        "Reclaimed %s bytes from %s entries in %.3f seconds "
+        "(%s bytes remain)."
+    )
+
+  def __init__(
+      self,
+      max_size: int = config.GC_MAX_SIZE,
+      max_age: int = config.GC_MAX_AGE,
+      verbose: bool = True,
+  ) -> None:
+    self.garbage_collector = GarbageCollector(max_size, max_age)
+    self.verbose = verbose
+
+  def invoke(self) -> None:
+    """Evict unused workspaces and caches."""
+
+    report = self.garbage_collector.collect()
+    if self.verbose:
+      click.echo(
+          self.Messages.report % (
+              report.reclaimed,
+              report.evicted,
+              report.elapsed,
+              report.remaining,
+          )
+      )
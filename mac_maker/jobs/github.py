@@ -3,7 +3,11 @@
 from typing import Optional
 
 import click
+from mac_maker import config
 from mac_maker.jobs.bases.provisioner import ProvisionerJobBase
+from mac_maker.profile.precheck import TypePrecheckFileData
+from mac_maker.profile.spec_file import SpecFileContentNotDefined
+from mac_maker.utilities.archive_cache import ArchiveCache
 from mac_maker.utilities.github import GithubRepository
 from mac_maker.utilities.workspace import WorkSpace
 
@@ -13,28 +17,81 @@ class GitHubJob(ProvisionerJobBase):
 
   :param repository_url: The GitHub Repository URL.
   :param branch_name: The GitHub Repository branch name.
+  :param archive_format: The GitHub bundle format to download.
+  :param persistent: Reuse a persistent workspace for this repository.
   """
 
   branch_name: Optional[str]
+  commit: Optional[str]
+  persistent: bool
   repository_url: str
+  source = "github"
   workspace: Optional[WorkSpace]
 
   class Messages(ProvisionerJobBase.Messages):
     retrieve_github_profile = "--- Retrieving Remote Profile ---"
 
-  def __init__(self, repository_url: str, branch_name: Optional[str]):
+  def __init__(
+      self,
+      repository_url: str,
+      branch_name: Optional[str],
+      archive_format: str = config.GITHUB_DEFAULT_ARCHIVE_FORMAT,
+      persistent: bool = False,
+  ):
     super().__init__()
     self.branch_name = branch_name
-    self.repository = GithubRepository(repository_url)
+    self.commit = None
+    self.persistent = persistent
+    self.repository = GithubRepository(
+        repository_url,
+        cache=ArchiveCache(),
+        archive_format=archive_format,
+    )
+    self.location = self.repository.get_http_url()
     self.workspace = None
 
+  def get_commit(self) -> str:
+    """Resolve the job's branch or tag to a commit SHA, once per job.
+
+    Every retrieval in this job uses the same commit, so the precheck and the
+    provisioned profile always come from identical repository content.
+
+    :returns: The commit SHA used by this job.
+    """
+
+    if self.commit is None:
+      self.commit = self.repository.resolve_commit(self.branch_name)
+    return self.commit
+
+  def get_precheck_content(self) -> TypePrecheckFileData:
+    """Extract the Profile's Precheck file contents.
+
+    Until the profile has been retrieved, only the precheck files themselves
+    are read from the GitHub repository.
+
+    :returns: The Precheck file data.
+    """
+
+    try:
+      self.spec_file.content
+    except SpecFileContentNotDefined:
+      return self.precheck_extractor.get_repository_precheck_data(
+          self.repository,
+          self.get_commit(),
+      )
+    return super().get_precheck_content()
+
   def initialize_spec_file(self) -> None:
     """Initialize the spec file for this provisioning job."""
 
     click.echo(self.Messages.retrieve_github_profile)
 
-    self.workspace = WorkSpace()
-    self.workspace.add_repository(self.repository, self.branch_name)
-    self.workspace.add_spec_file()
+    self.workspace = WorkSpace(
+        self.repository.get_http_url(),
+        self.persistent,
+    )
+    commit = self.get_commit()
+    self.workspace.add_repository(self.repository, commit)
+    self.workspace.add_spec_file(source_commit=commit)
     self.spec_file.path = str(self.workspace.spec_file)
     self.spec_file.load()
@@ -0,0 +1,67 @@
+"""A simple job to report the history of provisioning runs."""
+
+import time
+from typing import Optional
+
+import click
+from mac_maker import config
+from mac_maker.jobs.bases.simple import SimpleJobBase
+from mac_maker.utilities.run_history import RunHistory, RunHistoryEntry
+
+
+class HistoryJob(SimpleJobBase):
+  """Report the most recent provisioning runs, and their phase durations.
+
+  :param limit: The maximum number of runs to report.
+  :param source: Only report runs from this profile source.
+  """
+
+  class Messages:
+    empty = "No provisioning runs have been recorded."
+    header = (
+        "Started           Source  Ref           Status  Workspace  Precheck"
+        "    Galaxy  Playbook     OK  Changed  Failed  Location"
+    )
+    row = "%-16s  %-6s  %-12s  %6s  %9s  %8s  %8s  %8s  %5s  %7s  %6s  %s"
+
+  def __init__(
+      self,
+      limit: int = config.RUN_HISTORY_LIMIT,
+      source: Optional[str] = None,
+  ) -> None:
+    self.limit = limit
+    self.run_history = RunHistory()
+    self.source = source
+
+  def invoke(self) -> None:
+    """Report the most recent provisioning runs."""
+
+    entries = self.run_history.query(self.limit, self.source)
+    if not entries:
+      click.echo(self.Messages.empty)
+      return
+
+    click.echo(self.Messages.header)
+    for entry in entries:
+      click.echo(self._format_entry(entry))
+
+  def _format_entry(self, entry: RunHistoryEntry) -> str:
+    return self.Messages.row % (
+        time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.started)),
+        entry.source,
+        (entry.ref or config.TIMING_REPORT_UNNAMED)[:12],
+        entry.exit_status,
+        self._format_duration(entry.workspace),
+        self._format_duration(entry.precheck),
+        self._format_duration(entry.galaxy),
+        self._format_duration(entry.playbook),
+        entry.tasks_ok,
+        entry.tasks_changed,
+        entry.tasks_failed + entry.tasks_unreachable,
+        entry.location,
+    )
+
+  def _format_duration(self, duration: Optional[float]) -> str:
+    if duration is None:
+      return config.TIMING_REPORT_UNNAMED
+    return f"{duration:.1f}s"
@@ -1,5 +1,7 @@
 """A provisioning job for a spec file on the local file system."""
 
+from pathlib import Path
+
 from mac_maker.jobs.bases.provisioner import ProvisionerJobBase
 
 
@@ -9,10 +11,12 @@ class SpecFileJob(ProvisionerJobBase):
   :param spec_file_location: The path to the spec file.
   """
 
+  source = "spec"
   spec_file_location: str
 
   def __init__(self, spec_file_location: str):
     super().__init__()
+    self.location = str(Path(spec_file_location).resolve())
     self.spec_file.path = spec_file_location
 
   def initialize_spec_file(self) -> None:
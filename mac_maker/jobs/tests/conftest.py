@@ -5,9 +5,46 @@ from typing import Callable
 from unittest import mock
 
 import pytest
-from mac_maker.jobs import folder, github, spec_file, version
+from mac_maker.ansible_controller.spec import Spec
+from mac_maker.jobs import (
+    bundle,
+    bundle_builder,
+    folder,
+    garbage_collector,
+    github,
+    history,
+    spec_file,
+    version,
+)
 from mac_maker.jobs.bases import provisioner
 from mac_maker.profile.spec_file import SpecFile
+from mac_maker.utilities.garbage_collector import GarbageCollectorReport
+
+
+@pytest.fixture
+def mocked_ansible_runner() -> mock.Mock:
+  return mock.Mock()
+
+
+@pytest.fixture
+def mocked_archive_cache() -> mock.Mock:
+  return mock.Mock()
+
+
+@pytest.fixture
+def mocked_bundle() -> mock.Mock:
+  instance = mock.Mock()
+  instance.return_value.get_manifest.return_value = {
+      "version": 1,
+      "profile_root": "mock-profile",
+      "source_commit": "abc123",
+  }
+  return instance
+
+
+@pytest.fixture
+def mocked_bundle_file() -> str:
+  return "/path/to/bundle/file"
 
 
 @pytest.fixture
@@ -20,6 +57,18 @@ def mocked_folder_path() -> str:
   return "/path/to/folder"
 
 
+@pytest.fixture
+def mocked_garbage_collector() -> mock.Mock:
+  instance = mock.Mock()
+  instance.return_value.collect.return_value = GarbageCollectorReport(
+      evicted=2,
+      reclaimed=2048,
+      remaining=1024,
+      elapsed=0.5,
+  )
+  return instance
+
+
 @pytest.fixture
 def mocked_github_repository() -> mock.Mock:
   return mock.Mock()
@@ -30,6 +79,18 @@ def mocked_precheck_extractor() -> mock.Mock:
   return mock.Mock()
 
 
+@pytest.fixture
+def mocked_provisioner_job(global_spec_mock: Spec) -> mock.Mock:
+  instance = mock.Mock()
+  instance.get_spec.return_value = global_spec_mock
+  return instance
+
+
+@pytest.fixture
+def mocked_run_history() -> mock.Mock:
+  return mock.Mock()
+
+
 @pytest.fixture
 def mocked_spec_file(global_spec_file_mock: SpecFile) -> mock.Mock:
   return mock.Mock(return_value=global_spec_file_mock)
@@ -46,6 +107,68 @@ def mocked_workspace() -> mock.Mock:
   return instance
 
 
+@pytest.fixture
+def setup_bundle_builder_job_module(
+    mocked_ansible_runner: mock.Mock,
+    mocked_bundle: mock.Mock,
+    mocked_click_echo: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[], None]:
+
+  def setup() -> None:
+    monkeypatch.setattr(
+        bundle_builder,
+        "AnsibleRunner",
+        mocked_ansible_runner,
+    )
+    monkeypatch.setattr(
+        bundle_builder,
+        "Bundle",
+        mocked_bundle,
+    )
+    monkeypatch.setattr(
+        bundle_builder,
+        "click",
+        mock.Mock(echo=mocked_click_echo),
+    )
+
+  return setup
+
+
+@pytest.fixture
+def setup_bundle_job_module(
+    mocked_bundle: mock.Mock,
+    mocked_click_echo: mock.Mock,
+    mocked_spec_file: mock.Mock,
+    mocked_workspace: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[], None]:
+
+  def setup() -> None:
+    monkeypatch.setattr(
+        bundle,
+        "Bundle",
+        mocked_bundle,
+    )
+    monkeypatch.setattr(
+        bundle,
+        "click",
+        mock.Mock(echo=mocked_click_echo),
+    )
+    monkeypatch.setattr(
+        provisioner,
+        "SpecFile",
+        mocked_spec_file,
+    )
+    monkeypatch.setattr(
+        bundle,
+        "WorkSpace",
+        mocked_workspace,
+    )
+
+  return setup
+
+
 @pytest.fixture
 def setup_folder_job_module(
     mocked_click_echo: mock.Mock,
@@ -74,8 +197,31 @@ def setup_folder_job_module(
   return setup
 
 
+@pytest.fixture
+def setup_garbage_collector_job_module(
+    mocked_click_echo: mock.Mock,
+    mocked_garbage_collector: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[], None]:
+
+  def setup() -> None:
+    monkeypatch.setattr(
+        garbage_collector,
+        "click",
+        mock.Mock(echo=mocked_click_echo),
+    )
+    monkeypatch.setattr(
+        garbage_collector,
+        "GarbageCollector",
+        mocked_garbage_collector,
+    )
+
+  return setup
+
+
 @pytest.fixture
 def setup_github_job_module(
+    mocked_archive_cache: mock.Mock,
     mocked_click_echo: mock.Mock,
     mocked_github_repository: mock.Mock,
     mocked_spec_file: mock.Mock,
@@ -84,6 +230,11 @@ def setup_github_job_module(
 ) -> Callable[[], None]:
 
   def setup() -> None:
+    monkeypatch.setattr(
+        github,
+        "ArchiveCache",
+        mocked_archive_cache,
+    )
     monkeypatch.setattr(
         github,
         "click",
@@ -108,6 +259,28 @@ def setup_github_job_module(
   return setup
 
 
+@pytest.fixture
+def setup_history_job_module(
+    mocked_click_echo: mock.Mock,
+    mocked_run_history: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[], None]:
+
+  def setup() -> None:
+    monkeypatch.setattr(
+        history,
+        "click",
+        mock.Mock(echo=mocked_click_echo),
+    )
+    monkeypatch.setattr(
+        history,
+        "RunHistory",
+        mocked_run_history,
+    )
+
+  return setup
+
+
 @pytest.fixture
 def setup_spec_file_job_module(
     mocked_click_echo: mock.Mock,
@@ -152,6 +325,30 @@ def setup_version_job_module(
   return setup
 
 
+@pytest.fixture
+def bundle_builder_job_instance(
+    mocked_bundle_file: str,
+    mocked_provisioner_job: mock.Mock,
+    setup_bundle_builder_job_module: Callable[[], None],
+) -> bundle_builder.BundleBuilderJob:
+  setup_bundle_builder_job_module()
+
+  return bundle_builder.BundleBuilderJob(
+      mocked_provisioner_job,
+      mocked_bundle_file,
+  )
+
+
+@pytest.fixture
+def bundle_job_instance(
+    mocked_bundle_file: str,
+    setup_bundle_job_module: Callable[[], None],
+) -> bundle.BundleJob:
+  setup_bundle_job_module()
+
+  return bundle.BundleJob(mocked_bundle_file)
+
+
 @pytest.fixture
 def folder_job_instance(
     mocked_folder_path: str,
@@ -176,6 +373,15 @@ def github_job_instance(
   )
 
 
+@pytest.fixture
+def history_job_instance(
+    setup_history_job_module: Callable[[], None],
+) -> history.HistoryJob:
+  setup_history_job_module()
+
+  return history.HistoryJob()
+
+
 @pytest.fixture
 def spec_file_job_instance(
     mocked_spec_file_path: str,
@@ -0,0 +1,102 @@
+"""Test the BundleJob class."""
+
+from pathlib import Path
+from unittest import mock
+
+from mac_maker.jobs.bases.provisioner import ProvisionerJobBase
+from mac_maker.jobs.bundle import BundleJob
+
+
+class TestBundleJob:
+  """Test the BundleJob class."""
+
+  def test_initialize__has_correct_inheritance(
+      self,
+      mocked_bundle_file: str,
+  ) -> None:
+    instance = BundleJob(mocked_bundle_file)
+
+    assert isinstance(instance, BundleJob)
+    assert isinstance(instance, ProvisionerJobBase)
+
+  def test_initialize__has_correct_attributes(
+      self,
+      mocked_bundle_file: str,
+  ) -> None:
+    instance = BundleJob(mocked_bundle_file)
+
+    assert instance.bundle_file == mocked_bundle_file
+    assert instance.location == str(Path(mocked_bundle_file).resolve())
+    assert instance.offline is True
+    assert instance.source == "bundle"
+    assert instance.workspace is None
+
+  def test_initialize_spec_file__calls_echo(
+      self,
+      mocked_click_echo: mock.Mock,
+      bundle_job_instance: BundleJob,
+  ) -> None:
+    bundle_job_instance.initialize_spec_file()
+
+    mocked_click_echo.assert_called_once_with(
+        bundle_job_instance.Messages.load_bundle_profile
+    )
+
+  def test_initialize_spec_file__validates_bundle(
+      self,
+      mocked_bundle: mock.Mock,
+      mocked_bundle_file: str,
+      bundle_job_instance: BundleJob,
+  ) -> None:
+    bundle_job_instance.initialize_spec_file()
+
+    mocked_bundle.assert_called_once_with(mocked_bundle_file)
+    mocked_bundle.return_value.get_manifest.assert_called_once_with()
+
+  def test_initialize_spec_file__creates_workspace(
+      self,
+      mocked_bundle_file: str,
+      mocked_workspace: mock.Mock,
+      bundle_job_instance: BundleJob,
+  ) -> None:
+    bundle_job_instance.initialize_spec_file()
+
+    mocked_workspace.assert_called_once_with(
+        str(Path(mocked_bundle_file).resolve())
+    )
+    assert bundle_job_instance.workspace == mocked_workspace.return_value
+
+  def test_initialize_spec_file__adds_bundle_to_workspace(
+      self,
+      mocked_bundle: mock.Mock,
+      mocked_workspace: mock.Mock,
+      bundle_job_instance: BundleJob,
+  ) -> None:
+    bundle_job_instance.initialize_spec_file()
+
+    mocked_workspace.return_value.add_bundle.assert_called_once_with(
+        mocked_bundle.return_value
+    )
+
+  def test_initialize_spec_file__adds_spec_file_to_workspace(
+      self,
+      mocked_workspace: mock.Mock,
+      bundle_job_instance: BundleJob,
+  ) -> None:
+    bundle_job_instance.initialize_spec_file()
+
+    mocked_workspace.return_value.add_spec_file.assert_called_once_with(
+        source_commit="abc123"
+    )
+
+  def test_initialize_spec_file__loads_spec_file(
+      self,
+      mocked_spec_file: mock.Mock,
+      bundle_job_instance: BundleJob,
+  ) -> None:
+    bundle_job_instance.initialize_spec_file()
+
+    assert bundle_job_instance.workspace is not None
+    assert mocked_spec_file.return_value.path == \
+        str(bundle_job_instance.workspace.spec_file)
+    mocked_spec_file.return_value.load.assert_called_once_with()
@@ -0,0 +1,95 @@
+"""Test the BundleBuilderJob class."""
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from mac_maker import config
+from mac_maker.ansible_controller.spec import Spec
+from mac_maker.jobs.bases.simple import SimpleJobBase
+from mac_maker.jobs.bundle_builder import BundleBuilderJob
+
+
+class TestBundleBuilderJob:
+  """Test the BundleBuilderJob class."""
+
+  def test_initialize__has_correct_inheritance(
+      self,
+      bundle_builder_job_instance: BundleBuilderJob,
+  ) -> None:
+    assert isinstance(bundle_builder_job_instance, SimpleJobBase)
+
+  def test_initialize__has_correct_attributes(
+      self,
+      mocked_bundle: mock.Mock,
+      mocked_bundle_file: str,
+      mocked_provisioner_job: mock.Mock,
+      bundle_builder_job_instance: BundleBuilderJob,
+  ) -> None:
+    mocked_bundle.assert_called_once_with(mocked_bundle_file)
+    assert bundle_builder_job_instance.bundle == mocked_bundle.return_value
+    assert bundle_builder_job_instance.job == mocked_provisioner_job
+
+  def test_invoke__installs_galaxy_requirements(
+      self,
+      global_spec_mock: Spec,
+      mocked_ansible_runner: mock.Mock,
+      bundle_builder_job_instance: BundleBuilderJob,
+  ) -> None:
+    bundle_builder_job_instance.invoke()
+
+    mocked_ansible_runner.assert_called_once_with(global_spec_mock)
+    mocked_ansible_runner.return_value.install.assert_called_once_with()
+    mocked_ansible_runner.return_value.start.assert_not_called()
+
+  def test_invoke__creates_bundle_without_machine_specific_files(
+      self,
+      global_spec_mock: Spec,
+      mocked_bundle: mock.Mock,
+      bundle_builder_job_instance: BundleBuilderJob,
+  ) -> None:
+    bundle_builder_job_instance.invoke()
+
+    mocked_bundle.return_value.create.assert_called_once_with(
+        Path(global_spec_mock.workspace_root_path),
+        exclude=[
+            Path(global_spec_mock.inventory),
+            Path(global_spec_mock.profile_data_path) /
+            config.ANSIBLE_CONFIG_FILE,
+        ],
+        source_commit=global_spec_mock.source_commit,
+    )
+
+  def test_invoke__calls_echo(
+      self,
+      mocked_bundle: mock.Mock,
+      mocked_click_echo: mock.Mock,
+      bundle_builder_job_instance: BundleBuilderJob,
+  ) -> None:
+    bundle_builder_job_instance.invoke()
+
+    assert mocked_click_echo.call_args_list == [
+        mock.call(bundle_builder_job_instance.Messages.create_bundle),
+        mock.call(
+            bundle_builder_job_instance.Messages.bundle_created %
+            mocked_bundle.return_value.path
+        ),
+    ]
+
+  def test_invoke__install_fails__exits_without_bundle(
+      self,
+      mocked_ansible_runner: mock.Mock,
+      mocked_bundle: mock.Mock,
+      mocked_click_echo: mock.Mock,
+      bundle_builder_job_instance: BundleBuilderJob,
+  ) -> None:
+    mocked_ansible_runner.return_value.install.side_effect = ChildProcessError
+
+    with pytest.raises(SystemExit) as exc:
+      bundle_builder_job_instance.invoke()
+
+    assert exc.value.code == 1
+    mocked_bundle.return_value.create.assert_not_called()
+    mocked_click_echo.assert_called_once_with(
+        bundle_builder_job_instance.Messages.bundle_failed
+    )
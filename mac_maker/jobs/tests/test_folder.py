@@ -1,5 +1,6 @@
 """Test the FolderJob class."""
 
+from pathlib import Path
 from typing import Callable
 from unittest import mock
 
@@ -36,6 +37,9 @@ class TestFolderJob:
     instance = FolderJob(folder_path)
 
     assert instance.folder_path == folder_path
+    assert instance.location == str(Path(folder_path).resolve())
+    assert instance.persistent is False
+    assert instance.source == "folder"
     assert instance.workspace is None
 
   def test_initialize_spec_file__calls_echo(
@@ -61,9 +65,29 @@ class TestFolderJob:
 
     instance.initialize_spec_file()
 
-    mocked_workspace.assert_called_once_with()
+    mocked_workspace.assert_called_once_with(
+        str(Path(folder_path).resolve()),
+        False,
+    )
     assert instance.workspace == mocked_workspace.return_value
 
+  @vary_folder
+  def test_initialize_spec_file__vary_folder__persistent__creates_workspace(
+      self,
+      mocked_workspace: mock.Mock,
+      setup_folder_job_module: Callable[[], None],
+      folder_path: str,
+  ) -> None:
+    setup_folder_job_module()
+    instance = FolderJob(folder_path, persistent=True)
+
+    instance.initialize_spec_file()
+
+    mocked_workspace.assert_called_once_with(
+        str(Path(folder_path).resolve()),
+        True,
+    )
+
   @vary_folder
   def test_initialize_spec_file__vary_folder__adds_folder_to_workspace(
       self,
@@ -0,0 +1,69 @@
+"""Test the GarbageCollectorJob class."""
+
+from typing import Callable
+from unittest import mock
+
+from mac_maker import config
+from mac_maker.jobs.bases.simple import SimpleJobBase
+from mac_maker.jobs.garbage_collector import GarbageCollectorJob
+
+
+class TestGarbageCollectorJob:
+  """Test the GarbageCollectorJob class."""
+
+  def test_initialize__has_correct_inheritance(
+      self,
+      mocked_garbage_collector: mock.Mock,
+      setup_garbage_collector_job_module: Callable[[], None],
+  ) -> None:
+    setup_garbage_collector_job_module()
+
+    instance = GarbageCollectorJob()
+
+    assert isinstance(instance, SimpleJobBase)
+    assert instance.verbose is True
+    mocked_garbage_collector.assert_called_once_with(
+        config.GC_MAX_SIZE,
+        config.GC_MAX_AGE,
+    )
+
+  def test_initialize__budgets__creates_garbage_collector(
+      self,
+      mocked_garbage_collector: mock.Mock,
+      setup_garbage_collector_job_module: Callable[[], None],
+  ) -> None:
+    setup_garbage_collector_job_module()
+
+    GarbageCollectorJob(1024, 60)
+
+    mocked_garbage_collector.assert_called_once_with(1024, 60)
+
+  def test_invoke__verbose__collects_and_reports(
+      self,
+      mocked_click_echo: mock.Mock,
+      mocked_garbage_collector: mock.Mock,
+      setup_garbage_collector_job_module: Callable[[], None],
+  ) -> None:
+    setup_garbage_collector_job_module()
+    instance = GarbageCollectorJob()
+
+    instance.invoke()
+
+    mocked_garbage_collector.return_value.collect.assert_called_once_with()
+    mocked_click_echo.assert_called_once_with(
+        instance.Messages.report % (2048, 2, 0.5, 1024)
+    )
+
+  def test_invoke__not_verbose__collects_silently(
+      self,
+      mocked_click_echo: mock.Mock,
+      mocked_garbage_collector: mock.Mock,
+      setup_garbage_collector_job_module: Callable[[], None],
+  ) -> None:
+    setup_garbage_collector_job_module()
+    instance = GarbageCollectorJob(verbose=False)
+
+    instance.invoke()
+
+    mocked_garbage_collector.return_value.collect.assert_called_once_with()
+    mocked_click_echo.assert_not_called()
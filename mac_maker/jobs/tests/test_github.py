@@ -4,7 +4,9 @@ from typing import Callable, Optional
 from unittest import mock
 
 import pytest
+from mac_maker import config
 from mac_maker.__helpers__.parametrize import templated_parameters
+from mac_maker.ansible_controller.spec import Spec
 from mac_maker.jobs.bases.provisioner import ProvisionerJobBase
 from mac_maker.jobs.github import GitHubJob
 
@@ -43,11 +45,15 @@ class TestGitHubJob:
     instance = GitHubJob(url, branch_name)
 
     assert instance.branch_name == branch_name
+    assert instance.location == instance.repository.get_http_url()
+    assert instance.persistent is False
+    assert instance.source == "github"
     assert instance.workspace is None
 
   @valid_url_parameterization
   def test_initialize__valid_url__vary_parameters__has_github_repository(
       self,
+      mocked_archive_cache: mock.Mock,
       mocked_github_repository: mock.Mock,
       setup_github_job_module: Callable[[], None],
       url: str,
@@ -58,7 +64,83 @@ class TestGitHubJob:
     instance = GitHubJob(url, branch_name)
 
     assert instance.repository == mocked_github_repository.return_value
-    mocked_github_repository.assert_called_once_with(url)
+    mocked_archive_cache.assert_called_once_with()
+    mocked_github_repository.assert_called_once_with(
+        url,
+        cache=mocked_archive_cache.return_value,
+        archive_format=config.GITHUB_DEFAULT_ARCHIVE_FORMAT,
+    )
+
+  def test_initialize__tarball_archive_format__has_github_repository(
+      self,
+      mocked_archive_cache: mock.Mock,
+      mocked_github_repository: mock.Mock,
+      setup_github_job_module: Callable[[], None],
+  ) -> None:
+    setup_github_job_module()
+
+    GitHubJob(self.valid_url, None, "tarball")
+
+    mocked_github_repository.assert_called_once_with(
+        self.valid_url,
+        cache=mocked_archive_cache.return_value,
+        archive_format="tarball",
+    )
+
+  @valid_url_parameterization
+  def test_get_commit__vary_branch__resolves_once(
+      self,
+      mocked_github_repository: mock.Mock,
+      setup_github_job_module: Callable[[], None],
+      url: str,
+      branch_name: Optional[str],
+  ) -> None:
+    setup_github_job_module()
+    instance = GitHubJob(url, branch_name)
+
+    first = instance.get_commit()
+    second = instance.get_commit()
+
+    resolve_commit = mocked_github_repository.return_value.resolve_commit
+    resolve_commit.assert_called_once_with(branch_name)
+    assert first == second == resolve_commit.return_value
+    assert instance.commit == resolve_commit.return_value
+
+  def test_get_precheck_content__no_spec_file__reads_repository(
+      self,
+      mocked_github_repository: mock.Mock,
+      mocked_workspace: mock.Mock,
+      github_job_instance: GitHubJob,
+  ) -> None:
+    github_job_instance.precheck_extractor = mock.Mock()
+    extractor = github_job_instance.precheck_extractor
+
+    result = github_job_instance.get_precheck_content()
+
+    extractor.get_repository_precheck_data.assert_called_once_with(
+        github_job_instance.repository,
+        mocked_github_repository.return_value.resolve_commit.return_value,
+    )
+    extractor.get_precheck_data.assert_not_called()
+    assert result == extractor.get_repository_precheck_data.return_value
+    mocked_workspace.assert_not_called()
+
+  def test_get_precheck_content__spec_file__reads_workspace(
+      self,
+      global_spec_mock: Spec,
+      mocked_workspace: mock.Mock,
+      github_job_instance: GitHubJob,
+  ) -> None:
+    github_job_instance.precheck_extractor = mock.Mock()
+    github_job_instance.spec_file.content = global_spec_mock
+    extractor = github_job_instance.precheck_extractor
+
+    result = github_job_instance.get_precheck_content()
+
+    extractor.get_precheck_data.assert_called_once_with(global_spec_mock)
+    extractor.get_repository_precheck_data.assert_not_called()
+    assert result == extractor.get_precheck_data.return_value
+    mocked_workspace.assert_not_called()
 
   def test_initialize_spec_file__calls_echo(
       self,
@@ -74,6 +156,7 @@ class TestGitHubJob:
   @valid_url_parameterization
   def test_initialize_spec_file__creates_workspace(
       self,
+      mocked_github_repository: mock.Mock,
       mocked_workspace: mock.Mock,
       setup_github_job_module: Callable[[], None],
       url: str,
@@ -84,12 +167,35 @@ class TestGitHubJob:
 
     instance.initialize_spec_file()
 
-    mocked_workspace.assert_called_once_with()
+    mocked_workspace.assert_called_once_with(
+        mocked_github_repository.return_value.get_http_url.return_value,
+        False,
+    )
     assert instance.workspace == mocked_workspace.return_value
 
+  @valid_url_parameterization
+  def test_initialize_spec_file__persistent__creates_workspace(
+      self,
+      mocked_github_repository: mock.Mock,
+      mocked_workspace: mock.Mock,
+      setup_github_job_module: Callable[[], None],
+      url: str,
+      branch_name: Optional[str],
+  ) -> None:
+    setup_github_job_module()
+    instance = GitHubJob(url, branch_name, persistent=True)
+
+    instance.initialize_spec_file()
+
+    mocked_workspace.assert_called_once_with(
+        mocked_github_repository.return_value.get_http_url.return_value,
+        True,
+    )
+
   @valid_url_parameterization
   def test_initialize_spec_file__adds_repository_to_workspace(
       self,
+      mocked_github_repository: mock.Mock,
       mocked_workspace: mock.Mock,
       setup_github_job_module: Callable[[], None],
       url: str,
@@ -102,12 +208,13 @@ class TestGitHubJob:
 
     mocked_workspace.return_value.add_repository.assert_called_once_with(
         instance.repository,
-        branch_name,
+        mocked_github_repository.return_value.resolve_commit.return_value,
     )
 
   @valid_url_parameterization
   def test_initialize_spec_file__adds_spec_file_to_workspace(
       self,
+      mocked_github_repository: mock.Mock,
       mocked_workspace: mock.Mock,
       setup_github_job_module: Callable[[], None],
       url: str,
@@ -118,7 +225,10 @@ class TestGitHubJob:
 
     instance.initialize_spec_file()
 
-    mocked_workspace.return_value.add_spec_file.assert_called_once_with()
+    repository = mocked_github_repository.return_value
+    mocked_workspace.return_value.add_spec_file.assert_called_once_with(
+        source_commit=repository.resolve_commit.return_value,
+    )
 
   @valid_url_parameterization
   def test_initialize_spec_file__initializes_spec_file(
@@ -0,0 +1,111 @@
+"""Test the HistoryJob class."""
+
+import time
+from typing import Callable, Optional
+from unittest import mock
+
+import pytest
+from mac_maker import config
+from mac_maker.jobs.bases.simple import SimpleJobBase
+from mac_maker.jobs.history import HistoryJob
+from mac_maker.utilities.run_history import RunHistoryEntry
+
+
+class TestHistoryJob:
+  """Test the HistoryJob class."""
+
+  def create_entry(self, ref: Optional[str]) -> RunHistoryEntry:
+    return RunHistoryEntry(
+        started=1700000000.0,
+        source="github",
+        location="https://github.com/osx-provisioner/profile-example",
+        ref=ref,
+        exit_status=1,
+        workspace=1.25,
+        precheck=0.5,
+        galaxy=None,
+        playbook=320.0,
+        tasks_ok=10,
+        tasks_changed=4,
+        tasks_failed=1,
+        tasks_skipped=2,
+        tasks_unreachable=1,
+    )
+
+  def test_initialize__has_correct_inheritance(
+      self,
+      history_job_instance: HistoryJob,
+      mocked_run_history: mock.Mock,
+  ) -> None:
+    assert isinstance(history_job_instance, SimpleJobBase)
+    assert history_job_instance.limit == config.RUN_HISTORY_LIMIT
+    assert history_job_instance.run_history == mocked_run_history.return_value
+    assert history_job_instance.source is None
+
+  def test_invoke__vary_filters__queries_run_history(
+      self,
+      mocked_run_history: mock.Mock,
+      setup_history_job_module: Callable[[], None],
+  ) -> None:
+    setup_history_job_module()
+    mocked_run_history.return_value.query.return_value = []
+    instance = HistoryJob(5, "folder")
+
+    instance.invoke()
+
+    mocked_run_history.return_value.query.assert_called_once_with(5, "folder")
+
+  def test_invoke__no_entries__reports_empty_history(
+      self,
+      history_job_instance: HistoryJob,
+      mocked_click_echo: mock.Mock,
+      mocked_run_history: mock.Mock,
+  ) -> None:
+    mocked_run_history.return_value.query.return_value = []
+
+    history_job_instance.invoke()
+
+    mocked_click_echo.assert_called_once_with(
+        history_job_instance.Messages.empty
+    )
+
+  @pytest.mark.parametrize(
+      "ref,expected_ref",
+      (("a" * 40, "a" * 12), (None, config.TIMING_REPORT_UNNAMED)),
+      ids=("ref", "no_ref"),
+  )
+  def test_invoke__entries__reports_entries(
+      self,
+      history_job_instance: HistoryJob,
+      mocked_click_echo: mock.Mock,
+      mocked_run_history: mock.Mock,
+      ref: Optional[str],
+      expected_ref: str,
+  ) -> None:
+    entry = self.create_entry(ref)
+    mocked_run_history.return_value.query.return_value = [entry]
+
+    history_job_instance.invoke()
+
+    assert mocked_click_echo.mock_calls == [
+        mock.call(history_job_instance.Messages.header),
+        mock.call(
+            history_job_instance.Messages.row % (
+                time.strftime(
+                    "%Y-%m-%d %H:%M",
+                    time.localtime(entry.started),
+                ),
+                "github",
+                expected_ref,
+                1,
+                "1.2s",
+                "0.5s",
+                config.TIMING_REPORT_UNNAMED,
+                "320.0s",
+                10,
+                4,
+                2,
+                entry.location,
+            )
+        ),
+    ]
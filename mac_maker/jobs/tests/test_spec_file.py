@@ -1,5 +1,6 @@
 """Test the SpecFileJob class."""
 
+from pathlib import Path
 from unittest import mock
 
 from mac_maker.jobs.bases.provisioner import ProvisionerJobBase
@@ -25,6 +26,16 @@ class TestSpecFileJob:
   ) -> None:
     assert spec_file_job_instance.spec_file.path == mocked_spec_file_path
 
+  def test_initialize__has_correct_attributes(
+      self,
+      mocked_spec_file_path: str,
+      spec_file_job_instance: SpecFileJob,
+  ) -> None:
+    assert spec_file_job_instance.location == str(
+        Path(mocked_spec_file_path).resolve()
+    )
+    assert spec_file_job_instance.source == "spec"
+
   def test_initialize_spec_file__loads_spec_file(
       self,
       mocked_spec_file: mock.Mock,
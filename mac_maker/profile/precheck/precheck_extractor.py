@@ -1,10 +1,12 @@
 """Extractor for a profile's precheck data."""
 
 from pathlib import Path
+from typing import Optional
 
 from mac_maker import config
 from mac_maker.ansible_controller.spec import Spec
 from mac_maker.profile.precheck import TypePrecheckFileData
+from mac_maker.utilities.github import GithubRepository
 from mac_maker.utilities.mixins.text_file import TextFileReader
 
 
@@ -25,3 +27,19 @@ class PrecheckExtractor(TextFileReader):
         notes=self.read_text_file(workspace_root / config.PRECHECK['notes']),
         env=self.read_text_file(workspace_root / config.PRECHECK['env']),
     )
+
+  def get_repository_precheck_data(
+      self,
+      repository: GithubRepository,
+      branch_name: Optional[str],
+  ) -> TypePrecheckFileData:
+    """Read a GitHub profile's precheck data, without downloading the profile.
+
+    :param repository: The GitHub repository containing the profile.
+    :param branch_name: The branch of the repository to use.
+    :returns: The complete precheck contents.
+    """
+    return TypePrecheckFileData(
+        notes=repository.read_file(config.PRECHECK['notes'], branch_name),
+        env=repository.read_file(config.PRECHECK['env'], branch_name),
+    )
@@ -51,3 +51,45 @@ class TestPrecheckExtractor:
         notes=self.mocked_textfile_reader_result[0],
         env=self.mocked_textfile_reader_result[1],
     )
+
+  def test_get_repository_precheck_data__reads_correct_files(
+      self,
+      global_git_branch_mock: str,
+      precheck_extractor_instance: PrecheckExtractor,
+  ) -> None:
+    mocked_repository = mock.Mock()
+    mocked_repository.read_file.side_effect = (
+        self.mocked_textfile_reader_result
+    )
+
+    precheck_extractor_instance.get_repository_precheck_data(
+        mocked_repository,
+        global_git_branch_mock,
+    )
+
+    assert mocked_repository.read_file.mock_calls == [
+        mock.call(config.PRECHECK['notes'], global_git_branch_mock),
+        mock.call(config.PRECHECK['env'], global_git_branch_mock),
+    ]
+
+  def test_get_repository_precheck_data__returns_correct_data(
+      self,
+      global_git_branch_mock: str,
+      mocked_textfile_read: mock.Mock,
+      precheck_extractor_instance: PrecheckExtractor,
+  ) -> None:
+    mocked_repository = mock.Mock()
+    mocked_repository.read_file.side_effect = (
+        self.mocked_textfile_reader_result
+    )
+
+    result = precheck_extractor_instance.get_repository_precheck_data(
+        mocked_repository,
+        global_git_branch_mock,
+    )
+
+    assert result == TypePrecheckFileData(
+        notes=self.mocked_textfile_reader_result[0],
+        env=self.mocked_textfile_reader_result[1],
+    )
+    mocked_textfile_read.assert_not_called()
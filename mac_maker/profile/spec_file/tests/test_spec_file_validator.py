@@ -50,3 +50,18 @@ class TestSpecFileValidator:
     instance = SpecFileValidator(self.spec_data_valid)
 
     instance.validate()
+
+  def test_validate__source_commit__no_exception(self) -> None:
+    instance = SpecFileValidator(
+        dict(self.spec_data_valid, source_commit="a" * 40)
+    )
+
+    instance.validate()
+
+  def test_validate__invalid_source_commit__raises_exception(self) -> None:
+    instance = SpecFileValidator(
+        dict(self.spec_data_valid, source_commit="main")
+    )
+
+    with pytest.raises(exceptions.SpecFileValidationError):
+      instance.validate()
@@ -27,6 +27,20 @@ def mocked_job(request: pytest.FixtureRequest) -> mock.Mock:
   )
 
 
+@pytest.fixture
+def mocked_job_bundle(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+  instance = mock.Mock()
+  monkeypatch.setattr(cli.jobs, "BundleJob", instance)
+  return instance
+
+
+@pytest.fixture
+def mocked_job_bundle_builder(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+  instance = mock.Mock()
+  monkeypatch.setattr(cli.jobs, "BundleBuilderJob", instance)
+  return instance
+
+
 @pytest.fixture
 def mocked_job_folder(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
   instance = mock.Mock()
@@ -34,6 +48,13 @@ def mocked_job_folder(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
   return instance
 
 
+@pytest.fixture(autouse=True)
+def mocked_job_garbage_collector(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+  instance = mock.Mock()
+  monkeypatch.setattr(cli.jobs, "GarbageCollectorJob", instance)
+  return instance
+
+
 @pytest.fixture
 def mocked_job_github(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
   instance = mock.Mock()
@@ -41,6 +62,13 @@ def mocked_job_github(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
   return instance
 
 
+@pytest.fixture
+def mocked_job_history(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+  instance = mock.Mock()
+  monkeypatch.setattr(cli.jobs, "HistoryJob", instance)
+  return instance
+
+
 @pytest.fixture
 def mocked_job_spec_file(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
   instance = mock.Mock()
@@ -0,0 +1,76 @@
+"""Test harness for cases requiring a local HTTP server."""
+
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List
+
+
+class StandInServer(ThreadingHTTPServer):
+  """Local HTTP stand-in server, serving a single file."""
+
+  content = b""
+  failures = 0
+  etag = '"mock-etag"'
+  last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+  def __init__(self) -> None:
+    super().__init__(("127.0.0.1", 0), StandInRequestHandler)
+    self.responses: List[int] = []
+
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+  """Request handler honouring conditional request headers."""
+
+  server: StandInServer
+
+  def do_GET(self) -> None:  # pylint: disable=invalid-name
+    """Serve the configured content, or a 304 if it's unchanged.
+
+    Each status is recorded before the response is sent, so it's visible to
+    the client as soon as the response has been read.
+    """
+
+    if self.server.failures > 0:
+      self.server.failures -= 1
+      self.server.responses.append(503)
+      self.send_response(503)
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+      return
+
+    if self.headers.get("If-None-Match") == self.server.etag:
+      self.server.responses.append(304)
+      self.send_response(304)
+      self.end_headers()
+      return
+
+    self.server.responses.append(200)
+    self.send_response(200)
+    self.send_header("Content-Length", str(len(self.server.content)))
+    self.send_header("ETag", self.server.etag)
+    self.send_header("Last-Modified", self.server.last_modified)
+    self.end_headers()
+    self.wfile.write(self.server.content)
+
+  def log_message(self, *args: Any) -> None:
+    """Silence request logging."""
+
+
+class HttpTestHarness(unittest.TestCase):
+  """Test harness with a local HTTP stand-in server."""
+
+  def setUp(self) -> None:
+    super().setUp()
+    self.server = StandInServer()
+    self.server_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+    thread = threading.Thread(
+        target=self.server.serve_forever,
+        kwargs={
+            "poll_interval": 0.01
+        },
+        daemon=True,
+    )
+    thread.start()
+    self.addCleanup(self.server.server_close)
+    self.addCleanup(self.server.shutdown)
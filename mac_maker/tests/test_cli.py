@@ -1,5 +1,5 @@
 """Test the Mac Maker CLI."""
-from typing import Callable, Tuple, Union
+from typing import Callable, Optional, Tuple, Union
 from unittest import mock
 
 import pytest
@@ -10,6 +10,7 @@ from mac_maker.tests.conftest import InvokeType
 class TestCli:
   """Test the Mac Maker CLI."""
 
+  mocked_bundle_file = "/non/existent/bundle/path"
   mocked_folder_path = "/non/existent/folder/path"
   mocked_git_url = "https://github.com/non/existent/.git"
   mocked_git_branch = "develop"
@@ -84,29 +85,126 @@ class TestCli:
     mocked_job.assert_called_once_with()
     mocked_job.return_value.invoke.assert_called_once_with()
 
+  @pytest.mark.parametrize(
+      "command,args",
+      (
+          ("gc", (10 * 1024**3, 30 * 24 * 60 * 60)),
+          ("gc --max-size 1 --max-age 2", (1024**2, 2 * 24 * 60 * 60)),
+      ),
+      ids=("defaults", "options"),
+  )
+  def test_vary_gc_command__invokes_job_correctly(
+      self,
+      invoke: InvokeType,
+      mocked_job_garbage_collector: mock.Mock,
+      command: str,
+      args: Tuple[int, int],
+  ) -> None:
+    invoke(command)
+
+    mocked_job_garbage_collector.assert_called_once_with(*args)
+    mocked_job_garbage_collector.return_value.invoke.assert_called_once_with()
+
+  @pytest.mark.parametrize(
+      "command,args",
+      (
+          ("history", (20, None)),
+          ("history --limit 5 --source github", (5, "github")),
+      ),
+      ids=("defaults", "options"),
+  )
+  def test_vary_history_command__invokes_job_correctly(
+      self,
+      invoke: InvokeType,
+      mocked_job_history: mock.Mock,
+      command: str,
+      args: Tuple[int, Optional[str]],
+  ) -> None:
+    invoke(command)
+
+    mocked_job_history.assert_called_once_with(*args)
+    mocked_job_history.return_value.invoke.assert_called_once_with()
+
+  @pytest.mark.parametrize(
+      "mocked_job,command",
+      named_parameters(
+          (
+              "mocked_job_spec_file",
+              f"precheck spec {mocked_spec_file}",
+          ),
+          (
+              "mocked_job_github",
+              f"apply github {mocked_git_url}",
+          ),
+          names=[1],
+      ),
+      indirect=["mocked_job"],
+  )
+  def test_vary_provisioning_command__collects_garbage_after_job(
+      self,
+      invoke: InvokeType,
+      mocked_job: mock.Mock,
+      mocked_job_garbage_collector: mock.Mock,
+      setup_click_paths_exist: Callable[[], None],
+      command: str,
+  ) -> None:
+    setup_click_paths_exist()
+    calls = mock.Mock()
+    calls.attach_mock(mocked_job, "job")
+    calls.attach_mock(
+        mocked_job_garbage_collector.return_value.invoke,
+        "collect",
+    )
+
+    invoke(command)
+
+    mocked_job_garbage_collector.assert_called_once_with(verbose=False)
+    assert calls.mock_calls[-1] == mock.call.collect()
+    assert len(calls.mock_calls) > 1
+
   @pytest.mark.parametrize(
       "mocked_job,command,args",
       named_parameters(
           (
               "mocked_job_folder",
               f"precheck folder {mocked_folder_path}",
-              (mocked_folder_path,),
+              (mocked_folder_path, False),
           ),
           (
               "mocked_job_github",
               f"precheck github {mocked_git_url}",
-              (mocked_git_url, None),
+              (mocked_git_url, None, "zip", False),
           ),
           (
               "mocked_job_github",
               f"precheck github {mocked_git_url} --branch {mocked_git_branch}",
-              (mocked_git_url, mocked_git_branch),
+              (mocked_git_url, mocked_git_branch, "zip", False),
+          ),
+          (
+              "mocked_job_github",
+              f"precheck github {mocked_git_url} --archive-format tarball",
+              (mocked_git_url, None, "tarball", False),
+          ),
+          (
+              "mocked_job_github",
+              f"precheck github {mocked_git_url} --persistent",
+              (mocked_git_url, None, "zip", True),
+          ),
+          (
+              "mocked_job_folder",
+              f"precheck folder {mocked_folder_path} --persistent",
+              (mocked_folder_path, True),
           ),
           (
               "mocked_job_spec_file",
               f"precheck spec {mocked_spec_file}",
               (mocked_spec_file,),
           ),
+          (
+              "mocked_job_bundle",
+              f"precheck bundle {mocked_bundle_file}",
+              (mocked_bundle_file,),
+          ),
           names=[1],
       ),
       indirect=["mocked_job"],
@@ -161,17 +259,32 @@ class TestCli:
           (
               "mocked_job_folder",
               f"apply folder {mocked_folder_path}",
-              (mocked_folder_path,),
+              (mocked_folder_path, False),
           ),
           (
               "mocked_job_github",
               f"apply github {mocked_git_url}",
-              (mocked_git_url, None),
+              (mocked_git_url, None, "zip", False),
           ),
           (
               "mocked_job_github",
               f"apply github {mocked_git_url} --branch {mocked_git_branch}",
-              (mocked_git_url, mocked_git_branch),
+              (mocked_git_url, mocked_git_branch, "zip", False),
+          ),
+          (
+              "mocked_job_github",
+              f"apply github {mocked_git_url} --archive-format tarball",
+              (mocked_git_url, None, "tarball", False),
+          ),
+          (
+              "mocked_job_github",
+              f"apply github {mocked_git_url} --persistent",
+              (mocked_git_url, None, "zip", True),
+          ),
+          (
+              "mocked_job_folder",
+              f"apply folder {mocked_folder_path} --persistent",
+              (mocked_folder_path, True),
           ),
           (
               "mocked_job_spec_file",
@@ -182,7 +295,7 @@ class TestCli:
       ),
       indirect=["mocked_job"],
   )
-  def test_vary_apply_command__paths_exist__invokes_provision_correctly(
+  def test_vary_apply_command__paths_exist__invokes_apply_correctly(
       self,
       invoke: InvokeType,
       mocked_job: mock.Mock,
@@ -195,8 +308,80 @@ class TestCli:
     invoke(command)
 
     mocked_job.assert_called_once_with(*args)
-    mocked_job.return_value.precheck.assert_called_once_with(notes=False)
-    mocked_job.return_value.provision.assert_called_once_with()
+    mocked_job.return_value.apply.assert_called_once_with(
+        force_galaxy=False,
+        refresh_facts=False,
+    )
+
+  @pytest.mark.parametrize(
+      "mocked_job,command",
+      named_parameters(
+          (
+              "mocked_job_folder",
+              f"apply folder {mocked_folder_path} --force-galaxy",
+          ),
+          (
+              "mocked_job_github",
+              f"apply github {mocked_git_url} --force-galaxy",
+          ),
+          (
+              "mocked_job_spec_file",
+              f"apply spec {mocked_spec_file} --force-galaxy",
+          ),
+          names=[1],
+      ),
+      indirect=["mocked_job"],
+  )
+  def test_vary_apply_command__force_galaxy__invokes_apply_correctly(
+      self,
+      invoke: InvokeType,
+      mocked_job: mock.Mock,
+      setup_click_paths_exist: Callable[[], None],
+      command: str,
+  ) -> None:
+    setup_click_paths_exist()
+
+    invoke(command)
+
+    mocked_job.return_value.apply.assert_called_once_with(
+        force_galaxy=True,
+        refresh_facts=False,
+    )
+
+  @pytest.mark.parametrize(
+      "mocked_job,command",
+      named_parameters(
+          (
+              "mocked_job_folder",
+              f"apply folder {mocked_folder_path} --refresh-facts",
+          ),
+          (
+              "mocked_job_github",
+              f"apply github {mocked_git_url} --refresh-facts",
+          ),
+          (
+              "mocked_job_spec_file",
+              f"apply spec {mocked_spec_file} --refresh-facts",
+          ),
+          names=[1],
+      ),
+      indirect=["mocked_job"],
+  )
+  def test_vary_apply_command__refresh_facts__invokes_apply_correctly(
+      self,
+      invoke: InvokeType,
+      mocked_job: mock.Mock,
+      setup_click_paths_exist: Callable[[], None],
+      command: str,
+  ) -> None:
+    setup_click_paths_exist()
+
+    invoke(command)
+
+    mocked_job.return_value.apply.assert_called_once_with(
+        force_galaxy=False,
+        refresh_facts=True,
+    )
 
   @pytest.mark.parametrize(
       "mocked_job,command",
@@ -213,7 +398,7 @@ class TestCli:
       ),
       indirect=["mocked_job"],
   )
-  def test_vary_apply_command__paths_do_not_exist__invokes_provision_correctly(
+  def test_vary_apply_command__paths_do_not_exist__invokes_apply_correctly(
       self,
       invoke: InvokeType,
       mocked_job: mock.Mock,
@@ -225,5 +410,99 @@ class TestCli:
     invoke(command)
 
     mocked_job.assert_not_called()
-    mocked_job.return_value.precheck.assert_not_called()
-    mocked_job.return_value.provision.assert_not_called()
+    mocked_job.return_value.apply.assert_not_called()
+
+  def test_apply_bundle_command__path_exists__invokes_apply_correctly(
+      self,
+      invoke: InvokeType,
+      mocked_job_bundle: mock.Mock,
+      setup_click_paths_exist: Callable[[], None],
+  ) -> None:
+    setup_click_paths_exist()
+
+    invoke(f"apply bundle {self.mocked_bundle_file}")
+
+    mocked_job_bundle.assert_called_once_with(self.mocked_bundle_file)
+    mocked_job_bundle.return_value.apply.assert_called_once_with(
+        refresh_facts=False
+    )
+
+  def test_apply_bundle_command__refresh_facts__invokes_apply_correctly(
+      self,
+      invoke: InvokeType,
+      mocked_job_bundle: mock.Mock,
+      setup_click_paths_exist: Callable[[], None],
+  ) -> None:
+    setup_click_paths_exist()
+
+    invoke(f"apply bundle {self.mocked_bundle_file} --refresh-facts")
+
+    mocked_job_bundle.return_value.apply.assert_called_once_with(
+        refresh_facts=True
+    )
+
+  def test_apply_bundle_command__path_does_not_exist__does_not_apply(
+      self,
+      invoke: InvokeType,
+      mocked_job_bundle: mock.Mock,
+      setup_click_do_not_exist: Callable[[], None],
+  ) -> None:
+    setup_click_do_not_exist()
+
+    invoke(f"apply bundle {self.mocked_bundle_file}")
+
+    mocked_job_bundle.assert_not_called()
+
+  @pytest.mark.parametrize(
+      "mocked_job,command,args",
+      named_parameters(
+          (
+              "mocked_job_folder",
+              f"bundle folder {mocked_folder_path} {mocked_bundle_file}",
+              (mocked_folder_path, False),
+          ),
+          (
+              "mocked_job_folder",
+              (
+                  f"bundle folder {mocked_folder_path} {mocked_bundle_file}"
+                  " --persistent"
+              ),
+              (mocked_folder_path, True),
+          ),
+          (
+              "mocked_job_github",
+              f"bundle github {mocked_git_url} {mocked_bundle_file}",
+              (mocked_git_url, None, "zip", False),
+          ),
+          (
+              "mocked_job_github",
+              (
+                  f"bundle github {mocked_git_url} {mocked_bundle_file}"
+                  f" --branch {mocked_git_branch} --archive-format tarball"
+              ),
+              (mocked_git_url, mocked_git_branch, "tarball", False),
+          ),
+          names=[1],
+      ),
+      indirect=["mocked_job"],
+  )
+  def test_vary_bundle_command__paths_exist__invokes_job_correctly(
+      # pylint: disable=too-many-arguments
+      self,
+      invoke: InvokeType,
+      mocked_job: mock.Mock,
+      mocked_job_bundle_builder: mock.Mock,
+      setup_click_paths_exist: Callable[[], None],
+      command: str,
+      args: Tuple[str],
+  ) -> None:
+    setup_click_paths_exist()
+
+    invoke(command)
+
+    mocked_job.assert_called_once_with(*args)
+    mocked_job_bundle_builder.assert_called_once_with(
+        mocked_job.return_value,
+        self.mocked_bundle_file,
+    )
+    mocked_job_bundle_builder.return_value.invoke.assert_called_once_with()
@@ -0,0 +1,210 @@
+"""Local cache for downloaded GitHub archives."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from mac_maker import config
+from mac_maker.utilities.mixins.json_file import JSONFileReader, JSONFileWriter
+from mac_maker.utilities.state import StateDirectory
+
+
+class ArchiveCache(JSONFileReader, JSONFileWriter):
+  """Local cache for downloaded GitHub archives.
+
+  Archives are stored under a digest of their key (ie. org/repo/ref), with
+  the least recently used entries evicted once the cache exceeds its size cap.
+
+  :param max_size: The maximum combined size of all cached archives in bytes.
+  :param ttl: The number of seconds an entry is considered fresh.
+  """
+
+  archive_suffix = ".archive"
+  metadata_suffix = ".json"
+  partial_suffix = ".partial"
+
+  class Messages:
+    evicted = "ArchiveCache: Evicted '%s' (%s bytes)."
+    hit = "ArchiveCache: Found cached archive for '%s'."
+    miss = "ArchiveCache: No cached archive for '%s'."
+    refreshed = "ArchiveCache: Refreshed cached archive for '%s'."
+    stored = "ArchiveCache: Stored archive for '%s'."
+
+  def __init__(
+      self,
+      max_size: int = config.ARCHIVE_CACHE_MAX_SIZE,
+      ttl: int = config.ARCHIVE_CACHE_TTL,
+  ) -> None:
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.max_size = max_size
+    self.ttl = ttl
+    self.root = StateDirectory().get_folder(config.ARCHIVE_CACHE_FOLDER)
+
+  @staticmethod
+  def create_key(*parts: str) -> str:
+    """Create a cache key from its component parts.
+
+    :param parts: The component parts of the key (ie. org, repo, ref).
+    :returns: The cache key.
+    """
+
+    return "/".join(parts)
+
+  def get_archive_path(self, key: str) -> Path:
+    """Return the location a cached archive is stored at.
+
+    :param key: The cache key of the archive.
+    :returns: The path to the (possibly absent) cached archive.
+    """
+
+    return self.root / (self._digest(key) + self.archive_suffix)
+
+  def get(self, key: str) -> Optional[Path]:
+    """Return a cached archive, and mark it as recently used.
+
+    :param key: The cache key of the archive.
+    :returns: The path to the cached archive, or None if not present.
+    """
+
+    archive_path = self.get_archive_path(key)
+    if not archive_path.exists() or self.get_metadata(key) is None:
+      self.log.debug(self.Messages.miss, key)
+      return None
+
+    os.utime(archive_path)
+    self.log.debug(self.Messages.hit, key)
+    return archive_path
+
+  def get_archives(self) -> List[Path]:
+    """Return all cached archives, from least to most recently used.
+
+    :returns: A list of cached archive paths.
+    """
+
+    return [archive for archive, _ in self._get_archive_stats()]
+
+  def get_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+    """Return the metadata stored alongside a cached archive.
+
+    :param key: The cache key of the archive.
+    :returns: The stored metadata, or None if not present.
+    """
+
+    metadata_path = self._get_metadata_path(key)
+    if not metadata_path.exists():
+      return None
+    metadata: Dict[str, Any] = self.load_json_file(metadata_path)
+    return metadata
+
+  def is_fresh(self, key: str) -> bool:
+    """Check if a cached archive was stored within the cache's ttl.
+
+    :param key: The cache key of the archive.
+    :returns: A boolean indicating if the archive can be used as is.
+    """
+
+    metadata = self.get_metadata(key)
+    if metadata is None:
+      return False
+    return time.time() - metadata["stored"] < self.ttl
+
+  def refresh(self, key: str) -> None:
+    """Mark a cached archive as fresh, after successful revalidation.
+
+    :param key: The cache key of the archive.
+    """
+
+    metadata = self.get_metadata(key)
+    if metadata is None:
+      return
+    metadata["stored"] = time.time()
+    self.write_json_file(metadata, self._get_metadata_path(key))
+    self.log.debug(self.Messages.refreshed, key)
+
+  @contextmanager
+  def store(
+      self,
+      key: str,
+      metadata: Optional[Dict[str, Any]] = None,
+  ) -> Iterator[IO[bytes]]:
+    """Yield a file handle, whose content is cached if no exception occurs.
+
+    :param key: The cache key of the archive.
+    :param metadata: Additional metadata to store with the archive.
+    :yields: A writable binary file handle.
+    """
+
+    os.makedirs(self.root, exist_ok=True)
+    archive_path = self.get_archive_path(key)
+    handle = tempfile.NamedTemporaryFile(  # pylint: disable=consider-using-with
+        dir=self.root,
+        suffix=self.partial_suffix,
+        delete=False,
+    )
+    try:
+      with handle:
+        yield handle
+      os.replace(handle.name, archive_path)
+    except BaseException:
+      if os.path.exists(handle.name):
+        os.remove(handle.name)
+      raise
+
+    self.write_json_file(
+        dict(metadata or {}, key=key, stored=time.time()),
+        self._get_metadata_path(key),
+    )
+    self.log.debug(self.Messages.stored, key)
+    self.evict(keep=archive_path)
+
+  def evict(self, keep: Optional[Path] = None) -> None:
+    """Remove least recently used archives, until under the size cap.
+
+    :param keep: An archive that should not be evicted.
+    """
+
+    archives = self._get_archive_stats()
+    total_size = sum(archive_stat.st_size for _, archive_stat in archives)
+
+    for archive, archive_stat in archives:
+      if total_size <= self.max_size:
+        break
+      if archive == keep:
+        continue
+      try:
+        total_size -= self.remove(archive)
+      except FileNotFoundError:
+        total_size -= archive_stat.st_size
+
+  def remove(self, archive: Path) -> int:
+    """Remove a cached archive, and its metadata.
+
+    :param archive: The path of the cached archive.
+    :returns: The size of the removed archive in bytes.
+    """
+
+    archive_size = archive.stat().st_size
+    archive.unlink()
+    archive.with_suffix(self.metadata_suffix).unlink(missing_ok=True)
+    self.log.debug(self.Messages.evicted, archive.name, archive_size)
+    return archive_size
+
+  def _get_archive_stats(self) -> List[Tuple[Path, os.stat_result]]:
+    archives = []
+    for archive in self.root.glob("*" + self.archive_suffix):
+      try:
+        archives.append((archive, archive.stat()))
+      except FileNotFoundError:
+        continue
+    return sorted(archives, key=lambda entry: entry[1].st_mtime)
+
+  def _digest(self, key: str) -> str:
+    return hashlib.sha256(key.encode(self.encoding)).hexdigest()
+
+  def _get_metadata_path(self, key: str) -> Path:
+    return self.root / (self._digest(key) + self.metadata_suffix)
@@ -0,0 +1,140 @@
+"""Self-contained profile bundles, for offline provisioning."""
+
+import functools
+import io
+import json
+import logging
+import os
+import tarfile
+import time
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Optional, Set, Union
+
+from mac_maker import config
+from mac_maker.utilities.exceptions import BundleInvalid
+from mac_maker.utilities.extractor import TarExtractor
+
+
+class Bundle:
+  """A self-contained profile bundle, for offline provisioning.
+
+  A bundle is a compressed tar archive of a profile's data folder, including
+  its installed Galaxy roles and collections, preceded by a manifest.  Files
+  specific to the machine that created the bundle are left out.
+
+  :param path: The location of the bundle file.
+  """
+
+  class Messages:
+    created = "Bundle: Created bundle '%s' (%s bytes) in %.3f seconds."
+    extracted = "Bundle: Extracted bundle '%s' to '%s'."
+    error_invalid = "The file '%s' is not a valid Mac Maker bundle!"
+
+  def __init__(self, path: Union[Path, str]) -> None:
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.path = Path(path)
+
+  def create(
+      self,
+      profile_root: Path,
+      exclude: List[Path],
+      source_commit: Optional[str] = None,
+  ) -> None:
+    """Create the bundle from a profile in a workspace.
+
+    :param profile_root: The root folder of the profile.
+    :param exclude: Paths inside the profile's data folder to leave out.
+    :param source_commit: The commit SHA the profile was retrieved from.
+    """
+
+    start = time.perf_counter()
+    excluded = {
+        PurePosixPath(profile_root.name) /
+        path.relative_to(profile_root).as_posix()
+        for path in exclude
+        if path.is_relative_to(profile_root)
+    }
+    manifest = json.dumps(
+        {
+            "version": config.BUNDLE_VERSION,
+            "profile_root": profile_root.name,
+            "source_commit": source_commit,
+        }
+    ).encode("utf-8")
+
+    temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+    try:
+      with tarfile.open(
+          temporary,
+          "w:gz",
+          compresslevel=config.BUNDLE_COMPRESSION_LEVEL,
+      ) as tar:
+        manifest_info = tarfile.TarInfo(config.BUNDLE_MANIFEST_FILE)
+        manifest_info.size = len(manifest)
+        manifest_info.mtime = int(time.time())
+        tar.addfile(manifest_info, io.BytesIO(manifest))
+        tar.add(
+            profile_root / config.PROFILE_FOLDER_PATH,
+            arcname=f"{profile_root.name}/{config.PROFILE_FOLDER_PATH}",
+            filter=functools.partial(self._filter, excluded),
+        )
+      os.replace(temporary, self.path)
+    finally:
+      temporary.unlink(missing_ok=True)
+
+    self.log.debug(
+        self.Messages.created,
+        self.path,
+        self.path.stat().st_size,
+        time.perf_counter() - start,
+    )
+
+  def get_manifest(self) -> Dict[str, Any]:
+    """Read and validate the bundle's manifest.
+
+    :returns: The bundle's manifest.
+    :raises: :class:`BundleInvalid`
+    """
+
+    try:
+      content = TarExtractor(self.path).read(config.BUNDLE_MANIFEST_FILE)
+      manifest = json.loads(content or b"null")
+    except (OSError, tarfile.TarError, ValueError) as exc:
+      raise BundleInvalid(self.Messages.error_invalid % self.path) from exc
+
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != config.BUNDLE_VERSION
+        or not isinstance(manifest.get("profile_root"), str)
+        or not manifest["profile_root"].strip(".")
+        or "/" in manifest["profile_root"]
+    ):
+      raise BundleInvalid(self.Messages.error_invalid % self.path)
+    return manifest
+
+  def extract(self, file_system_target: Path) -> Path:
+    """Extract the bundle's profile into a folder.
+
+    :param file_system_target: The destination path to extract to.
+    :returns: The root folder of the extracted profile.
+    :raises: :class:`BundleInvalid`
+    """
+
+    manifest = self.get_manifest()
+    try:
+      TarExtractor(self.path).extract(file_system_target)
+    except (OSError, tarfile.TarError) as exc:
+      raise BundleInvalid(self.Messages.error_invalid % self.path) from exc
+
+    profile_root = file_system_target / manifest["profile_root"]
+    self.log.debug(self.Messages.extracted, self.path, profile_root)
+    return profile_root
+
+  def _filter(
+      self,
+      excluded: Set[PurePosixPath],
+      member: tarfile.TarInfo,
+  ) -> Optional[tarfile.TarInfo]:
+    if PurePosixPath(member.name) in excluded:
+      return None
+    return member
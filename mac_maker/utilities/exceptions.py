@@ -1,6 +1,14 @@
 """Exceptions for the Mac Maker utilities."""
 
 
+class BundleExceptionBase(Exception):
+  """Base class for Bundle exceptions."""
+
+
+class BundleInvalid(BundleExceptionBase):
+  """Raised when a file is not a valid profile bundle."""
+
+
 class GithubExceptionBase(Exception):
   """Base class for GitHub exceptions."""
 
@@ -9,6 +17,10 @@ class GithubCommunicationError(GithubExceptionBase):
   """Raised when a remote GitHub repository cannot be accessed."""
 
 
+class GithubReferenceInvalid(GithubExceptionBase):
+  """Raised when a branch or tag cannot be resolved to a commit."""
+
+
 class GithubRepositoryInvalid(GithubExceptionBase):
   """Raised when a GitHub repository URL cannot be parsed."""
 
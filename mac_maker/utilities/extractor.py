@@ -0,0 +1,392 @@
+"""Archive extraction for profile bundles."""
+
+import logging
+import os
+import shutil
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import IO, Iterator, List, Optional, Set, Union
+from zipfile import ZipFile, ZipInfo
+
+from mac_maker import config
+from mac_maker.utilities.ignore_rules import IgnoreRules
+
+
+class ProfileMemberFilter:
+  """Selects the archive members a Mac Maker profile requires.
+
+  :param root_folder: The top level folder inside the archive.
+  """
+
+  def __init__(self, root_folder: str) -> None:
+    self.root_folder = root_folder.rstrip("/")
+    self.profile_prefix = f"{self.root_folder}/{config.PROFILE_FOLDER_PATH}/"
+    self.selected_files = (
+        self.root_folder,
+        f"{self.root_folder}/",
+        f"{self.root_folder}/{config.PROFILE_FOLDER_PATH}",
+        f"{self.root_folder}/{config.SPEC_FILE_NAME}",
+    )
+
+  def is_selected(self, member_name: str) -> bool:
+    """Check if an archive member is part of the profile.
+
+    :param member_name: The name of the archive member.
+    :returns: A boolean indicating if the member should be extracted.
+    """
+
+    return (
+        member_name.startswith(self.profile_prefix)
+        or member_name in self.selected_files
+    )
+
+
+class IgnoreMemberFilter:
+  """Deselects the archive members matched by the bundle's ignore file.
+
+  The ignore file's rules are loaded by the extractor, and members are only
+  filtered once they have been loaded.
+
+  :param root_folder: The top level folder inside the archive.
+  :param member_filter: An optional filter to combine with this one.
+  """
+
+  def __init__(
+      self,
+      root_folder: str,
+      member_filter: Optional[ProfileMemberFilter] = None,
+  ) -> None:
+    self.root_folder = root_folder.rstrip("/")
+    self.ignore_file = f"{self.root_folder}/{config.IGNORE_FILE_NAME}"
+    self.member_filter = member_filter
+    self.rules: Optional[IgnoreRules] = None
+
+  def load(self, content: bytes) -> None:
+    """Load the rules from the content of the bundle's ignore file.
+
+    :param content: The content of the ignore file.
+    """
+
+    self.rules = IgnoreRules.from_text(content.decode("utf-8"))
+
+  def is_selected(self, member_name: str) -> bool:
+    """Check if an archive member is selected, and not ignored.
+
+    :param member_name: The name of the archive member.
+    :returns: A boolean indicating if the member should be extracted.
+    """
+
+    if self.member_filter and not self.member_filter.is_selected(member_name):
+      return False
+    relative_path = member_name[len(self.root_folder) + 1:]
+    if self.rules is None or not relative_path.strip("/"):
+      return True
+    return not self.rules.is_ignored(relative_path, member_name.endswith("/"))
+
+
+TypeMemberFilter = Union[IgnoreMemberFilter, ProfileMemberFilter]
+
+
+class ChunkStream:
+  """A readable binary stream over an iterator of byte chunks.
+
+  :param chunks: An iterator of byte chunks, such as a streamed HTTP response.
+  :param copy: An optional binary file each chunk is also written to.
+  """
+
+  def __init__(
+      self,
+      chunks: Iterator[bytes],
+      copy: Optional[IO[bytes]] = None,
+  ) -> None:
+    self.chunks = chunks
+    self.copy = copy
+    self._buffer = bytearray()
+
+  def read(self, size: int = -1) -> bytes:
+    """Read up to size bytes from the stream.
+
+    :param size: The maximum number of bytes to read, or -1 to read it all.
+    :returns: The bytes read, or an empty bytes object at the end of stream.
+    """
+
+    while size < 0 or len(self._buffer) < size:
+      chunk = next(self.chunks, None)
+      if chunk is None:
+        break
+      self._receive(chunk)
+
+    if size < 0:
+      size = len(self._buffer)
+    data = bytes(self._buffer[:size])
+    del self._buffer[:size]
+    return data
+
+  def drain(self) -> None:
+    """Consume the remaining chunks, so that any copy is complete."""
+
+    for chunk in self.chunks:
+      if self.copy is not None:
+        self.copy.write(chunk)
+
+  def _receive(self, chunk: bytes) -> None:
+    if self.copy is not None:
+      self.copy.write(chunk)
+    self._buffer.extend(chunk)
+
+
+class TarExtractor:
+  """Extracts the contents of a (compressed) tar archive in a single pass.
+
+  Members are written as soon as they are read, so extracting from a network
+  stream overlaps with the transfer itself.
+
+  :param archive: The path to, or a readable stream of, the tar archive.
+  """
+
+  class Messages:
+    extracted = "TarExtractor: Extracted %s of %s archive members."
+    throughput = "TarExtractor: Wrote %s bytes in %.3f seconds (%.1f MB/s)."
+
+  def __init__(self, archive: Union[ChunkStream, IO[bytes], Path]) -> None:
+    self.archive = archive
+    self.log = logging.getLogger(config.LOGGER_NAME)
+
+  def extract(
+      self,
+      file_system_target: Union[Path, str],
+      member_filter: Optional[TypeMemberFilter] = None,
+  ) -> None:
+    """Extract the archive, optionally limited to selected members.
+
+    An ignore file only applies to the members that follow it in the archive,
+    which in GitHub's tarballs includes the entire profile folder.
+
+    :param file_system_target: The destination path to extract to.
+    :param member_filter: An optional filter selecting members to extract.
+    """
+
+    start = time.perf_counter()
+    total_bytes = 0
+    total_members = 0
+    extracted_members = 0
+
+    with self._open() as tar:
+      for member in tar:
+        total_members += 1
+        member_name = member.name + "/" if member.isdir() else member.name
+        selected = (
+            member_filter is None or member_filter.is_selected(member_name)
+        )
+        if selected:
+          tar.extract(member, path=file_system_target, filter="data")
+          extracted_members += 1
+          total_bytes += member.size if member.isfile() else 0
+        if (
+            isinstance(member_filter, IgnoreMemberFilter)
+            and member.name == member_filter.ignore_file and member.isfile()
+        ):
+          member_filter.load(
+              self._read_member(tar, member, file_system_target, selected)
+          )
+
+    elapsed = time.perf_counter() - start
+    self.log.debug(
+        self.Messages.throughput,
+        total_bytes,
+        elapsed,
+        total_bytes / (1024 * 1024) / max(elapsed, 1e-9),
+    )
+    self.log.debug(self.Messages.extracted, extracted_members, total_members)
+
+  def read(self, member_name: str) -> Optional[bytes]:
+    """Read a single archive member, without extracting anything.
+
+    :param member_name: The name of the archive member.
+    :returns: The member's content, or None if it does not exist.
+    """
+
+    with self._open() as tar:
+      for member in tar:
+        if member.name == member_name and member.isfile():
+          member_file = tar.extractfile(member)
+          return member_file.read() if member_file else None
+    return None
+
+  def _read_member(
+      self,
+      tar: tarfile.TarFile,
+      member: tarfile.TarInfo,
+      file_system_target: Union[Path, str],
+      extracted: bool,
+  ) -> bytes:
+    if extracted:
+      return (Path(file_system_target) / member.name).read_bytes()
+    member_file = tar.extractfile(member)
+    return member_file.read() if member_file else b""
+
+  def _open(self) -> tarfile.TarFile:
+    if isinstance(self.archive, Path):
+      return tarfile.open(name=self.archive, mode="r|*")
+    return tarfile.open(  # type: ignore[call-overload]
+        fileobj=self.archive,
+        mode="r|*",
+    )
+
+
+class ZipExtractor:
+  """Extracts the contents of a zip archive.
+
+  Directories are created in order before any files are written, then the
+  file members are decompressed and written concurrently by a thread pool.
+
+  :param archive: The path to, or an open handle of, the zip archive.
+  :param workers: The number of threads used to extract file members.
+  """
+
+  class Messages:
+    extracted = "ZipExtractor: Extracted %s of %s archive members."
+    throughput = "ZipExtractor: Wrote %s bytes in %.3f seconds (%.1f MB/s)."
+
+  def __init__(
+      self,
+      archive: Union[IO[bytes], Path],
+      workers: int = config.EXTRACTION_WORKERS,
+  ) -> None:
+    self.archive = archive
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.workers = workers
+    self._lock = threading.Lock()
+
+  def extract(
+      self,
+      file_system_target: Union[Path, str],
+      member_filter: Optional[TypeMemberFilter] = None,
+  ) -> None:
+    """Extract the archive, optionally limited to selected members.
+
+    :param file_system_target: The destination path to extract to.
+    :param member_filter: An optional filter selecting members to extract.
+    """
+
+    target = Path(file_system_target)
+    start = time.perf_counter()
+
+    with ZipFile(self.archive) as zipfile:
+      if isinstance(member_filter, IgnoreMemberFilter):
+        self._load_ignore_file(zipfile, member_filter)
+      all_members = zipfile.infolist()
+      members = self._select_members(all_members, member_filter)
+      files = [member for member in members if not member.is_dir()]
+      directories = self._create_directories(target, members)
+
+      with ThreadPoolExecutor(max_workers=self.workers) as executor:
+        futures = [
+            executor.submit(self._extract_file, zipfile, member, target)
+            for member in files
+        ]
+      for future in futures:
+        future.result()
+
+      for member in reversed(directories):
+        self._set_permissions(member, self._get_member_path(target, member))
+
+    self._log_throughput(files, time.perf_counter() - start)
+    self.log.debug(self.Messages.extracted, len(members), len(all_members))
+
+  def read(self, member_name: str) -> Optional[bytes]:
+    """Read a single archive member, without extracting anything.
+
+    :param member_name: The name of the archive member.
+    :returns: The member's content, or None if it does not exist.
+    """
+
+    with ZipFile(self.archive) as zipfile:
+      try:
+        return zipfile.read(member_name)
+      except KeyError:
+        return None
+
+  def _create_directories(
+      self,
+      target: Path,
+      members: List[ZipInfo],
+  ) -> List[ZipInfo]:
+    folders: Set[Path] = set()
+    for member in members:
+      member_path = self._get_member_path(target, member)
+      folders.add(member_path if member.is_dir() else member_path.parent)
+
+    for folder in sorted(folders):
+      os.makedirs(folder, exist_ok=True)
+
+    return sorted(
+        (member for member in members if member.is_dir()),
+        key=lambda member: member.filename,
+    )
+
+  def _extract_file(
+      self,
+      zipfile: ZipFile,
+      member: ZipInfo,
+      target: Path,
+  ) -> None:
+    member_path = self._get_member_path(target, member)
+
+    # ZipFile reference counts its open members without a lock.
+    with self._lock:
+      source = zipfile.open(member)
+    try:
+      with open(member_path, "wb") as destination:
+        shutil.copyfileobj(source, destination)
+    finally:
+      with self._lock:
+        source.close()
+
+    self._set_permissions(member, member_path)
+
+  def _get_member_path(self, target: Path, member: ZipInfo) -> Path:
+    parts = [
+        part for part in PurePosixPath(member.filename).parts
+        if part not in ("/", ".", "..")
+    ]
+    return target.joinpath(*parts)
+
+  def _log_throughput(self, files: List[ZipInfo], elapsed: float) -> None:
+    total_bytes = sum(member.file_size for member in files)
+    self.log.debug(
+        self.Messages.throughput,
+        total_bytes,
+        elapsed,
+        total_bytes / (1024 * 1024) / max(elapsed, 1e-9),
+    )
+
+  def _load_ignore_file(
+      self,
+      zipfile: ZipFile,
+      member_filter: IgnoreMemberFilter,
+  ) -> None:
+    try:
+      member_filter.load(zipfile.read(member_filter.ignore_file))
+    except KeyError:
+      return
+
+  def _select_members(
+      self,
+      members: List[ZipInfo],
+      member_filter: Optional[TypeMemberFilter],
+  ) -> List[ZipInfo]:
+    if member_filter is None:
+      return members
+    return [
+        member for member in members
+        if member_filter.is_selected(member.filename)
+    ]
+
+  def _set_permissions(self, member: ZipInfo, member_path: Path) -> None:
+    mode = (member.external_attr >> 16) & 0o777
+    if mode:
+      os.chmod(member_path, mode)
@@ -0,0 +1,152 @@
+"""Copy-on-write aware file copying."""
+
+import ctypes
+import ctypes.util
+import errno
+import fcntl
+import logging
+import os
+import shutil
+import stat
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Union
+
+from mac_maker import config
+
+FICLONE = 0x40049409
+
+
+class FileCopier:
+  """Copies files, cloning or linking them instead of copying data if possible.
+
+  Files are first cloned with a copy-on-write reflink, if the file system
+  supports them.  Otherwise read-only files are hardlinked, as nothing is
+  expected to write to them.  Everything else falls back to a real copy.
+
+  :param reflink: Attempt to clone files with a reflink.
+  :param hardlink: Attempt to hardlink read-only files.
+  """
+
+  unsupported_errors = (
+      errno.EBADF,
+      errno.EINVAL,
+      errno.ENOSYS,
+      errno.ENOTSUP,
+      errno.ENOTTY,
+      errno.EOPNOTSUPP,
+      errno.EPERM,
+      errno.EXDEV,
+  )
+
+  class Messages:
+    summary = "FileCopier: Cloned %s, linked %s and copied %s files."
+
+  def __init__(
+      self,
+      reflink: bool = config.COPY_REFLINK,
+      hardlink: bool = config.COPY_HARDLINK,
+  ) -> None:
+    self.reflink = reflink
+    self.hardlink = hardlink
+    self.counts: Counter[str] = Counter()
+    self.log = logging.getLogger(config.LOGGER_NAME)
+
+  def copy(
+      self,
+      source: Union[Path, str],
+      destination: Union[Path, str],
+  ) -> str:
+    """Copy a single file, with its metadata, to a new destination.
+
+    This is a drop-in replacement for :func:`shutil.copy2`.
+
+    :param source: The path of the file to copy.
+    :param destination: The path to copy the file to.
+    :returns: The destination path.
+    """
+
+    if self.reflink and self._clone(source, destination):
+      shutil.copystat(source, destination)
+      self.counts["cloned"] += 1
+    elif self.hardlink and self._link(source, destination):
+      self.counts["linked"] += 1
+    else:
+      shutil.copy2(source, destination)
+      self.counts["copied"] += 1
+    return str(destination)
+
+  def log_summary(self) -> None:
+    """Log the number of files cloned, linked and copied."""
+
+    self.log.debug(
+        self.Messages.summary,
+        self.counts["cloned"],
+        self.counts["linked"],
+        self.counts["copied"],
+    )
+
+  def _clone(
+      self,
+      source: Union[Path, str],
+      destination: Union[Path, str],
+  ) -> bool:
+    try:
+      if sys.platform == "darwin":
+        self._clone_darwin(source, destination)
+      else:
+        self._clone_linux(source, destination)
+    except OSError as exc:
+      if exc.errno not in self.unsupported_errors:
+        raise
+      self.reflink = False
+      return False
+    return True
+
+  def _clone_darwin(
+      self,
+      source: Union[Path, str],
+      destination: Union[Path, str],
+  ) -> None:
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    if libc.clonefile(
+        os.fsencode(source),
+        os.fsencode(destination),
+        0,
+    ) != 0:
+      error = ctypes.get_errno()
+      raise OSError(error, os.strerror(error), str(destination))
+
+  def _clone_linux(
+      self,
+      source: Union[Path, str],
+      destination: Union[Path, str],
+  ) -> None:
+    with open(source, "rb") as source_handle:
+      with open(destination, "wb") as destination_handle:
+        try:
+          fcntl.ioctl(
+              destination_handle.fileno(),
+              FICLONE,
+              source_handle.fileno(),
+          )
+        except OSError:
+          os.unlink(destination)
+          raise
+
+  def _link(
+      self,
+      source: Union[Path, str],
+      destination: Union[Path, str],
+  ) -> bool:
+    if os.stat(source).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH):
+      return False
+    try:
+      os.link(source, destination)
+    except OSError as exc:
+      if exc.errno not in self.unsupported_errors:
+        raise
+      self.hardlink = False
+      return False
+    return True
@@ -0,0 +1,73 @@
+"""Advisory file locking."""
+
+import fcntl
+import logging
+from pathlib import Path
+from typing import IO, Optional, Union
+
+from mac_maker import config
+
+
+class FileLock:
+  """Advisory exclusive lock, held on a lock file.
+
+  The lock is only granted to a single holder at once, and is released
+  explicitly, or when the process exits.
+
+  :param path: The location of the lock file.
+  """
+
+  class Messages:
+    acquired = "FileLock: Acquired %s lock on %s."
+    waiting = "FileLock: Waiting for %s lock on %s."
+
+  exclusive_mode = "exclusive"
+
+  def __init__(self, path: Union[Path, str]) -> None:
+    self.path = Path(path)
+    self.mode: Optional[str] = None
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self._handle: Optional[IO[bytes]] = None
+
+  def exclusive(self) -> None:
+    """Acquire the exclusive lock, waiting for another holder to release it."""
+
+    self._acquire()
+
+  def try_exclusive(self) -> bool:
+    """Acquire the exclusive lock, only if no other holder has the lock.
+
+    :returns: A boolean indicating if the exclusive lock was acquired.
+    """
+
+    return self._acquire(blocking=False)
+
+  def release(self) -> None:
+    """Release the lock, if it is held."""
+
+    if self._handle is not None:
+      fcntl.flock(self._handle, fcntl.LOCK_UN)
+      self._handle.close()
+      self._handle = None
+    self.mode = None
+
+  def _acquire(self, blocking: bool = True) -> bool:
+    mode = self.exclusive_mode
+    if self.mode == mode:
+      return True
+
+    if self._handle is None:
+      self.path.parent.mkdir(parents=True, exist_ok=True)
+      self._handle = open(self.path, "ab")  # pylint: disable=consider-using-with
+
+    try:
+      fcntl.flock(self._handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+      if not blocking:
+        return False
+      self.log.info(self.Messages.waiting, mode, self.path)
+      fcntl.flock(self._handle, fcntl.LOCK_EX)
+
+    self.mode = mode
+    self.log.debug(self.Messages.acquired, mode, self.path)
+    return True
@@ -0,0 +1,195 @@
+"""Incremental folder synchronization."""
+
+import hashlib
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from mac_maker import config
+from mac_maker.utilities.ignore_rules import IgnoreRules
+from mac_maker.utilities.mixins.json_file import JSONFileReader, JSONFileWriter
+
+TypeManifestEntry = List[Optional[Union[int, str]]]
+
+
+class FolderSync(JSONFileReader, JSONFileWriter):
+  """Incrementally mirrors a source folder into a destination folder.
+
+  A manifest records the size, modification time and (optionally) a content
+  digest of each file copied by the previous sync.  Only new and changed
+  files are copied, and only files removed from the source since the
+  previous sync are deleted, so content created inside the destination by
+  other tools (ie. installed Galaxy requirements) is left alone.
+
+  :param source: The folder to copy from.
+  :param destination: The folder to copy to.
+  :param manifest: The location of the manifest file for this destination.
+  :param checksum: Compare content digests, in addition to size and mtime.
+  :param copy_function: The function used to copy files (default: copy2).
+  :param ignore: Optional ignore rules excluding source content from the sync.
+  """
+
+  class Messages:
+    synced = (
+        "FolderSync: Copied %s, removed %s and kept %s files "
+        "in %.3f seconds."
+    )
+
+  def __init__(
+      self,
+      source: Union[Path, str],
+      destination: Union[Path, str],
+      manifest: Union[Path, str],
+      checksum: bool = config.FOLDER_SYNC_CHECKSUM,
+      copy_function: Optional[Callable[[Path, Path], object]] = None,
+      ignore: Optional[IgnoreRules] = None,
+  ) -> None:
+    self.copy_function = copy_function
+    self.ignore = ignore
+    self.source = Path(source)
+    self.destination = Path(destination)
+    self.manifest = Path(manifest)
+    self.checksum = checksum
+    self.log = logging.getLogger(config.LOGGER_NAME)
+
+  def sync(self) -> None:
+    """Copy changed files, and delete removed files, from the source."""
+
+    start = time.perf_counter()
+    previous = self.load_manifest()
+    current: Dict[str, TypeManifestEntry] = {}
+    copied = 0
+
+    for relative_path in self._walk():
+      source_file = self.source / relative_path
+      entry = self._get_entry(source_file)
+      current[relative_path] = entry
+      if self._is_unchanged(relative_path, entry, previous):
+        continue
+      self._copy(source_file, self.destination / relative_path)
+      copied += 1
+
+    removed = 0
+    for relative_path in set(previous) - set(current):
+      self._remove(self.destination / relative_path)
+      removed += 1
+
+    self.write_json_file(
+        {
+            "files": current
+        },
+        self.manifest,
+    )
+    self.log.debug(
+        self.Messages.synced,
+        copied,
+        removed,
+        len(current) - copied,
+        time.perf_counter() - start,
+    )
+
+  def is_synchronized(self) -> bool:
+    """Check if the destination already matches the source.
+
+    :returns: A boolean indicating if a sync would change nothing.
+    """
+
+    previous = self.load_manifest()
+    relative_paths = self._walk()
+    if set(relative_paths) != set(previous):
+      return False
+    return all(
+        self._is_unchanged(
+            relative_path,
+            self._get_entry(self.source / relative_path),
+            previous,
+        ) for relative_path in relative_paths
+    )
+
+  def load_manifest(self) -> Dict[str, TypeManifestEntry]:
+    """Load the file entries recorded by the previous sync.
+
+    :returns: A dictionary of relative paths to their recorded entries.
+    """
+
+    if not self.manifest.exists():
+      return {}
+    manifest = self.load_json_file(self.manifest)
+    files: Dict[str, TypeManifestEntry] = manifest["files"]
+    return files
+
+  def _walk(self) -> List[str]:
+    relative_paths = []
+    visited = {self._get_folder_id(self.source)}
+    for folder, folder_names, file_names in os.walk(
+        self.source,
+        followlinks=True,
+    ):
+      relative_folder = Path(folder).relative_to(self.source)
+      folder_names[:] = [
+          folder_name for folder_name in folder_names
+          if not self._is_ignored(relative_folder / folder_name, True)
+          and self._is_unvisited(Path(folder) / folder_name, visited)
+      ]
+      for file_name in file_names:
+        relative_path = relative_folder / file_name
+        if not self._is_ignored(relative_path, False):
+          relative_paths.append(relative_path.as_posix())
+    return relative_paths
+
+  def _get_folder_id(self, folder: Path) -> Tuple[int, int]:
+    folder_stat = folder.stat()
+    return folder_stat.st_dev, folder_stat.st_ino
+
+  def _is_unvisited(self, folder: Path, visited: Set[Tuple[int, int]]) -> bool:
+    folder_id = self._get_folder_id(folder)
+    if folder_id in visited:
+      return False
+    visited.add(folder_id)
+    return True
+
+  def _is_ignored(self, relative_path: Path, is_dir: bool) -> bool:
+    if self.ignore is None:
+      return False
+    return self.ignore.is_ignored(relative_path.as_posix(), is_dir)
+
+  def _get_entry(self, source_file: Path) -> TypeManifestEntry:
+    file_stat = source_file.stat()
+    digest = None
+    if self.checksum:
+      with open(source_file, "rb") as file_handle:
+        digest = hashlib.file_digest(file_handle, "sha256").hexdigest()
+    return [file_stat.st_size, file_stat.st_mtime_ns, digest]
+
+  def _is_unchanged(
+      self,
+      relative_path: str,
+      entry: TypeManifestEntry,
+      previous: Dict[str, TypeManifestEntry],
+  ) -> bool:
+    return (
+        previous.get(relative_path) == entry
+        and (self.destination / relative_path).exists()
+    )
+
+  def _copy(self, source_file: Path, destination_file: Path) -> None:
+    destination_file.parent.mkdir(parents=True, exist_ok=True)
+    if destination_file.is_symlink() or destination_file.exists():
+      destination_file.unlink()
+    if self.copy_function is not None:
+      self.copy_function(source_file, destination_file)
+    else:
+      shutil.copy2(source_file, destination_file)
+
+  def _remove(self, destination_file: Path) -> None:
+    destination_file.unlink(missing_ok=True)
+    folder = destination_file.parent
+    while folder != self.destination and folder.exists():
+      try:
+        folder.rmdir()
+      except OSError:
+        break
+      folder = folder.parent
@@ -0,0 +1,221 @@
+"""Garbage collection of persistent workspaces and caches."""
+
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Set, Tuple
+
+from mac_maker import config
+from mac_maker.utilities.archive_cache import ArchiveCache
+from mac_maker.utilities.state import StateDirectory
+from mac_maker.utilities.trash import Trash
+from mac_maker.utilities.workspace import WorkSpace
+
+
+class GarbageCollectorEntry(NamedTuple):
+  """A single evictable entry of persistent state."""
+
+  path: Path
+  size: int
+  last_used: float
+  remove: Callable[[Path], bool]
+
+
+class GarbageCollectorReport(NamedTuple):
+  """The results of a garbage collection."""
+
+  evicted: int
+  reclaimed: int
+  remaining: int
+  elapsed: float
+
+
+class GarbageCollector:
+  """Evicts persistent state, within a disk budget and a maximum age.
+
+  Persistent workspaces, cached GitHub archives and cached Galaxy content are
+  considered together.  Entries unused for longer than the maximum age are
+  evicted, and then the least recently used entries until the total size is
+  within budget.  Workspaces in use by a running job are never evicted, and
+  workspaces discarded by previous, interrupted, evictions are always swept.
+
+  :param max_size: The maximum combined size of all entries in bytes.
+  :param max_age: The maximum number of seconds an entry may remain unused.
+  """
+
+  class Messages:
+    collected = (
+        "GarbageCollector: Reclaimed %s bytes from %s entries "
+        "in %.3f seconds, %s bytes remain."
+    )
+    error_remove_failure = "GarbageCollector: Unable to remove '%s': %s"
+    evicted = "GarbageCollector: Evicted '%s' (%s bytes)."
+    in_use = "GarbageCollector: Skipped workspace in use '%s'."
+
+  def __init__(
+      self,
+      max_size: int = config.GC_MAX_SIZE,
+      max_age: int = config.GC_MAX_AGE,
+  ) -> None:
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.max_size = max_size
+    self.max_age = max_age
+    self.archive_cache = ArchiveCache()
+    self.galaxy_cache = StateDirectory().get_folder(config.GALAXY_CACHE_FOLDER)
+
+  def collect(self) -> GarbageCollectorReport:
+    """Evict expired, and least recently used, entries.
+
+    :returns: A report of the evicted entries and reclaimed space.
+    """
+
+    start = time.perf_counter()
+    now = time.time()
+    evicted = 0
+    reclaimed = 0
+    remaining = 0
+
+    for entry in self.get_discarded_entries():
+      if self._evict(entry):
+        evicted += 1
+        reclaimed += entry.size
+      else:
+        remaining += entry.size
+
+    entries = sorted(self.get_entries(), key=lambda entry: entry.last_used)
+    remaining += sum(entry.size for entry in entries)
+
+    for entry in entries:
+      expired = now - entry.last_used > self.max_age
+      if not expired and remaining <= self.max_size:
+        break
+      if not self._evict(entry):
+        continue
+      evicted += 1
+      reclaimed += entry.size
+      remaining -= entry.size
+
+    report = GarbageCollectorReport(
+        evicted=evicted,
+        reclaimed=reclaimed,
+        remaining=remaining,
+        elapsed=time.perf_counter() - start,
+    )
+    self.log.debug(
+        self.Messages.collected,
+        report.reclaimed,
+        report.evicted,
+        report.elapsed,
+        report.remaining,
+    )
+    return report
+
+  def get_discarded_entries(self) -> List[GarbageCollectorEntry]:
+    """Return the workspaces discarded, but not yet deleted, by evictions.
+
+    :returns: A list of discarded entries.
+    """
+
+    workspaces = StateDirectory().get_folder(config.WORKSPACES_FOLDER)
+    return self._create_entries(
+        Trash.get_discarded(workspaces),
+        self._remove_discarded,
+    )
+
+  def get_entries(self) -> List[GarbageCollectorEntry]:
+    """Return all evictable entries of persistent state.
+
+    Entries removed by another job while they are being listed are skipped.
+
+    :returns: A list of evictable entries.
+    """
+
+    entries = self._create_entries(
+        WorkSpace.get_persistent_roots(),
+        self._remove_workspace,
+    )
+    entries += self._create_entries(
+        self.archive_cache.get_archives(),
+        self._remove_archive,
+    )
+    if self.galaxy_cache.exists():
+      entries += self._create_entries(
+          sorted(self.galaxy_cache.iterdir()),
+          self._remove_path,
+      )
+    return entries
+
+  def _create_entries(
+      self,
+      paths: List[Path],
+      remove: Callable[[Path], bool],
+  ) -> List[GarbageCollectorEntry]:
+    entries = []
+    for path in paths:
+      try:
+        entries.append(
+            GarbageCollectorEntry(
+                path=path,
+                size=self._get_size(path),
+                last_used=path.stat().st_mtime,
+                remove=remove,
+            )
+        )
+      except FileNotFoundError:
+        continue
+    return entries
+
+  def _evict(self, entry: GarbageCollectorEntry) -> bool:
+    try:
+      if not entry.remove(entry.path):
+        return False
+    except OSError as exc:
+      self.log.warning(self.Messages.error_remove_failure, entry.path, exc)
+      return False
+    self.log.debug(self.Messages.evicted, entry.path, entry.size)
+    return True
+
+  def _get_size(self, path: Path) -> int:
+    if not path.is_dir() or path.is_symlink():
+      return path.lstat().st_size
+
+    size = 0
+    seen: Set[Tuple[int, int]] = set()
+    for folder, _, file_names in os.walk(path):
+      for file_name in file_names:
+        try:
+          file_stat = os.lstat(os.path.join(folder, file_name))
+        except FileNotFoundError:
+          continue
+        if (file_stat.st_dev, file_stat.st_ino) in seen:
+          continue
+        seen.add((file_stat.st_dev, file_stat.st_ino))
+        size += file_stat.st_size
+    return size
+
+  def _remove_archive(self, path: Path) -> bool:
+    self.archive_cache.remove(path)
+    return True
+
+  def _remove_discarded(self, path: Path) -> bool:
+    return Trash(path).delete(path)
+
+  def _remove_path(self, path: Path) -> bool:
+    if path.is_dir() and not path.is_symlink():
+      shutil.rmtree(path)
+    else:
+      path.unlink()
+    return True
+
+  def _remove_workspace(self, path: Path) -> bool:
+    lock = WorkSpace.get_lock(path)
+    if not lock.try_exclusive():
+      self.log.debug(self.Messages.in_use, path)
+      return False
+    try:
+      Trash(path).discard()
+    finally:
+      lock.release()
+    return True
@@ -2,34 +2,117 @@
 
 import logging
 import re
-from io import BytesIO
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Match, Optional, Union
-from zipfile import ZipFile
+from typing import IO, Any, Dict, Iterator, Match, Optional, Tuple, Union
 
 import requests
 from mac_maker import config
+from mac_maker.utilities.archive_cache import ArchiveCache
 from mac_maker.utilities.exceptions import (
     GithubCommunicationError,
+    GithubReferenceInvalid,
     GithubRepositoryInvalid,
 )
+from mac_maker.utilities.extractor import (
+    ChunkStream,
+    IgnoreMemberFilter,
+    ProfileMemberFilter,
+    TarExtractor,
+    ZipExtractor,
+)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class GithubRepository:
   """GitHub Repository representation.
 
+  All instances share a single pooled HTTP session, which keeps connections
+  alive and retries failed idempotent requests with jittered backoff.
+
   :param repository: The http or ssh URL of the repository.
+  :param cache: An optional cache to store downloaded archives in.
+  :param archive_format: The bundle format to download ("zip" or "tarball").
   """
 
+  archive_host = "https://github.com"
+  commit_sha = re.compile(config.GITHUB_COMMIT_SHA_REGEX)
+  connect_timeout = config.GITHUB_CONNECT_TIMEOUT
   match_http = re.compile(config.GITHUB_HTTP_REGEX, re.IGNORECASE)
   match_ssh = re.compile(config.GITHUB_SSH_REGEX, re.IGNORECASE)
+  chunk_size = config.GITHUB_DOWNLOAD_CHUNK_SIZE
   default_branch = config.GITHUB_DEFAULT_BRANCH
-  timeout = 10
+  encoding = "utf-8"
+  not_modified = 304
+  raw_host = "https://raw.githubusercontent.com"
+  read_timeout = config.GITHUB_READ_TIMEOUT
+  refs_service = "git-upload-pack"
+  session: Optional[requests.Session] = None
+  validators = {
+      "etag": ("ETag", "If-None-Match"),
+      "last_modified": ("Last-Modified", "If-Modified-Since"),
+  }
 
-  def __init__(self, repository: str) -> None:
+  def __init__(
+      self,
+      repository: str,
+      cache: Optional[ArchiveCache] = None,
+      archive_format: str = config.GITHUB_DEFAULT_ARCHIVE_FORMAT,
+  ) -> None:
+    if archive_format not in config.GITHUB_ARCHIVE_FORMATS:
+      raise ValueError(f"Unknown archive format: '{archive_format}'.")
+    self.archive_format = archive_format
+    self.cache = cache
     self.logger = logging.getLogger(config.LOGGER_NAME)
     self._parsed_url = self._parse_repository_url(repository)
 
+  @property
+  def timeout(self) -> Tuple[float, float]:
+    """Return the connect and read timeouts for GitHub requests.
+
+    :returns: A tuple of the connect and read timeouts in seconds.
+    """
+    return (self.connect_timeout, self.read_timeout)
+
+  @classmethod
+  def get_session(cls) -> requests.Session:
+    """Return the HTTP session shared by all GitHub requests.
+
+    :returns: The shared HTTP session.
+    """
+
+    if cls.session is None:
+      retries = Retry(
+          total=config.GITHUB_RETRIES,
+          backoff_factor=config.GITHUB_RETRY_BACKOFF,
+          backoff_jitter=config.GITHUB_RETRY_JITTER,
+          status_forcelist=config.GITHUB_RETRY_STATUSES,
+          allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+          raise_on_status=False,
+      )
+      adapter = HTTPAdapter(
+          pool_connections=config.GITHUB_POOL_SIZE,
+          pool_maxsize=config.GITHUB_POOL_SIZE,
+          max_retries=retries,
+      )
+      cls.session = requests.Session()
+      cls.session.mount("https://", adapter)
+      cls.session.mount("http://", adapter)
+    return cls.session
+
+  @classmethod
+  def is_commit_sha(cls, branch_name: Optional[str]) -> bool:
+    """Return True if the given name is a full commit SHA.
+
+    :param branch_name: The branch, tag or commit SHA to check.
+    :returns: A boolean indicating if this is a full commit SHA.
+    """
+    if branch_name is None:
+      return False
+    return cls.commit_sha.fullmatch(branch_name) is not None
+
   def _parse_repository_url(self, repository: str) -> Match[str]:
     parsed_url = re.match(self.match_http, repository)
     if not parsed_url:
@@ -88,46 +171,267 @@ class GithubRepository:
         f"{self._parsed_url.group('repo')}.git"
     )
 
+  def get_refs_url(self) -> str:
+    """Return the url advertising the repository's branches and tags.
+
+    :return: The git smart http reference discovery url.
+    """
+    return (
+        f"{self.archive_host}/{self._parsed_url.group('org')}/"
+        f"{self._parsed_url.group('repo')}.git/info/refs"
+        f"?service={self.refs_service}"
+    )
+
+  def resolve_commit(self, branch_name: Optional[str]) -> str:
+    """Resolve a branch or tag to the commit SHA it currently points to.
+
+    Full commit SHAs are returned unchanged, without any network traffic.
+    Branches take precedence over tags of the same name, and annotated tags
+    are resolved to the commit they reference.
+
+    :param branch_name: The branch, tag or commit SHA of the repository.
+    :returns: The resolved commit SHA.
+    :raises: :class:`GithubReferenceInvalid`
+    """
+
+    branch_name = self.get_branch_name(branch_name)
+    if self.is_commit_sha(branch_name):
+      return branch_name
+
+    refs = self._get_remote_refs()
+    for candidate in (
+        f"refs/heads/{branch_name}",
+        f"refs/tags/{branch_name}^{{}}",
+        f"refs/tags/{branch_name}",
+        branch_name,
+    ):
+      if candidate in refs:
+        self.logger.info(
+            "GithubRepository: Resolved '%s' to commit: %s",
+            branch_name,
+            refs[candidate],
+        )
+        return refs[candidate]
+
+    self.logger.error(
+        "GithubRepository: Cannot resolve '%s' to a commit.",
+        branch_name,
+    )
+    raise GithubReferenceInvalid(f"Unknown branch or tag: '{branch_name}'.")
+
+  def get_cache_key(self, branch_name: Optional[str]) -> str:
+    """Return the archive cache key for the given branch.
+
+    :param branch_name: The branch of the repository to use.
+    :return: The archive cache key for this branch and archive format.
+    """
+    return ArchiveCache.create_key(
+        self.get_org_name(),
+        self.get_repo_name(),
+        self.get_branch_name(branch_name),
+        self.archive_format,
+    )
+
+  def get_file_url(
+      self,
+      relative_path: Union[Path, str],
+      branch_name: Optional[str],
+  ) -> str:
+    """Generate a url to retrieve a single file from the given branch.
+
+    :param relative_path: The path of the file, relative to the repo root.
+    :param branch_name: The branch of the repository to use.
+    :return: The url of the file on this branch.
+    """
+    branch_name = self.get_branch_name(branch_name)
+    return (
+        f"{self.raw_host}/{self._parsed_url.group('org')}/"
+        f"{self._parsed_url.group('repo')}/{branch_name}/"
+        f"{Path(relative_path).as_posix()}"
+    )
+
+  def get_bundle_url(self, branch_name: Optional[str]) -> str:
+    """Generate a url in this repository's archive format for the branch.
+
+    :param branch_name: The branch of the repository to use.
+    :return: The url of the bundle for this branch.
+    """
+    if self.archive_format == "tarball":
+      return self.get_tarball_bundle_url(branch_name)
+    return self.get_zip_bundle_url(branch_name)
+
+  def get_tarball_bundle_url(self, branch_name: Optional[str]) -> str:
+    """Generate a tarball url for the given branch.
+
+    :param branch_name: The branch of the repository to use.
+    :return: The url of the tarball bundle for this branch.
+    """
+    return self._get_archive_url(
+        branch_name,
+        config.GITHUB_ARCHIVE_FORMATS["tarball"],
+    )
+
   def get_zip_bundle_url(self, branch_name: Optional[str]) -> str:
     """Generate a zipfile url for the given branch.
 
     :param branch_name: The branch of the repository to use.
     :return: The url of the zipfile bundle for this branch.
     """
+    return self._get_archive_url(
+        branch_name,
+        config.GITHUB_ARCHIVE_FORMATS["zip"],
+    )
+
+  def _get_archive_url(self, branch_name: Optional[str], suffix: str) -> str:
     branch_name = self.get_branch_name(branch_name)
+    reference = branch_name
+    if not self.is_commit_sha(branch_name):
+      reference = f"refs/heads/{branch_name}"
     return (
-        f"https://github.com/{self._parsed_url.group('org')}/"
+        f"{self.archive_host}/{self._parsed_url.group('org')}/"
         f"{self._parsed_url.group('repo')}"
-        f"/archive/refs/heads/{branch_name}.zip"
+        f"/archive/{reference}{suffix}"
     )
 
   def get_zip_bundle_root_folder(self, branch_name: Optional[str]) -> str:
-    """Return the top level folder inside a repo's zip bundle.
+    """Return the top level folder inside a repo's zip or tarball bundle.
 
     :param branch_name: The branch of the repository to use.
-    :return: The top level folder inside a repo's zip bundle.
+    :return: The top level folder inside a repo's bundle.
     """
     branch_name = self.get_branch_name(branch_name)
     return f"{self._parsed_url.group('repo')}-{branch_name}"
 
-  def download_zip_bundle_profile(
-      self, file_system_target: Union[Path, str], branch_name: Optional[str]
+  def download_bundle_profile(
+      self,
+      file_system_target: Union[Path, str],
+      branch_name: Optional[str],
+      profile_only: bool = False,
   ) -> None:
-    """Download a zip bundle for the branch, then unzip everything.
+    """Download a bundle in this repository's archive format, and extract it.
 
+    :param file_system_target: The destination path to extract the bundle to.
     :param branch_name: The branch of the repository to use.
+    :param profile_only: Extract only the profile folder and spec file.
+    """
+
+    if self.archive_format == "tarball":
+      self.download_tarball_bundle_profile(
+          file_system_target,
+          branch_name,
+          profile_only,
+      )
+    else:
+      self.download_zip_bundle_profile(
+          file_system_target,
+          branch_name,
+          profile_only,
+      )
+
+  def download_tarball_bundle_profile(
+      self,
+      file_system_target: Union[Path, str],
+      branch_name: Optional[str],
+      profile_only: bool = False,
+  ) -> None:
+    """Download a tarball bundle for the branch, extracting as it arrives.
+
+    The tarball is decompressed and extracted in a single streaming pass, so
+    extraction overlaps with the network transfer.  If this repository has a
+    cache, the stream is also written into the cache as it is extracted, and
+    fresh or revalidated cached tarballs are used without a download.
+
+    :param file_system_target: The destination path to extract the bundle to.
+    :param branch_name: The branch of the repository to use.
+    :param profile_only: Extract only the profile folder and spec file.
+    """
+
+    branch_name = self.get_branch_name(branch_name)
+    member_filter = self._get_member_filter(branch_name, profile_only)
+
+    if self.cache is None:
+      with self._request_bundle(branch_name) as http_response:
+        self._extract_tarball(http_response, file_system_target, member_filter)
+      return
+
+    with self._open_cached_bundle(self.cache, branch_name) as bundle:
+      if isinstance(bundle, Path):
+        TarExtractor(bundle).extract(file_system_target, member_filter)
+        return
+      with self.cache.store(
+          self.get_cache_key(branch_name),
+          self._get_response_validators(bundle),
+      ) as archive:
+        self._extract_tarball(
+            bundle,
+            file_system_target,
+            member_filter,
+            archive,
+        )
+
+  def download_zip_bundle_profile(
+      self,
+      file_system_target: Union[Path, str],
+      branch_name: Optional[str],
+      profile_only: bool = False,
+  ) -> None:
+    """Download a zip bundle for the branch, then unzip it.
+
+    The bundle is streamed to a temporary file inside the target folder, so
+    memory usage does not grow with the size of the archive.  If this
+    repository has a cache, fresh cached bundles are used without any network
+    traffic, stale cached bundles are revalidated with a conditional request,
+    and new downloads are streamed into the cache instead.
+
     :param file_system_target: The destination path to unzip the bundle to.
+    :param branch_name: The branch of the repository to use.
+    :param profile_only: Extract only the profile folder and spec file.
+    """
+
+    branch_name = self.get_branch_name(branch_name)
+    member_filter = self._get_member_filter(branch_name, profile_only)
+
+    if self.cache is not None:
+      ZipExtractor(self._get_cached_zipfile(self.cache, branch_name)).extract(
+          file_system_target,
+          member_filter,
+      )
+      return
+
+    with tempfile.TemporaryFile(dir=file_system_target) as archive:
+      self._download_zipfile(branch_name, archive)
+      ZipExtractor(archive).extract(file_system_target, member_filter)
+
+  def read_file(
+      self,
+      relative_path: Union[Path, str],
+      branch_name: Optional[str],
+  ) -> str:
+    """Read a single text file from the branch, without a full download.
+
+    A fresh cached bundle is used if one is available, otherwise only the
+    requested file is retrieved from GitHub.
+
+    :param relative_path: The path of the file, relative to the repo root.
+    :param branch_name: The branch of the repository to use.
+    :returns: The content of the file.
     """
 
     branch_name = self.get_branch_name(branch_name)
-    http_response = self._download_zipfile(branch_name)
-    with ZipFile(BytesIO(http_response.content)) as zipfile:
-      zipfile.extractall(path=file_system_target)
 
-  def _download_zipfile(self, branch_name: str) -> requests.Response:
-    remote_url = self.get_zip_bundle_url(branch_name)
+    if self.cache is not None:
+      cached_content = self._read_cached_file(
+          self.cache,
+          relative_path,
+          branch_name,
+      )
+      if cached_content is not None:
+        return cached_content
+
+    remote_url = self.get_file_url(relative_path, branch_name)
     try:
-      http_response = requests.get(remote_url, timeout=self.timeout)
+      http_response = self.get_session().get(remote_url, timeout=self.timeout)
+      http_response.raise_for_status()
     except requests.exceptions.RequestException as exc:
       self.logger.error(
           "GithubRepository: cannot download '%s'",
@@ -137,7 +441,218 @@ class GithubRepository:
           "Communication error with Github."
       ) from exc
     self.logger.info(
-        "GithubRepository: Retrieved zip content from: %s",
+        "GithubRepository: Retrieved file content from: %s",
         remote_url,
     )
-    return http_response
+    return http_response.content.decode(self.encoding)
+
+  def _read_cached_file(
+      self,
+      cache: ArchiveCache,
+      relative_path: Union[Path, str],
+      branch_name: str,
+  ) -> Optional[str]:
+    cache_key = self.get_cache_key(branch_name)
+    cached_archive = cache.get(cache_key)
+    if cached_archive is None or not self._is_cache_valid(
+        cache,
+        branch_name,
+    ):
+      return None
+
+    content = self._get_extractor(cached_archive).read(
+        f"{self.get_zip_bundle_root_folder(branch_name)}/"
+        f"{Path(relative_path).as_posix()}"
+    )
+    if content is None:
+      return None
+    self.logger.info(
+        "GithubRepository: Using cached file content for: %s",
+        relative_path,
+    )
+    return content.decode(self.encoding)
+
+  def _is_cache_valid(self, cache: ArchiveCache, branch_name: str) -> bool:
+    if self.is_commit_sha(branch_name):
+      return True
+    return cache.is_fresh(self.get_cache_key(branch_name))
+
+  def _get_remote_refs(self) -> Dict[str, str]:
+    remote_url = self.get_refs_url()
+    try:
+      http_response = self.get_session().get(remote_url, timeout=self.timeout)
+      http_response.raise_for_status()
+    except requests.exceptions.RequestException as exc:
+      self.logger.error(
+          "GithubRepository: cannot download '%s'",
+          remote_url,
+      )
+      raise GithubCommunicationError(
+          "Communication error with Github."
+      ) from exc
+
+    refs = {}
+    for line in self._parse_packet_lines(http_response.content):
+      if line.startswith("#"):
+        continue
+      commit, reference = line.split("\0")[0].split(" ", maxsplit=1)
+      refs[reference] = commit
+    return refs
+
+  def _parse_packet_lines(self, content: bytes) -> Iterator[str]:
+    position = 0
+    while position + 4 <= len(content):
+      length = int(content[position:position + 4], 16)
+      if length == 0:
+        position += 4
+        continue
+      line = content[position + 4:position + length]
+      yield line.decode(self.encoding).rstrip("\n")
+      position += length
+
+  def _get_extractor(
+      self,
+      archive: Path,
+  ) -> Union[TarExtractor, ZipExtractor]:
+    if self.archive_format == "tarball":
+      return TarExtractor(archive)
+    return ZipExtractor(archive)
+
+  def _get_member_filter(
+      self,
+      branch_name: str,
+      profile_only: bool,
+  ) -> IgnoreMemberFilter:
+    root_folder = self.get_zip_bundle_root_folder(branch_name)
+    profile_filter = None
+    if profile_only:
+      profile_filter = ProfileMemberFilter(root_folder)
+    return IgnoreMemberFilter(root_folder, profile_filter)
+
+  def _get_cached_zipfile(self, cache: ArchiveCache, branch_name: str) -> Path:
+    cache_key = self.get_cache_key(branch_name)
+
+    with self._open_cached_bundle(cache, branch_name) as bundle:
+      if isinstance(bundle, Path):
+        return bundle
+      with cache.store(
+          cache_key,
+          self._get_response_validators(bundle),
+      ) as archive:
+        self._write_zipfile(bundle, archive)
+
+    return cache.get_archive_path(cache_key)
+
+  @contextmanager
+  def _open_cached_bundle(
+      self,
+      cache: ArchiveCache,
+      branch_name: str,
+  ) -> Iterator[Union[Path, requests.Response]]:
+    cache_key = self.get_cache_key(branch_name)
+    cached_archive = cache.get(cache_key)
+    headers: Dict[str, str] = {}
+
+    if cached_archive is not None:
+      if self._is_cache_valid(cache, branch_name):
+        self.logger.info(
+            "GithubRepository: Using cached %s content for: %s",
+            self.archive_format,
+            cache_key,
+        )
+        yield cached_archive
+        return
+      headers = self._get_conditional_headers(cache.get_metadata(cache_key))
+
+    with self._request_bundle(branch_name, headers) as http_response:
+      if cached_archive is not None and (
+          http_response.status_code == self.not_modified
+      ):
+        cache.refresh(cache_key)
+        self.logger.info(
+            "GithubRepository: Revalidated cached %s content for: %s",
+            self.archive_format,
+            cache_key,
+        )
+        yield cached_archive
+        return
+      yield http_response
+
+  def _get_conditional_headers(
+      self,
+      metadata: Optional[Dict[str, Any]],
+  ) -> Dict[str, str]:
+    headers = {}
+    for key, (_, request_header) in self.validators.items():
+      if metadata and metadata.get(key):
+        headers[request_header] = metadata[key]
+    return headers
+
+  def _get_response_validators(
+      self,
+      http_response: requests.Response,
+  ) -> Dict[str, str]:
+    metadata = {}
+    for key, (response_header, _) in self.validators.items():
+      if response_header in http_response.headers:
+        metadata[key] = http_response.headers[response_header]
+    return metadata
+
+  def _download_zipfile(self, branch_name: str, archive: IO[bytes]) -> None:
+    with self._request_bundle(branch_name) as http_response:
+      self._write_zipfile(http_response, archive)
+
+  def _extract_tarball(
+      self,
+      http_response: requests.Response,
+      file_system_target: Union[Path, str],
+      member_filter: Optional[IgnoreMemberFilter],
+      archive: Optional[IO[bytes]] = None,
+  ) -> None:
+    stream = ChunkStream(
+        http_response.iter_content(chunk_size=self.chunk_size),
+        copy=archive,
+    )
+    TarExtractor(stream).extract(file_system_target, member_filter)
+    stream.drain()
+    self.logger.info(
+        "GithubRepository: Retrieved tarball content from: %s",
+        http_response.url,
+    )
+
+  @contextmanager
+  def _request_bundle(
+      self,
+      branch_name: str,
+      headers: Optional[Dict[str, str]] = None,
+  ) -> Iterator[requests.Response]:
+    remote_url = self.get_bundle_url(branch_name)
+    try:
+      with self.get_session().get(
+          remote_url,
+          headers=headers or {},
+          stream=True,
+          timeout=self.timeout,
+      ) as http_response:
+        http_response.raise_for_status()
+        yield http_response
+    except requests.exceptions.RequestException as exc:
+      self.logger.error(
+          "GithubRepository: cannot download '%s'",
+          remote_url,
+      )
+      raise GithubCommunicationError(
+          "Communication error with Github."
+      ) from exc
+
+  def _write_zipfile(
+      self,
+      http_response: requests.Response,
+      archive: IO[bytes],
+  ) -> None:
+    for chunk in http_response.iter_content(chunk_size=self.chunk_size):
+      archive.write(chunk)
+    self.logger.info(
+        "GithubRepository: Retrieved zip content from: %s",
+        http_response.url,
+    )
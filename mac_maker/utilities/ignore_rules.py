@@ -0,0 +1,162 @@
+"""Ignore rules for profile content, with gitignore semantics."""
+
+import re
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Pattern, Set, Union
+
+from mac_maker import config
+from mac_maker.utilities.mixins.text_file import TextFileReader
+
+
+class IgnoreRule(NamedTuple):
+  """A single compiled ignore pattern."""
+
+  pattern: Pattern[str]
+  negated: bool
+  directory_only: bool
+
+
+class IgnoreRules:
+  """Ignore rules for profile content, with gitignore semantics.
+
+  Patterns are matched against paths relative to the profile root.  The last
+  matching pattern wins, patterns prefixed with `!` re-include content, and
+  content inside an ignored folder is always ignored.
+
+  :param lines: The lines of an ignore file.
+  """
+
+  def __init__(self, lines: List[str]) -> None:
+    self.rules = [
+        rule for rule in (self._parse(line) for line in lines) if rule
+    ]
+
+  @classmethod
+  def from_text(cls, content: str) -> "IgnoreRules":
+    """Create ignore rules from the content of an ignore file.
+
+    :param content: The content of the ignore file.
+    :returns: The created ignore rules.
+    """
+
+    return cls(content.splitlines())
+
+  @classmethod
+  def from_folder(cls, folder: Union[Path, str]) -> Optional["IgnoreRules"]:
+    """Create ignore rules from the ignore file in a profile folder.
+
+    :param folder: The root folder of the profile.
+    :returns: The created ignore rules, or None if there's no ignore file.
+    """
+
+    ignore_file = Path(folder) / config.IGNORE_FILE_NAME
+    if not ignore_file.is_file():
+      return None
+    return cls.from_text(TextFileReader().read_text_file(ignore_file))
+
+  def is_ignored(self, relative_path: str, is_dir: bool = False) -> bool:
+    """Check if a path, relative to the profile root, is ignored.
+
+    :param relative_path: The posix path, relative to the profile root.
+    :param is_dir: A boolean indicating if the path is a folder.
+    :returns: A boolean indicating if the path is ignored.
+    """
+
+    parts = relative_path.strip("/").split("/")
+    for index in range(1, len(parts)):
+      if self._match("/".join(parts[:index]), True):
+        return True
+    return self._match("/".join(parts), is_dir)
+
+  def ignore_names(
+      self,
+      root: Union[Path, str],
+      folder: str,
+      names: List[str],
+  ) -> Set[str]:
+    """Return the names inside a folder to ignore, for :func:`copytree`.
+
+    :param root: The root folder of the profile.
+    :param folder: The folder being copied.
+    :param names: The names of the folder's content.
+    :returns: The names that should not be copied.
+    """
+
+    relative_folder = Path(folder).relative_to(root)
+    ignored = set()
+    for name in names:
+      relative_path = (relative_folder / name).as_posix()
+      if self._match(relative_path, (Path(folder) / name).is_dir()):
+        ignored.add(name)
+    return ignored
+
+  def _match(self, relative_path: str, is_dir: bool) -> bool:
+    ignored = False
+    for rule in self.rules:
+      if rule.directory_only and not is_dir:
+        continue
+      if rule.pattern.match(relative_path):
+        ignored = not rule.negated
+    return ignored
+
+  def _parse(self, line: str) -> Optional[IgnoreRule]:
+    line = line.rstrip("\n")
+    if not line.endswith("\\ "):
+      line = line.rstrip(" ")
+    if not line or line.startswith("#"):
+      return None
+
+    negated = line.startswith("!")
+    if negated or line.startswith("\\"):
+      line = line[1:]
+
+    directory_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+      return None
+
+    anchored = "/" in line
+    line = line.lstrip("/")
+    expression = self._translate(line)
+    if not anchored:
+      expression = "(?:.*/)?" + expression
+    return IgnoreRule(
+        pattern=re.compile(f"^{expression}$"),
+        negated=negated,
+        directory_only=directory_only,
+    )
+
+  def _translate(self, pattern: str) -> str:
+    expression = ""
+    index = 0
+    while index < len(pattern):
+      character = pattern[index]
+      if pattern.startswith("**/", index):
+        expression += "(?:.*/)?"
+        index += 3
+      elif pattern.startswith("/**", index) and index + 3 == len(pattern):
+        expression += "/.*"
+        index += 3
+      elif pattern.startswith("**", index):
+        expression += ".*"
+        index += 2
+      elif character == "*":
+        expression += "[^/]*"
+        index += 1
+      elif character == "?":
+        expression += "[^/]"
+        index += 1
+      elif character == "[" and "]" in pattern[index + 2:]:
+        end = pattern.index("]", index + 2)
+        body = pattern[index + 1:end]
+        if body.startswith("!"):
+          body = "^" + body[1:]
+        expression += f"[{body}]"
+        index = end + 1
+      elif character == "\\" and index + 1 < len(pattern):
+        expression += re.escape(pattern[index + 1])
+        index += 2
+      else:
+        expression += re.escape(character)
+        index += 1
+    return expression
@@ -1,6 +1,7 @@
 """JSONFile mixin classes."""
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Union
 
@@ -32,8 +33,12 @@ class JSONFileWriter:
   ) -> None:
     """Write a Python object to the filesystem as JSON.
 
+    The file is replaced atomically, so it's never read partially written.
+
     :param python_object: The Python object to write to file as JSON.
     :param json_file_location: The path to the destination file.
     """
-    with open(json_file_location, "w", encoding=self.encoding) as file_handle:
+    temporary_location = f"{json_file_location}.{os.getpid()}.tmp"
+    with open(temporary_location, "w", encoding=self.encoding) as file_handle:
       json.dump(python_object, file_handle)
+    os.replace(temporary_location, json_file_location)
@@ -47,6 +47,7 @@ class JSONFileReaderTest(TestCase):
     m_json.load.assert_called_once_with(self.mock_context)
 
 
+@mock.patch(JSON_FILE_MODULE + '.os')
 @mock.patch(JSON_FILE_MODULE + '.json')
 @mock.patch('builtins.open')
 class JSONFileWriterTest(TestCase):
@@ -64,6 +65,7 @@ class JSONFileWriterTest(TestCase):
       self,
       m_open: mock.Mock,
       m_json: mock.Mock,
+      _: mock.Mock,
   ) -> None:
     mock_path = "/mock/path"
     self.mock_context.return_value = self.mock_json
@@ -72,3 +74,21 @@ class JSONFileWriterTest(TestCase):
     self.instance.write_json_file(self.mock_object, mock_path)
 
     m_json.dump.assert_called_once_with(self.mock_object, self.mock_context)
+
+  def test_write_json_file_replaces_atomically(
+      self,
+      m_open: mock.Mock,
+      _: mock.Mock,
+      m_os: mock.Mock,
+  ) -> None:
+    mock_path = "/mock/path"
+    m_os.getpid.return_value = 123
+
+    self.instance.write_json_file(self.mock_object, mock_path)
+
+    m_open.assert_called_once_with(
+        "/mock/path.123.tmp",
+        "w",
+        encoding=self.instance.encoding,
+    )
+    m_os.replace.assert_called_once_with("/mock/path.123.tmp", mock_path)
@@ -0,0 +1,33 @@
+"""Timer for the phases of a job."""
+
+import contextlib
+import time
+from typing import Dict, Iterator
+
+
+class PhaseTimer:
+  """Timer for the phases of a job.
+
+  Phases may be nested, and the duration of a nested phase is excluded from
+  the duration of the phase containing it.  A phase measured more than once
+  accumulates its total duration.
+  """
+
+  def __init__(self) -> None:
+    self.phases: Dict[str, float] = {}
+
+  @contextlib.contextmanager
+  def measure(self, phase: str) -> Iterator[None]:
+    """Measure the duration of a phase, until the context exits.
+
+    :param phase: The name of the phase being measured.
+    """
+
+    started = time.monotonic()
+    nested = sum(self.phases.values())
+    try:
+      yield
+    finally:
+      elapsed = time.monotonic() - started
+      elapsed -= sum(self.phases.values()) - nested
+      self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
@@ -0,0 +1,138 @@
+"""Run history of provisioning jobs."""
+
+import contextlib
+import logging
+import sqlite3
+from typing import Iterator, List, NamedTuple, Optional
+
+from mac_maker import config
+from mac_maker.utilities.state import StateDirectory
+
+
+class RunHistoryEntry(NamedTuple):
+  """A single provisioning run, and its phase durations in seconds."""
+
+  started: float
+  source: str
+  location: str
+  ref: Optional[str]
+  exit_status: int
+  workspace: Optional[float]
+  precheck: Optional[float]
+  galaxy: Optional[float]
+  playbook: Optional[float]
+  tasks_ok: int
+  tasks_changed: int
+  tasks_failed: int
+  tasks_skipped: int
+  tasks_unreachable: int
+
+
+class RunHistory:
+  """Run history of provisioning jobs, stored in a SQLite database.
+
+  The database is kept in the state directory, and only the most recent runs
+  are retained.  A run that can't be recorded is logged, but never interrupts
+  the job.
+
+  :param max_entries: The maximum number of runs to retain.
+  """
+
+  schema = """
+    CREATE TABLE IF NOT EXISTS runs (
+      id INTEGER PRIMARY KEY AUTOINCREMENT,
+      started REAL NOT NULL,
+      source TEXT NOT NULL,
+      location TEXT NOT NULL,
+      ref TEXT,
+      exit_status INTEGER NOT NULL,
+      workspace REAL,
+      precheck REAL,
+      galaxy REAL,
+      playbook REAL,
+      tasks_ok INTEGER NOT NULL,
+      tasks_changed INTEGER NOT NULL,
+      tasks_failed INTEGER NOT NULL,
+      tasks_skipped INTEGER NOT NULL,
+      tasks_unreachable INTEGER NOT NULL
+    )
+  """
+
+  class Messages:
+    error_record_failure = "RunHistory: Unable to record run: %s"
+    recorded = "RunHistory: Recorded run of '%s' with exit status %s."
+
+  def __init__(
+      self,
+      max_entries: int = config.RUN_HISTORY_MAX_ENTRIES,
+  ) -> None:
+    self.log = logging.getLogger(config.LOGGER_NAME)
+    self.max_entries = max_entries
+    self.path = StateDirectory().root / config.RUN_HISTORY_FILE
+
+  def record(self, entry: RunHistoryEntry) -> None:
+    """Record a provisioning run, and evict the oldest runs.
+
+    :param entry: The provisioning run to record.
+    """
+
+    columns = ", ".join(RunHistoryEntry._fields)
+    placeholders = ", ".join("?" for _ in RunHistoryEntry._fields)
+
+    try:
+      self.path.parent.mkdir(parents=True, exist_ok=True)
+      with self._connect() as connection:
+        connection.execute(
+            f"INSERT INTO runs ({columns}) VALUES ({placeholders})",  # nosec
+            entry,
+        )
+        connection.execute(
+            "DELETE FROM runs WHERE id NOT IN "
+            "(SELECT id FROM runs ORDER BY id DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+    except (OSError, sqlite3.Error) as exc:
+      self.log.warning(self.Messages.error_record_failure, exc)
+      return
+
+    self.log.debug(self.Messages.recorded, entry.location, entry.exit_status)
+
+  def query(
+      self,
+      limit: int = config.RUN_HISTORY_LIMIT,
+      source: Optional[str] = None,
+  ) -> List[RunHistoryEntry]:
+    """Query the most recent provisioning runs.
+
+    :param limit: The maximum number of runs to return.
+    :param source: Only return runs from this profile source.
+    :returns: The matching runs, most recent first.
+    """
+
+    if not self.path.is_file():
+      return []
+
+    columns = ", ".join(RunHistoryEntry._fields)
+    where = "" if source is None else "WHERE source = ?"
+    parameters = () if source is None else (source,)
+
+    with self._connect() as connection:
+      rows = connection.execute(
+          f"SELECT {columns} FROM runs {where} "  # nosec
+          "ORDER BY id DESC LIMIT ?",
+          (*parameters, limit),
+      ).fetchall()
+    return [RunHistoryEntry(*row) for row in rows]
+
+  @contextlib.contextmanager
+  def _connect(self) -> Iterator[sqlite3.Connection]:
+    connection = sqlite3.connect(
+        self.path,
+        timeout=config.RUN_HISTORY_TIMEOUT,
+    )
+    try:
+      with connection:
+        connection.execute(self.schema)
+        yield connection
+    finally:
+      connection.close()
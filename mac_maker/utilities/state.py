@@ -0,0 +1,28 @@
+"""Persistent state directory representation."""
+
+import os
+from pathlib import Path
+
+from mac_maker import config
+
+
+class StateDirectory:
+  """Persistent state directory, shared between Mac Maker jobs.
+
+  The location defaults to `~/.mac_maker`, but can be overridden with the
+  `MAC_MAKER_HOME` environment variable.
+  """
+
+  def __init__(self) -> None:
+    self.root = Path(
+        os.getenv(config.ENV_MAC_MAKER_HOME, config.MAC_MAKER_HOME)
+    ).expanduser().resolve()
+
+  def get_folder(self, name: str) -> Path:
+    """Return the location of a named folder inside the state directory.
+
+    :param name: The name of the folder.
+    :returns: The absolute path of the folder.
+    """
+
+    return self.root / name
@@ -7,7 +7,8 @@ from typing import Callable, cast
 from unittest import mock
 
 import pytest
-from mac_maker.utilities import workspace
+from mac_maker import config
+from mac_maker.utilities import archive_cache, workspace
 
 
 @pytest.fixture
@@ -15,6 +16,18 @@ def mocked_profile_root() -> Path:
   return Path("mocked/profile/root")
 
 
+@pytest.fixture
+def mocked_state_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+  state_root = tmp_path / "state"
+  monkeypatch.setenv(config.ENV_MAC_MAKER_HOME, str(state_root))
+  return state_root
+
+
+@pytest.fixture
+def mocked_file_copier() -> mock.Mock:
+  return mock.Mock()
+
+
 @pytest.fixture
 def mocked_github_repository(mocked_profile_root: Path,) -> mock.Mock:
   return mock.Mock(
@@ -44,15 +57,43 @@ def mocked_spec_file_instance(mocked_spec_file: mock.Mock) -> mock.Mock:
   return cast(mock.Mock, mocked_spec_file.return_value)
 
 
+@pytest.fixture
+def mocked_file_lock() -> mock.Mock:
+  return mock.Mock()
+
+
+@pytest.fixture
+def mocked_trash() -> mock.Mock:
+  return mock.Mock()
+
+
+@pytest.fixture
+def mocked_workspace_source() -> str:
+  return "/path/to/profile"
+
+
 @pytest.fixture
 def setup_workspace_module(
+    mocked_file_copier: mock.Mock,
+    mocked_file_lock: mock.Mock,
     mocked_os_module: mock.Mock,
     mocked_shutil_module: mock.Mock,
     mocked_spec_file: mock.Mock,
+    mocked_trash: mock.Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> Callable[[], None]:
 
   def setup() -> None:
+    monkeypatch.setattr(
+        workspace,
+        "FileCopier",
+        mocked_file_copier,
+    )
+    monkeypatch.setattr(
+        workspace,
+        "FileLock",
+        mocked_file_lock,
+    )
     monkeypatch.setattr(
         workspace,
         "os",
@@ -68,17 +109,30 @@ def setup_workspace_module(
         "SpecFile",
         mocked_spec_file,
     )
+    monkeypatch.setattr(
+        workspace,
+        "Trash",
+        mocked_trash,
+    )
 
   return setup
 
 
+@pytest.fixture
+def archive_cache_instance(
+    mocked_state_root: Path,  # pylint: disable=unused-argument
+) -> archive_cache.ArchiveCache:
+  return archive_cache.ArchiveCache(max_size=100, ttl=60)
+
+
 @pytest.fixture
 def workspace_instance(
+    mocked_workspace_source: str,
     setup_workspace_module: Callable[[], None],
 ) -> workspace.WorkSpace:
   setup_workspace_module()
 
-  return workspace.WorkSpace()
+  return workspace.WorkSpace(mocked_workspace_source)
 
 
 @pytest.fixture
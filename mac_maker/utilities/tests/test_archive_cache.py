@@ -0,0 +1,254 @@
+"""Test the ArchiveCache class."""
+
+import logging
+import os
+from logging import Logger
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.utilities import archive_cache
+
+
+class TestArchiveCache:
+  """Test the ArchiveCache class."""
+
+  mocked_key = "org/repo/branch"
+
+  def test_initialize__attributes(
+      self,
+      mocked_state_root: Path,
+  ) -> None:
+    instance = archive_cache.ArchiveCache()
+
+    assert isinstance(instance.log, Logger)
+    assert instance.max_size == config.ARCHIVE_CACHE_MAX_SIZE
+    assert instance.ttl == config.ARCHIVE_CACHE_TTL
+    assert instance.root == (
+        mocked_state_root.resolve() / config.ARCHIVE_CACHE_FOLDER
+    )
+
+  def test_initialize__does_not_create_root(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    assert not archive_cache_instance.root.exists()
+
+  def test_create_key__joins_parts(self) -> None:
+    assert archive_cache.ArchiveCache.create_key(
+        "org",
+        "repo",
+        "branch",
+    ) == self.mocked_key
+
+  def test_get__empty_cache__returns_none(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    assert archive_cache_instance.get(self.mocked_key) is None
+
+  def test_store__successful_write__stores_archive(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    with archive_cache_instance.store(self.mocked_key) as handle:
+      handle.write(b"content")
+
+    cached = archive_cache_instance.get(self.mocked_key)
+
+    assert cached == archive_cache_instance.get_archive_path(self.mocked_key)
+    assert cached.read_bytes() == b"content"
+
+  def test_store__successful_write__stores_metadata(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    with archive_cache_instance.store(
+        self.mocked_key,
+        {
+            "extra": "value"
+        },
+    ) as handle:
+      handle.write(b"content")
+
+    metadata = archive_cache_instance.get_metadata(self.mocked_key)
+
+    assert metadata is not None
+    assert metadata["key"] == self.mocked_key
+    assert metadata["extra"] == "value"
+
+  def test_store__failed_write__does_not_store_archive(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    with pytest.raises(IOError):
+      with archive_cache_instance.store(self.mocked_key) as handle:
+        handle.write(b"partial")
+        raise IOError
+
+    assert archive_cache_instance.get(self.mocked_key) is None
+    assert os.listdir(archive_cache_instance.root) == []
+
+  def test_store__logging(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+
+    with archive_cache_instance.store(self.mocked_key) as handle:
+      handle.write(b"content")
+
+    assert decode_logs(caplog.records) == [
+        "DEBUG:mac_maker:" +
+        archive_cache_instance.Messages.stored % self.mocked_key,
+    ]
+
+  def test_is_fresh__empty_cache__returns_false(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    assert archive_cache_instance.is_fresh(self.mocked_key) is False
+
+  @pytest.mark.parametrize(
+      "elapsed,expected",
+      ((0, True), (59, True), (60, False), (600, False)),
+  )
+  def test_is_fresh__vary_elapsed_time__returns_correct_value(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+      elapsed: int,
+      expected: bool,
+  ) -> None:
+    with mock.patch.object(archive_cache.time, "time", return_value=1000):
+      with archive_cache_instance.store(self.mocked_key) as handle:
+        handle.write(b"content")
+
+    with mock.patch.object(
+        archive_cache.time,
+        "time",
+        return_value=1000 + elapsed,
+    ):
+      assert archive_cache_instance.is_fresh(self.mocked_key) is expected
+
+  def test_refresh__empty_cache__does_nothing(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    archive_cache_instance.refresh(self.mocked_key)
+
+    assert archive_cache_instance.get_metadata(self.mocked_key) is None
+
+  def test_refresh__stale_archive__becomes_fresh(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    with mock.patch.object(archive_cache.time, "time", return_value=0):
+      with archive_cache_instance.store(
+          self.mocked_key,
+          {
+              "etag": "value"
+          },
+      ) as handle:
+        handle.write(b"content")
+
+    archive_cache_instance.refresh(self.mocked_key)
+
+    assert archive_cache_instance.is_fresh(self.mocked_key) is True
+    metadata = archive_cache_instance.get_metadata(self.mocked_key)
+    assert metadata is not None
+    assert metadata["etag"] == "value"
+
+  def test_evict__over_size_cap__removes_least_recently_used(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    for index, key in enumerate(("key1", "key2")):
+      with archive_cache_instance.store(key) as handle:
+        handle.write(b"0" * 40)
+      os.utime(archive_cache_instance.get_archive_path(key), (index, index))
+
+    archive_cache_instance.get("key1")
+    with archive_cache_instance.store("key3") as handle:
+      handle.write(b"0" * 40)
+
+    assert archive_cache_instance.get("key1") is not None
+    assert archive_cache_instance.get("key2") is None
+    assert archive_cache_instance.get("key3") is not None
+
+  def test_evict__single_archive_over_size_cap__keeps_new_archive(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    with archive_cache_instance.store(self.mocked_key) as handle:
+      handle.write(b"0" * 200)
+
+    assert archive_cache_instance.get(self.mocked_key) is not None
+
+  def test_get_archives__returns_least_recently_used_first(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    for index, key in enumerate(("key1", "key2")):
+      with archive_cache_instance.store(key) as handle:
+        handle.write(b"0")
+      os.utime(archive_cache_instance.get_archive_path(key), (index, index))
+    archive_cache_instance.get("key1")
+
+    assert archive_cache_instance.get_archives() == [
+        archive_cache_instance.get_archive_path("key2"),
+        archive_cache_instance.get_archive_path("key1"),
+    ]
+
+  def test_get_archives__removed_archive__skips_removed_archive(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    with archive_cache_instance.store("key1") as handle:
+      handle.write(b"0")
+    archive = archive_cache_instance.get_archive_path("key1")
+    removed = archive_cache_instance.get_archive_path("key2")
+
+    with mock.patch.object(
+        type(archive_cache_instance.root),
+        "glob",
+        return_value=iter([removed, archive]),
+    ):
+      assert archive_cache_instance.get_archives() == [archive]
+
+  def test_evict__archive_removed_concurrently__stops_under_size_cap(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    for index, key in enumerate(("key1", "key2")):
+      with archive_cache_instance.store(key) as handle:
+        handle.write(b"0" * 40)
+      os.utime(archive_cache_instance.get_archive_path(key), (index, index))
+    archive_cache_instance.max_size = 50
+
+    with mock.patch.object(
+        archive_cache_instance,
+        "remove",
+        side_effect=FileNotFoundError,
+    ) as mocked_remove:
+      archive_cache_instance.evict()
+
+    mocked_remove.assert_called_once_with(
+        archive_cache_instance.get_archive_path("key1")
+    )
+
+  def test_remove__removes_archive_and_metadata(
+      self,
+      archive_cache_instance: archive_cache.ArchiveCache,
+  ) -> None:
+    with archive_cache_instance.store(self.mocked_key) as handle:
+      handle.write(b"0" * 10)
+    archive = archive_cache_instance.get_archive_path(self.mocked_key)
+
+    reclaimed = archive_cache_instance.remove(archive)
+
+    assert reclaimed == 10
+    assert not archive.exists()
+    assert archive_cache_instance.get_metadata(self.mocked_key) is None
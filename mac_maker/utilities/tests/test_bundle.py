@@ -0,0 +1,174 @@
+"""Test the Bundle class."""
+
+import io
+import json
+import logging
+import tarfile
+from pathlib import Path
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.utilities import bundle
+from mac_maker.utilities.exceptions import BundleInvalid
+
+
+class TestBundle:
+  """Test the Bundle class."""
+
+  @pytest.fixture
+  def profile_root(self, tmp_path: Path) -> Path:
+    profile_root = tmp_path / "workspace" / "mock-profile"
+    profile = profile_root / config.PROFILE_FOLDER_PATH
+    (profile / "roles" / "galaxy_role").mkdir(parents=True)
+    (profile / "install.yml").write_text("playbook")
+    (profile / "inventory").write_text("machine specific")
+    (profile / "roles" / "galaxy_role" / "main.yml").write_text("role")
+    return profile_root
+
+  @pytest.fixture
+  def instance(self, tmp_path: Path) -> bundle.Bundle:
+    return bundle.Bundle(tmp_path / "profile.bundle")
+
+  def create_bundle(self, path: Path, manifest: object) -> None:
+    content = json.dumps(manifest).encode("utf-8")
+    with tarfile.open(path, "w:gz") as tar:
+      manifest_info = tarfile.TarInfo(config.BUNDLE_MANIFEST_FILE)
+      manifest_info.size = len(content)
+      tar.addfile(manifest_info, io.BytesIO(content))
+
+  def test_create__writes_manifest_first(
+      self,
+      instance: bundle.Bundle,
+      profile_root: Path,
+  ) -> None:
+    instance.create(profile_root, exclude=[], source_commit="abc123")
+
+    with tarfile.open(instance.path, "r:gz") as tar:
+      members = tar.getnames()
+
+    assert members[0] == config.BUNDLE_MANIFEST_FILE
+    assert instance.get_manifest() == {
+        "version": config.BUNDLE_VERSION,
+        "profile_root": "mock-profile",
+        "source_commit": "abc123",
+    }
+
+  def test_create__adds_profile_content(
+      self,
+      instance: bundle.Bundle,
+      profile_root: Path,
+  ) -> None:
+    instance.create(profile_root, exclude=[])
+
+    with tarfile.open(instance.path, "r:gz") as tar:
+      members = tar.getnames()
+
+    assert "mock-profile/profile/install.yml" in members
+    assert "mock-profile/profile/inventory" in members
+    assert "mock-profile/profile/roles/galaxy_role/main.yml" in members
+
+  def test_create__excluded_paths__leaves_them_out(
+      self,
+      instance: bundle.Bundle,
+      profile_root: Path,
+  ) -> None:
+    inventory = profile_root / config.PROFILE_FOLDER_PATH / "inventory"
+
+    instance.create(profile_root, exclude=[inventory])
+
+    with tarfile.open(instance.path, "r:gz") as tar:
+      members = tar.getnames()
+
+    assert "mock-profile/profile/inventory" not in members
+    assert "mock-profile/profile/install.yml" in members
+
+  def test_create__leaves_no_temporary_files(
+      self,
+      instance: bundle.Bundle,
+      profile_root: Path,
+  ) -> None:
+    instance.create(profile_root, exclude=[])
+
+    assert list(instance.path.parent.glob(".*.tmp")) == []
+
+  def test_create__logging(
+      self,
+      instance: bundle.Bundle,
+      profile_root: Path,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+
+    instance.create(profile_root, exclude=[])
+
+    assert decode_logs(caplog.records)[0].startswith(
+        f"DEBUG:mac_maker:Bundle: Created bundle '{instance.path}'"
+    )
+
+  def test_get_manifest__missing_file__raises_exception(
+      self,
+      instance: bundle.Bundle,
+  ) -> None:
+    with pytest.raises(BundleInvalid) as exc:
+      instance.get_manifest()
+
+    expected = bundle.Bundle.Messages.error_invalid % instance.path
+    assert str(exc.value) == expected
+
+  def test_get_manifest__not_an_archive__raises_exception(
+      self,
+      instance: bundle.Bundle,
+  ) -> None:
+    instance.path.write_text("not a bundle")
+
+    with pytest.raises(BundleInvalid):
+      instance.get_manifest()
+
+  @pytest.mark.parametrize(
+      "manifest",
+      (
+          None,
+          {
+              "version": config.BUNDLE_VERSION + 1,
+              "profile_root": "mock-profile",
+          },
+          {
+              "version": config.BUNDLE_VERSION,
+              "profile_root": "..",
+          },
+          {
+              "version": config.BUNDLE_VERSION,
+              "profile_root": "../mock-profile",
+          },
+      ),
+  )
+  def test_get_manifest__invalid_manifest__raises_exception(
+      self,
+      instance: bundle.Bundle,
+      manifest: object,
+  ) -> None:
+    self.create_bundle(instance.path, manifest)
+
+    with pytest.raises(BundleInvalid):
+      instance.get_manifest()
+
+  def test_extract__extracts_profile(
+      self,
+      instance: bundle.Bundle,
+      profile_root: Path,
+      tmp_path: Path,
+  ) -> None:
+    inventory = profile_root / config.PROFILE_FOLDER_PATH / "inventory"
+    instance.create(profile_root, exclude=[inventory])
+    target = tmp_path / "extracted"
+    target.mkdir()
+
+    extracted_root = instance.extract(target)
+
+    profile = extracted_root / config.PROFILE_FOLDER_PATH
+    assert extracted_root == target / "mock-profile"
+    assert (profile / "install.yml").read_text() == "playbook"
+    assert (profile / "roles" / "galaxy_role" / "main.yml").read_text() == \
+        "role"
+    assert not (profile / "inventory").exists()
@@ -0,0 +1,481 @@
+"""Test the archive extraction classes."""
+
+import logging
+import os
+import stat
+import tarfile
+from io import BytesIO
+from pathlib import Path
+from typing import List
+from zipfile import ZipFile, ZipInfo
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.__helpers__.parametrize import templated_ids
+from mac_maker.utilities import extractor
+
+
+class TestProfileMemberFilter:
+  """Test the ProfileMemberFilter class."""
+
+  @pytest.mark.parametrize(
+      "member_name,expected",
+      (
+          ("repo-main", True),
+          ("repo-main/", True),
+          ("repo-main/profile", True),
+          ("repo-main/profile/", True),
+          ("repo-main/profile/install.yml", True),
+          ("repo-main/profile/__precheck__/env.yml", True),
+          ("repo-main/spec.json", True),
+          ("repo-main/README.md", False),
+          ("repo-main/docs/", False),
+          ("repo-main/profiles/install.yml", False),
+          ("repo-other/profile/install.yml", False),
+      ),
+      ids=templated_ids("{0}"),
+  )
+  def test_is_selected__vary_member__returns_correct_value(
+      self,
+      member_name: str,
+      expected: bool,
+  ) -> None:
+    instance = extractor.ProfileMemberFilter("repo-main")
+
+    assert instance.is_selected(member_name) is expected
+
+
+class TestIgnoreMemberFilter:
+  """Test the IgnoreMemberFilter class."""
+
+  @pytest.mark.parametrize(
+      "member_name,expected",
+      (
+          ("repo-main/", True),
+          ("repo-main/.macmakerignore", True),
+          ("repo-main/profile/install.yml", True),
+          ("repo-main/profile/media/", False),
+          ("repo-main/profile/media/video.mp4", False),
+          ("repo-main/profile/notes.log", False),
+          ("repo-main/profile/keep.log", True),
+      ),
+      ids=templated_ids("{0}"),
+  )
+  def test_is_selected__vary_member__returns_correct_value(
+      self,
+      member_name: str,
+      expected: bool,
+  ) -> None:
+    instance = extractor.IgnoreMemberFilter("repo-main")
+    instance.load(b"media/\n*.log\n!keep.log\n")
+
+    assert instance.is_selected(member_name) is expected
+
+  def test_is_selected__rules_not_loaded__selects_all_members(self) -> None:
+    instance = extractor.IgnoreMemberFilter("repo-main")
+
+    assert instance.is_selected("repo-main/profile/notes.log") is True
+
+  def test_is_selected__member_filter__combines_filters(self) -> None:
+    instance = extractor.IgnoreMemberFilter(
+        "repo-main",
+        extractor.ProfileMemberFilter("repo-main"),
+    )
+    instance.load(b"*.log\n")
+
+    assert instance.is_selected("repo-main/README.md") is False
+    assert instance.is_selected("repo-main/profile/notes.log") is False
+    assert instance.is_selected("repo-main/profile/install.yml") is True
+
+
+class TestChunkStream:
+  """Test the ChunkStream class."""
+
+  chunks = [b"abc", b"defg", b"h"]
+
+  def test_read__vary_size__returns_correct_bytes(self) -> None:
+    instance = extractor.ChunkStream(iter(self.chunks))
+
+    assert instance.read(2) == b"ab"
+    assert instance.read(3) == b"cde"
+    assert instance.read(10) == b"fgh"
+    assert instance.read(1) == b""
+
+  def test_read__no_size__returns_all_bytes(self) -> None:
+    instance = extractor.ChunkStream(iter(self.chunks))
+
+    assert instance.read(1) == b"a"
+    assert instance.read() == b"bcdefgh"
+
+  def test_read__with_copy__copies_received_chunks(self) -> None:
+    copy = BytesIO()
+    instance = extractor.ChunkStream(iter(self.chunks), copy=copy)
+
+    instance.read(4)
+
+    assert copy.getvalue() == b"abcdefg"
+
+  def test_drain__with_copy__copies_remaining_chunks(self) -> None:
+    copy = BytesIO()
+    instance = extractor.ChunkStream(iter(self.chunks), copy=copy)
+
+    instance.read(1)
+    instance.drain()
+
+    assert copy.getvalue() == b"abcdefgh"
+
+
+class TestTarExtractor:
+  """Test the TarExtractor class."""
+
+  members = {
+      "repo-main/README.md": b"readme",
+      "repo-main/docs/image.png": b"image",
+      "repo-main/profile/install.yml": b"playbook",
+      "repo-main/profile/__precheck__/notes.txt": b"notes",
+  }
+
+  @pytest.fixture
+  def mocked_tarball(self, tmp_path: Path) -> Path:
+    archive = tmp_path / "archive.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+      for name, content in self.members.items():
+        member = tarfile.TarInfo(name)
+        member.size = len(content)
+        member.mode = 0o755 if name.endswith(".yml") else 0o644
+        tar.addfile(member, BytesIO(content))
+    return archive
+
+  def test_read__existing_member__returns_content(
+      self,
+      mocked_tarball: Path,
+  ) -> None:
+    instance = extractor.TarExtractor(mocked_tarball)
+
+    assert instance.read("repo-main/profile/install.yml") == b"playbook"
+
+  def test_read__missing_member__returns_none(
+      self,
+      mocked_tarball: Path,
+  ) -> None:
+    instance = extractor.TarExtractor(mocked_tarball)
+
+    assert instance.read("repo-main/profile/missing.yml") is None
+
+  def test_extract__no_filter__extracts_all_members(
+      self,
+      mocked_tarball: Path,
+      tmp_path: Path,
+  ) -> None:
+    target = tmp_path / "target"
+
+    extractor.TarExtractor(mocked_tarball).extract(target)
+
+    for name, content in self.members.items():
+      assert (target / name).read_bytes() == content
+
+  def test_extract__chunk_stream__extracts_all_members(
+      self,
+      mocked_tarball: Path,
+      tmp_path: Path,
+  ) -> None:
+    data = mocked_tarball.read_bytes()
+    chunks = iter([data[i:i + 7] for i in range(0, len(data), 7)])
+    target = tmp_path / "target"
+
+    extractor.TarExtractor(extractor.ChunkStream(chunks)).extract(target)
+
+    for name, content in self.members.items():
+      assert (target / name).read_bytes() == content
+
+  def test_extract__profile_filter__extracts_profile_members(
+      self,
+      mocked_tarball: Path,
+      tmp_path: Path,
+  ) -> None:
+    target = tmp_path / "target"
+
+    extractor.TarExtractor(mocked_tarball).extract(
+        target,
+        extractor.ProfileMemberFilter("repo-main"),
+    )
+
+    assert sorted(
+        str(path.relative_to(target))
+        for path in target.rglob("*")
+        if path.is_file()
+    ) == [
+        "repo-main/profile/__precheck__/notes.txt",
+        "repo-main/profile/install.yml",
+    ]
+
+  def test_extract__profile_filter__logging(
+      self,
+      mocked_tarball: Path,
+      tmp_path: Path,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    instance = extractor.TarExtractor(mocked_tarball)
+
+    instance.extract(
+        tmp_path / "target",
+        extractor.ProfileMemberFilter("repo-main"),
+    )
+
+    logs = decode_logs(caplog.records)
+    assert len(logs) == 2
+    assert logs[0].startswith(
+        "DEBUG:mac_maker:" +
+        instance.Messages.throughput.split("%", maxsplit=1)[0] + "13 bytes"
+    )
+    assert logs[1] == "DEBUG:mac_maker:" + instance.Messages.extracted % (2, 4)
+
+  def test_extract__preserves_permissions(
+      self,
+      mocked_tarball: Path,
+      tmp_path: Path,
+  ) -> None:
+    target = tmp_path / "target"
+
+    extractor.TarExtractor(mocked_tarball).extract(target)
+
+    assert stat.S_IMODE(
+        os.stat(target / "repo-main/profile/install.yml").st_mode
+    ) == 0o755
+    assert stat.S_IMODE(
+        os.stat(target / "repo-main/README.md").st_mode
+    ) == 0o644
+
+  def test_extract__unsafe_member_names__raises_exception(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    archive = tmp_path / "unsafe.tar"
+    with tarfile.open(archive, "w") as tar:
+      member = tarfile.TarInfo("../escaped.txt")
+      tar.addfile(member, BytesIO(b""))
+    target = tmp_path / "target"
+
+    with pytest.raises(tarfile.OutsideDestinationError):
+      extractor.TarExtractor(archive).extract(target)
+
+    assert not (tmp_path / "escaped.txt").exists()
+
+  @pytest.mark.parametrize(
+      "profile_only,expected",
+      (
+          (
+              False,
+              [
+                  "repo-main/.macmakerignore",
+                  "repo-main/README.md",
+                  "repo-main/profile/install.yml",
+              ],
+          ),
+          (True, ["repo-main/profile/install.yml"]),
+      ),
+      ids=templated_ids("profile_only:{0}"),
+  )
+  def test_extract__ignore_filter__skips_ignored_members(
+      self,
+      tmp_path: Path,
+      profile_only: bool,
+      expected: List[str],
+  ) -> None:
+    archive = BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+      for name, content in {
+          "repo-main/.macmakerignore": b"docs/\n__precheck__/\n",
+          **self.members,
+      }.items():
+        member = tarfile.TarInfo(name)
+        member.size = len(content)
+        tar.addfile(member, BytesIO(content))
+    data = archive.getvalue()
+    chunks = iter([data[i:i + 7] for i in range(0, len(data), 7)])
+    target = tmp_path / "target"
+    member_filter = extractor.IgnoreMemberFilter(
+        "repo-main",
+        extractor.ProfileMemberFilter("repo-main") if profile_only else None,
+    )
+
+    extractor.TarExtractor(extractor.ChunkStream(chunks)).extract(
+        target,
+        member_filter,
+    )
+
+    assert sorted(
+        str(path.relative_to(target))
+        for path in target.rglob("*")
+        if path.is_file()
+    ) == expected
+
+
+class TestZipExtractor:
+  """Test the ZipExtractor class."""
+
+  members = {
+      "repo-main/README.md": b"readme",
+      "repo-main/docs/image.png": b"image",
+      "repo-main/profile/install.yml": b"playbook",
+      "repo-main/profile/__precheck__/notes.txt": b"notes",
+  }
+
+  @pytest.fixture
+  def mocked_zipfile(self, tmp_path: Path) -> Path:
+    archive = tmp_path / "archive.zip"
+    with ZipFile(archive, "w") as zipfile:
+      for name, content in self.members.items():
+        zipfile.writestr(name, content)
+    return archive
+
+  def test_read__existing_member__returns_content(
+      self,
+      mocked_zipfile: Path,
+  ) -> None:
+    instance = extractor.ZipExtractor(mocked_zipfile)
+
+    assert instance.read("repo-main/profile/install.yml") == b"playbook"
+
+  def test_read__missing_member__returns_none(
+      self,
+      mocked_zipfile: Path,
+  ) -> None:
+    instance = extractor.ZipExtractor(mocked_zipfile)
+
+    assert instance.read("repo-main/profile/missing.yml") is None
+
+  def test_extract__no_filter__extracts_all_members(
+      self,
+      mocked_zipfile: Path,
+      tmp_path: Path,
+  ) -> None:
+    target = tmp_path / "target"
+
+    extractor.ZipExtractor(mocked_zipfile).extract(target)
+
+    for name, content in self.members.items():
+      assert (target / name).read_bytes() == content
+
+  def test_extract__profile_filter__extracts_profile_members(
+      self,
+      mocked_zipfile: Path,
+      tmp_path: Path,
+  ) -> None:
+    target = tmp_path / "target"
+
+    extractor.ZipExtractor(mocked_zipfile).extract(
+        target,
+        extractor.ProfileMemberFilter("repo-main"),
+    )
+
+    assert sorted(
+        str(path.relative_to(target))
+        for path in target.rglob("*")
+        if path.is_file()
+    ) == [
+        "repo-main/profile/__precheck__/notes.txt",
+        "repo-main/profile/install.yml",
+    ]
+
+  def test_extract__profile_filter__logging(
+      self,
+      mocked_zipfile: Path,
+      tmp_path: Path,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    instance = extractor.ZipExtractor(mocked_zipfile)
+
+    instance.extract(
+        tmp_path / "target",
+        extractor.ProfileMemberFilter("repo-main"),
+    )
+
+    logs = decode_logs(caplog.records)
+    assert len(logs) == 2
+    assert logs[0].startswith(
+        "DEBUG:mac_maker:" +
+        instance.Messages.throughput.split("%", maxsplit=1)[0] + "13 bytes"
+    )
+    assert logs[1] == "DEBUG:mac_maker:" + instance.Messages.extracted % (2, 4)
+
+  def test_extract__vary_workers__extracts_all_members(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    archive = tmp_path / "archive.zip"
+    names = [
+        f"repo-main/profile/{index % 7}/{index}.yml" for index in range(200)
+    ]
+    with ZipFile(archive, "w") as zipfile:
+      for name in names:
+        zipfile.writestr(name, name)
+
+    for workers in (1, 8):
+      target = tmp_path / f"target{workers}"
+      extractor.ZipExtractor(archive, workers=workers).extract(target)
+
+      for name in names:
+        assert (target / name).read_text() == name
+
+  def test_extract__preserves_permissions(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    archive = tmp_path / "archive.zip"
+    with ZipFile(archive, "w") as zipfile:
+      for name, mode in (("script.sh", 0o755), ("data.txt", 0o640)):
+        member = ZipInfo(f"repo-main/{name}")
+        member.external_attr = (stat.S_IFREG | mode) << 16
+        zipfile.writestr(member, "content")
+    target = tmp_path / "target"
+
+    extractor.ZipExtractor(archive).extract(target)
+
+    assert stat.S_IMODE(os.stat(target / "repo-main/script.sh").st_mode) == \
+        0o755
+    assert stat.S_IMODE(os.stat(target / "repo-main/data.txt").st_mode) == \
+        0o640
+
+  def test_extract__unsafe_member_names__stays_inside_target(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    archive = tmp_path / "archive.zip"
+    with ZipFile(archive, "w") as zipfile:
+      zipfile.writestr("../escaped.txt", "content")
+      zipfile.writestr("/absolute.txt", "content")
+    target = tmp_path / "target"
+
+    extractor.ZipExtractor(archive).extract(target)
+
+    assert not (tmp_path / "escaped.txt").exists()
+    assert (target / "escaped.txt").exists()
+    assert (target / "absolute.txt").exists()
+
+  def test_extract__ignore_filter__skips_ignored_members(
+      self,
+      mocked_zipfile: Path,
+      tmp_path: Path,
+  ) -> None:
+    with ZipFile(mocked_zipfile, "a") as zipfile:
+      zipfile.writestr("repo-main/.macmakerignore", "docs/\n__precheck__/\n")
+    target = tmp_path / "target"
+
+    extractor.ZipExtractor(mocked_zipfile).extract(
+        target,
+        extractor.IgnoreMemberFilter("repo-main"),
+    )
+
+    assert sorted(
+        str(path.relative_to(target))
+        for path in target.rglob("*")
+        if path.is_file()
+    ) == [
+        "repo-main/.macmakerignore",
+        "repo-main/README.md",
+        "repo-main/profile/install.yml",
+    ]
@@ -0,0 +1,171 @@
+"""Test the FileCopier class."""
+
+import errno
+import logging
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.utilities import file_copier
+
+FILE_COPIER_MODULE = file_copier.__name__
+
+
+class TestFileCopier:
+  """Test the FileCopier class."""
+
+  @pytest.fixture
+  def source(self, tmp_path: Path) -> Path:
+    source = tmp_path / "source.yml"
+    source.write_text("content")
+    os.utime(source, (1000000000, 1000000000))
+    return source
+
+  @pytest.fixture
+  def read_only_source(self, source: Path) -> Path:
+    source.chmod(0o444)
+    return source
+
+  @pytest.fixture
+  def destination(self, tmp_path: Path) -> Path:
+    return tmp_path / "destination.yml"
+
+  def unsupported(self, *_: object) -> None:
+    raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+  def test_initialize__attributes(self) -> None:
+    instance = file_copier.FileCopier()
+
+    assert instance.reflink is config.COPY_REFLINK
+    assert instance.hardlink is config.COPY_HARDLINK
+    assert isinstance(instance.log, logging.Logger)
+
+  def test_copy__reflink_supported__clones_file(
+      self,
+      source: Path,
+      destination: Path,
+  ) -> None:
+    instance = file_copier.FileCopier()
+
+    destination.write_text("content")
+
+    with mock.patch.object(instance, "_clone", return_value=True) as clone:
+      result = instance.copy(source, destination)
+
+    clone.assert_called_once_with(source, destination)
+    assert destination.stat().st_mtime == source.stat().st_mtime
+    assert result == str(destination)
+    assert instance.counts["cloned"] == 1
+
+  def test_copy__linux_reflink__uses_ficlone(
+      self,
+      source: Path,
+      destination: Path,
+  ) -> None:
+    instance = file_copier.FileCopier()
+
+    with mock.patch(FILE_COPIER_MODULE + ".sys.platform", "linux"):
+      with mock.patch(FILE_COPIER_MODULE + ".fcntl.ioctl") as ioctl:
+        instance.copy(source, destination)
+
+    assert ioctl.call_args[0][1] == file_copier.FICLONE
+    assert destination.stat().st_mtime == source.stat().st_mtime
+    assert instance.counts["cloned"] == 1
+
+  def test_copy__linux_reflink_unsupported__disables_reflink(
+      self,
+      source: Path,
+      destination: Path,
+  ) -> None:
+    instance = file_copier.FileCopier(hardlink=False)
+
+    with mock.patch(FILE_COPIER_MODULE + ".sys.platform", "linux"):
+      with mock.patch(
+          FILE_COPIER_MODULE + ".fcntl.ioctl",
+          side_effect=self.unsupported,
+      ):
+        instance.copy(source, destination)
+
+    assert instance.reflink is False
+    assert destination.read_text() == "content"
+    assert instance.counts["copied"] == 1
+
+  def test_copy__reflink_other_error__raises_exception(
+      self,
+      source: Path,
+      destination: Path,
+  ) -> None:
+    instance = file_copier.FileCopier()
+
+    with mock.patch.object(
+        instance,
+        "_clone_linux",
+        side_effect=OSError(errno.ENOSPC, "No space left on device"),
+    ):
+      with mock.patch(FILE_COPIER_MODULE + ".sys.platform", "linux"):
+        with pytest.raises(OSError):
+          instance.copy(source, destination)
+
+  def test_copy__read_only_file__hardlinks_file(
+      self,
+      read_only_source: Path,
+      destination: Path,
+  ) -> None:
+    instance = file_copier.FileCopier(reflink=False)
+
+    instance.copy(read_only_source, destination)
+
+    assert destination.stat().st_ino == read_only_source.stat().st_ino
+    assert instance.counts["linked"] == 1
+
+  def test_copy__writable_file__copies_file(
+      self,
+      source: Path,
+      destination: Path,
+  ) -> None:
+    instance = file_copier.FileCopier(reflink=False)
+
+    instance.copy(source, destination)
+
+    assert destination.stat().st_ino != source.stat().st_ino
+    assert destination.read_text() == "content"
+    assert destination.stat().st_mtime == source.stat().st_mtime
+    assert instance.counts["copied"] == 1
+
+  def test_copy__hardlink_unsupported__disables_hardlink(
+      self,
+      read_only_source: Path,
+      destination: Path,
+  ) -> None:
+    instance = file_copier.FileCopier(reflink=False)
+
+    with mock.patch(
+        FILE_COPIER_MODULE + ".os.link",
+        side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+    ):
+      instance.copy(read_only_source, destination)
+
+    assert instance.hardlink is False
+    assert destination.stat().st_ino != read_only_source.stat().st_ino
+    assert instance.counts["copied"] == 1
+
+  def test_log_summary__logging(
+      self,
+      read_only_source: Path,
+      destination: Path,
+      tmp_path: Path,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    instance = file_copier.FileCopier(reflink=False)
+    instance.copy(read_only_source, destination)
+    instance.copy(read_only_source, tmp_path / "other.yml")
+
+    instance.log_summary()
+
+    assert decode_logs(caplog.records) == [
+        "DEBUG:mac_maker:" + instance.Messages.summary % (0, 2, 0),
+    ]
@@ -0,0 +1,104 @@
+"""Test the FileLock class."""
+
+import fcntl
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.utilities import file_lock
+
+
+class TestFileLock:
+  """Test the FileLock class."""
+
+  @pytest.fixture
+  def lock_path(self, tmp_path: Path) -> Path:
+    return tmp_path / "nested" / "workspace.lock"
+
+  def try_lock(self, lock_path: Path, operation: int) -> bool:
+    with open(lock_path, "ab") as handle:
+      try:
+        fcntl.flock(handle, operation | fcntl.LOCK_NB)
+      except BlockingIOError:
+        return False
+      fcntl.flock(handle, fcntl.LOCK_UN)
+    return True
+
+  def test_initialize__attributes(self, lock_path: Path) -> None:
+    instance = file_lock.FileLock(lock_path)
+
+    assert instance.path == lock_path
+    assert instance.mode is None
+
+  def test_exclusive__creates_lock_file(self, lock_path: Path) -> None:
+    instance = file_lock.FileLock(lock_path)
+
+    instance.exclusive()
+
+    assert lock_path.exists()
+    assert instance.mode == instance.exclusive_mode
+
+  def test_exclusive__allows_no_other_locks(self, lock_path: Path) -> None:
+    instance = file_lock.FileLock(lock_path)
+
+    instance.exclusive()
+
+    assert instance.mode == instance.exclusive_mode
+    assert self.try_lock(lock_path, fcntl.LOCK_SH) is False
+    assert self.try_lock(lock_path, fcntl.LOCK_EX) is False
+
+  def test_try_exclusive__not_held_elsewhere__returns_true(
+      self,
+      lock_path: Path,
+  ) -> None:
+    instance = file_lock.FileLock(lock_path)
+
+    assert instance.try_exclusive() is True
+    assert instance.mode == instance.exclusive_mode
+
+  def test_try_exclusive__held_elsewhere__returns_false(
+      self,
+      lock_path: Path,
+  ) -> None:
+    holder = file_lock.FileLock(lock_path)
+    holder.exclusive()
+    instance = file_lock.FileLock(lock_path)
+
+    assert instance.try_exclusive() is False
+    assert instance.mode is None
+
+  def test_release__allows_other_locks(self, lock_path: Path) -> None:
+    instance = file_lock.FileLock(lock_path)
+    instance.exclusive()
+
+    instance.release()
+
+    assert instance.mode is None
+    assert self.try_lock(lock_path, fcntl.LOCK_EX) is True
+
+  def test_exclusive__held_elsewhere__waits_for_lock(
+      self,
+      lock_path: Path,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    instance = file_lock.FileLock(lock_path)
+    lock_path.parent.mkdir()
+
+    with open(lock_path, "ab") as handle:
+      fcntl.flock(handle, fcntl.LOCK_SH)
+      release = threading.Timer(0.1, fcntl.flock, (handle, fcntl.LOCK_UN))
+      release.start()
+      instance.exclusive()
+      release.join()
+
+    assert instance.mode == instance.exclusive_mode
+    assert decode_logs(caplog.records)[-2:] == [
+        "INFO:mac_maker:" + instance.Messages.waiting %
+        (instance.exclusive_mode, lock_path),
+        "DEBUG:mac_maker:" + instance.Messages.acquired %
+        (instance.exclusive_mode, lock_path),
+    ]
@@ -0,0 +1,262 @@
+"""Test the FolderSync class."""
+
+import logging
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.utilities import folder_sync
+from mac_maker.utilities.ignore_rules import IgnoreRules
+
+
+class TestFolderSync:
+  """Test the FolderSync class."""
+
+  @pytest.fixture
+  def source(self, tmp_path: Path) -> Path:
+    source = tmp_path / "source"
+    (source / "roles" / "local").mkdir(parents=True)
+    (source / "install.yml").write_text("playbook")
+    (source / "roles" / "local" / "main.yml").write_text("role")
+    return source
+
+  @pytest.fixture
+  def destination(self, tmp_path: Path) -> Path:
+    return tmp_path / "destination"
+
+  @pytest.fixture
+  def instance(
+      self,
+      source: Path,
+      destination: Path,
+      tmp_path: Path,
+  ) -> folder_sync.FolderSync:
+    return folder_sync.FolderSync(
+        source,
+        destination,
+        tmp_path / "manifest.json",
+    )
+
+  def test_sync__new_destination__copies_all_files(
+      self,
+      destination: Path,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    instance.sync()
+
+    assert (destination / "install.yml").read_text() == "playbook"
+    assert (destination / "roles" / "local" / "main.yml").read_text() == \
+        "role"
+
+  def test_sync__new_destination__writes_manifest(
+      self,
+      source: Path,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    instance.sync()
+
+    stat = (source / "install.yml").stat()
+    assert instance.load_manifest() == {
+        "install.yml": [stat.st_size, stat.st_mtime_ns, None],
+        "roles/local/main.yml": mock.ANY,
+    }
+
+  def test_sync__unchanged_source__copies_nothing(
+      self,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    instance.sync()
+
+    with mock.patch(folder_sync.__name__ + ".shutil") as mocked_shutil:
+      instance.sync()
+
+    mocked_shutil.copy2.assert_not_called()
+
+  def test_sync__changed_file__copies_changed_file_only(
+      self,
+      source: Path,
+      destination: Path,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    instance.sync()
+    (source / "install.yml").write_text("edited playbook")
+
+    with mock.patch(
+        folder_sync.__name__ + ".shutil.copy2",
+        wraps=folder_sync.shutil.copy2,
+    ) as mocked_copy:
+      instance.sync()
+
+    mocked_copy.assert_called_once_with(
+        source / "install.yml",
+        destination / "install.yml",
+    )
+    assert (destination / "install.yml").read_text() == "edited playbook"
+
+  def test_sync__missing_destination_file__copies_file(
+      self,
+      destination: Path,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    instance.sync()
+    (destination / "install.yml").unlink()
+
+    instance.sync()
+
+    assert (destination / "install.yml").read_text() == "playbook"
+
+  def test_sync__removed_file__removes_file_and_empty_folders(
+      self,
+      source: Path,
+      destination: Path,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    instance.sync()
+    (source / "roles" / "local" / "main.yml").unlink()
+
+    instance.sync()
+
+    assert not (destination / "roles").exists()
+    assert (destination / "install.yml").exists()
+    assert "roles/local/main.yml" not in instance.load_manifest()
+
+  def test_sync__unmanaged_destination_content__is_kept(
+      self,
+      destination: Path,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    instance.sync()
+    installed = destination / "roles" / "installed" / "main.yml"
+    installed.parent.mkdir()
+    installed.write_text("installed")
+
+    instance.sync()
+
+    assert installed.read_text() == "installed"
+
+  def test_sync__checksum__copies_same_size_and_mtime_changes(
+      self,
+      source: Path,
+      destination: Path,
+      tmp_path: Path,
+  ) -> None:
+    instance = folder_sync.FolderSync(
+        source,
+        destination,
+        tmp_path / "manifest.json",
+        checksum=True,
+    )
+    instance.sync()
+    playbook = source / "install.yml"
+    stat = playbook.stat()
+    playbook.write_text("PLAYBOOK")
+    os.utime(playbook, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    instance.sync()
+
+    assert (destination / "install.yml").read_text() == "PLAYBOOK"
+
+  def test_sync__ignore_rules__skips_and_removes_ignored_files(
+      self,
+      source: Path,
+      destination: Path,
+      instance: folder_sync.FolderSync,
+      tmp_path: Path,
+  ) -> None:
+    instance.sync()
+    instance = folder_sync.FolderSync(
+        source,
+        destination,
+        tmp_path / "manifest.json",
+        ignore=IgnoreRules(["roles/"]),
+    )
+
+    instance.sync()
+
+    assert not (destination / "roles").exists()
+    assert (destination / "install.yml").exists()
+    assert list(instance.load_manifest()) == ["install.yml"]
+
+  def test_sync__symlinked_folder__copies_linked_files(
+      self,
+      source: Path,
+      destination: Path,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    (source / "linked").symlink_to(source / "roles" / "local")
+
+    instance.sync()
+
+    assert (destination / "linked" / "main.yml").read_text() == "role"
+
+  def test_sync__symlink_loop__copies_each_folder_once(
+      self,
+      source: Path,
+      destination: Path,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    (source / "roles" / "local" / "loop").symlink_to(source / "roles")
+
+    instance.sync()
+
+    assert sorted(instance.load_manifest()) == [
+        "install.yml",
+        "roles/local/main.yml",
+    ]
+    assert not (destination / "roles" / "local" / "loop").exists()
+
+  def test_is_synchronized__new_destination__returns_false(
+      self,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    assert instance.is_synchronized() is False
+
+  def test_is_synchronized__unchanged_source__returns_true(
+      self,
+      instance: folder_sync.FolderSync,
+  ) -> None:
+    instance.sync()
+
+    assert instance.is_synchronized() is True
+
+  @pytest.mark.parametrize(
+      "change",
+      ("edit", "add", "remove"),
+  )
+  def test_is_synchronized__vary_source_change__returns_false(
+      self,
+      source: Path,
+      instance: folder_sync.FolderSync,
+      change: str,
+  ) -> None:
+    instance.sync()
+    if change == "edit":
+      (source / "install.yml").write_text("edited playbook")
+    elif change == "add":
+      (source / "new.yml").write_text("new")
+    else:
+      (source / "install.yml").unlink()
+
+    assert instance.is_synchronized() is False
+
+  def test_sync__logging(
+      self,
+      source: Path,
+      instance: folder_sync.FolderSync,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    instance.sync()
+    (source / "install.yml").write_text("edited playbook")
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    caplog.clear()
+
+    instance.sync()
+
+    logs = decode_logs(caplog.records)
+    assert len(logs) == 1
+    assert logs[0].startswith(
+        "DEBUG:mac_maker:FolderSync: Copied 1, removed 0 and kept 1 files"
+    )
@@ -0,0 +1,259 @@
+"""Test the GarbageCollector class."""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+from unittest import mock
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.utilities import garbage_collector, trash
+from mac_maker.utilities.archive_cache import ArchiveCache
+from mac_maker.utilities.workspace import WorkSpace
+
+
+class TestGarbageCollector:
+  """Test the GarbageCollector class."""
+
+  day = 24 * 60 * 60
+
+  @pytest.fixture
+  def create_workspace(
+      self,
+      mocked_state_root: Path,  # pylint: disable=unused-argument
+  ) -> Callable[[str, int, int], WorkSpace]:
+
+    def create(source: str, size: int, age: int) -> WorkSpace:
+      instance = WorkSpace(source, persistent=True)
+      (instance.root / "content").write_bytes(b"0" * size)
+      last_used = time.time() - age
+      os.utime(instance.root, (last_used, last_used))
+      instance.lock.release()
+      return instance
+
+    return create
+
+  @pytest.fixture
+  def create_archive(
+      self,
+      mocked_state_root: Path,  # pylint: disable=unused-argument
+  ) -> Callable[[str, int, int], Path]:
+
+    def create(key: str, size: int, age: int) -> Path:
+      cache = ArchiveCache()
+      with cache.store(key) as handle:
+        handle.write(b"0" * size)
+      archive = cache.get_archive_path(key)
+      last_used = time.time() - age
+      os.utime(archive, (last_used, last_used))
+      return archive
+
+    return create
+
+  @pytest.fixture
+  def create_galaxy_entry(
+      self,
+      mocked_state_root: Path,
+  ) -> Callable[[str, int, int], Path]:
+
+    def create(name: str, size: int, age: int) -> Path:
+      entry = mocked_state_root / config.GALAXY_CACHE_FOLDER / name
+      entry.parent.mkdir(parents=True, exist_ok=True)
+      entry.write_bytes(b"0" * size)
+      last_used = time.time() - age
+      os.utime(entry, (last_used, last_used))
+      return entry
+
+    return create
+
+  def wait_for_trash(self) -> None:
+    for thread in threading.enumerate():
+      if thread.name == "mac_maker_trash":
+        thread.join()
+
+  def test_initialize__attributes(
+      self,
+      mocked_state_root: Path,
+  ) -> None:
+    instance = garbage_collector.GarbageCollector()
+
+    assert instance.max_size == config.GC_MAX_SIZE
+    assert instance.max_age == config.GC_MAX_AGE
+    assert instance.galaxy_cache == (
+        mocked_state_root.resolve() / config.GALAXY_CACHE_FOLDER
+    )
+
+  def test_collect__empty_state__reports_nothing(
+      self,
+      mocked_state_root: Path,  # pylint: disable=unused-argument
+  ) -> None:
+    report = garbage_collector.GarbageCollector().collect()
+
+    assert report.evicted == 0
+    assert report.reclaimed == 0
+    assert report.remaining == 0
+
+  def test_collect__within_budgets__evicts_nothing(
+      self,
+      create_archive: Callable[[str, int, int], Path],
+      create_galaxy_entry: Callable[[str, int, int], Path],
+      create_workspace: Callable[[str, int, int], WorkSpace],
+  ) -> None:
+    workspace = create_workspace("/profile", 100, 0)
+    archive = create_archive("org/repo/main", 100, 0)
+    galaxy_entry = create_galaxy_entry("role.tar.gz", 100, 0)
+
+    report = garbage_collector.GarbageCollector(1000, self.day).collect()
+
+    assert report.evicted == 0
+    assert workspace.root.exists()
+    assert archive.exists()
+    assert galaxy_entry.exists()
+
+  def test_collect__expired_entries__evicts_expired_entries(
+      self,
+      create_archive: Callable[[str, int, int], Path],
+      create_galaxy_entry: Callable[[str, int, int], Path],
+      create_workspace: Callable[[str, int, int], WorkSpace],
+  ) -> None:
+    expired_workspace = create_workspace("/expired", 100, 3 * self.day)
+    workspace = create_workspace("/profile", 100, 0)
+    expired_archive = create_archive("org/repo/old", 100, 2 * self.day)
+    expired_galaxy_entry = create_galaxy_entry("old.tar.gz", 100, 2 * self.day)
+
+    report = garbage_collector.GarbageCollector(10000, self.day).collect()
+    self.wait_for_trash()
+
+    assert report.evicted == 3
+    assert not expired_workspace.root.exists()
+    assert not expired_archive.exists()
+    assert not expired_galaxy_entry.exists()
+    assert workspace.root.exists()
+
+  def test_collect__over_size_budget__evicts_least_recently_used(
+      self,
+      create_archive: Callable[[str, int, int], Path],
+      create_galaxy_entry: Callable[[str, int, int], Path],
+      create_workspace: Callable[[str, int, int], WorkSpace],
+  ) -> None:
+    oldest = create_galaxy_entry("oldest.tar.gz", 100, 300)
+    older = create_archive("org/repo/older", 100, 200)
+    workspace = create_workspace("/profile", 100, 100)
+    newest = create_archive("org/repo/newest", 100, 0)
+
+    report = garbage_collector.GarbageCollector(250, self.day).collect()
+
+    assert report.evicted == 2
+    assert report.reclaimed >= 200
+    assert report.remaining <= 250
+    assert not oldest.exists()
+    assert not older.exists()
+    assert workspace.root.exists()
+    assert newest.exists()
+
+  def test_collect__workspace_in_use__skips_workspace(
+      self,
+      create_workspace: Callable[[str, int, int], WorkSpace],
+  ) -> None:
+    workspace = create_workspace("/profile", 100, 3 * self.day)
+    workspace.lock.exclusive()
+
+    report = garbage_collector.GarbageCollector(0, self.day).collect()
+
+    assert report.evicted == 0
+    assert report.remaining == 100
+    assert workspace.root.exists()
+
+  def test_collect__discarded_workspaces__sweeps_discarded_workspaces(
+      self,
+      create_workspace: Callable[[str, int, int], WorkSpace],
+      mocked_state_root: Path,
+  ) -> None:
+    workspace = create_workspace("/profile", 100, 0)
+    discarded = (
+        mocked_state_root / config.WORKSPACES_FOLDER /
+        (".key" + config.TRASH_SUFFIX + "leftover")
+    )
+    discarded.mkdir()
+    (discarded / "content").write_bytes(b"0" * 100)
+
+    report = garbage_collector.GarbageCollector(10000, self.day).collect()
+
+    assert report.evicted == 1
+    assert report.reclaimed == 100
+    assert report.remaining == 100
+    assert not discarded.exists()
+    assert workspace.root.exists()
+
+  def test_collect__discarded_workspace_remove_failure__counts_remaining(
+      self,
+      mocked_state_root: Path,
+  ) -> None:
+    discarded = (
+        mocked_state_root / config.WORKSPACES_FOLDER /
+        (".key" + config.TRASH_SUFFIX + "leftover")
+    )
+    discarded.mkdir(parents=True)
+    (discarded / "content").write_bytes(b"0" * 100)
+
+    with mock.patch.object(
+        trash.shutil,
+        "rmtree",
+        side_effect=OSError,
+    ):
+      report = garbage_collector.GarbageCollector(10000, self.day).collect()
+
+    assert report.evicted == 0
+    assert report.remaining == 100
+    assert discarded.exists()
+
+  def test_get_entries__entry_removed_while_listing__skips_entry(
+      self,
+      create_archive: Callable[[str, int, int], Path],
+      create_workspace: Callable[[str, int, int], WorkSpace],
+  ) -> None:
+    workspace = create_workspace("/profile", 100, 0)
+    archive = create_archive("org/repo/main", 100, 0)
+    instance = garbage_collector.GarbageCollector()
+    get_size = instance._get_size  # pylint: disable=protected-access
+
+    def remove_archive_then_get_size(path: Path) -> int:
+      if path == archive:
+        archive.unlink()
+      return get_size(path)
+
+    with mock.patch.object(
+        instance,
+        "_get_size",
+        side_effect=remove_archive_then_get_size,
+    ):
+      entries = instance.get_entries()
+
+    assert [entry.path for entry in entries] == [workspace.root]
+
+  def test_collect__logging(
+      self,
+      create_archive: Callable[[str, int, int], Path],
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    archive = create_archive("org/repo/old", 100, 2 * self.day)
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    caplog.clear()
+    instance = garbage_collector.GarbageCollector(10000, self.day)
+
+    report = instance.collect()
+
+    logs = decode_logs(caplog.records)
+    assert logs[-2] == (
+        "DEBUG:mac_maker:" + instance.Messages.evicted % (archive, 100)
+    )
+    assert logs[-1] == "DEBUG:mac_maker:" + instance.Messages.collected % (
+        100,
+        1,
+        report.elapsed,
+        0,
+    )
@@ -1,16 +1,31 @@
 """Test the GithubRepository class."""
 
+import os
+import tarfile
+import tempfile
 from io import BytesIO
+from pathlib import Path
+from typing import Optional
 from unittest import mock
+from zipfile import ZipFile
 
 import requests.exceptions
-from mac_maker.tests.fixtures import fixtures_git
+from mac_maker import config
+from mac_maker.tests.fixtures import fixtures_git, fixtures_http
 from mac_maker.utilities import github as github_module
+from mac_maker.utilities.archive_cache import ArchiveCache
 from mac_maker.utilities.exceptions import (
     GithubCommunicationError,
+    GithubReferenceInvalid,
     GithubRepositoryInvalid,
 )
+from mac_maker.utilities.extractor import (
+    IgnoreMemberFilter,
+    ProfileMemberFilter,
+)
 from mac_maker.utilities.github import GithubRepository
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 GITHUB_MODULE = github_module.__name__
 
@@ -34,6 +49,10 @@ class TestGithubRepositoryInitialize(fixtures_git.GitTestHarness):
     self.assertEqual(repo.get_http_url(), self.repository_http_url)
     self.assertEqual(repo.get_ssh_url(), self.repository_ssh_url)
 
+  def test_initialize_with_illegal_archive_format(self) -> None:
+    with self.assertRaises(ValueError):
+      GithubRepository(self.repository_http_url, archive_format="rar")
+
   def test_initialize_with_ssh(self) -> None:
     repo = GithubRepository(self.repository_ssh_url)
     self.assertEqual(repo.get_http_url(), self.repository_http_url)
@@ -60,6 +79,60 @@ class TestGithubRepositoryGetMethods(fixtures_git.GitTestHarness):
         "https://github.com/grocerypanic/panic/archive/refs/heads/develop.zip"
     )
 
+  def test_tarball_archive_url_specific_branch(self) -> None:
+    self.assertEqual(
+        self.repo.get_tarball_bundle_url("develop"),
+        "https://github.com/grocerypanic/panic/archive/refs/heads/"
+        "develop.tar.gz"
+    )
+
+  def test_bundle_url_default_format(self) -> None:
+    self.assertEqual(
+        self.repo.get_bundle_url("develop"),
+        self.repo.get_zip_bundle_url("develop"),
+    )
+
+  def test_bundle_url_tarball_format(self) -> None:
+    repo = GithubRepository(self.repository_http_url, archive_format="tarball")
+    self.assertEqual(
+        repo.get_bundle_url("develop"),
+        repo.get_tarball_bundle_url("develop"),
+    )
+
+  def test_zip_archive_url_commit_sha(self) -> None:
+    commit = "a" * 40
+    self.assertEqual(
+        self.repo.get_zip_bundle_url(commit),
+        f"https://github.com/grocerypanic/panic/archive/{commit}.zip"
+    )
+
+  def test_tarball_archive_url_commit_sha(self) -> None:
+    commit = "a" * 40
+    self.assertEqual(
+        self.repo.get_tarball_bundle_url(commit),
+        f"https://github.com/grocerypanic/panic/archive/{commit}.tar.gz"
+    )
+
+  def test_get_refs_url(self) -> None:
+    self.assertEqual(
+        self.repo.get_refs_url(),
+        "https://github.com/grocerypanic/panic.git/info/refs"
+        "?service=git-upload-pack"
+    )
+
+  def test_is_commit_sha(self) -> None:
+    self.assertTrue(self.repo.is_commit_sha("0123456789abcdef" * 2 + "0" * 8))
+    self.assertFalse(self.repo.is_commit_sha("a" * 39))
+    self.assertFalse(self.repo.is_commit_sha("main"))
+    self.assertFalse(self.repo.is_commit_sha(None))
+
+  def test_get_file_url(self) -> None:
+    self.assertEqual(
+        self.repo.get_file_url(Path("profile/file.txt"), "develop"),
+        "https://raw.githubusercontent.com/grocerypanic/panic/develop/"
+        "profile/file.txt"
+    )
+
   def test_get_branch_name(self) -> None:
     self.assertEqual(self.repo.get_branch_name(None), self.repo.default_branch)
 
@@ -86,72 +159,754 @@ class TestGithubRepositoryGetMethods(fixtures_git.GitTestHarness):
     )
 
 
-@mock.patch(GITHUB_MODULE + ".requests.get")
-@mock.patch(GITHUB_MODULE + ".BytesIO")
-@mock.patch(GITHUB_MODULE + ".ZipFile")
+class TestGithubRepositorySession(fixtures_git.GitTestHarness):
+  """Test the GithubRepository classes shared HTTP session."""
+
+  def setUp(self) -> None:
+    super().setUp()
+    patcher = mock.patch.object(GithubRepository, "session", None)
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def test_timeout(self) -> None:
+    repo = GithubRepository(self.repository_http_url)
+
+    self.assertEqual(
+        repo.timeout,
+        (config.GITHUB_CONNECT_TIMEOUT, config.GITHUB_READ_TIMEOUT),
+    )
+
+  def test_get_session_is_shared(self) -> None:
+    repo1 = GithubRepository(self.repository_http_url)
+    repo2 = GithubRepository(self.repository_ssh_url)
+
+    self.assertIsInstance(repo1.get_session(), requests.Session)
+    self.assertIs(repo1.get_session(), repo2.get_session())
+
+  def test_get_session_adapter_pool(self) -> None:
+    adapter = GithubRepository.get_session().get_adapter("https://github.com")
+
+    assert isinstance(adapter, HTTPAdapter)
+    self.assertEqual(
+        adapter.poolmanager.connection_pool_kw["maxsize"],
+        config.GITHUB_POOL_SIZE,
+    )
+
+  def test_get_session_adapter_retries(self) -> None:
+    adapter = GithubRepository.get_session().get_adapter("https://github.com")
+
+    assert isinstance(adapter, HTTPAdapter)
+    self.assertEqual(adapter.max_retries.total, config.GITHUB_RETRIES)
+    self.assertEqual(
+        adapter.max_retries.backoff_factor,
+        config.GITHUB_RETRY_BACKOFF,
+    )
+    self.assertEqual(
+        adapter.max_retries.backoff_jitter,
+        config.GITHUB_RETRY_JITTER,
+    )
+    self.assertEqual(
+        adapter.max_retries.status_forcelist,
+        config.GITHUB_RETRY_STATUSES,
+    )
+    self.assertEqual(
+        adapter.max_retries.allowed_methods,
+        Retry.DEFAULT_ALLOWED_METHODS,
+    )
+
+
+@mock.patch(GITHUB_MODULE + ".GithubRepository.session")
+@mock.patch(GITHUB_MODULE + ".tempfile.TemporaryFile")
+@mock.patch(GITHUB_MODULE + ".ZipExtractor")
 class TestGithubRepositoryNetwork(fixtures_git.GitTestHarness):
   """Test the GithubRepository classes network bound methods."""
 
   def setUp(self) -> None:
     super().setUp()
-    self.mock_zip_context = mock.Mock()
-    self.mock_data = b"Random String"
-    self.mock_files = {
-        "a": "a.txt",
-        "b": "b.txt"
-    }
+    self.mock_chunks = [b"Random ", b"String"]
+    self.mock_archive = BytesIO()
     self.mock_branch = "develop"
+    self.mock_folder = "/some_folder"
 
   def create_mock_context(
-      self, mock_zipfile: mock.Mock, mock_bytes: mock.Mock
+      self,
+      mock_extractor: mock.Mock,
+      mock_tempfile: mock.Mock,
+      mock_session: mock.Mock,
   ) -> None:
-    context = mock_zipfile.return_value.__enter__
-    context.return_value = self.mock_zip_context
-    context.return_value.read.return_value = self.mock_data
-    mock_bytes.return_value = BytesIO(self.mock_data)
+    mock_tempfile.return_value.__enter__.return_value = self.mock_archive
+    response = mock_session.get.return_value.__enter__.return_value
+    response.iter_content.return_value = iter(self.mock_chunks)
 
   def test_download_zip_bundle_request(
-      self, mock_zipfile: mock.Mock, mock_bytes: mock.Mock, mock_get: mock.Mock
+      self,
+      mock_extractor: mock.Mock,
+      mock_tempfile: mock.Mock,
+      mock_session: mock.Mock,
   ) -> None:
-    self.create_mock_context(mock_zipfile, mock_bytes)
-    mock_folder = "/some_folder"
-    mock_branch = "develop"
+    self.create_mock_context(mock_extractor, mock_tempfile, mock_session)
 
     repo = GithubRepository(self.repository_http_url)
-    repo.download_zip_bundle_profile(mock_folder, mock_branch)
+    repo.download_zip_bundle_profile(self.mock_folder, self.mock_branch)
 
-    mock_get.assert_called_once_with(
-        repo.get_zip_bundle_url(mock_branch),
+    mock_session.get.assert_called_once_with(
+        repo.get_zip_bundle_url(self.mock_branch),
+        headers={},
+        stream=True,
         timeout=repo.timeout,
     )
 
   def test_download_zip_bundle_request_fails(
-      self, mock_zipfile: mock.Mock, mock_bytes: mock.Mock, mock_get: mock.Mock
+      self,
+      mock_extractor: mock.Mock,
+      mock_tempfile: mock.Mock,
+      mock_session: mock.Mock,
   ) -> None:
-    self.create_mock_context(mock_zipfile, mock_bytes)
-    mock_folder = "/some_folder"
-    mock_branch = "develop"
-    mock_get.side_effect = requests.exceptions.RequestException
+    self.create_mock_context(mock_extractor, mock_tempfile, mock_session)
+    mock_session.get.side_effect = requests.exceptions.RequestException
 
     repo = GithubRepository(self.repository_http_url)
 
     with self.assertRaises(GithubCommunicationError):
-      repo.download_zip_bundle_profile(mock_folder, mock_branch)
+      repo.download_zip_bundle_profile(self.mock_folder, self.mock_branch)
 
-    mock_get.assert_called_once_with(
-        repo.get_zip_bundle_url(mock_branch),
+    mock_session.get.assert_called_once_with(
+        repo.get_zip_bundle_url(self.mock_branch),
+        headers={},
+        stream=True,
         timeout=repo.timeout,
     )
+    mock_extractor.assert_not_called()
+
+  def test_download_zip_bundle_request_bad_status(
+      self,
+      mock_extractor: mock.Mock,
+      mock_tempfile: mock.Mock,
+      mock_session: mock.Mock,
+  ) -> None:
+    self.create_mock_context(mock_extractor, mock_tempfile, mock_session)
+    response = mock_session.get.return_value.__enter__.return_value
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError
+
+    repo = GithubRepository(self.repository_http_url)
+
+    with self.assertRaises(GithubCommunicationError):
+      repo.download_zip_bundle_profile(self.mock_folder, self.mock_branch)
+
+    mock_extractor.assert_not_called()
+
+  def test_download_zip_bundle_streams_chunks_to_temporary_file(
+      self,
+      mock_extractor: mock.Mock,
+      mock_tempfile: mock.Mock,
+      mock_session: mock.Mock,
+  ) -> None:
+    self.create_mock_context(mock_extractor, mock_tempfile, mock_session)
+
+    repo = GithubRepository(self.repository_http_url)
+    repo.download_zip_bundle_profile(self.mock_folder, self.mock_branch)
+
+    mock_tempfile.assert_called_once_with(dir=self.mock_folder)
+    mock_session.get.return_value.__enter__.return_value.iter_content \
+        .assert_called_once_with(chunk_size=repo.chunk_size)
+    self.assertEqual(self.mock_archive.getvalue(), b"".join(self.mock_chunks))
 
   def test_download_zip_bundle_zipfile_context(
-      self, mock_zipfile: mock.Mock, mock_bytes: mock.Mock, _: mock.Mock
+      self,
+      mock_extractor: mock.Mock,
+      mock_tempfile: mock.Mock,
+      mock_session: mock.Mock,
+  ) -> None:
+    self.create_mock_context(mock_extractor, mock_tempfile, mock_session)
+
+    repo = GithubRepository(self.repository_http_url)
+    repo.download_zip_bundle_profile(self.mock_folder, self.mock_branch)
+
+    mock_extractor.assert_called_once_with(self.mock_archive)
+    mock_extractor.return_value.extract.assert_called_once()
+    extract_args = mock_extractor.return_value.extract.call_args[0]
+    self.assertEqual(extract_args[0], self.mock_folder)
+    self.assertIsInstance(extract_args[1], IgnoreMemberFilter)
+    self.assertIsNone(extract_args[1].member_filter)
+
+  def test_download_zip_bundle_profile_only(
+      self,
+      mock_extractor: mock.Mock,
+      mock_tempfile: mock.Mock,
+      mock_session: mock.Mock,
+  ) -> None:
+    self.create_mock_context(mock_extractor, mock_tempfile, mock_session)
+
+    repo = GithubRepository(self.repository_http_url)
+    repo.download_zip_bundle_profile(
+        self.mock_folder,
+        self.mock_branch,
+        profile_only=True,
+    )
+
+    member_filter = mock_extractor.return_value.extract.call_args[0][1]
+    self.assertIsInstance(member_filter, IgnoreMemberFilter)
+    self.assertIsInstance(member_filter.member_filter, ProfileMemberFilter)
+    self.assertEqual(
+        member_filter.member_filter.root_folder,
+        repo.get_zip_bundle_root_folder(self.mock_branch),
+    )
+
+
+def create_packet_lines(*lines: bytes) -> bytes:
+  """Encode lines in git's smart http packet line format."""
+  content = b""
+  for line in lines:
+    if line:
+      content += f"{len(line) + 4:04x}".encode() + line
+    else:
+      content += b"0000"
+  return content
+
+
+@mock.patch(GITHUB_MODULE + ".GithubRepository.session")
+class TestGithubRepositoryResolveCommit(fixtures_git.GitTestHarness):
+  """Test the GithubRepository classes commit resolution."""
+
+  branch_commit = "1" * 40
+  tag_commit = "2" * 40
+  annotated_tag = "3" * 40
+  annotated_tag_commit = "4" * 40
+
+  def setUp(self) -> None:
+    super().setUp()
+    self.repo = GithubRepository(self.repository_http_url)
+    self.mock_refs = create_packet_lines(
+        b"# service=git-upload-pack\n",
+        b"",
+        f"{self.branch_commit} HEAD\0multi_ack side-band-64k\n".encode(),
+        f"{self.branch_commit} refs/heads/main\n".encode(),
+        f"{self.tag_commit} refs/heads/shared\n".encode(),
+        f"{self.tag_commit} refs/tags/v1.0.0\n".encode(),
+        f"{self.annotated_tag} refs/tags/shared\n".encode(),
+        f"{self.annotated_tag} refs/tags/v2.0.0\n".encode(),
+        f"{self.annotated_tag_commit} refs/tags/v2.0.0^{{}}\n".encode(),
+        b"",
+    )
+
+  def test_resolve_commit_sha(self, mock_session: mock.Mock) -> None:
+    self.assertEqual(self.repo.resolve_commit("a" * 40), "a" * 40)
+    mock_session.get.assert_not_called()
+
+  def test_resolve_commit_branch(self, mock_session: mock.Mock) -> None:
+    mock_session.get.return_value.content = self.mock_refs
+
+    self.assertEqual(self.repo.resolve_commit("main"), self.branch_commit)
+    mock_session.get.assert_called_once_with(
+        self.repo.get_refs_url(),
+        timeout=self.repo.timeout,
+    )
+
+  def test_resolve_commit_default_branch(self, mock_session: mock.Mock) -> None:
+    mock_session.get.return_value.content = self.mock_refs
+
+    self.assertEqual(self.repo.resolve_commit(None), self.branch_commit)
+
+  def test_resolve_commit_tag(self, mock_session: mock.Mock) -> None:
+    mock_session.get.return_value.content = self.mock_refs
+
+    self.assertEqual(self.repo.resolve_commit("v1.0.0"), self.tag_commit)
+
+  def test_resolve_commit_annotated_tag(self, mock_session: mock.Mock) -> None:
+    mock_session.get.return_value.content = self.mock_refs
+
+    self.assertEqual(
+        self.repo.resolve_commit("v2.0.0"),
+        self.annotated_tag_commit,
+    )
+
+  def test_resolve_commit_branch_before_tag(
+      self,
+      mock_session: mock.Mock,
+  ) -> None:
+    mock_session.get.return_value.content = self.mock_refs
+
+    self.assertEqual(self.repo.resolve_commit("shared"), self.tag_commit)
+
+  def test_resolve_commit_unknown(self, mock_session: mock.Mock) -> None:
+    mock_session.get.return_value.content = self.mock_refs
+
+    with self.assertRaises(GithubReferenceInvalid):
+      self.repo.resolve_commit("missing")
+
+  def test_resolve_commit_request_fails(self, mock_session: mock.Mock) -> None:
+    mock_session.get.side_effect = requests.exceptions.RequestException
+
+    with self.assertRaises(GithubCommunicationError):
+      self.repo.resolve_commit("main")
+
+
+class TestGithubRepositoryBundleFormat(fixtures_git.GitTestHarness):
+  """Test the GithubRepository classes archive format selection."""
+
+  def setUp(self) -> None:
+    super().setUp()
+    self.mock_branch = "develop"
+    self.mock_folder = "/some_folder"
+
+  @mock.patch(GITHUB_MODULE + ".GithubRepository.download_zip_bundle_profile")
+  def test_download_bundle_profile_zip(self, mock_download: mock.Mock) -> None:
+    repo = GithubRepository(self.repository_http_url)
+
+    repo.download_bundle_profile(self.mock_folder, self.mock_branch, True)
+
+    mock_download.assert_called_once_with(
+        self.mock_folder,
+        self.mock_branch,
+        True,
+    )
+
+  @mock.patch(
+      GITHUB_MODULE + ".GithubRepository.download_tarball_bundle_profile"
+  )
+  def test_download_bundle_profile_tarball(
+      self,
+      mock_download: mock.Mock,
+  ) -> None:
+    repo = GithubRepository(self.repository_http_url, archive_format="tarball")
+
+    repo.download_bundle_profile(self.mock_folder, self.mock_branch, True)
+
+    mock_download.assert_called_once_with(
+        self.mock_folder,
+        self.mock_branch,
+        True,
+    )
+
+
+@mock.patch(GITHUB_MODULE + ".GithubRepository.session")
+@mock.patch(GITHUB_MODULE + ".ZipExtractor")
+class TestGithubRepositoryCache(fixtures_git.GitTestHarness):
+  """Test the GithubRepository classes archive caching."""
+
+  def setUp(self) -> None:
+    super().setUp()
+    self.mock_archive = BytesIO()
+    self.mock_branch = "develop"
+    self.mock_cache = mock.Mock()
+    self.mock_cache.get.return_value = Path("/cached/archive")
+    self.mock_cache.store.return_value.__enter__ = mock.Mock(
+        return_value=self.mock_archive
+    )
+    self.mock_cache.store.return_value.__exit__ = mock.Mock(return_value=None)
+    self.mock_folder = "/some_folder"
+    self.repo = GithubRepository(
+        self.repository_http_url,
+        cache=self.mock_cache,
+    )
+
+  def test_get_cache_key(self, *_: mock.Mock) -> None:
+    self.assertEqual(
+        self.repo.get_cache_key(self.mock_branch),
+        f"{self.org_name}/{self.repo_name}/{self.mock_branch}/zip",
+    )
+
+  def test_get_cache_key_default_branch(self, *_: mock.Mock) -> None:
+    self.assertEqual(
+        self.repo.get_cache_key(None),
+        f"{self.org_name}/{self.repo_name}/{self.repo.default_branch}/zip",
+    )
+
+  def test_get_cache_key_tarball(self, *_: mock.Mock) -> None:
+    repo = GithubRepository(
+        self.repository_http_url,
+        cache=self.mock_cache,
+        archive_format="tarball",
+    )
+
+    self.assertEqual(
+        repo.get_cache_key(self.mock_branch),
+        f"{self.org_name}/{self.repo_name}/{self.mock_branch}/tarball",
+    )
+
+  def test_download_zip_bundle_fresh_cache(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    self.mock_cache.is_fresh.return_value = True
+
+    self.repo.download_zip_bundle_profile(self.mock_folder, self.mock_branch)
+
+    self.mock_cache.get.assert_called_once_with(
+        self.repo.get_cache_key(self.mock_branch)
+    )
+    mock_session.get.assert_not_called()
+    mock_extractor.assert_called_once_with(self.mock_cache.get.return_value)
+
+  def test_download_zip_bundle_stale_cache_modified(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    self.mock_cache.is_fresh.return_value = False
+    self.mock_cache.get_metadata.return_value = {
+        "etag": '"old"',
+        "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    response = mock_session.get.return_value.__enter__.return_value
+    response.status_code = 200
+    response.headers = {
+        "ETag": '"new"'
+    }
+    response.iter_content.return_value = iter([b"data"])
+
+    self.repo.download_zip_bundle_profile(self.mock_folder, self.mock_branch)
+
+    mock_session.get.assert_called_once_with(
+        self.repo.get_zip_bundle_url(self.mock_branch),
+        headers={
+            "If-None-Match": '"old"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        },
+        stream=True,
+        timeout=self.repo.timeout,
+    )
+    self.mock_cache.store.assert_called_once_with(
+        self.repo.get_cache_key(self.mock_branch),
+        {
+            "etag": '"new"'
+        },
+    )
+    self.assertEqual(self.mock_archive.getvalue(), b"data")
+    mock_extractor.assert_called_once_with(
+        self.mock_cache.get_archive_path.return_value
+    )
+
+  def test_download_zip_bundle_stale_cache_not_modified(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    self.mock_cache.is_fresh.return_value = False
+    self.mock_cache.get_metadata.return_value = {
+        "etag": '"old"'
+    }
+    response = mock_session.get.return_value.__enter__.return_value
+    response.status_code = 304
+
+    self.repo.download_zip_bundle_profile(self.mock_folder, self.mock_branch)
+
+    response.iter_content.assert_not_called()
+    self.mock_cache.store.assert_not_called()
+    self.mock_cache.refresh.assert_called_once_with(
+        self.repo.get_cache_key(self.mock_branch)
+    )
+    mock_extractor.assert_called_once_with(self.mock_cache.get.return_value)
+
+  def test_download_zip_bundle_stale_cache_commit_sha(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    self.mock_cache.is_fresh.return_value = False
+
+    self.repo.download_zip_bundle_profile(self.mock_folder, "a" * 40)
+
+    mock_session.get.assert_not_called()
+    self.mock_cache.refresh.assert_not_called()
+    mock_extractor.assert_called_once_with(self.mock_cache.get.return_value)
+
+  def test_download_zip_bundle_empty_cache(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    self.mock_cache.get.return_value = None
+    response = mock_session.get.return_value.__enter__.return_value
+    response.headers = {}
+    response.iter_content.return_value = iter([b"data"])
+
+    self.repo.download_zip_bundle_profile(self.mock_folder, self.mock_branch)
+
+    self.mock_cache.is_fresh.assert_not_called()
+    mock_session.get.assert_called_once()
+    mock_extractor.assert_called_once_with(
+        self.mock_cache.get_archive_path.return_value
+    )
+
+
+@mock.patch(GITHUB_MODULE + ".GithubRepository.session")
+@mock.patch(GITHUB_MODULE + ".ZipExtractor")
+class TestGithubRepositoryReadFile(fixtures_git.GitTestHarness):
+  """Test the GithubRepository classes single file retrieval."""
+
+  def setUp(self) -> None:
+    super().setUp()
+    self.mock_branch = "develop"
+    self.mock_cache = mock.Mock()
+    self.mock_path = Path("profile/file.txt")
+
+  def test_read_file_no_cache(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    mock_session.get.return_value.content = b"content"
+    repo = GithubRepository(self.repository_http_url)
+
+    result = repo.read_file(self.mock_path, self.mock_branch)
+
+    self.assertEqual(result, "content")
+    mock_session.get.assert_called_once_with(
+        repo.get_file_url(self.mock_path, self.mock_branch),
+        timeout=repo.timeout,
+    )
+    mock_extractor.assert_not_called()
+
+  def test_read_file_request_fails(
+      self, _: mock.Mock, mock_session: mock.Mock
   ) -> None:
-    self.create_mock_context(mock_zipfile, mock_bytes)
-    mock_folder = "/some_folder"
-    mock_branch = "develop"
+    mock_session.get.side_effect = requests.exceptions.RequestException
+    repo = GithubRepository(self.repository_http_url)
+
+    with self.assertRaises(GithubCommunicationError):
+      repo.read_file(self.mock_path, self.mock_branch)
 
+  def test_read_file_bad_status(
+      self, _: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    mock_session.get.return_value.raise_for_status.side_effect = (
+        requests.exceptions.HTTPError
+    )
     repo = GithubRepository(self.repository_http_url)
-    repo.download_zip_bundle_profile(mock_folder, mock_branch)
 
-    mock_zipfile.assert_called_once_with(mock_bytes.return_value)
-    self.mock_zip_context.extractall.assert_called_once_with(path=mock_folder)
+    with self.assertRaises(GithubCommunicationError):
+      repo.read_file(self.mock_path, self.mock_branch)
+
+  def test_read_file_fresh_cache(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    self.mock_cache.is_fresh.return_value = True
+    mock_extractor.return_value.read.return_value = b"cached"
+    repo = GithubRepository(self.repository_http_url, cache=self.mock_cache)
+
+    result = repo.read_file(self.mock_path, self.mock_branch)
+
+    self.assertEqual(result, "cached")
+    mock_extractor.assert_called_once_with(self.mock_cache.get.return_value)
+    mock_extractor.return_value.read.assert_called_once_with(
+        f"{self.repo_name}-{self.mock_branch}/profile/file.txt"
+    )
+    mock_session.get.assert_not_called()
+
+  def test_read_file_fresh_cache_missing_file(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    self.mock_cache.is_fresh.return_value = True
+    mock_extractor.return_value.read.return_value = None
+    mock_session.get.return_value.content = b"content"
+    repo = GithubRepository(self.repository_http_url, cache=self.mock_cache)
+
+    result = repo.read_file(self.mock_path, self.mock_branch)
+
+    self.assertEqual(result, "content")
+    mock_session.get.assert_called_once()
+
+  def test_read_file_stale_cache_commit_sha(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    self.mock_cache.is_fresh.return_value = False
+    mock_extractor.return_value.read.return_value = b"cached"
+    repo = GithubRepository(self.repository_http_url, cache=self.mock_cache)
+
+    result = repo.read_file(self.mock_path, "a" * 40)
+
+    self.assertEqual(result, "cached")
+    mock_session.get.assert_not_called()
+
+  def test_read_file_stale_cache(
+      self, mock_extractor: mock.Mock, mock_session: mock.Mock
+  ) -> None:
+    self.mock_cache.is_fresh.return_value = False
+    mock_session.get.return_value.content = b"content"
+    repo = GithubRepository(self.repository_http_url, cache=self.mock_cache)
+
+    result = repo.read_file(self.mock_path, self.mock_branch)
+
+    self.assertEqual(result, "content")
+    mock_extractor.assert_not_called()
+    mock_session.get.assert_called_once()
+
+
+class TestGithubRepositoryConditionalRequests(
+    fixtures_http.HttpTestHarness,
+    fixtures_git.GitTestHarness,
+):
+  """Test the GithubRepository classes conditional requests."""
+
+  def setUp(self) -> None:
+    super().setUp()
+    self.mock_branch = "develop"
+    self.mock_file = f"{self.repo_name}-{self.mock_branch}/profile/file.txt"
+    self.server.content = self.create_zipfile(b"content")
+
+    temporary_folder = tempfile.TemporaryDirectory()
+    self.addCleanup(temporary_folder.cleanup)
+    self.root = Path(temporary_folder.name)
+    environment = mock.patch.dict(
+        os.environ,
+        {
+            config.ENV_MAC_MAKER_HOME: str(self.root / "state")
+        },
+    )
+    environment.start()
+    self.addCleanup(environment.stop)
+
+    self.cache = ArchiveCache(ttl=0)
+    self.repo = GithubRepository(self.repository_http_url, cache=self.cache)
+    self.repo.archive_host = self.server_url
+
+  def create_zipfile(self, content: bytes) -> bytes:
+    data = BytesIO()
+    with ZipFile(data, "w") as zipfile:
+      zipfile.writestr(self.mock_file, content)
+    return data.getvalue()
+
+  def download(self, name: str) -> Path:
+    target = self.root / name
+    target.mkdir()
+    self.repo.download_zip_bundle_profile(target, self.mock_branch)
+    return target / self.mock_file
+
+  def test_unchanged_remote_is_revalidated(self) -> None:
+    first = self.download("first")
+    second = self.download("second")
+
+    self.assertEqual(self.server.responses, [200, 304])
+    self.assertEqual(first.read_bytes(), b"content")
+    self.assertEqual(second.read_bytes(), b"content")
+
+  def test_changed_remote_is_downloaded(self) -> None:
+    self.download("first")
+    self.server.content = self.create_zipfile(b"changed")
+    self.server.etag = '"changed-etag"'
+    second = self.download("second")
+
+    self.assertEqual(self.server.responses, [200, 200])
+    self.assertEqual(second.read_bytes(), b"changed")
+    metadata = self.cache.get_metadata(
+        self.repo.get_cache_key(self.mock_branch)
+    )
+    assert metadata is not None
+    self.assertEqual(metadata["etag"], '"changed-etag"')
+
+  def test_fresh_cache_skips_network(self) -> None:
+    self.cache.ttl = 60
+    self.download("first")
+    second = self.download("second")
+
+    self.assertEqual(self.server.responses, [200])
+    self.assertEqual(second.read_bytes(), b"content")
+
+  def test_transient_failure_is_retried(self) -> None:
+    self.server.failures = 1
+    first = self.download("first")
+
+    self.assertEqual(self.server.responses, [503, 200])
+    self.assertEqual(first.read_bytes(), b"content")
+
+
+class TestGithubRepositoryTarball(
+    fixtures_http.HttpTestHarness,
+    fixtures_git.GitTestHarness,
+):
+  """Test the GithubRepository classes tarball backend."""
+
+  def setUp(self) -> None:
+    super().setUp()
+    self.mock_branch = "develop"
+    self.mock_root = f"{self.repo_name}-{self.mock_branch}"
+    self.mock_file = f"{self.mock_root}/profile/file.txt"
+    self.mock_other_file = f"{self.mock_root}/README.md"
+    self.server.content = self.create_tarball(b"content")
+
+    temporary_folder = tempfile.TemporaryDirectory()
+    self.addCleanup(temporary_folder.cleanup)
+    self.root = Path(temporary_folder.name)
+    environment = mock.patch.dict(
+        os.environ,
+        {
+            config.ENV_MAC_MAKER_HOME: str(self.root / "state")
+        },
+    )
+    environment.start()
+    self.addCleanup(environment.stop)
+
+  def create_tarball(self, content: bytes) -> bytes:
+    data = BytesIO()
+    with tarfile.open(fileobj=data, mode="w:gz") as tar:
+      for name, member_content in (
+          (self.mock_file, content),
+          (self.mock_other_file, b"readme"),
+      ):
+        member = tarfile.TarInfo(name)
+        member.size = len(member_content)
+        tar.addfile(member, BytesIO(member_content))
+    return data.getvalue()
+
+  def create_repository(
+      self,
+      cache: Optional[ArchiveCache] = None,
+  ) -> GithubRepository:
+    repo = GithubRepository(
+        self.repository_http_url,
+        cache=cache,
+        archive_format="tarball",
+    )
+    repo.archive_host = self.server_url
+    return repo
+
+  def download(
+      self,
+      repo: GithubRepository,
+      name: str,
+      profile_only: bool = False,
+  ) -> Path:
+    target = self.root / name
+    target.mkdir()
+    repo.download_bundle_profile(target, self.mock_branch, profile_only)
+    return target
+
+  def test_download_without_cache(self) -> None:
+    target = self.download(self.create_repository(), "first")
+
+    self.assertEqual((target / self.mock_file).read_bytes(), b"content")
+    self.assertEqual((target / self.mock_other_file).read_bytes(), b"readme")
+    self.assertEqual(list(target.glob("tmp*")), [])
+
+  def test_download_profile_only(self) -> None:
+    target = self.download(self.create_repository(), "first", True)
+
+    self.assertEqual((target / self.mock_file).read_bytes(), b"content")
+    self.assertFalse((target / self.mock_other_file).exists())
+
+  def test_download_is_stored_in_cache(self) -> None:
+    cache = ArchiveCache()
+    repo = self.create_repository(cache)
+
+    self.download(repo, "first")
+
+    cached_archive = cache.get(repo.get_cache_key(self.mock_branch))
+    assert cached_archive is not None
+    self.assertEqual(cached_archive.read_bytes(), self.server.content)
+
+  def test_fresh_cache_skips_network(self) -> None:
+    repo = self.create_repository(ArchiveCache())
+
+    self.download(repo, "first")
+    second = self.download(repo, "second")
+
+    self.assertEqual(self.server.responses, [200])
+    self.assertEqual((second / self.mock_file).read_bytes(), b"content")
+
+  def test_unchanged_remote_is_revalidated(self) -> None:
+    repo = self.create_repository(ArchiveCache(ttl=0))
+
+    self.download(repo, "first")
+    second = self.download(repo, "second")
+
+    self.assertEqual(self.server.responses, [200, 304])
+    self.assertEqual((second / self.mock_file).read_bytes(), b"content")
+
+  def test_read_file_fresh_cache(self) -> None:
+    repo = self.create_repository(ArchiveCache())
+    self.download(repo, "first")
+
+    result = repo.read_file("profile/file.txt", self.mock_branch)
+
+    self.assertEqual(result, "content")
+    self.assertEqual(self.server.responses, [200])
@@ -0,0 +1,97 @@
+"""Test the IgnoreRules class."""
+
+from pathlib import Path
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.parametrize import templated_ids
+from mac_maker.utilities.ignore_rules import IgnoreRules
+
+
+class TestIgnoreRules:
+  """Test the IgnoreRules class."""
+
+  content = "\n".join(
+      (
+          "# Comments and blank lines are skipped.",
+          "",
+          "*.log",
+          "!keep.log",
+          "media/",
+          "/build",
+          "docs/**/*.png",
+          "cache-?",
+          "\\#literal",
+      )
+  )
+
+  @pytest.mark.parametrize(
+      "relative_path,is_dir,expected",
+      (
+          ("install.yml", False, False),
+          ("notes.log", False, True),
+          ("roles/role/notes.log", False, True),
+          ("keep.log", False, False),
+          ("media", True, True),
+          ("media", False, False),
+          ("media/video.mp4", False, True),
+          ("roles/media/video.mp4", False, True),
+          ("build", False, True),
+          ("roles/build", False, False),
+          ("docs/image.png", False, True),
+          ("docs/nested/image.png", False, True),
+          ("images/image.png", False, False),
+          ("cache-1", False, True),
+          ("cache-10", False, False),
+          ("#literal", False, True),
+      ),
+      ids=templated_ids("{0}"),
+  )
+  def test_is_ignored__vary_path__returns_correct_value(
+      self,
+      relative_path: str,
+      is_dir: bool,
+      expected: bool,
+  ) -> None:
+    instance = IgnoreRules.from_text(self.content)
+
+    assert instance.is_ignored(relative_path, is_dir) is expected
+
+  def test_is_ignored__negated_file_in_ignored_folder__is_ignored(
+      self,
+  ) -> None:
+    instance = IgnoreRules(["media/", "!media/keep.txt"])
+
+    assert instance.is_ignored("media/keep.txt") is True
+
+  def test_from_folder__no_ignore_file__returns_none(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    assert IgnoreRules.from_folder(tmp_path) is None
+
+  def test_from_folder__ignore_file__returns_rules(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    (tmp_path / config.IGNORE_FILE_NAME).write_text(self.content)
+
+    instance = IgnoreRules.from_folder(tmp_path)
+
+    assert instance is not None
+    assert instance.is_ignored("notes.log") is True
+
+  def test_ignore_names__returns_ignored_names(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    (tmp_path / "roles" / "media").mkdir(parents=True)
+    (tmp_path / "roles" / "notes.log").write_text("log")
+    (tmp_path / "roles" / "main.yml").write_text("role")
+    instance = IgnoreRules.from_text(self.content)
+
+    assert instance.ignore_names(
+        tmp_path,
+        str(tmp_path / "roles"),
+        ["media", "notes.log", "main.yml"],
+    ) == {"media", "notes.log"}
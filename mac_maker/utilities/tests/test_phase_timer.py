@@ -0,0 +1,76 @@
+"""Test the PhaseTimer class."""
+
+from unittest import mock
+
+import pytest
+from mac_maker.utilities import phase_timer
+
+PHASE_TIMER_MODULE = phase_timer.__name__
+
+
+@mock.patch(PHASE_TIMER_MODULE + ".time")
+class TestPhaseTimer:
+  """Test the PhaseTimer class."""
+
+  def test_init__attributes(self, _: mock.Mock) -> None:
+    timer = phase_timer.PhaseTimer()
+
+    assert timer.phases == {}
+
+  def test_measure__records_phase_duration(self, m_time: mock.Mock) -> None:
+    m_time.monotonic.side_effect = [10.0, 12.5]
+    timer = phase_timer.PhaseTimer()
+
+    with timer.measure("galaxy"):
+      pass
+
+    assert timer.phases == {
+        "galaxy": 2.5
+    }
+
+  def test_measure__repeated_phase__accumulates_duration(
+      self,
+      m_time: mock.Mock,
+  ) -> None:
+    m_time.monotonic.side_effect = [10.0, 12.5, 20.0, 21.0]
+    timer = phase_timer.PhaseTimer()
+
+    with timer.measure("galaxy"):
+      pass
+    with timer.measure("galaxy"):
+      pass
+
+    assert timer.phases == {
+        "galaxy": 3.5
+    }
+
+  def test_measure__nested_phase__excluded_from_outer_phase(
+      self,
+      m_time: mock.Mock,
+  ) -> None:
+    m_time.monotonic.side_effect = [10.0, 11.0, 15.0, 16.0]
+    timer = phase_timer.PhaseTimer()
+
+    with timer.measure("precheck"):
+      with timer.measure("workspace"):
+        pass
+
+    assert timer.phases == {
+        "precheck": 2.0,
+        "workspace": 4.0
+    }
+
+  def test_measure__exception_inside_context__records_phase_duration(
+      self,
+      m_time: mock.Mock,
+  ) -> None:
+    m_time.monotonic.side_effect = [10.0, 12.5]
+    timer = phase_timer.PhaseTimer()
+
+    with pytest.raises(ChildProcessError):
+      with timer.measure("playbook"):
+        raise ChildProcessError
+
+    assert timer.phases == {
+        "playbook": 2.5
+    }
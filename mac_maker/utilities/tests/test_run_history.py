@@ -0,0 +1,137 @@
+"""Test the RunHistory class."""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.utilities import run_history
+
+
+@pytest.fixture
+def run_history_instance(
+    mocked_state_root: Path,  # pylint: disable=unused-argument
+) -> run_history.RunHistory:
+  return run_history.RunHistory()
+
+
+class TestRunHistory:
+  """Test the RunHistory class."""
+
+  def create_entry(
+      self,
+      started: float,
+      source: str = "github",
+      ref: Optional[str] = "a" * 40,
+  ) -> run_history.RunHistoryEntry:
+    return run_history.RunHistoryEntry(
+        started=started,
+        source=source,
+        location="https://github.com/osx-provisioner/profile-example",
+        ref=ref,
+        exit_status=0,
+        workspace=1.5,
+        precheck=0.5,
+        galaxy=None,
+        playbook=120.25,
+        tasks_ok=10,
+        tasks_changed=4,
+        tasks_failed=0,
+        tasks_skipped=2,
+        tasks_unreachable=0,
+    )
+
+  def test_initialize__attributes(
+      self,
+      run_history_instance: run_history.RunHistory,
+      mocked_state_root: Path,
+  ) -> None:
+    assert isinstance(run_history_instance.log, logging.Logger)
+    assert run_history_instance.max_entries == config.RUN_HISTORY_MAX_ENTRIES
+    assert run_history_instance.path == (
+        mocked_state_root.resolve() / config.RUN_HISTORY_FILE
+    )
+
+  def test_query__no_database__returns_no_entries(
+      self,
+      run_history_instance: run_history.RunHistory,
+  ) -> None:
+    assert run_history_instance.query() == []
+    assert not run_history_instance.path.exists()
+
+  def test_record__creates_database__entry_can_be_queried(
+      self,
+      run_history_instance: run_history.RunHistory,
+  ) -> None:
+    entry = self.create_entry(1000.0, ref=None)
+
+    run_history_instance.record(entry)
+
+    assert run_history_instance.query() == [entry]
+
+  def test_query__multiple_entries__returns_most_recent_first(
+      self,
+      run_history_instance: run_history.RunHistory,
+  ) -> None:
+    entries = [self.create_entry(float(started)) for started in range(5)]
+    for entry in entries:
+      run_history_instance.record(entry)
+
+    assert run_history_instance.query(limit=3) == entries[:1:-1]
+
+  def test_query__source__returns_matching_entries(
+      self,
+      run_history_instance: run_history.RunHistory,
+  ) -> None:
+    folder_entry = self.create_entry(1.0, source="folder")
+    github_entry = self.create_entry(2.0, source="github")
+    run_history_instance.record(folder_entry)
+    run_history_instance.record(github_entry)
+
+    assert run_history_instance.query(source="folder") == [folder_entry]
+
+  def test_record__max_entries__evicts_oldest_entries(
+      self,
+      mocked_state_root: Path,  # pylint: disable=unused-argument
+  ) -> None:
+    instance = run_history.RunHistory(max_entries=2)
+    entries = [self.create_entry(float(started)) for started in range(4)]
+    for entry in entries:
+      instance.record(entry)
+
+    assert instance.query() == [entries[3], entries[2]]
+
+  def test_record__logging(
+      self,
+      run_history_instance: run_history.RunHistory,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    entry = self.create_entry(1.0)
+
+    run_history_instance.record(entry)
+
+    assert decode_logs(caplog.records) == [
+        "DEBUG:mac_maker:" + run_history_instance.Messages.recorded %
+        (entry.location, entry.exit_status),
+    ]
+
+  def test_record__invalid_database__logs_warning(
+      self,
+      run_history_instance: run_history.RunHistory,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    run_history_instance.path.parent.mkdir(parents=True)
+    run_history_instance.path.write_text("not a database")
+
+    run_history_instance.record(self.create_entry(1.0))
+
+    assert decode_logs(caplog.records) == [
+        "WARNING:mac_maker:" +
+        run_history_instance.Messages.error_record_failure %
+        sqlite3.DatabaseError("file is not a database"),
+    ]
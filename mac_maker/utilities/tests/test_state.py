@@ -0,0 +1,39 @@
+"""Test the StateDirectory class."""
+
+from pathlib import Path
+
+import pytest
+from mac_maker import config
+from mac_maker.utilities import state
+
+
+class TestStateDirectory:
+  """Test the StateDirectory class."""
+
+  def test_initialize__no_env__uses_default_root(
+      self,
+      monkeypatch: pytest.MonkeyPatch,
+  ) -> None:
+    monkeypatch.delenv(config.ENV_MAC_MAKER_HOME, raising=False)
+
+    instance = state.StateDirectory()
+
+    assert instance.root == config.MAC_MAKER_HOME.resolve()
+
+  def test_initialize__env__uses_env_root(
+      self,
+      mocked_state_root: Path,
+  ) -> None:
+    instance = state.StateDirectory()
+
+    assert instance.root == mocked_state_root.resolve()
+
+  def test_get_folder__returns_named_folder(
+      self,
+      mocked_state_root: Path,
+  ) -> None:
+    instance = state.StateDirectory()
+
+    folder = instance.get_folder("named")
+
+    assert folder == mocked_state_root.resolve() / "named"
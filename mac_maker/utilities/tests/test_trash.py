@@ -0,0 +1,217 @@
+"""Test the Trash class."""
+
+import logging
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from mac_maker import config
+from mac_maker.__helpers__.logs import decode_logs
+from mac_maker.utilities import trash
+from mac_maker.utilities.file_lock import FileLock
+
+
+class TestTrash:
+  """Test the Trash class."""
+
+  @pytest.fixture
+  def folder(self, tmp_path: Path) -> Path:
+    folder = tmp_path / "installer.workspace"
+    (folder / "roles" / "role").mkdir(parents=True)
+    (folder / "roles" / "role" / "main.yml").write_text("role")
+    return folder
+
+  def test_initialize__attributes(self, folder: Path) -> None:
+    instance = trash.Trash(folder)
+
+    assert instance.folder == folder
+    assert instance.prefix == ".installer.workspace" + config.TRASH_SUFFIX
+    assert instance.threads == []
+
+  def test_discard__moves_folder_aside_and_deletes_it(
+      self,
+      folder: Path,
+      tmp_path: Path,
+  ) -> None:
+    instance = trash.Trash(folder)
+
+    instance.discard()
+
+    assert not folder.exists()
+    instance.wait()
+    assert list(tmp_path.iterdir()) == []
+
+  def test_discard__deletes_in_non_daemon_thread(
+      self,
+      folder: Path,
+  ) -> None:
+    instance = trash.Trash(folder)
+
+    with mock.patch(trash.__name__ + ".threading.Thread") as mocked_thread:
+      instance.discard()
+
+    mocked_thread.assert_called_once_with(
+        target=instance._delete,  # pylint: disable=protected-access
+        args=([mock.ANY],),
+        name="mac_maker_trash",
+        daemon=False,
+    )
+    mocked_thread.return_value.start.assert_called_once_with()
+    discarded = mocked_thread.call_args.kwargs["args"][0][0]
+    assert discarded.parent == folder.parent
+    assert discarded.name.startswith(instance.prefix)
+    assert (discarded / "roles" / "role" / "main.yml").exists()
+
+  def test_sweep__leftover_folders__deletes_leftovers_only(
+      self,
+      folder: Path,
+      tmp_path: Path,
+  ) -> None:
+    instance = trash.Trash(folder)
+    leftovers = [tmp_path / (instance.prefix + name) for name in ("a", "b")]
+    for leftover in leftovers:
+      (leftover / "nested").mkdir(parents=True)
+
+    instance.sweep()
+    instance.wait()
+
+    assert sorted(tmp_path.iterdir()) == [folder]
+
+  def test_sweep__leftover_folders_of_other_folders__deletes_leftovers(
+      self,
+      folder: Path,
+      tmp_path: Path,
+  ) -> None:
+    instance = trash.Trash(folder)
+    other = tmp_path / "other"
+    other.mkdir()
+    leftover = tmp_path / (".other" + config.TRASH_SUFFIX + "a")
+    (leftover / "nested").mkdir(parents=True)
+
+    instance.sweep()
+    instance.wait()
+
+    assert sorted(tmp_path.iterdir()) == [folder, other]
+
+  def test_sweep__no_leftover_folders__starts_no_thread(
+      self,
+      folder: Path,
+  ) -> None:
+    instance = trash.Trash(folder)
+
+    instance.sweep()
+
+    assert instance.threads == []
+
+  def test_sweep__missing_parent__starts_no_thread(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    instance = trash.Trash(tmp_path / "missing" / "installer.workspace")
+
+    instance.sweep()
+
+    assert instance.threads == []
+
+  def test_sweep__lock_files__are_not_swept(
+      self,
+      folder: Path,
+      tmp_path: Path,
+  ) -> None:
+    instance = trash.Trash(folder)
+    lock_file = tmp_path / (instance.prefix + "a" + config.TRASH_LOCK_SUFFIX)
+    lock_file.write_text("")
+
+    assert trash.Trash.get_discarded(tmp_path) == []
+
+  def test_sweep__concurrent_sweeps__delete_each_leftover_once(
+      self,
+      folder: Path,
+      tmp_path: Path,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    instances = [trash.Trash(folder), trash.Trash(folder)]
+    leftovers = [
+        tmp_path / (instances[0].prefix + str(index)) for index in range(4)
+    ]
+    for leftover in leftovers:
+      for name in range(50):
+        (leftover / str(name)).mkdir(parents=True)
+        (leftover / str(name) / "file").write_text("content")
+
+    for instance in instances:
+      instance.sweep()
+    for instance in instances:
+      instance.wait()
+
+    assert sorted(tmp_path.iterdir()) == [folder]
+    assert not [
+        record for record in caplog.records if record.levelno > logging.DEBUG
+    ]
+
+  def test_delete__locked_folder__skips_folder(
+      self,
+      folder: Path,
+      tmp_path: Path,
+  ) -> None:
+    instance = trash.Trash(folder)
+    leftover = tmp_path / (instance.prefix + "a")
+    leftover.mkdir()
+    holder = FileLock(tmp_path / (leftover.name + config.TRASH_LOCK_SUFFIX))
+    holder.exclusive()
+
+    result = instance.delete(leftover)
+
+    assert result is False
+    assert leftover.exists()
+
+  def test_delete__missing_folder__returns_true(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    instance = trash.Trash(tmp_path / "installer.workspace")
+
+    assert instance.delete(tmp_path / "missing") is True
+    assert list(tmp_path.iterdir()) == []
+
+  def test_discard__logging(
+      self,
+      folder: Path,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    instance = trash.Trash(folder)
+
+    instance.discard()
+    instance.wait()
+
+    logs = decode_logs(caplog.records)
+    assert len(logs) == 3
+    assert logs[0].startswith(
+        "DEBUG:mac_maker:Trash: Moved " + str(folder) + " aside"
+    )
+    assert logs[1].startswith("DEBUG:mac_maker:FileLock: Acquired exclusive")
+    assert logs[2].startswith("DEBUG:mac_maker:Trash: Deleted ")
+
+  def test_delete__failure__logs_warning(
+      self,
+      tmp_path: Path,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    instance = trash.Trash(tmp_path / "installer.workspace")
+    leftover = tmp_path / "leftover"
+
+    with mock.patch.object(
+        trash.shutil,
+        "rmtree",
+        side_effect=PermissionError,
+    ):
+      result = instance.delete(leftover)
+
+    logs = decode_logs(caplog.records)
+    assert result is False
+    assert logs[-1].startswith(
+        "WARNING:mac_maker:Trash: Unable to delete " + str(leftover)
+    )
@@ -12,11 +12,14 @@ from mac_maker.__helpers__.logs import decode_logs
 from mac_maker.__helpers__.parametrize import templated_ids
 from mac_maker.ansible_controller.spec import Spec
 from mac_maker.utilities import exceptions, workspace
+from mac_maker.utilities.github import GithubRepository
 
 
 class TestWorkSpace:
   """Test the Workspace class."""
 
+  source = "/path/to/profile"
+
   vary_branch = pytest.mark.parametrize(
       "branch_name",
       (None, "develop"),
@@ -34,37 +37,93 @@ class TestWorkSpace:
       workspace_instance: workspace.WorkSpace,
   ) -> None:
     assert isinstance(workspace_instance.log, Logger)
-    assert workspace_instance.root == Path(config.WORKSPACE).resolve()
+    assert workspace_instance.persistent is False
+    assert workspace_instance.root == (
+        Path(config.WORKSPACE).resolve() /
+        workspace.WorkSpace.get_key(self.source)
+    )
     assert workspace_instance.profile_root is None
     assert workspace_instance.spec_file is None
 
-  def test_initialize__root_exists__removes_existing_workspace_root(
+  def test_initialize__acquires_exclusive_lock_before_reset(
+      self,
+      mocked_file_lock: mock.Mock,
+      mocked_os_module: mock.Mock,
+      setup_workspace_module: Callable[[], None],
+  ) -> None:
+    setup_workspace_module()
+    calls = mock.Mock()
+    calls.attach_mock(mocked_file_lock.return_value.exclusive, "exclusive")
+    calls.attach_mock(mocked_os_module.mkdir, "mkdir")
+
+    instance = workspace.WorkSpace(self.source)
+
+    lock_name = instance.root.name + config.WORKSPACE_LOCK_SUFFIX
+    mocked_file_lock.assert_called_once_with(instance.root.with_name(lock_name))
+    assert calls.mock_calls == [
+        mock.call.exclusive(),
+        mock.call.mkdir(instance.root),
+    ]
+
+  def test_initialize__sweeps_trash(
+      self,
+      mocked_trash: mock.Mock,
+      setup_workspace_module: Callable[[], None],
+  ) -> None:
+    setup_workspace_module()
+
+    instance = workspace.WorkSpace(self.source)
+
+    mocked_trash.assert_called_once_with(instance.root)
+    mocked_trash.return_value.sweep.assert_called_once_with()
+
+  def test_initialize__root_exists__discards_existing_workspace_root(
+      self,
+      mocked_os_module: mock.Mock,
+      mocked_shutil_module: mock.Mock,
+      mocked_trash: mock.Mock,
+      setup_workspace_module: Callable[[], None],
+  ) -> None:
+    setup_workspace_module()
+    mocked_os_module.path.exists.return_value = True
+
+    instance = workspace.WorkSpace(self.source)
+
+    mocked_os_module.path.exists.assert_called_once_with(instance.root)
+    mocked_trash.return_value.discard.assert_called_once_with()
+    mocked_shutil_module.rmtree.assert_not_called()
+
+  def test_initialize__root_exists__no_background__removes_workspace_root(
       self,
       mocked_os_module: mock.Mock,
       mocked_shutil_module: mock.Mock,
+      mocked_trash: mock.Mock,
       setup_workspace_module: Callable[[], None],
   ) -> None:
     setup_workspace_module()
     mocked_os_module.path.exists.return_value = True
 
-    instance = workspace.WorkSpace()
+    instance = workspace.WorkSpace(self.source, background_delete=False)
 
     mocked_os_module.path.exists.assert_called_once_with(instance.root)
     mocked_shutil_module.rmtree.assert_called_once_with(instance.root)
+    mocked_trash.return_value.discard.assert_not_called()
 
   def test_initialize__no_root_exists__does_not_remove_existing_workspace_root(
       self,
       mocked_os_module: mock.Mock,
       mocked_shutil_module: mock.Mock,
+      mocked_trash: mock.Mock,
       setup_workspace_module: Callable[[], None],
   ) -> None:
     setup_workspace_module()
     mocked_os_module.path.exists.return_value = False
 
-    instance = workspace.WorkSpace()
+    instance = workspace.WorkSpace(self.source)
 
     mocked_os_module.path.exists.assert_called_once_with(instance.root)
     mocked_shutil_module.rmtree.assert_not_called()
+    mocked_trash.return_value.discard.assert_not_called()
 
   @pytest.mark.parametrize(
       "workspace_exists",
@@ -80,13 +139,44 @@ class TestWorkSpace:
     setup_workspace_module()
     mocked_os_module.path.exists.return_value = workspace_exists
 
-    instance = workspace.WorkSpace()
+    instance = workspace.WorkSpace(self.source)
 
     mocked_os_module.mkdir.assert_called_once_with(instance.root)
 
+  def test_add_bundle__extracts_bundle_to_root(
+      self,
+      workspace_instance: workspace.WorkSpace,
+  ) -> None:
+    mocked_bundle = mock.Mock()
+
+    workspace_instance.add_bundle(mocked_bundle)
+
+    mocked_bundle.extract.assert_called_once_with(workspace_instance.root)
+    assert workspace_instance.profile_root == (
+        mocked_bundle.extract.return_value
+    )
+
+  def test_add_bundle__logging(
+      self,
+      workspace_instance: workspace.WorkSpace,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    caplog.set_level(logging.DEBUG)
+    mocked_bundle = mock.Mock()
+
+    workspace_instance.add_bundle(mocked_bundle)
+
+    assert decode_logs(caplog.records) == [
+        (
+            "DEBUG:mac_maker:" + workspace_instance.Messages.add_bundle %
+            mocked_bundle.extract.return_value
+        ),
+    ]
+
   @vary_folder
   def test_add_folder__vary_folder__successful_copy__copies_folder_to_root(
       self,
+      mocked_file_copier: mock.Mock,
       mocked_shutil_module: mock.Mock,
       workspace_instance: workspace.WorkSpace,
       folder_path: str,
@@ -96,7 +186,10 @@ class TestWorkSpace:
     mocked_shutil_module.copytree.assert_called_once_with(
         folder_path,
         workspace_instance.root / os.path.basename(folder_path),
+        copy_function=mocked_file_copier.return_value.copy,
+        ignore=None,
     )
+    mocked_file_copier.return_value.log_summary.assert_called_once_with()
 
   @vary_folder
   def test_add_folder__vary_folder__failed_copy__raises_correct_exception(
@@ -175,7 +268,7 @@ class TestWorkSpace:
     assert decode_logs(caplog.records) == []
 
   @vary_branch
-  def test_add_repository__vary_branch__downloads_zip_bundle(
+  def test_add_repository__vary_branch__downloads_bundle(
       self,
       mocked_github_repository: mock.Mock,
       workspace_instance: workspace.WorkSpace,
@@ -186,6 +279,12 @@ class TestWorkSpace:
         branch_name,
     )
 
+    mocked_github_repository \
+        .download_bundle_profile.assert_called_once_with(
+            workspace_instance.root,
+            branch_name,
+            profile_only=True,
+        )
     mocked_github_repository \
         .get_zip_bundle_root_folder.assert_called_once_with(branch_name)
 
@@ -203,8 +302,8 @@ class TestWorkSpace:
     )
 
     assert workspace_instance.profile_root == (
-        Path(config.WORKSPACE) / mocked_profile_root
-    ).resolve()
+        workspace_instance.root / mocked_profile_root
+    )
 
   @vary_branch
   def test_add_repository__vary_branch__logging(
@@ -265,6 +364,17 @@ class TestWorkSpace:
     assert mocked_spec_file_instance.content == \
         Spec.from_profile(expected_profile)
 
+  def test_add_spec_file__with_source_commit__spec_file_records_commit(
+      self,
+      mocked_spec_file_instance: mock.Mock,
+      workspace_instance_with_profile: workspace.WorkSpace,
+  ) -> None:
+    commit = "a" * 40
+
+    workspace_instance_with_profile.add_spec_file(source_commit=commit)
+
+    assert mocked_spec_file_instance.content.source_commit == commit
+
   def test_add_spec_file__with_profile__logging(
       self,
       workspace_instance_with_profile: workspace.WorkSpace,
@@ -295,3 +405,271 @@ class TestWorkSpace:
     assert workspace_instance_with_profile.spec_file == (
         workspace_instance_with_profile.profile_root / "spec.json"
     )
+
+
+class TestPersistentWorkSpace:
+  """Test the Workspace class, with a persistent workspace."""
+
+  source = "https://github.com/owner/repo.git"
+  commit = "a" * 40
+  other_commit = "b" * 40
+
+  @pytest.fixture
+  def mocked_repository(self) -> mock.Mock:
+
+    def download(root: Path, branch_name: str, **_: bool) -> None:
+      profile_data = root / f"repo-{branch_name}" / config.PROFILE_FOLDER_PATH
+      profile_data.mkdir(parents=True)
+      (profile_data / "install.yml").write_text(branch_name)
+
+    return mock.Mock(
+        **{
+            "download_bundle_profile.side_effect": download,
+            "get_zip_bundle_root_folder.side_effect": "repo-{0}".format,
+            "is_commit_sha.side_effect": GithubRepository.is_commit_sha,
+        }
+    )
+
+  @pytest.fixture
+  def persistent_instance(
+      self,
+      mocked_state_root: Path,  # pylint: disable=unused-argument
+  ) -> workspace.WorkSpace:
+    return workspace.WorkSpace(self.source, persistent=True)
+
+  def test_initialize__attributes(
+      self,
+      mocked_state_root: Path,
+      persistent_instance: workspace.WorkSpace,
+  ) -> None:
+    assert persistent_instance.persistent is True
+    assert persistent_instance.source == self.source
+    assert persistent_instance.root == (
+        mocked_state_root / config.WORKSPACES_FOLDER /
+        workspace.WorkSpace.get_key(self.source)
+    )
+    assert persistent_instance.root.is_dir()
+
+  def test_initialize__existing_content__is_kept(
+      self,
+      persistent_instance: workspace.WorkSpace,
+  ) -> None:
+    existing = persistent_instance.root / "existing.txt"
+    existing.write_text("content")
+    persistent_instance.lock.release()
+
+    workspace.WorkSpace(self.source, persistent=True)
+
+    assert existing.read_text() == "content"
+
+  def test_initialize__acquires_exclusive_lock_before_creating_root(
+      self,
+      mocked_state_root: Path,
+  ) -> None:
+    root = (
+        mocked_state_root / config.WORKSPACES_FOLDER /
+        workspace.WorkSpace.get_key(self.source)
+    )
+    root_existed = []
+
+    with mock.patch.object(workspace.FileLock, "exclusive") as mocked_lock:
+      mocked_lock.side_effect = lambda: root_existed.append(root.exists())
+      workspace.WorkSpace(self.source, persistent=True)
+
+    assert root_existed == [False]
+    assert root.is_dir()
+
+  def test_get_key__vary_source__returns_unique_keys(self) -> None:
+    assert workspace.WorkSpace.get_key(self.source) != \
+        workspace.WorkSpace.get_key("/path/to/folder")
+
+  def test_initialize__marks_workspace_as_used(
+      self,
+      persistent_instance: workspace.WorkSpace,
+  ) -> None:
+    os.utime(persistent_instance.root, (0, 0))
+    persistent_instance.lock.release()
+
+    instance = workspace.WorkSpace(self.source, persistent=True)
+
+    assert instance.root.stat().st_mtime > 0
+
+  def test_get_lock__returns_lock_beside_root(self, tmp_path: Path) -> None:
+    lock = workspace.WorkSpace.get_lock(tmp_path / "key")
+
+    assert lock.path == tmp_path / ("key" + config.WORKSPACE_LOCK_SUFFIX)
+    assert lock.mode is None
+
+  def test_get_persistent_roots__no_workspaces__returns_empty_list(
+      self,
+      mocked_state_root: Path,  # pylint: disable=unused-argument
+  ) -> None:
+    assert not workspace.WorkSpace.get_persistent_roots()
+
+  def test_get_persistent_roots__returns_workspace_folders_only(
+      self,
+      persistent_instance: workspace.WorkSpace,
+  ) -> None:
+    (persistent_instance.root.parent / ".key.trash-leftover").mkdir()
+
+    assert workspace.WorkSpace.get_persistent_roots() == [
+        persistent_instance.root
+    ]
+
+  def test_get_manifest__new_workspace__returns_empty_manifest(
+      self,
+      persistent_instance: workspace.WorkSpace,
+  ) -> None:
+    assert persistent_instance.get_manifest() == {}
+
+  def test_add_repository__new_workspace__downloads_and_writes_manifest(
+      self,
+      mocked_repository: mock.Mock,
+      persistent_instance: workspace.WorkSpace,
+  ) -> None:
+    persistent_instance.add_repository(mocked_repository, self.commit)
+
+    mocked_repository.download_bundle_profile.assert_called_once_with(
+        persistent_instance.root,
+        self.commit,
+        profile_only=True,
+    )
+    assert persistent_instance.profile_root == (
+        persistent_instance.root / f"repo-{self.commit}"
+    )
+    assert persistent_instance.get_manifest() == {
+        "profile_root": f"repo-{self.commit}",
+        "revision": self.commit,
+        "source": self.source,
+    }
+
+  def test_add_repository__same_commit__reuses_workspace(
+      self,
+      mocked_repository: mock.Mock,
+      persistent_instance: workspace.WorkSpace,
+      caplog: pytest.LogCaptureFixture,
+  ) -> None:
+    persistent_instance.add_repository(mocked_repository, self.commit)
+    mocked_repository.download_bundle_profile.reset_mock()
+    caplog.set_level(logging.DEBUG, logger=config.LOGGER_NAME)
+    caplog.clear()
+    persistent_instance.lock.release()
+
+    instance = workspace.WorkSpace(self.source, persistent=True)
+    instance.add_repository(mocked_repository, self.commit)
+
+    mocked_repository.download_bundle_profile.assert_not_called()
+    assert instance.profile_root == persistent_instance.profile_root
+    assert decode_logs(caplog.records) == [
+        (
+            "DEBUG:mac_maker:" + instance.lock.Messages.acquired %
+            (instance.lock.exclusive_mode, instance.lock.path)
+        ),
+        (
+            "DEBUG:mac_maker:" +
+            instance.Messages.reuse_repository % instance.profile_root
+        ),
+    ]
+    assert instance.lock.mode == instance.lock.exclusive_mode
+
+  def test_add_repository__new_commit__replaces_previous_profile(
+      self,
+      mocked_repository: mock.Mock,
+      persistent_instance: workspace.WorkSpace,
+  ) -> None:
+    persistent_instance.add_repository(mocked_repository, self.commit)
+    previous_profile_root = persistent_instance.profile_root
+    assert previous_profile_root is not None
+    persistent_instance.lock.release()
+
+    instance = workspace.WorkSpace(self.source, persistent=True)
+    instance.add_repository(mocked_repository, self.other_commit)
+
+    assert not previous_profile_root.exists()
+    assert instance.profile_root == (
+        instance.root / f"repo-{self.other_commit}"
+    )
+    assert instance.get_manifest()["revision"] == self.other_commit
+
+  def test_add_repository__branch_name__does_not_reuse_workspace(
+      self,
+      mocked_repository: mock.Mock,
+      persistent_instance: workspace.WorkSpace,
+  ) -> None:
+    mocked_repository.download_bundle_profile.side_effect = None
+    persistent_instance.add_repository(mocked_repository, "main")
+    persistent_instance.add_repository(mocked_repository, "main")
+
+    assert mocked_repository.download_bundle_profile.call_count == 2
+    assert persistent_instance.get_manifest()["revision"] is None
+
+  def test_add_folder__persistent__synchronizes_folder(
+      self,
+      persistent_instance: workspace.WorkSpace,
+      tmp_path: Path,
+  ) -> None:
+    folder = tmp_path / "profile_folder"
+
+    with mock.patch.object(workspace, "FolderSync") as mocked_folder_sync:
+      mocked_folder_sync.return_value.is_synchronized.return_value = False
+      persistent_instance.add_folder(str(folder))
+
+    mocked_folder_sync.assert_called_once_with(
+        str(folder),
+        persistent_instance.root / "profile_folder",
+        persistent_instance.root / config.WORKSPACE_SYNC_MANIFEST_FILE,
+        copy_function=mock.ANY,
+        ignore=None,
+    )
+    mocked_folder_sync.return_value.sync.assert_called_once_with()
+    assert persistent_instance.lock.mode == \
+        persistent_instance.lock.exclusive_mode
+
+  def test_add_folder__synchronized__does_not_synchronize_folder(
+      self,
+      persistent_instance: workspace.WorkSpace,
+      tmp_path: Path,
+  ) -> None:
+    folder = tmp_path / "profile_folder"
+
+    with mock.patch.object(workspace, "FolderSync") as mocked_folder_sync:
+      mocked_folder_sync.return_value.is_synchronized.return_value = True
+      persistent_instance.add_folder(str(folder))
+
+    mocked_folder_sync.return_value.sync.assert_not_called()
+
+  def test_add_folder__ignore_file__excludes_ignored_content(
+      self,
+      persistent_instance: workspace.WorkSpace,
+      tmp_path: Path,
+  ) -> None:
+    folder = tmp_path / "profile_folder"
+    (folder / "media").mkdir(parents=True)
+    (folder / "media" / "video.mp4").write_text("video")
+    (folder / "install.yml").write_text("install")
+    (folder / config.IGNORE_FILE_NAME).write_text("media/\n")
+
+    persistent_instance.add_folder(str(folder))
+
+    destination = persistent_instance.root / "profile_folder"
+    assert (destination / "install.yml").exists()
+    assert (destination / config.IGNORE_FILE_NAME).exists()
+    assert not (destination / "media").exists()
+
+  def test_add_folder__existing_content__is_kept(
+      self,
+      persistent_instance: workspace.WorkSpace,
+      tmp_path: Path,
+  ) -> None:
+    folder = tmp_path / "profile_folder"
+    folder.mkdir()
+    (folder / "install.yml").write_text("new")
+    installed_role = persistent_instance.root / "profile_folder" / "role.yml"
+    installed_role.parent.mkdir()
+    installed_role.write_text("installed")
+
+    persistent_instance.add_folder(str(folder))
+
+    assert (persistent_instance.root / "profile_folder" /
+            "install.yml").read_text() == "new"
+    assert installed_role.read_text() == "installed"
@@ -0,0 +1,137 @@
+"""Background deletion of discarded folders."""
+
+import errno
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from types import TracebackType
+from typing import Callable, List, Tuple, Type, Union
+
+from mac_maker import config
+from mac_maker.utilities.file_lock import FileLock
+
+
+class Trash:
+  """Deletes a folder in the background, so a new job doesn't wait for it.
+
+  The folder is atomically renamed aside (next to its original location, so
+  the rename never crosses a file system), and then deleted by a background
+  thread while the new job proceeds.  The thread is not a daemon, so the
+  deletion completes before the process exits.  Folders left behind by an
+  interrupted run are found and deleted by :meth:`sweep`.
+
+  Each discarded folder is deleted while holding a lock beside it, so a
+  folder that another process is already deleting is skipped.
+
+  :param folder: The folder to discard.
+  """
+
+  class Messages:
+    deleted = "Trash: Deleted %s in %.3f seconds."
+    discarded = "Trash: Moved %s aside for deletion as %s."
+    error_delete_failure = "Trash: Unable to delete %s: %s"
+    in_use = "Trash: Skipped %s, which is already being deleted."
+
+  def __init__(self, folder: Union[Path, str]) -> None:
+    self.folder = Path(folder)
+    self.prefix = f".{self.folder.name}{config.TRASH_SUFFIX}"
+    self.threads: List[threading.Thread] = []
+    self.log = logging.getLogger(config.LOGGER_NAME)
+
+  def discard(self) -> None:
+    """Rename the folder aside, and delete it in the background."""
+
+    discarded = self.folder.parent / f"{self.prefix}{uuid.uuid4().hex}"
+    os.rename(self.folder, discarded)
+    self.log.debug(self.Messages.discarded, self.folder, discarded)
+    self._delete_in_background([discarded])
+
+  @staticmethod
+  def get_discarded(parent: Path) -> List[Path]:
+    """Return the discarded folders, that have not yet been deleted.
+
+    :param parent: The folder containing the discarded folders.
+    :returns: A list of discarded folders.
+    """
+
+    if not parent.exists():
+      return []
+    return sorted(
+        path for path in parent.glob(f".*{config.TRASH_SUFFIX}*")
+        if not path.name.endswith(config.TRASH_LOCK_SUFFIX)
+    )
+
+  def sweep(self) -> None:
+    """Delete any folders discarded next to this folder, but not yet deleted.
+
+    This includes folders left behind by previous, interrupted, runs and
+    folders discarded from folders with other names.  Folders that another
+    process is already deleting are skipped.
+    """
+
+    leftovers = self.get_discarded(self.folder.parent)
+    if leftovers:
+      self._delete_in_background(leftovers)
+
+  def delete(self, folder: Path) -> bool:
+    """Delete a discarded folder, unless another process is deleting it.
+
+    :param folder: The discarded folder to delete.
+    :returns: A boolean indicating if the folder was deleted.
+    """
+
+    lock = FileLock(folder.with_name(folder.name + config.TRASH_LOCK_SUFFIX))
+    if not lock.try_exclusive():
+      self.log.debug(self.Messages.in_use, folder)
+      return False
+
+    start = time.perf_counter()
+    try:
+      shutil.rmtree(folder, onerror=self._ignore_missing)
+      lock.path.unlink(missing_ok=True)
+    except OSError as exc:
+      self.log.warning(self.Messages.error_delete_failure, folder, exc)
+      return False
+    finally:
+      lock.release()
+
+    self.log.debug(
+        self.Messages.deleted,
+        folder,
+        time.perf_counter() - start,
+    )
+    return True
+
+  def wait(self) -> None:
+    """Wait for all background deletions started by this instance."""
+
+    for thread in self.threads:
+      thread.join()
+
+  def _delete_in_background(self, folders: List[Path]) -> None:
+    thread = threading.Thread(
+        target=self._delete,
+        args=(folders,),
+        name="mac_maker_trash",
+        daemon=False,
+    )
+    thread.start()
+    self.threads.append(thread)
+
+  def _delete(self, folders: List[Path]) -> None:
+    for folder in folders:
+      self.delete(folder)
+
+  def _ignore_missing(
+      self,
+      _: Callable[..., object],
+      __: str,
+      exc_info: Tuple[Type[BaseException], BaseException, TracebackType],
+  ) -> None:
+    if isinstance(exc_info[1], OSError) and exc_info[1].errno == errno.ENOENT:
+      return
+    raise exc_info[1]
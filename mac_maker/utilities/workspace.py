@@ -1,37 +1,132 @@
 """Workspace representation."""
 
+import functools
+import hashlib
 import logging
 import os
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from mac_maker import config
 from mac_maker.ansible_controller.spec import Spec
 from mac_maker.profile import Profile, spec_file
+from mac_maker.utilities.bundle import Bundle
 from mac_maker.utilities.exceptions import WorkSpaceInvalid
+from mac_maker.utilities.file_copier import FileCopier
+from mac_maker.utilities.file_lock import FileLock
+from mac_maker.utilities.folder_sync import FolderSync
 from mac_maker.utilities.github import GithubRepository
+from mac_maker.utilities.ignore_rules import IgnoreRules
+from mac_maker.utilities.mixins.json_file import JSONFileReader, JSONFileWriter
+from mac_maker.utilities.state import StateDirectory
+from mac_maker.utilities.trash import Trash
 
 
-class WorkSpace:
-  """Workspace representation."""
+class WorkSpace(JSONFileReader, JSONFileWriter):
+  """Workspace representation.
+
+  Each profile source has its own workspace folder, so jobs for different
+  profiles never share content.  By default, the workspace is recreated for
+  every job.  A persistent workspace is kept between jobs instead, and its
+  content (including installed Galaxy requirements) is only materialised
+  again when the profile has changed.
+
+  Workspaces are guarded by an advisory lock, held exclusively until the job
+  ends:  a job writes its spec file, generated Ansible configuration, Galaxy
+  requirements and event stream into the workspace, so jobs for the same
+  profile wait for each other instead of writing over each other's content.
+
+  :param source: The profile source (ie. a repository url or folder path).
+  :param persistent: Keep this workspace between jobs.
+  :param background_delete: Delete a previous workspace in the background.
+  """
 
   class Messages:
+    add_bundle = "WorkSpace: Extracted profile bundle to workspace: %s."
     add_folder = "WorkSpace: Copied local folder to workspace: %s."
     add_repository = "WorkSpace: Attached GitHub repository to workspace: %s."
     add_spec_file = "WorkSpace: Attached spec file to workspace: %s."
+    reuse_repository = (
+        "WorkSpace: Reusing GitHub repository revision in workspace: %s."
+    )
     error_no_repository = "No GitHub Repository has been added."
     error_not_a_folder = "The location '%s' is not a directory!"
     error_profile_copy_failure = (
         "Unable to copy content from target location '%s'!"
     )
 
-  def __init__(self) -> None:
+  def __init__(
+      self,
+      source: str,
+      persistent: bool = False,
+      background_delete: bool = config.WORKSPACE_BACKGROUND_DELETE,
+  ) -> None:
     self.log = logging.getLogger(config.LOGGER_NAME)
+    self.persistent = persistent
     self.profile_root: Optional[Path] = None
-    self.root = Path(config.WORKSPACE).resolve()
+    self.source = source
     self.spec_file: Optional[Path] = None
-    self._reset()
+    if persistent:
+      workspaces = StateDirectory().get_folder(config.WORKSPACES_FOLDER)
+    else:
+      workspaces = Path(config.WORKSPACE).resolve()
+    self.root = workspaces / self.get_key(source)
+    self.lock = self.get_lock(self.root)
+    self.manifest = self.root / config.WORKSPACE_MANIFEST_FILE
+    self.lock.exclusive()
+    if persistent:
+      self.root.mkdir(parents=True, exist_ok=True)
+      os.utime(self.root)
+    else:
+      self.trash = Trash(self.root)
+      self.trash.sweep()
+      self._reset(background_delete)
+
+  @staticmethod
+  def get_key(source: str) -> str:
+    """Return the workspace folder name for a profile source.
+
+    :param source: The profile source (ie. a repository url or folder path).
+    :returns: The folder name of the workspace.
+    """
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+  @staticmethod
+  def get_lock(root: Path) -> FileLock:
+    """Return the lock guarding a workspace.
+
+    :param root: The root folder of the workspace.
+    :returns: The (unacquired) lock for the workspace.
+    """
+    return FileLock(root.with_name(root.name + config.WORKSPACE_LOCK_SUFFIX))
+
+  @staticmethod
+  def get_persistent_roots() -> List[Path]:
+    """Return the root folders of all persistent workspaces.
+
+    :returns: A list of persistent workspace root folders.
+    """
+    workspaces = StateDirectory().get_folder(config.WORKSPACES_FOLDER)
+    if not workspaces.exists():
+      return []
+    return sorted(
+        path for path in workspaces.iterdir()
+        if path.is_dir() and not path.name.startswith(".")
+    )
+
+  def add_bundle(self, bundle: Bundle) -> None:
+    """Add a profile bundle to the current Workspace.
+
+    :param bundle: The profile bundle to extract.
+    :raises: :class:`mac_maker.utilities.exceptions.BundleInvalid`
+    """
+
+    self.profile_root = bundle.extract(self.root)
+    self.log.debug(
+        self.Messages.add_bundle,
+        self.profile_root,
+    )
 
   def add_folder(
       self,
@@ -39,21 +134,46 @@ class WorkSpace:
   ) -> None:
     """Add a local filesystem folder to the current Workspace.
 
+    A persistent workspace is synchronized incrementally, so only files that
+    changed since the previous job are copied.  Files are cloned or linked
+    instead of copied, where the file system allows it.  Content matched by
+    the profile's ignore file is left out.
+
     :param folder_location: A validated filesystem path to add.
     """
 
     profile_basename = os.path.basename(folder_location)
+    copier = FileCopier()
+    rules = IgnoreRules.from_folder(folder_location)
 
     try:
-      shutil.copytree(
-          folder_location,
-          self.root / profile_basename,
-      )
+      if self.persistent:
+        folder_sync = FolderSync(
+            folder_location,
+            self.root / profile_basename,
+            self.root / config.WORKSPACE_SYNC_MANIFEST_FILE,
+            copy_function=copier.copy,
+            ignore=rules,
+        )
+        if not folder_sync.is_synchronized():
+          folder_sync.sync()
+      else:
+        shutil.copytree(
+            folder_location,
+            self.root / profile_basename,
+            copy_function=copier.copy,
+            ignore=(
+                functools.partial(rules.ignore_names, folder_location)
+                if rules else None
+            ),
+        )
     except Exception as exc:
       raise IOError(
           self.Messages.error_profile_copy_failure % folder_location
       ) from exc
 
+    copier.log_summary()
+
     self.profile_root = self.root / profile_basename
     self.log.debug(
         self.Messages.add_folder,
@@ -67,22 +187,72 @@ class WorkSpace:
   ) -> None:
     """Add a GitHub Repository to the current Workspace.
 
+    Only the repository's profile folder is extracted into the workspace.  A
+    persistent workspace that already holds the same commit is reused as is.
+
     :param repo: The GitHub Repository object.
-    :param branch_name: The GitHub Repository branch name.
+    :param branch_name: The GitHub Repository branch name, tag or commit SHA.
     """
 
-    repo.download_zip_bundle_profile(self.root, branch_name)
-    self.profile_root = (
-        self.root / repo.get_zip_bundle_root_folder(branch_name)
+    profile_root = self.root / repo.get_zip_bundle_root_folder(branch_name)
+
+    if self.persistent and self._reuse_repository(
+        repo,
+        branch_name,
+        profile_root,
+    ):
+      return
+
+    manifest = self.get_manifest()
+    if manifest.get("profile_root"):
+      shutil.rmtree(self.root / manifest["profile_root"], ignore_errors=True)
+
+    repo.download_bundle_profile(
+        self.root,
+        branch_name,
+        profile_only=True,
+    )
+    self.profile_root = profile_root
+    self.write_manifest(
+        revision=branch_name if repo.is_commit_sha(branch_name) else None
     )
     self.log.debug(
         self.Messages.add_repository,
         self.profile_root,
     )
 
-  def add_spec_file(self) -> None:
+  def get_manifest(self) -> Dict[str, Any]:
+    """Return the manifest of a persistent workspace's previous content.
+
+    :returns: The manifest content, which is empty for a new workspace.
+    """
+
+    if not self.persistent or not self.manifest.exists():
+      return {}
+    manifest: Dict[str, Any] = self.load_json_file(self.manifest)
+    return manifest
+
+  def write_manifest(self, revision: Optional[str] = None) -> None:
+    """Record the current content of a persistent workspace.
+
+    :param revision: The commit SHA of the current profile, if known.
+    """
+
+    if not self.persistent or self.profile_root is None:
+      return
+    self.write_json_file(
+        {
+            "profile_root": self.profile_root.name,
+            "revision": revision,
+            "source": self.source,
+        },
+        self.manifest,
+    )
+
+  def add_spec_file(self, source_commit: Optional[str] = None) -> None:
     """Generate and write a spec file to this workspace.
 
+    :param source_commit: The commit SHA the profile was retrieved from.
     :raises: :class:`WorkSpaceInvalid`
     """
 
@@ -92,7 +262,10 @@ class WorkSpace:
     profile_instance = Profile(str(self.profile_root))
     spec_file_instance = spec_file.SpecFile()
     spec_file_instance.path = profile_instance.get_spec_file()
-    spec_file_instance.content = Spec.from_profile(profile_instance)
+    spec_file_instance.content = Spec.from_profile(
+        profile_instance,
+        source_commit=source_commit,
+    )
     spec_file_instance.write()
 
     self.log.debug(
@@ -102,10 +275,32 @@ class WorkSpace:
 
     self.spec_file = spec_file_instance.path
 
-  def _reset(self) -> None:
+  def _reuse_repository(
+      self,
+      repo: GithubRepository,
+      branch_name: Optional[str],
+      profile_root: Path,
+  ) -> bool:
+    revision = self.get_manifest().get("revision")
+    if not (
+        repo.is_commit_sha(branch_name) and revision == branch_name
+        and profile_root.exists()
+    ):
+      return False
+    self.profile_root = profile_root
+    self.log.debug(
+        self.Messages.reuse_repository,
+        self.profile_root,
+    )
+    return True
+
+  def _reset(self, background_delete: bool) -> None:
     """If a workspace already exists at the given path, then remove it."""
 
     if os.path.exists(self.root):
-      shutil.rmtree(self.root)
+      if background_delete:
+        self.trash.discard()
+      else:
+        shutil.rmtree(self.root)
 
     os.mkdir(self.root)